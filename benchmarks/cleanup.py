@@ -0,0 +1,146 @@
+"""
+Compares scratch directory cleanup strategies on wide trees of small file(s).
+
+Each strategy is measured on a freshly populated tree: the original synchronous `shutil.rmtree`, the parallel
+`polyium.utilities.systems.remove`, and a background cleanup (reporting both the time until `__exit__` returns, and the
+time until the tree is actually deleted). A scratch pool acquire/populate/release cycle is compared against a
+`mkdtemp` + `shutil.rmtree` cycle. The run fails if a background cleanup blocks for longer than a synchronous one.
+
+Usage:
+
+    python benchmarks/cleanup.py --files 20000 --directories 100 --iterations 3
+"""
+
+import argparse
+import pathlib
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import typing
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent.joinpath("src")))
+
+import polyium.utilities.systems
+
+def populate(directory: pathlib.Path, files: int, directories: int) -> None:
+    """
+    Creates the given number of small file(s), spread evenly across the given number of sub-directories.
+    """
+
+    for index in range(directories):
+        directory.joinpath(str(index)).mkdir(parents=True, exist_ok=True)
+
+    for index in range(files):
+        directory.joinpath(str(index % directories), "%d.json" % index).write_bytes(b"{}\n")
+
+def measure(function: typing.Callable[[], typing.Optional[float]], iterations: int) -> typing.Tuple[float, typing.Optional[float]]:
+    """
+    Returns the median wall-clock time (in milliseconds) of a function, and the median of its own (optional) reported
+    secondary time (in milliseconds).
+    """
+
+    samples: typing.List[float] = []
+    secondary: typing.List[float] = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        value = function()
+
+        samples.append((time.perf_counter() - start) * 1000)
+
+        if value is not None:
+            secondary.append(value)
+
+    return statistics.median(samples), statistics.median(secondary) if secondary else None
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scratch directory cleanup benchmark.")
+
+    parser.add_argument("--files", type=int, default=20000, help="the number of file(s) per tree")
+    parser.add_argument("--directories", type=int, default=100, help="the number of sub-directories per tree")
+    parser.add_argument("--iterations", type=int, default=3, help="the number of iteration(s) per strategy")
+
+    namespace = parser.parse_args()
+
+    def synchronous() -> float:
+        directory = pathlib.Path(tempfile.mkdtemp())
+
+        populate(directory, namespace.files, namespace.directories)
+
+        start = time.perf_counter()
+
+        shutil.rmtree(directory)
+
+        return (time.perf_counter() - start) * 1000
+
+    def parallel() -> float:
+        directory = pathlib.Path(tempfile.mkdtemp())
+
+        populate(directory, namespace.files, namespace.directories)
+
+        start = time.perf_counter()
+
+        polyium.utilities.systems.remove(directory)
+
+        return (time.perf_counter() - start) * 1000
+
+    blocking: typing.List[float] = []
+
+    def background() -> float:
+        directory = polyium.utilities.systems.Directory.temporary(background=True)
+
+        populate(directory, namespace.files, namespace.directories)
+
+        start = time.perf_counter()
+
+        directory.__exit__(None, None, None)
+
+        blocking.append((time.perf_counter() - start) * 1000)
+
+        polyium.utilities.systems.reaper.wait()
+
+        return (time.perf_counter() - start) * 1000
+
+    def legacy_cycle() -> None:
+        directory = pathlib.Path(tempfile.mkdtemp())
+
+        populate(directory, namespace.files // 10, namespace.directories)
+
+        shutil.rmtree(directory)
+
+    pool = polyium.utilities.systems.Pool(size=2)
+
+    def pool_cycle() -> None:
+        with pool.directory() as directory:
+            populate(directory, namespace.files // 10, namespace.directories)
+
+    sys.stdout.write("Cleanup (%d File(s) across %d Directories; median of %d)\n" % (namespace.files, namespace.directories, namespace.iterations))
+
+    _, rmtree = measure(synchronous, namespace.iterations)
+
+    sys.stdout.write("    %-24s %10.2fms\n" % ("shutil.rmtree", rmtree))
+
+    _, removal = measure(parallel, namespace.iterations)
+
+    sys.stdout.write("    %-24s %10.2fms\n" % ("parallel remove", removal))
+
+    _, completed = measure(background, namespace.iterations)
+
+    exiting = statistics.median(blocking)
+
+    sys.stdout.write("    %-24s %10.2fms (deleted after %.2fms)\n" % ("background __exit__", exiting, completed))
+
+    sys.stdout.write("\nScratch Cycle (%d File(s); median of %d)\n" % (namespace.files // 10, namespace.iterations))
+
+    sys.stdout.write("    %-24s %10.2fms\n" % ("mkdtemp + rmtree", measure(legacy_cycle, namespace.iterations)[0]))
+    sys.stdout.write("    %-24s %10.2fms\n" % ("pool", measure(pool_cycle, namespace.iterations)[0]))
+
+    pool.close(wait=True)
+
+    return 1 if exiting > rmtree else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Measures the output size, serialization time, and deserialization time of every output encoding, for both a large model
+dump (`Model.encode`) and a large model's JSON schema.
+
+The run fails if any encoding doesn't round-trip, or if the minified, canonical, or binary output(s) are larger than
+the original (pretty) output.
+
+Usage:
+
+    python benchmarks/encodings.py --fields 500 --items 200 --iterations 5
+"""
+
+import argparse
+import json
+import pathlib
+import statistics
+import sys
+import time
+import typing
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent.joinpath("src")))
+
+import pydantic
+
+import polyium.models.configuration
+import polyium.models.internal.base
+import polyium.utilities.encodings
+
+def model(fields: int) -> typing.Type[polyium.models.internal.base.Model]:
+    """
+    Creates a model with the given number of (mixed-type) field(s), and a list of nested item(s).
+    """
+
+    item = pydantic.create_model("Item", __base__=polyium.models.internal.base.Model, identifier=(int, 0), label=(str, ""), score=(float, 0.0), enabled=(bool, True))
+
+    definitions: typing.Dict[str, typing.Any] = {}
+
+    for index in range(fields):
+        definitions["example_field_%d" % index] = [(int, index), (str, "value-%d" % index), (float, index / 3), (bool, index % 2 == 0)][index % 4]
+
+    return pydantic.create_model("Large", __base__=polyium.models.internal.base.Model, items=(typing.List[item], []), **definitions)
+
+def measure(function: typing.Callable[[], typing.Any], iterations: int) -> float:
+    """
+    Returns the median wall-clock time of a function, in milliseconds.
+    """
+
+    samples: typing.List[float] = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        function()
+
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+def report(title: str, encode: typing.Callable[[str], bytes], expectation: typing.Any, iterations: int) -> int:
+    """
+    Writes a table of size and timing per encoding, and returns the number of failure(s).
+    """
+
+    failures = 0
+
+    sys.stdout.write("%s\n" % title)
+    sys.stdout.write("    %-12s %12s %12s %12s\n" % ("encoding", "bytes", "encode", "decode"))
+
+    baseline = len(encode("pretty"))
+
+    for name, encoding in polyium.utilities.encodings.encodings.items():
+        content = encode(name)
+
+        serialization = measure(lambda: encode(name), iterations)
+        deserialization = measure(lambda: encoding.decode(content), iterations)
+
+        valid = encoding.decode(content) == expectation
+
+        sys.stdout.write("    %-12s %12d %10.2fms %10.2fms%s\n" % (name, len(content), serialization, deserialization, "" if valid else " (round-trip mismatch)"))
+
+        failures += int(not valid) + int(len(content) > baseline)
+
+    return failures
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Output encoding benchmark.")
+
+    parser.add_argument("--fields", type=int, default=500, help="the number of field(s) of the large model")
+    parser.add_argument("--items", type=int, default=200, help="the number of nested item(s) of the dumped instance")
+    parser.add_argument("--iterations", type=int, default=5, help="the number of iteration(s) per measurement")
+
+    namespace = parser.parse_args()
+
+    cls = model(namespace.fields)
+
+    instance = cls.model_validate({"items": [{"identifier": index, "label": "item-%d" % index, "score": index / 7, "enabled": bool(index % 3)} for index in range(namespace.items)]})
+
+    failures = report("Model Dump (%d Field(s), %d Item(s); median of %d)" % (namespace.fields, namespace.items, namespace.iterations), instance.encode, instance.model_dump(mode="json"), namespace.iterations)
+
+    sys.stdout.write("\n")
+
+    schema = cls.model_json_schema()
+
+    failures += report("JSON Schema (%d Field(s); median of %d)" % (namespace.fields, namespace.iterations), lambda name: polyium.utilities.encodings.encode(schema, name), json.loads(json.dumps(schema)), namespace.iterations)
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
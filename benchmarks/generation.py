@@ -0,0 +1,284 @@
+"""
+Measures schema generation and validation throughput, peak memory, and output size across synthetic model set(s), and
+compares the result(s) against a stored baseline.
+
+Every scenario synthesizes model(s) on top of `polyium.models.internal.base.Model` (i.e. `configuration.default()`):
+
+- `flat`: many small model(s) of mixed scalar field(s).
+- `nested`: chain(s) of model(s), each nesting the previous.
+- `wide`: model(s) with thousand(s) of field(s).
+- `enum`: model(s) with large `enum.Enum` and `typing.Literal` field(s).
+- `recursive`: self-referencing tree model(s).
+- `shared`: model(s) nesting a common pool of component model(s), so most definition(s) are shared.
+
+Each scenario runs in a freshly spawned process, so its peak resident set size is its own. Three phase(s) are measured:
+`build` (class creation, including pydantic's core schema), `generate` (`polyium.schemas.generator.generate`, i.e. JSON
+schema generation and serialization), and `validate` (`model_validate_json` of a synthesized instance per model).
+
+The run fails if any metric regresses beyond the threshold relative to the baseline: throughput (models/second) below
+`(1 - threshold)` of the baseline's, or peak memory and output bytes above `(1 + threshold)` of the baseline's.
+
+Usage:
+
+    python benchmarks/generation.py
+    python benchmarks/generation.py --scenario wide --scenario enum --threshold 0.3
+    python benchmarks/generation.py --update
+"""
+
+import argparse
+import concurrent.futures
+import enum
+import json
+import multiprocessing
+import pathlib
+import resource
+import sys
+import time
+import typing
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent.joinpath("src")))
+
+# The stored baseline, keyed by scenario.
+BASELINE = pathlib.Path(__file__).resolve().parent.joinpath("baseline.json")
+
+# Scenario shape(s): the number of model(s), and each scenario's own size parameter.
+SCENARIOS: typing.Dict[str, typing.Dict[str, int]] = {
+    "flat": {"models": 1000, "fields": 10},
+    "nested": {"models": 20, "depth": 25},
+    "wide": {"models": 2, "fields": 5000},
+    "enum": {"models": 20, "members": 2000},
+    "recursive": {"models": 200, "fields": 5},
+    "shared": {"models": 500, "components": 50, "references": 8},
+}
+
+# Metric(s) where a higher value is better; every other metric is better when lower.
+THROUGHPUT = ("build", "generate", "validate")
+
+def scalar(index: int) -> typing.Tuple[typing.Any, typing.Any, typing.Any]:
+    """
+    Returns a (type, default, JSON value) triple of a mixed scalar field, by index.
+    """
+
+    return [(int, 0, index), (str, "", "value-%d" % index), (float, 0.0, index / 3), (bool, False, index % 2 == 0)][index % 4]
+
+def synthesize(scenario: str, shape: typing.Dict[str, int]) -> typing.Tuple[typing.List[type], typing.List[str], int]:
+    """
+    Creates a scenario's model(s).
+
+    Returns
+    -------
+    tuple[list[type], list[str], int]
+        The model(s) to generate schema(s) for, a JSON instance per model, and the total number of model(s) built
+        (including nested model(s)).
+    """
+
+    import pydantic
+
+    import polyium.models.internal.base
+
+    base = polyium.models.internal.base.Model
+
+    models: typing.List[type] = []
+    instances: typing.List[str] = []
+    built = 0
+
+    if scenario in ("flat", "wide"):
+        for index in range(shape["models"]):
+            definitions = {"field_%d" % field: scalar(field)[:2] for field in range(shape["fields"])}
+
+            models.append(pydantic.create_model("%s_model_%d" % (scenario.title(), index), __base__=base, **definitions))
+            instances.append(json.dumps({"field_%d" % field: scalar(field)[2] for field in range(shape["fields"])}))
+
+        built = len(models)
+    elif scenario == "nested":
+        for chain in range(shape["models"]):
+            model = pydantic.create_model("Chain_%d_0" % chain, __base__=base, value=(int, 0))
+            instance: typing.Dict[str, typing.Any] = {"value": 0}
+
+            for depth in range(1, shape["depth"]):
+                model = pydantic.create_model("Chain_%d_%d" % (chain, depth), __base__=base, value=(int, 0), child=(model, ...))
+                instance = {"value": depth, "child": instance}
+
+            models.append(model)
+            instances.append(json.dumps(instance))
+
+        built = shape["models"] * shape["depth"]
+    elif scenario == "enum":
+        for index in range(shape["models"]):
+            members = ["member_%d_%d" % (index, member) for member in range(shape["members"])]
+
+            kind = enum.Enum("Kind_%d" % index, {member.upper(): member for member in members})
+
+            models.append(pydantic.create_model("Enum_model_%d" % index, __base__=base, kind=(kind, ...), literal=(typing.Literal[tuple(members)], ...)))
+            instances.append(json.dumps({"kind": members[-1], "literal": members[-1]}))
+
+        built = len(models)
+    elif scenario == "recursive":
+        for index in range(shape["models"]):
+            name = "Tree_%d" % index
+
+            definitions = {"field_%d" % field: scalar(field)[:2] for field in range(shape["fields"])}
+
+            model = pydantic.create_model(name, __base__=base, children=(typing.List[typing.ForwardRef(name)], []), **definitions)
+            model.model_rebuild(_types_namespace={name: model})
+
+            leaf = {"field_%d" % field: scalar(field)[2] for field in range(shape["fields"])}
+
+            models.append(model)
+            instances.append(json.dumps(dict(leaf, children=[dict(leaf, children=[leaf, leaf]), leaf])))
+
+        built = len(models)
+    elif scenario == "shared":
+        components: typing.List[type] = []
+        documents: typing.List[typing.Dict[str, typing.Any]] = []
+
+        for index in range(shape["components"]):
+            definitions = {"field_%d" % field: scalar(field)[:2] for field in range(10)}
+            document = {"field_%d" % field: scalar(field)[2] for field in range(10)}
+
+            # Every component nests another, forming a shallow tree of shared definition(s).
+            if index:
+                definitions["parent"] = (components[(index - 1) // 2], ...)
+                document["parent"] = documents[(index - 1) // 2]
+
+            components.append(pydantic.create_model("Component_%d" % index, __base__=base, **definitions))
+            documents.append(document)
+
+        for index in range(shape["models"]):
+            selection = sorted({(index * 7 + reference * 13) % shape["components"] for reference in range(shape["references"])})
+
+            models.append(pydantic.create_model("Shared_model_%d" % index, __base__=base, **{"component_%d" % component: (components[component], ...) for component in selection}))
+            instances.append(json.dumps({"component_%d" % component: documents[component] for component in selection}))
+
+        built = len(models) + len(components)
+    else:
+        raise ValueError("Unknown scenario \"%s\"" % scenario)
+
+    return models, instances, built
+
+def run(scenario: str, shape: typing.Dict[str, int], iterations: int) -> typing.Dict[str, float]:
+    """
+    Runs a single scenario; executed within a freshly spawned process.
+    """
+
+    import polyium.schemas.generator
+
+    start = time.perf_counter()
+
+    models, instances, built = synthesize(scenario, shape)
+
+    build = time.perf_counter() - start
+
+    generation = float("inf")
+    size = 0
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        results = list(polyium.schemas.generator.generate(models, jobs=1))
+
+        generation = min(generation, time.perf_counter() - start)
+
+        failures = [result for result in results if not result.successful]
+
+        if failures:
+            raise RuntimeError("Unable to Generate Schema (%s): %s" % (failures[0].task.name, failures[0].error))
+
+        size = sum(len(result.content.encode("utf-8")) for result in results)
+
+    validation = float("inf")
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        for model, instance in zip(models, instances):
+            model.model_validate_json(instance)
+
+        validation = min(validation, time.perf_counter() - start)
+
+    # Linux reports kilobytes; macOS, bytes.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+    return {
+        "build": built / build,
+        "generate": built / generation,
+        "validate": len(models) / validation,
+        "rss": rss,
+        "bytes": size,
+    }
+
+def compare(current: typing.Dict[str, float], baseline: typing.Dict[str, float], threshold: float) -> typing.List[str]:
+    """
+    Returns the name(s) of every metric regressing beyond the threshold.
+    """
+
+    regressions = []
+
+    for metric, value in current.items():
+        if metric not in baseline:
+            continue
+
+        if metric in THROUGHPUT:
+            regressed = value < baseline[metric] * (1 - threshold)
+        else:
+            regressed = value > baseline[metric] * (1 + threshold)
+
+        if regressed:
+            regressions.append(metric)
+
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Synthetic model schema generation benchmark suite.")
+
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), default=[], help="the scenario(s) to run; defaults to every scenario")
+    parser.add_argument("--iterations", type=int, default=3, help="the number of generation and validation iteration(s) per scenario (the fastest is reported)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="the relative regression tolerated before failing")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE, help="the baseline file")
+    parser.add_argument("--update", action="store_true", help="record the run's result(s) as the new baseline, rather than comparing")
+
+    namespace = parser.parse_args()
+
+    scenarios = namespace.scenario or list(SCENARIOS)
+
+    baseline: typing.Dict[str, typing.Any] = json.loads(namespace.baseline.read_text()) if namespace.baseline.is_file() else {}
+
+    context = multiprocessing.get_context("spawn")
+
+    results: typing.Dict[str, typing.Dict[str, float]] = {}
+
+    failures = 0
+
+    sys.stdout.write("%-10s %14s %14s %14s %12s %12s\n" % ("scenario", "build/s", "generate/s", "validate/s", "rss", "bytes"))
+
+    for scenario in scenarios:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(run, scenario, SCENARIOS[scenario], namespace.iterations).result()
+
+        results[scenario] = result
+
+        reference = baseline.get(scenario, {})
+
+        regressions = compare(result, reference.get("metrics", {}), namespace.threshold) if reference.get("shape") == SCENARIOS[scenario] else []
+
+        failures += len(regressions)
+
+        sys.stdout.write("%-10s %14.1f %14.1f %14.1f %10.1fMiB %12d%s\n" % (
+            scenario, result["build"], result["generate"], result["validate"], result["rss"] / 1048576, result["bytes"],
+            " (regressed: %s)" % ", ".join(regressions) if regressions else "" if reference else " (no baseline)",
+        ))
+
+    if namespace.update:
+        for scenario, result in results.items():
+            baseline[scenario] = {"shape": SCENARIOS[scenario], "metrics": result}
+
+        namespace.baseline.write_text(json.dumps(baseline, indent=4) + "\n")
+
+        sys.stdout.write("\nUpdated Baseline: %s\n" % namespace.baseline)
+
+        return 0
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
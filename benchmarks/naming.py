@@ -0,0 +1,134 @@
+"""
+Measures the cost of alias and title generation when building very large models, and fails if the naming engine is
+slower than the original, uncached conversion(s).
+
+Two measurement(s) are taken per style: the raw conversion throughput of every field name of a model (repeated, as when
+many models share field names), and the build time of a `pydantic.create_model` model with the style's configuration.
+The original `re.sub` / `split` / `join` generator(s) are measured identically as the baseline.
+
+Usage:
+
+    python benchmarks/naming.py --fields 5000 --models 20 --iterations 5
+"""
+
+import argparse
+import pathlib
+import re
+import statistics
+import sys
+import time
+import typing
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent.joinpath("src")))
+
+import pydantic
+
+import polyium.models.configuration
+import polyium.models.internal.naming
+
+def legacy_pascal_to_train_case(s: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "-", s).lower()
+
+def legacy_snake_case_to_train_case(snake: str) -> str:
+    partials = snake.split("_")
+
+    return "-".join(partial.lower() for partial in partials).lower()
+
+def legacy() -> pydantic.ConfigDict:
+    """
+    Returns the default configuration with the original, uncached generator(s).
+    """
+
+    configuration = polyium.models.configuration.default()
+
+    configuration.update(
+        alias_generator=legacy_snake_case_to_train_case,
+        model_title_generator=lambda model: legacy_pascal_to_train_case(model.__name__),
+        field_title_generator=lambda field_name, info: legacy_snake_case_to_train_case(field_name),
+    )
+
+    return configuration
+
+def names(fields: int) -> typing.List[str]:
+    return ["example_field_number_%d_value" % index for index in range(fields)]
+
+def convert(field: typing.Callable[[str], str], model: typing.Callable[[str], str], fields: typing.List[str], models: int, iterations: int) -> float:
+    """
+    Returns the median time (in milliseconds) to convert every field name, once per model, plus the model name(s).
+    """
+
+    samples: typing.List[float] = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        for index in range(models):
+            model("GeneratedExampleModel%d" % index)
+
+            for name in fields:
+                field(name)
+                field(name)
+
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+def build(configuration: pydantic.ConfigDict, fields: typing.List[str], iterations: int) -> float:
+    """
+    Returns the median time (in milliseconds) to build (and generate the JSON schema of) a model with the given field(s).
+    """
+
+    definitions: typing.Dict[str, typing.Any] = {name: (int, 0) for name in fields}
+
+    samples: typing.List[float] = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        model = pydantic.create_model("GeneratedExampleModel", __config__=configuration, **definitions)
+        model.model_json_schema()
+
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Alias and title generation benchmark.")
+
+    parser.add_argument("--fields", type=int, default=5000, help="the number of field(s) per model")
+    parser.add_argument("--models", type=int, default=20, help="the number of model(s) sharing the same field name(s), for the conversion benchmark")
+    parser.add_argument("--iterations", type=int, default=5, help="the number of iteration(s) per measurement")
+
+    namespace = parser.parse_args()
+
+    fields = names(namespace.fields)
+
+    baseline = convert(legacy_snake_case_to_train_case, legacy_pascal_to_train_case, fields, namespace.models, namespace.iterations)
+
+    sys.stdout.write("Conversion (%d Field(s) x %d Model(s))\n" % (namespace.fields, namespace.models))
+    sys.stdout.write("    %-16s %10.2fms\n" % ("legacy", baseline))
+
+    failures = 0
+
+    for name in ("train", "camel", "pascal", "screaming-snake"):
+        style = polyium.models.internal.naming.style(name)
+
+        style.field.cache_clear()
+        style.model.cache_clear()
+
+        median = convert(style.field, style.model, fields, namespace.models, namespace.iterations)
+
+        sys.stdout.write("    %-16s %10.2fms (%.1fx)\n" % (name, median, baseline / median if median else float("inf")))
+
+        failures += int(name == "train" and median > baseline)
+
+    sys.stdout.write("\nModel Build + Schema (%d Field(s))\n" % namespace.fields)
+    sys.stdout.write("    %-16s %10.2fms\n" % ("legacy", build(legacy(), fields, namespace.iterations)))
+
+    for name in ("train", "camel"):
+        sys.stdout.write("    %-16s %10.2fms\n" % (name, build(polyium.models.configuration.default(style=name), fields, namespace.iterations)))
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
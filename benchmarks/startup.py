@@ -0,0 +1,125 @@
+"""
+Measures the command-line's cold start-up latency, and fails if it exceeds a budget.
+
+Each command is executed repeatedly in a fresh interpreter, the same way the `json-schema-cli` console script invokes
+it, and the median wall-clock time is compared against the budget. A final execution under `python -X importtime`
+reports the heaviest import(s), and fails the run if any module that should only be imported by a subcommand (e.g.
+pydantic) is imported.
+
+Usage:
+
+    python benchmarks/startup.py --budget 50 --iterations 20
+"""
+
+import argparse
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+# Module(s) that must never be imported to serve `--version` or `--help`.
+forbidden = ("pydantic", "pydantic_core", "jsonschema", "packaging")
+
+# Mirrors the console script generated for the `json-schema-cli` entry-point.
+entrypoint = "import sys; from polyium.cli.main import executable; sys.argv[0] = 'json-schema-cli'; sys.exit(executable())"
+
+commands = {
+    "version": ["--version"],
+    "help": ["--help"],
+}
+
+def measure(arguments: typing.List[str], iterations: int, environment: typing.Dict[str, str]) -> typing.Tuple[float, typing.Dict[str, int]]:
+    """
+    Executes the command-line repeatedly, returning the median wall-clock time (in milliseconds), and the cumulative
+    import time (in microseconds) of every import from an additional `-X importtime` execution.
+    """
+
+    samples: typing.List[float] = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        process = subprocess.run([sys.executable, "-c", entrypoint, *arguments], capture_output=True, text=True, env=environment)
+
+        samples.append((time.perf_counter() - start) * 1000)
+
+        if process.returncode != 0:
+            raise RuntimeError("Command Failed (%s): %s" % (" ".join(arguments), process.stderr))
+
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", entrypoint, *arguments], capture_output=True, text=True, env=environment)
+
+    imports: typing.Dict[str, int] = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+
+        if cumulative.strip().isdigit():
+            imports[name.strip()] = int(cumulative)
+
+    return statistics.median(samples), imports
+
+def baseline(iterations: int, environment: typing.Dict[str, str]) -> float:
+    """
+    Returns the median wall-clock time (in milliseconds) of an empty interpreter start-up.
+    """
+
+    samples: typing.List[float] = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        subprocess.run([sys.executable, "-c", "pass"], capture_output=True, env=environment)
+
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Command-line start-up latency benchmark.")
+
+    parser.add_argument("--budget", type=float, default=50.0, help="the maximum median wall-clock time per command, in milliseconds")
+    parser.add_argument("--iterations", type=int, default=20, help="the number of execution(s) per command")
+    parser.add_argument("--top", type=int, default=8, help="the number of heaviest import(s) to report")
+
+    namespace = parser.parse_args()
+
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [str(pathlib.Path(__file__).resolve().parent.parent.joinpath("src")), environment.get("PYTHONPATH")]))
+
+    # Warm the filesystem and bytecode cache(s).
+    measure(["--version"], 1, environment)
+
+    interpreter = baseline(namespace.iterations, environment)
+
+    sys.stdout.write("Interpreter Baseline: %.1fms\n" % interpreter)
+
+    failures = 0
+
+    for name, arguments in commands.items():
+        median, imports = measure(arguments, namespace.iterations, environment)
+
+        status = "OK" if median <= namespace.budget else "OVER BUDGET"
+
+        sys.stdout.write("\n%s: %.1fms (%.1fms over baseline, budget %.1fms) - %s\n" % (name, median, median - interpreter, namespace.budget, status))
+
+        # Cumulative import time(s) are inflated by -X importtime itself; they're relative indicator(s) only.
+        for module, cumulative in sorted(imports.items(), key=lambda item: item[1], reverse=True)[:namespace.top]:
+            sys.stdout.write("    %8.2fms  %s\n" % (cumulative / 1000, module))
+
+        violations = sorted(module for module in imports if module.split(".")[0] in forbidden)
+
+        if violations:
+            sys.stdout.write("    Forbidden Import(s): %s\n" % ", ".join(violations))
+
+        failures += int(median > namespace.budget) + int(bool(violations))
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Measures the validation throughput of compiled validator(s) (`polyium.validation.compiler`) against `jsonschema`'s
+`Draft202012Validator`, on the schema(s) this tool emits for the synthetic model set(s) of `generation.py`.
+
+Every scenario's schema(s) are generated by `polyium.schemas.generator.schema`, and validated against the scenario's
+synthesized instance per model, plus seeded record(s) sampled from each schema (`polyium.schemas.sampling`), half of
+which are corrupted so that failure path(s) are measured too. Three measurement(s) are reported per scenario:
+
+- `compile`: the time to compile every schema, for `jsonschema` (`polyium.validation.validators.compile`, including
+  the metaschema check), and for the compiler both cold (checking and generating the source) and warm (loading the
+  stored module).
+- `is_valid`: instance(s) per second, stopping at the first failure.
+- `errors`: instance(s) per second, collecting every failure.
+
+The run fails if any compiled validator disagrees with `jsonschema` upon an instance's validity.
+
+Usage:
+
+    python benchmarks/validation.py
+    python benchmarks/validation.py --scenario flat --scenario recursive --records 500
+"""
+
+import argparse
+import json
+import pathlib
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import typing
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent.joinpath("src")))
+
+import generation
+
+import polyium.schemas.generator
+import polyium.schemas.sampling
+import polyium.validation.compiler
+import polyium.validation.validators
+
+# Scenario shape(s), scaled down from `generation.SCENARIOS` to keep sampling and `jsonschema` validation tractable.
+SCENARIOS: typing.Dict[str, typing.Dict[str, int]] = {
+    "flat": {"models": 100, "fields": 10},
+    "nested": {"models": 5, "depth": 25},
+    "wide": {"models": 1, "fields": 1000},
+    "enum": {"models": 5, "members": 500},
+    "recursive": {"models": 50, "fields": 5},
+    "shared": {"models": 50, "components": 50, "references": 8},
+}
+
+def measure(function: typing.Callable[[], typing.Any], iterations: int) -> float:
+    """
+    Returns the median wall-clock time of a function, in seconds.
+    """
+
+    samples: typing.List[float] = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+
+        function()
+
+        samples.append(time.perf_counter() - start)
+
+    return statistics.median(samples)
+
+def corrupt(instance: typing.Any, index: int) -> typing.Any:
+    """
+    Replaces one (nested) property of an object with a value of the wrong type, deterministically by index.
+    """
+
+    if not isinstance(instance, dict) or not instance:
+        return [instance]
+
+    key = sorted(instance)[index % len(instance)]
+
+    if isinstance(instance[key], dict) and index % 3:
+        return dict(instance, **{key: corrupt(instance[key], index // 3)})
+
+    return dict(instance, **{key: {"corrupted": index}})
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compiled validator benchmark.")
+
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), default=[], help="the scenario(s) to run; defaults to every scenario")
+    parser.add_argument("--records", type=int, default=200, help="the number of sampled record(s) per schema")
+    parser.add_argument("--iterations", type=int, default=3, help="the number of iteration(s) per measurement (the median is reported)")
+
+    namespace = parser.parse_args()
+
+    failures = 0
+
+    directory = pathlib.Path(tempfile.mkdtemp(prefix="json-schema-cli-validators-"))
+
+    sys.stdout.write("%-10s %8s %10s %26s %28s %28s\n" % ("scenario", "schemas", "instances", "compile (jsonschema/cold/warm)", "is_valid/s (jsonschema/compiled)", "errors/s (jsonschema/compiled)"))
+
+    try:
+        for scenario in namespace.scenario or list(SCENARIOS):
+            models, documents, _ = generation.synthesize(scenario, SCENARIOS[scenario])
+
+            schemas = [polyium.schemas.generator.schema(model) for model in models]
+
+            instances: typing.List[typing.List[typing.Any]] = []
+
+            for schema, document in zip(schemas, documents):
+                records = [json.loads(line) for line in b"".join(polyium.schemas.sampling.stream(schema, namespace.records, seed=1, jobs=1)).splitlines()]
+
+                instances.append([json.loads(document)] + [corrupt(record, index) if index % 2 else record for index, record in enumerate(records)])
+
+            shutil.rmtree(directory, ignore_errors=True)
+
+            start = time.perf_counter()
+            references = [polyium.validation.validators.compile(schema) for schema in schemas]
+            reference = time.perf_counter() - start
+
+            start = time.perf_counter()
+            compiled = [polyium.validation.compiler.compile(schema, directory=directory) for schema in schemas]
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            compiled = [polyium.validation.compiler.compile(schema, directory=directory) for schema in schemas]
+            warm = time.perf_counter() - start
+
+            for validator, schema in zip(compiled, schemas):
+                if not isinstance(validator, polyium.validation.compiler.Compiled):
+                    sys.stdout.write("    Fell Back to jsonschema: %s\n" % schema.get("title"))
+
+            for validators, group in zip(zip(references, compiled), instances):
+                for instance in group:
+                    failures += int(validators[0].is_valid(instance) != validators[1].is_valid(instance))
+
+            count = sum(len(group) for group in instances)
+
+            def validate(validators: typing.List[typing.Any], method: typing.Callable[[typing.Any, typing.Any], typing.Any]) -> float:
+                def function() -> None:
+                    for validator, group in zip(validators, instances):
+                        for instance in group:
+                            method(validator, instance)
+
+                return count / measure(function, namespace.iterations)
+
+            reference_valid = validate(references, lambda validator, instance: validator.is_valid(instance))
+            compiled_valid = validate(compiled, lambda validator, instance: validator.is_valid(instance))
+            reference_errors = validate(references, lambda validator, instance: list(validator.iter_errors(instance)))
+            compiled_errors = validate(compiled, lambda validator, instance: validator.errors(instance))
+
+            sys.stdout.write("%-10s %8d %10d %9.0fms/%5.0fms/%5.0fms %11.0f/%9.0f (%4.1fx) %11.0f/%9.0f (%4.1fx)\n" % (
+                scenario,
+                len(schemas),
+                count,
+                reference * 1000,
+                cold * 1000,
+                warm * 1000,
+                reference_valid,
+                compiled_valid,
+                compiled_valid / reference_valid,
+                reference_errors,
+                compiled_errors,
+                compiled_errors / reference_errors,
+            ))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if failures:
+        sys.stdout.write("\n%d Validity Mismatch(es)\n" % failures)
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
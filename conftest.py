@@ -4,6 +4,8 @@ Various fixtures for pytest that help automate and generate report(s).
 
 # https://pytest-with-eric.com/hooks/pytest-hooks/#Example-pytest-sessionstart-and-pytest-sessionfinish-Hooks
 
+import pathlib
+
 import pytest
 import logging
 
@@ -14,6 +16,14 @@ def pytest_configure(config: pytest.Config):
         "markers", "description: Adds a description to the test."
     )
 
+@pytest.fixture()
+def directory(tmp_path: pathlib.Path) -> pathlib.Path:
+    """
+    Provides an empty, per-test temporary directory; pytest removes it (along with all but the most recent run's).
+    """
+
+    return tmp_path
+
 @pytest.hookimpl()
 def pytest_sessionstart(session: pytest.Session):
     logger.debug("Starting Testing Session: %s", session.name)
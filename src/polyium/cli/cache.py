@@ -0,0 +1,69 @@
+"""
+The cache subcommand reports on, and prunes, the persistent schema cache.
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+import polyium.schemas.cache
+
+logger = logging.getLogger(__name__)
+
+def register(parser: argparse.ArgumentParser) -> None:
+    """
+    Registers the subcommand's argument(s).
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The subcommand's parser.
+    """
+
+    parser.description = "Inspect or prune the persistent schema cache."
+
+    parser.add_argument("--cache-directory", type=str, default=None, metavar="DIRECTORY", help="the schema cache directory; defaults to a directory under the system's temporary directory")
+
+    actions = parser.add_subparsers(title="actions", dest="action", metavar="ACTION", required=True)
+
+    actions.add_parser("stats", help="display the cache's location, entry count, and size")
+
+    prune = actions.add_parser("prune", help="evict least-recently used cache entries")
+    prune.add_argument("--cache-size", type=int, default=polyium.schemas.cache.MAXIMUM_BYTES, metavar="BYTES", help="the maximum size of the cache after pruning, in bytes")
+    prune.add_argument("--entries", type=int, default=None, help="the maximum number of entries after pruning")
+    prune.add_argument("--all", action="store_true", help="evict all entries")
+
+    parser.set_defaults(function=execute)
+
+def execute(namespace: argparse.Namespace) -> int:
+    """
+    Executes the subcommand.
+
+    Parameters
+    ----------
+    namespace : argparse.Namespace
+        The parsed command-line argument(s).
+
+    Returns
+    -------
+    int
+        The process exit status.
+    """
+
+    import polyium.models.base
+
+    directory = namespace.cache_directory or polyium.schemas.cache.default(polyium.models.base.Base().temporary_directory)
+
+    cache = polyium.schemas.cache.Cache(directory)
+
+    if namespace.action == "prune":
+        evicted = cache.prune(maximum=0 if namespace.all else namespace.cache_size, entries=0 if namespace.all else namespace.entries)
+
+        logger.info("Evicted %d Cache Entries", evicted)
+
+    statistics = cache.statistics()
+
+    sys.stdout.write("%s\n" % json.dumps({"directory": str(statistics.directory), "entries": statistics.entries, "bytes": statistics.bytes}, indent=4))
+
+    return 0
@@ -0,0 +1,79 @@
+"""
+The diff subcommand compares two directories of JSON schema(s), reporting (breaking) change(s).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+def register(parser: argparse.ArgumentParser) -> None:
+    """
+    Registers the subcommand's argument(s).
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The subcommand's parser.
+    """
+
+    parser.description = "Structurally compare two directories of JSON schema(s), classifying change(s) as breaking or non-breaking."
+
+    parser.add_argument("old", metavar="OLD", help="the baseline (e.g. previously released) schema directory")
+    parser.add_argument("new", metavar="NEW", help="the regenerated schema directory")
+    parser.add_argument("--format", type=str, choices=["text", "json"], default="text", help="the report's output format")
+    parser.add_argument("--fail-on", type=str, choices=["breaking", "any", "never"], default="breaking", help="the change(s) resulting in a non-zero exit status")
+
+    parser.set_defaults(function=execute)
+
+def execute(namespace: argparse.Namespace) -> int:
+    """
+    Executes the subcommand.
+
+    Parameters
+    ----------
+    namespace : argparse.Namespace
+        The parsed command-line argument(s).
+
+    Returns
+    -------
+    int
+        The process exit status: 1 if any change matched `--fail-on`, otherwise 0.
+    """
+
+    import pathlib
+
+    import polyium.schemas.diff
+
+    for directory in (namespace.old, namespace.new):
+        if not pathlib.Path(directory).is_dir():
+            logger.error("Schema Directory Not Found: %s", directory)
+
+            return 1
+
+    try:
+        report = polyium.schemas.diff.diff(namespace.old, namespace.new)
+    except (OSError, ValueError) as e:
+        logger.error("Unable to Compare Schema(s): %s", e)
+
+        return 1
+
+    if namespace.format == "json":
+        sys.stdout.write("%s\n" % json.dumps(report.serialize(), indent=4))
+    else:
+        for change in report.changes:
+            sys.stdout.write("%s %s:%s: %s\n" % ("BREAKING" if change.breaking else "        ", change.schema, change.pointer, change.kind))
+
+    logger.info("Compared %d Schema(s) (%d Unchanged): %d Change(s), %d Breaking", report.schemas, report.unchanged, len(report.changes), len(report.breaking))
+
+    if namespace.fail_on == "breaking":
+        return 1 if report.breaking else 0
+
+    if namespace.fail_on == "any":
+        return 1 if report.changes else 0
+
+    return 0
@@ -0,0 +1,252 @@
+"""
+The generate subcommand writes the JSON schema(s) of many `module:Model` target(s) to the artifacts directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import pathlib
+import sys
+import typing
+
+import polyium.internal.pool
+import polyium.schemas.cache
+import polyium.schemas.optimization
+
+logger = logging.getLogger(__name__)
+
+def register(parser: argparse.ArgumentParser) -> None:
+    """
+    Registers the subcommand's argument(s).
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The subcommand's parser.
+    """
+
+    parser.description = "Generate JSON schema(s) from dynamically imported pydantic model(s)."
+
+    parser.add_argument("targets", nargs="*", metavar="module:Model", help="target model specification(s); glob pattern(s) are supported, e.g. \"myapp.models.*:*\"")
+    parser.add_argument("--package", action="append", default=[], metavar="PACKAGE", help="target every model within a package, discovered from source without importing model-free module(s); may be repeated")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="the number of worker process(es); defaults to the system's cpu count")
+    parser.add_argument("--max-tasks-per-worker", type=int, default=polyium.internal.pool.MAXIMUM_TASKS, metavar="TASKS", help="the number of task(s) after which a worker process is replaced")
+    parser.add_argument("--max-worker-memory", type=int, default=polyium.internal.pool.MAXIMUM_MEMORY, metavar="BYTES", help="the resident set size beyond which a worker process is replaced")
+    parser.add_argument("--mode", type=str, choices=["validation", "serialization"], default="validation", help="the json schema generation mode")
+    parser.add_argument("--indent", type=int, default=4, help="the output's json indentation")
+    parser.add_argument("--output-profile", type=str, choices=list(polyium.schemas.optimization.profiles), default="default", help="the optimization pass(es) applied to every schema; \"runtime\" emits the smallest schema(s), \"docs\" retains every annotation")
+    parser.add_argument("--optimize", action="append", default=[], choices=list(polyium.schemas.optimization.passes), metavar="PASS", help="apply an additional optimization pass; may be repeated")
+    parser.add_argument("--bundle", action="store_true", help="consolidate every model's shared definition(s) into a single, deduplicated \"defs.json\" document")
+    parser.add_argument("--bundle-base-uri", type=str, default=None, metavar="URI", help="the base uri of every bundled document's \"$id\", against which reference(s) to \"defs.json\" resolve")
+    parser.add_argument("--format", type=str, choices=["pretty", "minified", "canonical", "cbor", "msgpack"], default="pretty", help="the output encoding; \"pretty\" honors --indent")
+
+    parser_group_1 = parser.add_argument_group("directories")
+    parser_group_1.add_argument("--working-directory", type=str, default=".", metavar="DIRECTORY", help="the runtime working directory, additionally added to the module search path")
+    parser_group_1.add_argument("--artifacts-directory", type=str, default="artifacts", metavar="DIRECTORY", help="the output directory; relative path(s) are resolved using the working directory")
+    parser_group_1.add_argument("--write-concurrency", type=int, default=16, metavar="WRITES", help="the maximum number of concurrent artifact write(s), overlapped with generation")
+
+    parser_group_2 = parser.add_argument_group("caching")
+    parser_group_2.add_argument("--cache-directory", type=str, default=None, metavar="DIRECTORY", help="the schema cache directory; defaults to a directory under the system's temporary directory")
+    parser_group_2.add_argument("--cache-size", type=int, default=polyium.schemas.cache.MAXIMUM_BYTES, metavar="BYTES", help="the maximum size of the schema cache, in bytes")
+    parser_group_2.add_argument("--no-cache", action="store_true", help="disable the schema cache")
+
+    parser.set_defaults(function=execute)
+
+def write(directory: pathlib.Path, results: typing.Iterable[polyium.schemas.generator.Result], bundle: bool = False, indent: typing.Optional[int] = 4, encoding: str = "pretty", concurrency: int = 16, base: typing.Optional[str] = None) -> typing.Tuple[int, int]:
+    """
+    Writes successfully generated schema(s) to the given directory, one file per model, and logs any failure(s).
+
+    Unchanged schema file(s) are skipped, and changed file(s) are replaced atomically (see `polyium.schemas.writer`);
+    write(s) are performed concurrently, while result(s) are still being generated (see `polyium.schemas.pipeline`).
+
+    Parameters
+    ----------
+    directory : pathlib.Path
+        The output directory.
+    results : typing.Iterable[polyium.schemas.generator.Result]
+        The generation result(s).
+    bundle : bool
+        Whether to consolidate the schema(s)' definition(s) into a shared document (see `polyium.schemas.bundle`).
+    indent : int | None
+        The bundled output's json indentation.
+    encoding : str
+        The output encoding (see `polyium.utilities.encodings`); other than "pretty", schema(s) are re-encoded, and
+        binary encoding(s) are written with their own file extension.
+    concurrency : int
+        The maximum number of concurrent write(s).
+    base : str | None
+        The bundled document(s)' base uri; defaults to `polyium.schemas.bundle.BASE`.
+
+    Returns
+    -------
+    tuple[int, int]
+        The total number of result(s), and the number of failure(s).
+    """
+
+    import polyium.internal.profiling
+    import polyium.schemas.pipeline
+    import polyium.schemas.writer
+    import polyium.utilities.encodings
+
+    profiler = polyium.internal.profiling.profiler
+
+    total, failures = 0, 0
+
+    schemas: typing.Dict[str, str] = {}
+
+    output = polyium.utilities.encodings.encoding(encoding)
+
+    with polyium.schemas.writer.Writer(directory) as writer, polyium.schemas.pipeline.Pipeline(writer, concurrency=concurrency) as pipeline:
+        def emit(name: str, content: str) -> None:
+            if output.name == "pretty":
+                pipeline.submit("%s.json" % name, content + "\n")
+            else:
+                pipeline.submit("%s%s" % (name, output.extension), output.encode(json.loads(content)) + (b"" if output.binary else b"\n"))
+
+        for result in results:
+            total += 1
+
+            if not result.successful:
+                logger.error("Unable to Generate Schema (%s): %s", result.task.name, result.error)
+
+                failures += 1
+
+                continue
+
+            if bundle:
+                schemas[result.task.name] = result.content
+            else:
+                emit(result.task.name, result.content)
+
+        if bundle:
+            import polyium.schemas.bundle
+
+            with profiler.phase("bundle", "bundle"):
+                consolidated = polyium.schemas.bundle.consolidate(schemas, indent=indent, base=base or polyium.schemas.bundle.BASE)
+
+            for name, content in consolidated.documents.items():
+                emit(name.removesuffix(".json"), content)
+
+            logger.info(
+                "Bundled %d Definition(s) into %d Unique Definition(s); %d Bytes Reduced to %d Bytes (%.1fx)",
+                consolidated.statistics.definitions, consolidated.statistics.unique, consolidated.statistics.before, consolidated.statistics.after, consolidated.statistics.ratio,
+            )
+
+    statistics = writer.statistics()
+
+    logger.info("Wrote %d Schema(s) (%d Bytes), Skipped %d Unchanged Schema(s) (%d Bytes)", statistics.written, statistics.bytes, statistics.skipped, statistics.saved)
+
+    return total, failures
+
+def discover(packages: typing.Iterable[str], cache: typing.Optional[polyium.schemas.cache.Cache] = None, jobs: typing.Optional[int] = None) -> typing.List[polyium.schemas.targets.Specification]:
+    """
+    Discovers every model within the given package(s) from source, updating the cache's persisted discovery index.
+
+    Returns
+    -------
+    list[polyium.schemas.targets.Specification]
+        An explicit specification per discovered model.
+    """
+
+    import polyium.internal.profiling
+    import polyium.schemas.discovery
+
+    with polyium.internal.profiling.profiler.phase("discover", "discovery"):
+        index = polyium.schemas.discovery.Index(None if cache is None else cache.index)
+        index.load()
+
+        parsed = index.update(packages, jobs=jobs)
+
+        index.save()
+
+        specifications = index.specifications(packages)
+
+    logger.info("Discovered %d Model(s) in %d Module(s); Parsed %d Source File(s)", len(specifications), len({specification.module for specification in specifications}), parsed)
+
+    return specifications
+
+class Unresolved(Exception):
+    """
+    Raised when target(s) cannot be resolved while result(s) are being generated, with the original failure chained as
+    its cause; distinguishes resolution failure(s) from failure(s) of the result(s)' consumer (e.g. a failed write).
+    """
+
+def resolved(results: typing.Iterable[polyium.schemas.generator.Result]) -> typing.Iterator[polyium.schemas.generator.Result]:
+    """
+    Yields generation result(s); as target(s) are only resolved upon iteration (see `polyium.schemas.generator.batch`),
+    resolution failure(s) are re-raised as :class:`Unresolved`.
+    """
+
+    try:
+        yield from results
+    except (ImportError, LookupError, ValueError) as e:
+        raise Unresolved(str(e)) from e
+
+def execute(namespace: argparse.Namespace) -> int:
+    """
+    Executes the subcommand.
+
+    Parameters
+    ----------
+    namespace : argparse.Namespace
+        The parsed command-line argument(s).
+
+    Returns
+    -------
+    int
+        The process exit status.
+    """
+
+    import polyium.models.base
+    import polyium.schemas.generator
+    import polyium.schemas.targets
+
+    settings = polyium.models.base.Base(working_directory=namespace.working_directory, artifacts_directory=namespace.artifacts_directory, create_artifacts_directory=True)
+
+    if str(settings.working_directory) not in sys.path:
+        sys.path.insert(0, str(settings.working_directory))
+
+    cache = None
+
+    if not namespace.no_cache:
+        cache = polyium.schemas.cache.Cache(namespace.cache_directory or polyium.schemas.cache.default(settings.temporary_directory), maximum=namespace.cache_size)
+
+    targets: typing.List[typing.Union[str, polyium.schemas.targets.Specification]] = list(namespace.targets)
+
+    if not targets and not namespace.package:
+        logger.error("At Least One Target or Package is Required")
+
+        return 1
+
+    if namespace.bundle and namespace.format in ("cbor", "msgpack"):
+        logger.error("Bundled Schema(s) Reference \"defs.json\"; a Binary Format (%s) is Unsupported", namespace.format)
+
+        return 1
+
+    try:
+        if namespace.package:
+            targets.extend(discover(namespace.package, cache=cache, jobs=namespace.jobs))
+    except (ImportError, LookupError, ValueError) as e:
+        logger.error("Unable to Discover Target(s): %s", e)
+
+        return 1
+
+    results = resolved(polyium.schemas.generator.batch(targets, jobs=namespace.jobs, cache=cache, max_tasks=namespace.max_tasks_per_worker, max_memory=namespace.max_worker_memory, mode=namespace.mode, indent=namespace.indent, passes=polyium.schemas.optimization.select(namespace.output_profile, namespace.optimize)))
+
+    try:
+        total, failures = write(settings.artifacts_directory, results, bundle=namespace.bundle, indent=namespace.indent, encoding=namespace.format, concurrency=namespace.write_concurrency, base=namespace.bundle_base_uri)
+    except Unresolved as e:
+        logger.error("Unable to Resolve Target(s): %s", e)
+
+        return 1
+    except OSError as e:
+        logger.error("Unable to Write Schema(s) (%s): %s", str(settings.artifacts_directory), e)
+
+        return 1
+
+    logger.info("Generated %d Schema(s) in: %s", total - failures, str(settings.artifacts_directory))
+
+    return 1 if failures else 0
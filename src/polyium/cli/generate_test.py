@@ -0,0 +1,47 @@
+import argparse
+import pathlib
+
+import pytest
+import logging
+
+import polyium.schemas.writer
+import polyium.cli.generate as module
+
+logger = logging.getLogger(__name__)
+
+def namespace(*arguments: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+
+    module.register(parser)
+
+    return parser.parse_args(list(arguments))
+
+def test_execute(request: pytest.FixtureRequest, directory: pathlib.Path):
+    assert module.execute(namespace("--jobs", "1", "--no-cache", "--artifacts-directory", str(directory), "polyium.models.base:Base")) == 0
+
+    assert directory.joinpath("polyium.models.base.Base.json").is_file()
+
+def test_execute_failures(request: pytest.FixtureRequest, directory: pathlib.Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture):
+    """
+    Tests that unresolvable target(s), and failed write(s), are reported separately.
+    """
+
+    arguments = ("--jobs", "1", "--no-cache", "--artifacts-directory", str(directory))
+
+    with caplog.at_level(logging.ERROR, logger=module.__name__):
+        assert module.execute(namespace(*arguments, "polyium.models.base:Missing")) == 1
+
+    assert "Unable to Resolve Target(s)" in caplog.text
+
+    caplog.clear()
+
+    def fail(*args, **kwargs):
+        raise PermissionError("Read-Only File System")
+
+    monkeypatch.setattr(polyium.schemas.writer.Writer, "write", fail)
+
+    with caplog.at_level(logging.ERROR, logger=module.__name__):
+        assert module.execute(namespace(*arguments, "polyium.models.base:Base")) == 1
+
+    assert "Unable to Write Schema(s)" in caplog.text
+    assert "Unable to Resolve" not in caplog.text
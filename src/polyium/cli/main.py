@@ -1,32 +1,24 @@
 """
 An example entrypoint.
+
+Start-up latency is kept to a minimum: `--version` is served without argument parsing or logging, and a subcommand's
+module (and thereby its heavier dependencies, such as pydantic or jsonschema) is only imported when the subcommand is
+invoked.
 """
 
 import sys
-import re
-import typing
-
-import logging
-import argparse
-
-handler = logging.StreamHandler()
-
-logger = logging.getLogger(__name__)
-
-
-class Formatter(logging.Formatter):
-    expression = r"(?<!\w)'([^\s']+)'(?!\w)"
-    substitution = r'"\1"'
-
-    def format(self, record) -> str:
-        # Modify the record or format the message as needed.
-        v = super().format(record)  # .replace("'", "%s" % '"')
-
-        return re.sub(self.expression, self.substitution, v)
-
-formatter = Formatter("[%(levelname)s] (%(asctime)s) (%(name)s) %(message)s")
-
-handler.setFormatter(formatter)
+import importlib
+
+# The subcommand name(s), mapped to the module implementing `register(parser)`, and the subcommand's help.
+commands = {
+    "generate": ("polyium.cli.generate", "generate json schema(s) from pydantic model(s)"),
+    "cache": ("polyium.cli.cache", "inspect or prune the schema cache"),
+    "watch": ("polyium.cli.watch", "incrementally regenerate json schema(s) upon source change(s)"),
+    "validate": ("polyium.cli.validate", "validate json document(s) against a json schema"),
+    "diff": ("polyium.cli.diff", "classify the change(s) between two directories of json schema(s)"),
+    "serve": ("polyium.cli.serve", "serve command-line invocation(s) from a warm daemon process"),
+    "sample": ("polyium.cli.sample", "stream seeded instance(s) of a json schema as ndjson"),
+}
 
 def version():
     import polyium.internal.versioning
@@ -37,10 +29,25 @@ def version():
 
     exit(0)
 
-def executable():
-    logging.basicConfig(level=logging.DEBUG, datefmt="%Y-%m-%dT%H:%M:%SZ")
-    logger.addHandler(handler)
-    logger.propagate = False
+def parser(arguments: list):
+    """
+    Creates the command-line argument parser.
+
+    Only the invoked subcommand's module is imported, and only its parser is fully registered; all other subcommand(s)
+    are registered by name and help alone.
+
+    Parameters
+    ----------
+    arguments : list[str]
+        The command-line argument(s), excluding the program name.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The argument parser.
+    """
+
+    import argparse
 
     # Create an argument parser object.
     parser = argparse.ArgumentParser(description="Python Example Template")
@@ -51,15 +58,159 @@ def executable():
     parser_group_1.add_argument("--verbose", type=bool, help="toggle verbose output", metavar="")
     parser_group_1.add_argument("--log-level", type=str, choices=["DEBUG", "INFO", "ERROR"], metavar="LEVEL", help="the global logging level to display", required=False, default="INFO")
 
+    parser_group_2 = parser.add_argument_group("profiling")
+    parser_group_2.add_argument("--profile", action="store_true", help="time each phase of work, writing a summary to stderr and a chrome trace-event file to the artifacts directory")
+    parser_group_2.add_argument("--profile-memory", action="store_true", help="additionally trace each phase's peak memory allocation(s) with tracemalloc (slower)")
+
+    subparsers = parser.add_subparsers(title="commands", dest="command", metavar="COMMAND")
+
+    selection = next((argument for argument in arguments if argument in commands), None)
+
+    for name, (module, description) in commands.items():
+        subparser = subparsers.add_parser(name, help=description)
+
+        if name == selection:
+            importlib.import_module(module).register(subparser)
+
+    return parser
+
+def executable():
+    arguments = sys.argv[1:]
+
+    # Fast-path: the version requires neither argument parsing, nor logging.
+    if arguments in (["-v"], ["--version"]):
+        version()
+
+    # Fast-path: forward the invocation to a warm daemon, if one is running (see `polyium.daemon`).
+    selection = next((argument for argument in arguments if argument in commands), None)
+
+    if selection is not None:
+        import polyium.daemon.protocol
+
+        status = polyium.daemon.protocol.forward(arguments) if selection in polyium.daemon.protocol.forwarded else None
+
+        if status is not None:
+            sys.exit(status)
+
     # Parse arguments.
-    namespace = parser.parse_args()
+    namespace = parser(arguments).parse_args(arguments)
 
     arguments = vars(namespace)
 
     if arguments["version"]:
         version()
 
+    import logging
+    import polyium.internal.logging.formatter
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(polyium.internal.logging.formatter.Formatter("[%(levelname)s] (%(asctime)s) (%(name)s) %(message)s"))
+
+    logger = logging.getLogger(__name__)
+
+    logging.basicConfig(level=arguments["log_level"], datefmt="%Y-%m-%dT%H:%M:%SZ")
+    logger.addHandler(handler)
+    logger.propagate = False
+
     logger.debug("Arguments: %r", arguments)
 
+    function = arguments.get("function")
+
+    if function is None:
+        return
+
+    sys.exit(dispatch(namespace))
+
+def dispatch(namespace) -> int:
+    """
+    Executes the parsed invocation's subcommand, profiling it if requested.
+
+    Returns
+    -------
+    int
+        The subcommand's exit status.
+    """
+
+    if namespace.profile or namespace.profile_memory:
+        return profile(namespace.function, namespace)
+
+    return namespace.function(namespace)
+
+def run(arguments: list) -> int:
+    """
+    Parses and executes a command-line invocation within the current process, without (re-)configuring logging; used by
+    the daemon (see `polyium.daemon.server`) to serve forwarded invocation(s).
+
+    Parameters
+    ----------
+    arguments : list[str]
+        The command-line argument(s), excluding the program name.
+
+    Returns
+    -------
+    int
+        The invocation's exit status.
+    """
+
+    namespace = parser(arguments).parse_args(arguments)
+
+    if namespace.version:
+        version()
+
+    import logging
+
+    logging.getLogger().setLevel(namespace.log_level)
+
+    if getattr(namespace, "function", None) is None:
+        return 0
+
+    return dispatch(namespace)
+
+def profile(function, namespace) -> int:
+    """
+    Executes a subcommand with profiling enabled, then writes the summary table to stderr, and the chrome trace-event
+    file to `<artifacts directory>/<command>.trace.json`.
+
+    Parameters
+    ----------
+    function : typing.Callable[[argparse.Namespace], int]
+        The subcommand's `execute` function.
+    namespace : argparse.Namespace
+        The parsed command-line argument(s).
+
+    Returns
+    -------
+    int
+        The subcommand's exit status.
+    """
+
+    import logging
+    import os
+
+    import polyium.internal.profiling
+
+    profiler = polyium.internal.profiling.enable(memory=namespace.profile_memory)
+
+    # Disabled (and its event(s) discarded) afterwards, as a daemon serves later invocation(s) within the same process.
+    try:
+        with profiler.phase(namespace.command, "command"):
+            status = function(namespace)
+
+        events = profiler.events()
+    finally:
+        polyium.internal.profiling.disable()
+
+    directory = os.path.join(getattr(namespace, "working_directory", "."), getattr(namespace, "artifacts_directory", "artifacts"))
+
+    path = os.path.join(directory, "%s.trace.json" % namespace.command)
+
+    polyium.internal.profiling.export(path, events)
+
+    sys.stderr.write("%s\n" % polyium.internal.profiling.summary(events))
+
+    logging.getLogger(__name__).info("Wrote %d Profiling Event(s) to: %s", len(events), path)
+
+    return status
+
 if __name__ == "__main__":
     executable()
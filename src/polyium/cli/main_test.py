@@ -0,0 +1,56 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Module(s) that must only be imported by the subcommand(s) requiring them.
+forbidden = ("pydantic", "jsonschema", "packaging")
+
+def modules(*arguments: str) -> set:
+    """
+    Executes the command-line in a fresh interpreter, and returns the name(s) of every imported module.
+    """
+
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [str(pathlib.Path(__file__).resolve().parents[2]), environment.get("PYTHONPATH")]))
+
+    # Never forward to a daemon that happens to be running.
+    environment["JSON_SCHEMA_CLI_SOCKET"] = ""
+
+    script = "import sys, atexit; atexit.register(lambda: sys.stderr.write('\\nMODULES:' + ','.join(sys.modules))); from polyium.cli.main import executable; executable()"
+
+    process = subprocess.run([sys.executable, "-c", script, *arguments], capture_output=True, text=True, env=environment)
+
+    assert process.returncode == 0, process.stderr
+
+    return set(process.stderr.rpartition("MODULES:")[-1].split(","))
+
+@pytest.mark.parametrize("arguments", [["--version"], ["--help"], ["generate", "--help"], ["watch", "--help"], ["validate", "--help"], ["diff", "--help"], ["serve", "--help"], ["sample", "--help"]])
+def test_lazy_imports(request: pytest.FixtureRequest, arguments: list):
+    """
+    Tests that start-up and help output(s) don't import any subcommand's heavier dependencies.
+    """
+
+    imported = modules(*arguments)
+
+    violations = sorted(module for module in imported if module.split(".")[0] in forbidden)
+
+    logger.debug("[%s] Imported %d Module(s); Violations: %s", request.node.name, len(imported), violations)
+
+    assert violations == []
+
+def test_lazy_subcommand_modules(request: pytest.FixtureRequest):
+    """
+    Tests that only the invoked subcommand's module is imported.
+    """
+
+    imported = modules("generate", "--help")
+
+    assert "polyium.cli.generate" in imported
+    assert "polyium.cli.watch" not in imported
+    assert "polyium.cli.cache" not in imported
@@ -0,0 +1,149 @@
+"""
+The sample subcommand streams seeded, reproducible instance(s) of a JSON schema (or a model) as newline-delimited JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import pathlib
+import sys
+import typing
+
+logger = logging.getLogger(__name__)
+
+def register(parser: argparse.ArgumentParser) -> None:
+    """
+    Registers the subcommand's argument(s).
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The subcommand's parser.
+    """
+
+    parser.description = "Stream seeded, reproducible instance(s) conforming to a JSON schema, or a pydantic model's schema, as NDJSON."
+
+    parser.add_argument("target", nargs="?", metavar="module:Model", help="the model whose schema is sampled; alternatively, see --schema")
+    parser.add_argument("--schema", type=str, default=None, metavar="FILE", help="the (generated) json schema to sample")
+    parser.add_argument("--mode", type=str, choices=["validation", "serialization"], default="validation", help="the json schema generation mode of a target model")
+    parser.add_argument("-n", "--count", type=int, default=1000, help="the number of record(s)")
+    parser.add_argument("--seed", type=int, default=0, help="the seed; the output is reproducible for a given seed, shard size, and distribution")
+    parser.add_argument("-o", "--output", type=str, default="-", metavar="FILE", help="the output file; defaults to standard output")
+    parser.add_argument("-j", "--jobs", type=int, default=None, metavar="N", help="the number of worker processes (default: cpu count)")
+    parser.add_argument("--shard-size", type=int, default=4096, metavar="RECORDS", help="the number of record(s) per shard (default: 4096)")
+    parser.add_argument("--working-directory", type=str, default=".", metavar="DIRECTORY", help="the runtime working directory, additionally added to the module search path")
+
+    parser_group_1 = parser.add_argument_group("distribution")
+    parser_group_1.add_argument("--distribution", type=str, choices=["uniform", "geometric"], default="uniform", help="the size distribution of string(s), array(s), and map(s); \"geometric\" favors small size(s)")
+    parser_group_1.add_argument("--max-items", type=int, default=8, metavar="N", help="the item(s) beyond the minimum of an array or map lacking a maximum")
+    parser_group_1.add_argument("--max-length", type=int, default=16, metavar="N", help="the character(s) beyond the minimum of a string lacking a maximum length")
+    parser_group_1.add_argument("--max-depth", type=int, default=4, metavar="N", help="the reference depth beyond which recursive structure(s) are kept minimal")
+    parser_group_1.add_argument("--edge-bias", type=float, default=0.1, metavar="PROBABILITY", help="the probability of an edge case: a minimum or maximum size, a boundary number, or the next enum value in turn")
+    parser_group_1.add_argument("--optional", type=float, default=0.5, metavar="PROBABILITY", help="the probability of including an optional property")
+
+    parser.set_defaults(function=execute)
+
+def load(namespace: argparse.Namespace) -> typing.Dict[str, typing.Any]:
+    """
+    Loads the `--schema` file, or generates the schema of the target model.
+
+    Raises
+    ------
+    ValueError
+        If neither (or both) a schema and a target are given, or the target doesn't resolve a single model.
+    """
+
+    if (namespace.schema is None) == (namespace.target is None):
+        raise ValueError("Either a Target or a Schema is Required")
+
+    if namespace.schema is not None:
+        return json.loads(pathlib.Path(namespace.schema).read_bytes())
+
+    import polyium.schemas.generator
+    import polyium.schemas.targets
+
+    directory = str(pathlib.Path(namespace.working_directory).resolve())
+
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    models = polyium.schemas.targets.resolve([namespace.target])
+
+    if len(models) != 1:
+        raise ValueError("Target Must Resolve a Single Model, Resolved %d: %s" % (len(models), namespace.target))
+
+    return polyium.schemas.generator.schema(models[0], mode=namespace.mode)
+
+def execute(namespace: argparse.Namespace) -> int:
+    """
+    Executes the subcommand.
+
+    Parameters
+    ----------
+    namespace : argparse.Namespace
+        The parsed command-line argument(s).
+
+    Returns
+    -------
+    int
+        The process exit status.
+    """
+
+    import polyium.schemas.sampling
+
+    try:
+        schema = load(namespace)
+    except (OSError, ImportError, LookupError, ValueError) as e:
+        logger.error("Unable to Load Schema: %s", e)
+
+        return 1
+
+    options = polyium.schemas.sampling.Options(
+        max_items=namespace.max_items,
+        max_length=namespace.max_length,
+        max_depth=namespace.max_depth,
+        distribution=namespace.distribution,
+        edge=namespace.edge_bias,
+        optional=namespace.optional,
+    )
+
+    try:
+        output = sys.stdout.buffer if namespace.output == "-" else open(namespace.output, "wb")
+    except OSError as e:
+        logger.error("Unable to Open Output (%s): %s", namespace.output, e)
+
+        return 1
+
+    size = 0
+
+    try:
+        for chunk in polyium.schemas.sampling.stream(schema, namespace.count, seed=namespace.seed, jobs=namespace.jobs, size=namespace.shard_size, options=options):
+            output.write(chunk)
+
+            size += len(chunk)
+
+        output.flush()
+    except ValueError as e:
+        logger.error("Unable to Sample Schema: %s", e)
+
+        return 1
+    except BrokenPipeError:
+        # The reader exited early (e.g. `| head`); standard output is flushed once more upon exit, so it's redirected to
+        # devnull rather than raising again. See https://docs.python.org/3/library/signal.html#note-on-sigpipe.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+        return 1
+    except OSError as e:
+        logger.error("Unable to Write Output (%s): %s", namespace.output, e)
+
+        return 1
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+
+    logger.info("Sampled %d Record(s) (%d Bytes)", max(0, namespace.count), size)
+
+    return 0
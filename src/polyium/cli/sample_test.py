@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+import logging
+
+import polyium.cli.sample as module
+
+logger = logging.getLogger(__name__)
+
+def namespace(*arguments: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+
+    module.register(parser)
+
+    return parser.parse_args(list(arguments))
+
+@pytest.fixture()
+def schema(directory: pathlib.Path) -> pathlib.Path:
+    path = directory.joinpath("schema.json")
+    path.write_text(json.dumps({"type": "integer", "minimum": 0}))
+
+    return path
+
+def test_execute(request: pytest.FixtureRequest, directory: pathlib.Path, schema: pathlib.Path):
+    assert module.execute(namespace("--schema", str(schema), "--count", "10", "--jobs", "1", "--output", str(directory.joinpath("output.ndjson")))) == 0
+
+    assert len(directory.joinpath("output.ndjson").read_text().splitlines()) == 10
+
+def test_execute_unopenable(request: pytest.FixtureRequest, directory: pathlib.Path, schema: pathlib.Path, caplog: pytest.LogCaptureFixture):
+    with caplog.at_level(logging.ERROR, logger=module.__name__):
+        assert module.execute(namespace("--schema", str(schema), "--count", "10", "--output", str(directory.joinpath("missing", "output.ndjson")))) == 1
+
+    assert "Unable to Open Output" in caplog.text
+
+def test_execute_broken_pipe(request: pytest.FixtureRequest, schema: pathlib.Path):
+    """
+    Tests that a reader exiting early (e.g. `| head -1`) ends sampling quietly, without a traceback.
+    """
+
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [str(pathlib.Path(__file__).resolve().parents[2]), environment.get("PYTHONPATH")]))
+
+    # Never forward to a daemon that happens to be running.
+    environment["JSON_SCHEMA_CLI_SOCKET"] = ""
+
+    script = "from polyium.cli.main import executable; executable()"
+
+    process = subprocess.Popen([sys.executable, "-c", script, "sample", "--schema", str(schema), "--count", "1000000", "--jobs", "1"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=environment)
+
+    assert process.stdout.readline()
+
+    process.stdout.close()
+
+    stderr = process.stderr.read().decode("utf-8")
+
+    assert process.wait() == 1
+    assert "Traceback" not in stderr and "BrokenPipeError" not in stderr, stderr
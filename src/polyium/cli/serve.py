@@ -0,0 +1,91 @@
+"""
+The serve subcommand runs the warm daemon, to which the command-line forwards generate, validate, diff, and cache
+invocation(s) while it's running (see `polyium.daemon`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+def register(parser: argparse.ArgumentParser) -> None:
+    """
+    Registers the subcommand's argument(s).
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The subcommand's parser.
+    """
+
+    parser.description = "Serve command-line invocation(s) from a warm daemon process, listening on a Unix domain socket."
+
+    parser.add_argument("--socket", type=str, default=None, metavar="PATH", help="the socket's path; defaults to $JSON_SCHEMA_CLI_SOCKET, or a per-user socket in the runtime directory")
+    parser.add_argument("--preload", action="append", default=[], metavar="MODULE", help="a model module to import upon start-up; may be repeated")
+    parser.add_argument("--working-directory", type=str, default=".", metavar="DIRECTORY", help="a directory added to the module search path, for preloaded module(s)")
+    parser.add_argument("--stop", action="store_true", help="stop the running daemon, rather than starting one")
+
+    parser.set_defaults(function=execute)
+
+def execute(namespace: argparse.Namespace) -> int:
+    """
+    Executes the subcommand; serves until stopped.
+
+    Parameters
+    ----------
+    namespace : argparse.Namespace
+        The parsed command-line argument(s).
+
+    Returns
+    -------
+    int
+        The process exit status.
+    """
+
+    import os
+    import sys
+
+    import polyium.daemon.protocol
+    import polyium.daemon.server
+
+    path = namespace.socket or polyium.daemon.protocol.location()
+
+    if path is None:
+        logger.error("Unix Domain Sockets are Unsupported, or Disabled through $%s", polyium.daemon.protocol.ENVIRONMENT)
+
+        return 1
+
+    if namespace.stop:
+        try:
+            polyium.daemon.protocol.request(path, {"action": "stop"}, timeout=5)
+        except OSError as e:
+            logger.error("No Daemon is Listening on Socket (%s): %s", path, e)
+
+            return 1
+
+        logger.info("Stopped Daemon on Socket: %s", path)
+
+        return 0
+
+    directory = os.path.abspath(namespace.working_directory)
+
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    server = polyium.daemon.server.Server(path, preload=namespace.preload)
+
+    try:
+        server.bind()
+    except (ImportError, OSError, RuntimeError) as e:
+        logger.error("Unable to Start Daemon: %s", e)
+
+        return 1
+
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        server.close()
+
+    return 0
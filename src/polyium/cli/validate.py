@@ -0,0 +1,166 @@
+"""
+The validate subcommand validates JSON document(s) against a JSON schema, reusing a single compiled validator.
+
+With `--ndjson`, every document is instead a newline-delimited JSON file, validated line by line across a process pool
+(see `polyium.validation.ndjson`).
+
+The schema's non-local reference(s) (e.g. a bundle's `defs.json`) are read from file(s) relative to the schema (see
+`polyium.validation.validators.registry`); a reference that can't be resolved fails the invocation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import pathlib
+import sys
+import typing
+
+logger = logging.getLogger(__name__)
+
+def register(parser: argparse.ArgumentParser) -> None:
+    """
+    Registers the subcommand's argument(s).
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The subcommand's parser.
+    """
+
+    parser.description = "Validate JSON document(s) against a JSON schema."
+
+    parser.add_argument("documents", nargs="+", metavar="DOCUMENT", help="the json document(s) to validate")
+    parser.add_argument("--schema", type=str, required=True, metavar="FILE", help="the json schema; the draft is selected by its \"$schema\", defaulting to 2020-12")
+    parser.add_argument("--no-formats", action="store_true", help="don't assert the \"format\" keyword")
+    parser.add_argument("--compiled", action="store_true", help="compile the schema into generated python source, falling back to jsonschema for unsupported keyword(s)")
+    parser.add_argument("--compiled-directory", type=str, default=None, metavar="DIRECTORY", help="the on-disk cache of --compiled validator(s) (default: $XDG_CACHE_HOME/json-schema-cli/validators); must be private to the user")
+    parser.add_argument("--ndjson", action="store_true", help="treat each document as newline-delimited json, validating every line")
+    parser.add_argument("-j", "--jobs", type=int, default=None, metavar="N", help="the number of worker processes for --ndjson (default: cpu count)")
+    parser.add_argument("--shard-size", type=int, default=4 * 1024 * 1024, metavar="BYTES", help="the approximate size of each --ndjson shard (default: 4 MiB)")
+
+    parser.set_defaults(function=execute)
+
+def report(path: str, errors: typing.Iterable[typing.Any]) -> int:
+    """
+    Writes a line per validation error to standard output, returning the number of error(s).
+    """
+
+    import polyium.validation.validators
+
+    count = 0
+
+    for error in errors:
+        count += 1
+
+        sys.stdout.write("%s: %s: %s\n" % (path, polyium.validation.validators.pointer(error.absolute_path) or "/", error.message))
+
+    return count
+
+def directory(namespace: argparse.Namespace) -> typing.Optional[str]:
+    """
+    Returns the on-disk cache directory of compiled validator(s), or None unless `--compiled`.
+    """
+
+    if not namespace.compiled:
+        return None
+
+    if namespace.compiled_directory is not None:
+        return namespace.compiled_directory
+
+    import polyium.validation.compiler
+
+    return str(polyium.validation.compiler.default())
+
+def stream(namespace: argparse.Namespace, schema: bytes) -> int:
+    """
+    Validates newline-delimited JSON document(s), writing a `path:line: pointer: message` line per failure.
+    """
+
+    import referencing.exceptions
+
+    import polyium.validation.ndjson
+
+    failures = 0
+
+    for path in namespace.documents:
+        try:
+            for failure in polyium.validation.ndjson.stream(path, schema, jobs=namespace.jobs, size=namespace.shard_size, formats=not namespace.no_formats, compiled=namespace.compiled, directory=directory(namespace), location=namespace.schema):
+                failures += 1
+
+                sys.stdout.write("%s:%d: %s: %s\n" % (path, failure.line, failure.pointer or "/", failure.message))
+        except referencing.exceptions.Unresolvable as e:
+            logger.error("Unresolvable Reference (%s): %s", namespace.schema, e)
+
+            return 1
+        except OSError as e:
+            logger.error("Unreadable Document (%s): %s", path, e)
+
+            failures += 1
+
+    logger.info("Validated %d NDJSON Document(s): %d Failure(s)", len(namespace.documents), failures)
+
+    return 1 if failures else 0
+
+def execute(namespace: argparse.Namespace) -> int:
+    """
+    Executes the subcommand.
+
+    Parameters
+    ----------
+    namespace : argparse.Namespace
+        The parsed command-line argument(s).
+
+    Returns
+    -------
+    int
+        The process exit status: 0 if every document is valid, otherwise 1.
+    """
+
+    import jsonschema.exceptions
+    import referencing.exceptions
+
+    import polyium.validation.validators
+
+    try:
+        schema = pathlib.Path(namespace.schema).read_bytes()
+
+        cache = polyium.validation.validators.validators
+
+        # A schema with non-local reference(s) depends upon its sibling file(s), and is never cached across invocation(s).
+        if namespace.no_formats or namespace.compiled or polyium.validation.validators.remote(json.loads(schema)):
+            cache = polyium.validation.validators.Cache(maximum=1, formats=not namespace.no_formats, compiled=namespace.compiled, directory=directory(namespace), location=namespace.schema)
+
+        validator = cache.get(schema)
+    except (OSError, ValueError, jsonschema.exceptions.SchemaError) as e:
+        logger.error("Invalid Schema (%s): %s", namespace.schema, e)
+
+        return 1
+
+    if namespace.ndjson:
+        return stream(namespace, schema)
+
+    invalid = 0
+
+    for path in namespace.documents:
+        try:
+            document = json.loads(pathlib.Path(path).read_bytes())
+        except (OSError, ValueError) as e:
+            sys.stdout.write("%s: /: %s\n" % (path, e))
+
+            invalid += 1
+
+            continue
+
+        try:
+            if report(path, validator.iter_errors(document)):
+                invalid += 1
+        except referencing.exceptions.Unresolvable as e:
+            logger.error("Unresolvable Reference (%s): %s", namespace.schema, e)
+
+            return 1
+
+    logger.info("Validated %d Document(s): %d Invalid", len(namespace.documents), invalid)
+
+    return 1 if invalid else 0
@@ -0,0 +1,91 @@
+import argparse
+import json
+import pathlib
+import typing
+
+import pydantic
+import pytest
+import logging
+
+import polyium.schemas.bundle
+import polyium.cli.validate as module
+
+logger = logging.getLogger(__name__)
+
+class Address(pydantic.BaseModel):
+    street: str
+    city: str
+
+class User(pydantic.BaseModel):
+    name: str
+    addresses: typing.List[Address]
+
+class Company(pydantic.BaseModel):
+    headquarters: Address
+
+def namespace(*arguments: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+
+    module.register(parser)
+
+    return parser.parse_args(list(arguments))
+
+@pytest.fixture()
+def bundle(directory: pathlib.Path) -> pathlib.Path:
+    """
+    Writes the bundled schema(s) of `User` and `Company` into the temporary directory's `schemas` directory.
+    """
+
+    bundle = polyium.schemas.bundle.consolidate({model.__name__: model.model_json_schema() for model in (User, Company)})
+
+    directory.joinpath("schemas").mkdir()
+
+    for name, content in bundle.documents.items():
+        directory.joinpath("schemas", name).write_text(content)
+
+    return directory.joinpath("schemas")
+
+@pytest.mark.parametrize("arguments", [(), ("--compiled",), ("--ndjson", "--jobs", "1"), ("--ndjson", "--jobs", "2")])
+def test_execute_bundle(request: pytest.FixtureRequest, directory: pathlib.Path, bundle: pathlib.Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture, arguments: typing.Tuple[str, ...]):
+    """
+    Tests that a bundled schema's reference(s) to its shared definitions resolve relative to the schema's file,
+    irrespective of the working directory.
+    """
+
+    valid = {"name": "Example", "addresses": [{"street": "Main", "city": "Town"}]}
+    invalid = {"name": "Example", "addresses": [{"street": "Main"}]}
+
+    documents = []
+
+    for name, document in (("valid", valid), ("invalid", invalid)):
+        documents.append(directory.joinpath("%s.json" % name))
+        documents[-1].write_text(json.dumps(document))
+
+    monkeypatch.chdir(directory)
+
+    arguments = (*arguments, "--compiled-directory", str(directory.joinpath("compiled")), "--schema", str(bundle.joinpath("User.json")))
+
+    assert module.execute(namespace(*arguments, str(documents[0]))) == 0
+    assert module.execute(namespace(*arguments, str(documents[1]))) == 1
+
+    assert "/addresses/0" in capsys.readouterr().out
+
+def test_execute_unresolvable(request: pytest.FixtureRequest, directory: pathlib.Path, bundle: pathlib.Path, capsys: pytest.CaptureFixture, caplog: pytest.LogCaptureFixture):
+    """
+    Tests that a reference which can't be resolved is reported, rather than raised.
+    """
+
+    bundle.joinpath(polyium.schemas.bundle.DEFINITIONS).unlink()
+
+    document = directory.joinpath("document.json")
+    document.write_text(json.dumps({"headquarters": {"street": "Main", "city": "Town"}}))
+
+    for arguments in ((), ("--ndjson", "--jobs", "1"), ("--ndjson", "--jobs", "2")):
+        caplog.clear()
+
+        with caplog.at_level(logging.ERROR, logger=module.__name__):
+            assert module.execute(namespace(*arguments, "--schema", str(bundle.joinpath("Company.json")), str(document))) == 1
+
+        assert "Unresolvable Reference (%s)" % bundle.joinpath("Company.json") in caplog.text
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,101 @@
+"""
+The watch subcommand monitors the target(s)' source tree(s) and incrementally regenerates affected JSON schema(s).
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import polyium.cli.generate
+import polyium.schemas.optimization
+import polyium.utilities.watchers
+
+logger = logging.getLogger(__name__)
+
+def register(parser: argparse.ArgumentParser) -> None:
+    """
+    Registers the subcommand's argument(s).
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The subcommand's parser.
+    """
+
+    parser.description = "Watch the target model(s)' source tree(s), and regenerate only the JSON schema(s) affected by a change."
+
+    parser.add_argument("targets", nargs="+", metavar="module:Model", help="target model specification(s); glob pattern(s) are supported, e.g. \"myapp.models.*:*\"")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="the number of worker process(es) used for the initial generation")
+    parser.add_argument("--mode", type=str, choices=["validation", "serialization"], default="validation", help="the json schema generation mode")
+    parser.add_argument("--indent", type=int, default=4, help="the output's json indentation")
+    parser.add_argument("--output-profile", type=str, choices=list(polyium.schemas.optimization.profiles), default="default", help="the optimization pass(es) applied to every schema; \"runtime\" emits the smallest schema(s), \"docs\" retains every annotation")
+    parser.add_argument("--optimize", action="append", default=[], choices=list(polyium.schemas.optimization.passes), metavar="PASS", help="apply an additional optimization pass; may be repeated")
+
+    parser_group_1 = parser.add_argument_group("directories")
+    parser_group_1.add_argument("--working-directory", type=str, default=".", metavar="DIRECTORY", help="the runtime working directory, additionally added to the module search path")
+    parser_group_1.add_argument("--artifacts-directory", type=str, default="artifacts", metavar="DIRECTORY", help="the output directory; relative path(s) are resolved using the working directory")
+
+    parser_group_2 = parser.add_argument_group("watching")
+    parser_group_2.add_argument("--polling", action="store_true", help="use stat-polling, even if inotify is available")
+    parser_group_2.add_argument("--interval", type=float, default=0.5, metavar="SECONDS", help="the stat-polling interval")
+
+    parser.set_defaults(function=execute)
+
+def execute(namespace: argparse.Namespace) -> int:
+    """
+    Executes the subcommand; runs until interrupted.
+
+    Parameters
+    ----------
+    namespace : argparse.Namespace
+        The parsed command-line argument(s).
+
+    Returns
+    -------
+    int
+        The process exit status.
+    """
+
+    import polyium.models.base
+    import polyium.schemas.incremental
+
+    settings = polyium.models.base.Base(working_directory=namespace.working_directory, artifacts_directory=namespace.artifacts_directory, create_artifacts_directory=True)
+
+    if str(settings.working_directory) not in sys.path:
+        sys.path.insert(0, str(settings.working_directory))
+
+    try:
+        session = polyium.schemas.incremental.Session(namespace.targets, mode=namespace.mode, indent=namespace.indent, passes=polyium.schemas.optimization.select(namespace.output_profile, namespace.optimize))
+
+        total, failures = polyium.cli.generate.write(settings.artifacts_directory, session.load(jobs=namespace.jobs))
+    except (ImportError, LookupError, ValueError) as e:
+        logger.error("Unable to Resolve Target(s): %s", e)
+
+        return 1
+
+    logger.info("Generated %d Schema(s) in: %s", total - failures, str(settings.artifacts_directory))
+
+    with polyium.utilities.watchers.create(session.roots(), polling=namespace.polling, interval=namespace.interval) as watcher:
+        logger.info("Watching (%s): %s", type(watcher).__name__, ", ".join(watcher.roots))
+
+        try:
+            while True:
+                paths = watcher.changes()
+
+                start = time.perf_counter()
+
+                try:
+                    results = session.update(paths)
+                except Exception as e:
+                    logger.error("Unable to Reload Changed Module(s): %s: %s", type(e).__name__, e)
+
+                    continue
+
+                total, failures = polyium.cli.generate.write(settings.artifacts_directory, results)
+
+                if total:
+                    logger.info("Regenerated %d Schema(s) in %.1fms", total - failures, (time.perf_counter() - start) * 1000)
+        except KeyboardInterrupt:
+            return 0
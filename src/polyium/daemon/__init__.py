@@ -0,0 +1,3 @@
+"""
+The daemon package serves command-line invocation(s) from a warm, long-running process over a Unix domain socket.
+"""
@@ -0,0 +1,233 @@
+"""
+The protocol module implements the daemon's wire format, and the thin client forwarding command-line invocation(s).
+
+Every message is a frame: a 4-byte, big-endian, unsigned length, followed by that many byte(s) of UTF-8 JSON. A client
+sends a single request frame, and receives a single response frame:
+
+- Request: `{"arguments": [...], "directory": "/current/working/directory"}`, or `{"action": "stop"}`.
+- Response: `{"status": 0, "stdout": "...", "stderr": "..."}`.
+
+The module is imported on the command-line's start-up path, so it only imports lightweight standard library module(s).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import typing
+
+# The environment variable overriding the socket's path; an empty value disables forwarding.
+ENVIRONMENT = "JSON_SCHEMA_CLI_SOCKET"
+
+# The maximum size of a single frame's payload, in bytes.
+MAXIMUM_FRAME = 256 * 1024 * 1024
+
+# Subcommand(s) a client forwards to a running daemon; long-running (or daemon-managing) subcommand(s) always run locally.
+forwarded = ("generate", "validate", "diff", "cache")
+
+_header = struct.Struct(">I")
+
+def location() -> typing.Optional[str]:
+    """
+    Returns the daemon's socket path, or None if forwarding is disabled or unsupported.
+
+    Defaults to `json-schema-cli-<uid>.sock` within `$XDG_RUNTIME_DIR`; otherwise, to `daemon.sock` within a private
+    `json-schema-cli-<uid>` directory (created by the daemon) of `$TMPDIR`, or `/tmp`, as any user may create file(s)
+    directly within the shared temporary directory.
+    """
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    if ENVIRONMENT in os.environ:
+        return os.environ[ENVIRONMENT] or None
+
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "json-schema-cli-%d.sock" % os.getuid())
+
+    return os.path.join(os.environ.get("TMPDIR") or "/tmp", "json-schema-cli-%d" % os.getuid(), "daemon.sock")
+
+def private(directory: str) -> bool:
+    """
+    Determines whether no other user may create, or replace, a file within the directory: it's owned by the current
+    user (or the superuser), and either isn't writable by its group or other user(s), or is sticky (e.g. `/tmp`).
+    """
+
+    try:
+        statistics = os.lstat(directory)
+    except OSError:
+        return False
+
+    if not stat.S_ISDIR(statistics.st_mode) or statistics.st_uid not in (os.getuid(), 0):
+        return False
+
+    return not statistics.st_mode & (stat.S_IWGRP | stat.S_IWOTH) or bool(statistics.st_mode & stat.S_ISVTX)
+
+def trusted(path: str) -> bool:
+    """
+    Determines whether a socket may be trusted with the current user's invocation(s): it's a socket owned by the current
+    user, within a :func:`private` directory.
+    """
+
+    try:
+        statistics = os.lstat(path)
+    except OSError:
+        return False
+
+    return stat.S_ISSOCK(statistics.st_mode) and statistics.st_uid == os.getuid() and private(os.path.dirname(os.path.abspath(path)))
+
+def peer(connection: socket.socket) -> typing.Optional[int]:
+    """
+    Returns the user ID of a Unix domain socket's peer, or None where `SO_PEERCRED` is unsupported (e.g. macOS).
+    """
+
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+
+    _, uid, _ = struct.unpack("3i", connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+
+    return uid
+
+def connect(path: str, timeout: typing.Optional[float] = None) -> socket.socket:
+    """
+    Connects to the daemon listening on the given socket, verifying that the socket, and (where supported) the process
+    listening on it, belong to the current user.
+
+    Raises
+    ------
+    PermissionError
+        If the socket, or its listener, belongs to another user.
+    OSError
+        If the daemon isn't reachable (e.g. `FileNotFoundError` or `ConnectionRefusedError`).
+    """
+
+    if os.path.lexists(path) and not trusted(path):
+        raise PermissionError("Untrusted Daemon Socket (Not Owned by the Current User): %s" % path)
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        connection.settimeout(timeout)
+        connection.connect(path)
+
+        if peer(connection) not in (None, os.getuid()):
+            raise PermissionError("Untrusted Daemon (Listening as Another User): %s" % path)
+    except BaseException:
+        connection.close()
+
+        raise
+
+    return connection
+
+def send(connection: socket.socket, message: typing.Any) -> None:
+    """
+    Writes a single message frame.
+    """
+
+    payload = json.dumps(message).encode("utf-8")
+
+    if len(payload) > MAXIMUM_FRAME:
+        raise ValueError("Frame Exceeds Maximum Size (%d > %d Bytes)" % (len(payload), MAXIMUM_FRAME))
+
+    connection.sendall(_header.pack(len(payload)) + payload)
+
+def _exactly(connection: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+
+    while len(buffer) < size:
+        chunk = connection.recv(min(size - len(buffer), 1048576))
+
+        if not chunk:
+            raise ConnectionError("Connection Closed Mid-Frame (%d of %d Bytes)" % (len(buffer), size))
+
+        buffer += chunk
+
+    return bytes(buffer)
+
+def receive(connection: socket.socket) -> typing.Any:
+    """
+    Reads a single message frame.
+
+    Raises
+    ------
+    ConnectionError
+        If the connection is closed before the frame is complete.
+    ValueError
+        If the frame exceeds :data:`MAXIMUM_FRAME`, or isn't valid JSON.
+    """
+
+    (size,) = _header.unpack(_exactly(connection, _header.size))
+
+    if size > MAXIMUM_FRAME:
+        raise ValueError("Frame Exceeds Maximum Size (%d > %d Bytes)" % (size, MAXIMUM_FRAME))
+
+    return json.loads(_exactly(connection, size))
+
+def request(path: str, message: typing.Any, timeout: typing.Optional[float] = None) -> typing.Any:
+    """
+    Sends a request to the daemon listening on the given socket, and returns its response.
+
+    Raises
+    ------
+    PermissionError
+        If the socket, or its listener, belongs to another user (see :func:`connect`).
+    OSError
+        If the daemon isn't reachable (e.g. `FileNotFoundError` or `ConnectionRefusedError`).
+    """
+
+    with connect(path, timeout) as connection:
+        send(connection, message)
+
+        return receive(connection)
+
+def forward(arguments: typing.List[str]) -> typing.Optional[int]:
+    """
+    Forwards a command-line invocation to a running daemon, replaying its output.
+
+    Only invocation(s) of a :data:`forwarded` subcommand should be forwarded.
+
+    Parameters
+    ----------
+    arguments : list[str]
+        The command-line argument(s), excluding the program name.
+
+    Returns
+    -------
+    int | None
+        The invocation's exit status; or None if no (trusted) daemon is reachable, in which case the invocation should
+        run locally.
+    """
+
+    path = location()
+
+    if path is None or not os.path.lexists(path):
+        return None
+
+    try:
+        connection = connect(path)
+    except PermissionError as e:
+        sys.stderr.write("Ignoring Daemon: %s\n" % e)
+
+        return None
+    except OSError:
+        # A stale socket file (i.e. the daemon exited uncleanly) refuses the connection.
+        return None
+
+    with connection:
+        try:
+            send(connection, {"arguments": arguments, "directory": os.getcwd()})
+
+            response = receive(connection)
+        except (OSError, ValueError) as e:
+            sys.stderr.write("Unable to Complete Daemon Request (%s): %s\n" % (path, e))
+
+            return 1
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+
+    return int(response.get("status", 1))
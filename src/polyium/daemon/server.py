@@ -0,0 +1,330 @@
+"""
+The server module implements the warm daemon: a single process that serves command-line invocation(s), forwarded by
+`polyium.daemon.protocol.forward`, over a Unix domain socket.
+
+Heavy dependencies (pydantic, jsonschema), and every model module imported by a request, stay imported between
+request(s); so do process-wide cache(s), such as compiled validator(s) (`polyium.validation.validators.validators`).
+
+Request(s) are served one at a time, as each temporarily adopts the client's working directory, and captures the
+process's standard output, standard error, and logging. Before every request, first-party module(s) (i.e. neither
+standard library, installed, nor polyium module(s)) whose source file changed are evicted, along with every other
+first-party module, so that a changed model is re-imported, rather than served stale.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import logging
+import os
+import signal
+import socket
+import sys
+import sysconfig
+import threading
+import traceback
+import typing
+
+import polyium.daemon.protocol
+
+logger = logging.getLogger(__name__)
+
+# Module(s) imported upon start-up, so that the first request is already warm.
+preloaded = ("pydantic", "jsonschema", "polyium.cli.generate", "polyium.cli.validate", "polyium.cli.diff", "polyium.schemas.generator", "polyium.validation.validators")
+
+class Modules:
+    """
+    Tracks first-party module(s) imported while serving, evicting them once any of their source file(s) change.
+    """
+
+    def __init__(self):
+        self._baseline: typing.Set[str] = set(sys.modules)
+        self._stamps: typing.Dict[str, typing.Optional[typing.Tuple[int, int]]] = {}
+
+        paths = sysconfig.get_paths()
+
+        excluded = [paths[key] for key in ("stdlib", "platstdlib", "purelib", "platlib") if key in paths]
+        excluded.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        self._excluded = tuple(os.path.join(os.path.realpath(path), "") for path in excluded)
+
+    @staticmethod
+    def stamp(path: str) -> typing.Optional[typing.Tuple[int, int]]:
+        try:
+            statistics = os.stat(path)
+        except OSError:
+            return None
+
+        return statistics.st_mtime_ns, statistics.st_size
+
+    def first_party(self, module: typing.Any) -> typing.Optional[str]:
+        """
+        Returns a module's source path if it's first-party, otherwise None.
+        """
+
+        path = getattr(module, "__file__", None)
+
+        if not path:
+            return None
+
+        path = os.path.realpath(path)
+
+        return None if path.startswith(self._excluded) else path
+
+    def refresh(self) -> int:
+        """
+        Records newly imported first-party module(s), and evicts every tracked module if any source file changed.
+
+        Returns
+        -------
+        int
+            The number of evicted module(s).
+        """
+
+        stale = False
+
+        for name, module in list(sys.modules.items()):
+            if name in self._baseline:
+                continue
+
+            path = self.first_party(module)
+
+            if path is None:
+                continue
+
+            stamp = self.stamp(path)
+
+            if name not in self._stamps:
+                self._stamps[name] = stamp
+            elif self._stamps[name] != stamp:
+                stale = True
+
+        if not stale:
+            return 0
+
+        for name in self._stamps:
+            sys.modules.pop(name, None)
+
+        # Memoized schema fragment(s) reference the evicted module(s)' model class(es).
+        if "polyium.schemas.fragments" in sys.modules:
+            sys.modules["polyium.schemas.fragments"].invalidate(self._stamps)
+
+        evicted = len(self._stamps)
+
+        self._stamps.clear()
+
+        importlib.invalidate_caches()
+
+        logger.info("Source Change(s) Detected; Evicted %d First-Party Module(s)", evicted)
+
+        return evicted
+
+def valid(message: typing.Any) -> bool:
+    """
+    Determines whether a request is an object whose field(s), where present, are of the expected type(s).
+    """
+
+    if not isinstance(message, dict):
+        return False
+
+    arguments = message.get("arguments", [])
+
+    if not isinstance(arguments, list) or not all(isinstance(argument, str) for argument in arguments):
+        return False
+
+    return isinstance(message.get("action", "execute"), str) and isinstance(message.get("directory"), (str, type(None)))
+
+class Server:
+    """
+    The daemon's socket server.
+
+    :ivar path: The socket's path.
+    :ivar modules: The first-party module tracker.
+    """
+
+    def __init__(self, path: str, preload: typing.Iterable[str] = ()):
+        self.path = path
+        self.modules = Modules()
+
+        self._preload = list(preload)
+        self._socket: typing.Optional[socket.socket] = None
+        self._running = False
+
+    def bind(self) -> None:
+        """
+        Warms the interpreter, and binds the socket (accessible by the current user alone), creating its directory
+        (private to the current user) if missing.
+
+        Raises
+        ------
+        RuntimeError
+            If another daemon is already listening on the socket, or if another user could replace the socket.
+        """
+
+        for name in preloaded:
+            importlib.import_module(name)
+
+        # Model module(s) preloaded on request are first-party, so they're tracked (and reloaded) like any other.
+        self.modules = Modules()
+
+        for name in self._preload:
+            importlib.import_module(name)
+
+        self.modules.refresh()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        if not polyium.daemon.protocol.private(directory):
+            raise RuntimeError("Socket Directory Isn't Private to the Current User: %s" % directory)
+
+        if os.path.lexists(self.path):
+            try:
+                polyium.daemon.protocol.request(self.path, {"action": "ping"}, timeout=1)
+            except PermissionError:
+                raise RuntimeError("Socket Path is Occupied by Another User: %s" % self.path) from None
+            except OSError:
+                os.unlink(self.path)
+            else:
+                raise RuntimeError("A Daemon is Already Listening on Socket: %s" % self.path)
+
+        instance = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        mask = os.umask(0o177)
+
+        try:
+            instance.bind(self.path)
+        finally:
+            os.umask(mask)
+
+        instance.listen(16)
+        instance.settimeout(0.5)
+
+        self._socket = instance
+
+    def handle(self, message: typing.Any) -> typing.Dict[str, typing.Any]:
+        """
+        Serves a single request.
+
+        Parameters
+        ----------
+        message : typing.Any
+            The request; any well-formed JSON frame, though only an object of the expected shape is served.
+
+        Returns
+        -------
+        dict[str, typing.Any]
+            The response; a malformed request is answered with status 2.
+        """
+
+        import polyium.cli.main
+
+        if not valid(message):
+            return {"status": 2, "stdout": "", "stderr": "Malformed Request"}
+
+        action = message.get("action", "execute")
+
+        if action == "ping":
+            return {"status": 0, "stdout": "", "stderr": ""}
+
+        if action == "stop":
+            self._running = False
+
+            return {"status": 0, "stdout": "", "stderr": ""}
+
+        self.modules.refresh()
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        handler = logging.StreamHandler(stderr)
+        handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+        root = logging.getLogger()
+
+        handlers, level, directory = root.handlers[:], root.level, os.getcwd()
+
+        # An invocation may extend the module search path (e.g. with its working directory), which must not outlive it.
+        path = sys.path[:]
+
+        try:
+            os.chdir(message.get("directory") or directory)
+
+            root.handlers = [handler]
+
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    status = polyium.cli.main.run(list(message.get("arguments", [])))
+                except SystemExit as e:
+                    status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception:
+                    stderr.write(traceback.format_exc())
+
+                    status = 1
+        finally:
+            root.handlers = handlers
+            root.setLevel(level)
+
+            sys.path[:] = path
+
+            os.chdir(directory)
+
+        self.modules.refresh()
+
+        return {"status": status, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def serve(self) -> None:
+        """
+        Serves request(s) until stopped (through a "stop" request, SIGTERM, or SIGINT).
+        """
+
+        if self._socket is None:
+            self.bind()
+
+        self._running = True
+
+        def terminate(*arguments: typing.Any) -> None:
+            self._running = False
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, terminate)
+
+        logger.info("Listening on Socket: %s", self.path)
+
+        try:
+            while self._running:
+                try:
+                    connection, _ = self._socket.accept()
+                except socket.timeout:
+                    continue
+
+                with connection:
+                    connection.settimeout(None)
+
+                    if polyium.daemon.protocol.peer(connection) not in (None, os.getuid()):
+                        logger.warning("Rejected Connection From Another User (UID %d)", polyium.daemon.protocol.peer(connection))
+
+                        continue
+
+                    try:
+                        request = polyium.daemon.protocol.receive(connection)
+
+                        polyium.daemon.protocol.send(connection, self.handle(request))
+                    except (OSError, ValueError) as e:
+                        logger.warning("Unable to Serve Request: %s", e)
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+
+            logger.info("Stopped Listening on Socket: %s", self.path)
@@ -0,0 +1,216 @@
+import json
+import os
+import pathlib
+import socket
+import sys
+import threading
+import time
+
+import pytest
+import logging
+
+import polyium.daemon.protocol
+import polyium.daemon.server as module
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture()
+def server(directory: pathlib.Path) -> module.Server:
+    instance = module.Server(str(directory.joinpath("daemon.sock")))
+    instance.bind()
+
+    thread = threading.Thread(target=instance.serve, daemon=True)
+    thread.start()
+
+    try:
+        yield instance
+    finally:
+        instance.stop()
+        thread.join(timeout=5)
+
+def test_frames(request: pytest.FixtureRequest):
+    """
+    Tests a frame round trip, and that truncated frame(s) raise rather than hang.
+    """
+
+    left, right = socket.socketpair()
+
+    with left, right:
+        polyium.daemon.protocol.send(left, {"arguments": ["generate", "é"]})
+
+        assert polyium.daemon.protocol.receive(right) == {"arguments": ["generate", "é"]}
+
+        left.sendall(b"\x00\x00\x00\x10{}")
+        left.shutdown(socket.SHUT_WR)
+
+        with pytest.raises(ConnectionError):
+            polyium.daemon.protocol.receive(right)
+
+def test_execute(request: pytest.FixtureRequest, server: module.Server, directory: pathlib.Path):
+    """
+    Tests that a forwarded invocation runs within the client's working directory, and that its output is returned.
+    """
+
+    for name, kind in (("old", "object"), ("new", "string")):
+        directory.joinpath(name).mkdir()
+        directory.joinpath(name, "example.json").write_text(json.dumps({"type": kind}))
+
+    response = polyium.daemon.protocol.request(server.path, {"arguments": ["diff", "old", "new"], "directory": str(directory)}, timeout=30)
+
+    logger.debug("Response: %s", response)
+
+    assert response["status"] == 1
+    assert "example.json:/type: type-changed" in response["stdout"]
+    assert "1 Breaking" in response["stderr"]
+    assert os.getcwd() != str(directory)
+
+def test_isolation(request: pytest.FixtureRequest, server: module.Server, directory: pathlib.Path):
+    """
+    Tests that neither profiling, nor a module search path entry, carries over from one request to the next.
+    """
+
+    import tracemalloc
+
+    import polyium.internal.profiling
+
+    path = sys.path[:]
+
+    arguments = ["--profile", "--profile-memory", "generate", "--working-directory", str(directory), "--no-cache", "missing_module:Model"]
+
+    response = polyium.daemon.protocol.request(server.path, {"arguments": arguments, "directory": str(directory)}, timeout=30)
+
+    assert directory.joinpath("artifacts", "generate.trace.json").is_file()
+
+    assert not polyium.internal.profiling.profiler.enabled
+    assert not tracemalloc.is_tracing()
+    assert sys.path == path
+
+    for name, kind in (("old", "object"), ("new", "string")):
+        directory.joinpath(name).mkdir()
+        directory.joinpath(name, "example.json").write_text(json.dumps({"type": kind}))
+
+    response = polyium.daemon.protocol.request(server.path, {"arguments": ["diff", "old", "new"], "directory": str(directory)}, timeout=30)
+
+    assert "type-changed" in response["stdout"]
+    assert not directory.joinpath("artifacts", "diff.trace.json").exists()
+    assert not polyium.internal.profiling.profiler.events()
+
+def test_forward(request: pytest.FixtureRequest, server: module.Server, directory: pathlib.Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture):
+    monkeypatch.setenv(polyium.daemon.protocol.ENVIRONMENT, server.path)
+
+    assert polyium.daemon.protocol.forward(["validate", "--help"]) == 0
+    assert "usage:" in capsys.readouterr().out
+
+    monkeypatch.setenv(polyium.daemon.protocol.ENVIRONMENT, str(directory.joinpath("missing.sock")))
+
+    assert polyium.daemon.protocol.forward(["validate", "--help"]) is None
+
+    monkeypatch.setenv(polyium.daemon.protocol.ENVIRONMENT, "")
+
+    assert polyium.daemon.protocol.location() is None
+
+@pytest.mark.parametrize("message", [[1, 2], "ping", None, {"arguments": "generate"}, {"arguments": [1]}, {"action": ["ping"]}, {"directory": 1}])
+def test_malformed(request: pytest.FixtureRequest, server: module.Server, message: object):
+    """
+    Tests that a well-formed frame of an unexpected shape is rejected, and that the daemon keeps serving.
+    """
+
+    assert polyium.daemon.protocol.request(server.path, message, timeout=5) == {"status": 2, "stdout": "", "stderr": "Malformed Request"}
+
+    assert polyium.daemon.protocol.request(server.path, {"action": "ping"}, timeout=5)["status"] == 0
+
+def test_untrusted(request: pytest.FixtureRequest, server: module.Server, directory: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Tests that invocation(s) are never forwarded to a socket another user could have created, or replaced.
+    """
+
+    planted = directory.joinpath("planted.sock")
+    planted.write_text("")
+
+    monkeypatch.setenv(polyium.daemon.protocol.ENVIRONMENT, str(planted))
+
+    assert polyium.daemon.protocol.forward(["validate", "--help"]) is None
+
+    with pytest.raises(PermissionError, match="Untrusted Daemon Socket"):
+        polyium.daemon.protocol.connect(str(planted))
+
+    if os.getuid() == 0:
+        os.chown(server.path, 65534, 65534)
+
+        with pytest.raises(PermissionError):
+            polyium.daemon.protocol.request(server.path, {"action": "ping"}, timeout=5)
+
+        os.chown(server.path, 0, 0)
+
+    directory.chmod(0o777)
+
+    try:
+        assert not polyium.daemon.protocol.trusted(server.path)
+
+        with pytest.raises(RuntimeError, match="Private"):
+            module.Server(str(directory.joinpath("other.sock"))).bind()
+    finally:
+        directory.chmod(0o755)
+
+    assert polyium.daemon.protocol.request(server.path, {"action": "ping"}, timeout=5)["status"] == 0
+
+def test_location(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(polyium.daemon.protocol.ENVIRONMENT, raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setenv("TMPDIR", "/shared")
+
+    assert polyium.daemon.protocol.location() == "/shared/json-schema-cli-%d/daemon.sock" % os.getuid()
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+
+    assert polyium.daemon.protocol.location() == "/run/user/1000/json-schema-cli-%d.sock" % os.getuid()
+
+def test_stop(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that a stop request shuts the daemon down, and removes its socket.
+    """
+
+    instance = module.Server(str(directory.joinpath("daemon.sock")))
+
+    thread = threading.Thread(target=instance.serve, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 30
+
+    while not os.path.exists(instance.path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    with pytest.raises(RuntimeError):
+        module.Server(instance.path).bind()
+
+    assert polyium.daemon.protocol.request(instance.path, {"action": "stop"}, timeout=5)["status"] == 0
+
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert not os.path.exists(instance.path)
+
+def test_modules(request: pytest.FixtureRequest, directory: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Tests that first-party module(s) are evicted once a source file changes.
+    """
+
+    name = "daemon_example_%d" % os.getpid()
+    path = directory.joinpath("%s.py" % name)
+    path.write_text("value = 1\n")
+
+    monkeypatch.syspath_prepend(str(directory))
+
+    modules = module.Modules()
+
+    try:
+        assert __import__(name).value == 1
+        assert modules.refresh() == 0
+
+        path.write_text("value = 22\n")
+
+        assert modules.refresh() == 1
+        assert name not in sys.modules
+        assert __import__(name).value == 22
+    finally:
+        sys.modules.pop(name, None)
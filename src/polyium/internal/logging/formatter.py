@@ -0,0 +1,16 @@
+import logging
+import re
+
+class Formatter(logging.Formatter):
+    """
+    A formatter that replaces single-quoted token(s) in the formatted message with double-quoted token(s).
+    """
+
+    expression = re.compile(r"(?<!\w)'([^\s']+)'(?!\w)")
+    substitution = r'"\1"'
+
+    def format(self, record) -> str:
+        # Modify the record or format the message as needed.
+        v = super().format(record)  # .replace("'", "%s" % '"')
+
+        return self.expression.sub(self.substitution, v)
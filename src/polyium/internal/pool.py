@@ -0,0 +1,319 @@
+"""
+The pool module implements a process pool whose worker(s) fork from a preloaded server, and are periodically recycled.
+
+Where supported, worker(s) are started through a `forkserver`: a single server process imports :data:`preloaded` (i.e.
+pydantic, jsonschema, and polyium's model(s)) once, and forks each worker from itself. Every worker therefore starts
+warm, yet (unlike a `fork` of the parent) inherits none of the parent's imported model module(s), or their side effect(s).
+
+A worker is retired, and replaced upon demand, once it has completed a number of task(s), or its resident set size
+exceeds a ceiling; bounding any leak from large model graph(s), or from the module(s) a task imports.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.forkserver
+import os
+import sys
+import typing
+
+import polyium.internal.profiling
+
+logger = logging.getLogger(__name__)
+
+# Module(s) imported once by the forkserver, and so already imported by every forked worker.
+preloaded = ("pydantic", "jsonschema", "polyium.models.base", "polyium.models.internal.base", "polyium.schemas.generator")
+
+# The default number of task(s) a worker completes before it's replaced.
+MAXIMUM_TASKS = 64
+
+# The default resident set size, in bytes, beyond which a worker is replaced.
+MAXIMUM_MEMORY = 1024 * 1048576
+
+def context() -> multiprocessing.context.BaseContext:
+    """
+    Returns the `forkserver` multiprocessing context, with :data:`preloaded` module(s) configured; or the `spawn`
+    context where a `forkserver` is unsupported.
+    """
+
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+
+    instance = multiprocessing.get_context("forkserver")
+
+    # Only effective until the server is started; a running server keeps its original preload(s).
+    instance.set_forkserver_preload(list(preloaded))
+
+    # From Python 3.12, the server applies the parent's module search path (passed as preparation data) before importing
+    # its preload(s); earlier server(s) only apply it once a worker is forked, so for first-party preload(s) to resolve,
+    # the search path is exported to the server through its environment instead.
+    if sys.version_info >= (3, 12):
+        multiprocessing.forkserver.ensure_running()
+
+        return instance
+
+    environment = os.environ.get("PYTHONPATH")
+
+    os.environ["PYTHONPATH"] = os.pathsep.join(entry for entry in sys.path if entry)
+
+    try:
+        multiprocessing.forkserver.ensure_running()
+    finally:
+        if environment is None:
+            del os.environ["PYTHONPATH"]
+        else:
+            os.environ["PYTHONPATH"] = environment
+
+    return instance
+
+def resident() -> typing.Optional[int]:
+    """
+    Returns the current process's resident set size, in bytes, if available; otherwise its high-water mark.
+    """
+
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return polyium.internal.profiling.rss()
+
+def work(connection: multiprocessing.connection.Connection, initializer: typing.Optional[typing.Callable[..., None]], initargs: typing.Tuple[typing.Any, ...], tasks: typing.Optional[int], memory: typing.Optional[int]) -> None:
+    """
+    A worker process's main loop: receives chunk(s) of task(s), and sends back each task's outcome.
+
+    Every response carries whether the worker is retiring, after which it exits.
+    """
+
+    if initializer is not None:
+        initializer(*initargs)
+
+    completed = 0
+
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            return
+
+        if message is None:
+            return
+
+        function, chunk = message
+
+        outcomes: typing.List[typing.Tuple[bool, typing.Any]] = []
+
+        for arguments in chunk:
+            try:
+                outcomes.append((True, function(*arguments)))
+            except Exception as e:
+                outcomes.append((False, e))
+
+        completed += len(chunk)
+
+        size = resident() if memory is not None else None
+
+        retire = (tasks is not None and completed >= tasks) or (size is not None and size >= memory)
+
+        try:
+            connection.send((outcomes, retire))
+        except Exception as e:
+            # A result (or exception) that cannot be pickled; the message is pickled whole, so nothing was sent.
+            connection.send(([(False, RuntimeError("Unable to Return Task Outcome(s): %s" % e))] * len(chunk), True))
+
+            retire = True
+
+        if retire:
+            return
+
+class _Worker:
+    __slots__ = ("process", "connection", "index")
+
+    def __init__(self, process: multiprocessing.process.BaseProcess, connection: multiprocessing.connection.Connection):
+        self.process = process
+        self.connection = connection
+        self.index: typing.Optional[int] = None
+
+class Pool:
+    """
+    A process pool whose worker(s) are forked from a preloaded server, and recycled.
+
+    Worker(s) are started lazily, up to `jobs` at once, and survive across :meth:`map` call(s) until retired.
+
+    :ivar jobs: The maximum number of concurrent worker process(es).
+    :ivar tasks: The number of task(s) after which a worker is replaced; None to never recycle by task count.
+    :ivar memory: The resident set size, in bytes, beyond which a worker is replaced; None to never recycle by memory.
+    :ivar started: The number of worker process(es) started.
+    """
+
+    def __init__(self, jobs: int, initializer: typing.Optional[typing.Callable[..., None]] = None, initargs: typing.Tuple[typing.Any, ...] = (), tasks: typing.Optional[int] = MAXIMUM_TASKS, memory: typing.Optional[int] = MAXIMUM_MEMORY):
+        self.jobs = max(1, jobs)
+        self.tasks = tasks
+        self.memory = memory
+        self.started = 0
+
+        self._initializer = initializer
+        self._initargs = initargs
+        self._context = context()
+        self._workers: typing.List[_Worker] = []
+        self._idle: typing.List[_Worker] = []
+
+    def __enter__(self) -> Pool:
+        return self
+
+    def __exit__(self, *arguments: typing.Any) -> None:
+        if arguments[0] is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def _start(self) -> _Worker:
+        parent, child = self._context.Pipe()
+
+        process = self._context.Process(target=work, args=(child, self._initializer, self._initargs, self.tasks, self.memory), daemon=True)
+        process.start()
+
+        child.close()
+
+        worker = _Worker(process, parent)
+
+        self._workers.append(worker)
+
+        self.started += 1
+
+        return worker
+
+    def _retire(self, worker: _Worker, timeout: typing.Optional[float] = 5) -> None:
+        self._workers.remove(worker)
+
+        worker.connection.close()
+        worker.process.join(timeout)
+
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join()
+
+    def map(self, function: typing.Callable[..., typing.Any], *iterables: typing.Iterable[typing.Any], chunksize: int = 1) -> typing.Iterator[typing.Any]:
+        """
+        Applies a function to every item of the given iterable(s) across the pool, like `concurrent.futures.Executor.map`.
+
+        Parameters
+        ----------
+        function : typing.Callable[..., typing.Any]
+            A picklable (i.e. module-level) function, called with an item of each iterable.
+        iterables : typing.Iterable[typing.Any]
+            The function's argument(s).
+        chunksize : int
+            The number of item(s) sent to a worker per round-trip.
+
+        Yields
+        ------
+        typing.Any
+            Every item's result, in order.
+
+        Raises
+        ------
+        Exception
+            An item's exception, once its result is reached; or a `RuntimeError` if its worker exited unexpectedly.
+        """
+
+        items = list(zip(*iterables))
+        chunks = [items[offset:offset + max(1, chunksize)] for offset in range(0, len(items), max(1, chunksize))]
+
+        pending = collections.deque(range(len(chunks)))
+        completed: typing.Dict[int, typing.List[typing.Tuple[bool, typing.Any]]] = {}
+        busy: typing.Dict[multiprocessing.connection.Connection, _Worker] = {}
+
+        position = 0
+
+        try:
+            while position < len(chunks):
+                while pending and (self._idle or len(self._workers) < self.jobs):
+                    worker = self._idle.pop() if self._idle else self._start()
+
+                    try:
+                        worker.connection.send((function, chunks[pending[0]]))
+                    except OSError:
+                        # The (idle) worker exited since its last task.
+                        self._retire(worker)
+
+                        continue
+
+                    worker.index = pending.popleft()
+
+                    busy[worker.connection] = worker
+
+                while position in completed:
+                    for successful, value in completed.pop(position):
+                        if not successful:
+                            raise value
+
+                        yield value
+
+                    position += 1
+
+                if position >= len(chunks):
+                    break
+
+                sentinels = {worker.process.sentinel: worker for worker in busy.values()}
+
+                for ready in multiprocessing.connection.wait(list(busy) + list(sentinels)):
+                    worker = busy.get(ready) or sentinels[ready]
+
+                    if worker.connection not in busy:
+                        continue
+
+                    del busy[worker.connection]
+
+                    try:
+                        outcomes, retire = worker.connection.recv()
+                    except (EOFError, OSError):
+                        worker.process.join()
+
+                        logger.warning("Worker Process Exited Unexpectedly (Exit Code %s)", worker.process.exitcode)
+
+                        outcomes, retire = [(False, RuntimeError("Worker Process Exited Unexpectedly (Exit Code %s)" % worker.process.exitcode))] * len(chunks[worker.index]), True
+
+                    completed[worker.index] = outcomes
+
+                    if retire:
+                        logger.debug("Recycling Worker Process: %d", worker.process.pid)
+
+                        self._retire(worker)
+                    else:
+                        self._idle.append(worker)
+        finally:
+            # Worker(s) still busy when iteration is abandoned (e.g. upon an exception) cannot be reused.
+            for worker in busy.values():
+                worker.process.terminate()
+
+                self._retire(worker)
+
+    def close(self) -> None:
+        """
+        Stops every worker, once idle.
+        """
+
+        for worker in list(self._workers):
+            try:
+                worker.connection.send(None)
+            except OSError:
+                pass
+
+            self._retire(worker)
+
+        self._idle.clear()
+
+    def terminate(self) -> None:
+        """
+        Stops every worker immediately.
+        """
+
+        for worker in list(self._workers):
+            worker.process.terminate()
+
+            self._retire(worker)
+
+        self._idle.clear()
@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pytest
+import logging
+
+import polyium.internal.pool as module
+
+logger = logging.getLogger(__name__)
+
+def square(value: int) -> int:
+    return value * value
+
+def identify(value: int) -> int:
+    return os.getpid()
+
+def fail(value: int) -> int:
+    if value == 2:
+        raise ValueError("Invalid Value: %d" % value)
+
+    return value
+
+def crash(value: int) -> int:
+    if value == 1:
+        os._exit(3)
+
+    return value
+
+def imported(value: str) -> bool:
+    return value in sys.modules
+
+def test_map(request: pytest.FixtureRequest):
+    """
+    Tests that result(s) are yielded in order, across chunk(s), and that worker(s) survive across map call(s).
+    """
+
+    with module.Pool(2, tasks=None) as pool:
+        assert list(pool.map(square, range(10), chunksize=3)) == [value * value for value in range(10)]
+        assert list(pool.map(square, [])) == []
+        assert list(pool.map(square, range(4))) == [0, 1, 4, 9]
+
+        assert pool.started == 2
+
+def test_preloaded(request: pytest.FixtureRequest):
+    """
+    Tests that worker(s) start with the preloaded module(s) imported, but none of the parent's other module(s).
+    """
+
+    import polyium.daemon.server
+
+    with module.Pool(1) as pool:
+        assert list(pool.map(imported, ["pydantic", "polyium.models.base", "polyium.daemon.server"])) == [True, True, False]
+
+def test_recycle_tasks(request: pytest.FixtureRequest):
+    with module.Pool(1, tasks=2) as pool:
+        identifiers = list(pool.map(identify, range(6)))
+
+    logger.debug("Worker Process Identifier(s): %s", identifiers)
+
+    assert pool.started == 3
+    assert len(set(identifiers)) == 3
+
+def test_recycle_memory(request: pytest.FixtureRequest):
+    """
+    Tests that a worker beyond the memory ceiling is replaced after every task.
+    """
+
+    with module.Pool(1, tasks=None, memory=1) as pool:
+        assert list(pool.map(square, range(3))) == [0, 1, 4]
+
+    assert pool.started == 3
+
+def test_exceptions(request: pytest.FixtureRequest):
+    """
+    Tests that a task's exception is raised once its result is reached, and that a crashed worker is replaced.
+    """
+
+    with module.Pool(2) as pool:
+        results = pool.map(fail, range(4))
+
+        assert [next(results), next(results)] == [0, 1]
+
+        with pytest.raises(ValueError, match="Invalid Value: 2"):
+            next(results)
+
+        with pytest.raises(RuntimeError, match="Exited Unexpectedly"):
+            list(pool.map(crash, range(3)))
+
+        assert list(pool.map(square, range(3))) == [0, 1, 4]
@@ -0,0 +1,309 @@
+"""
+The profiling module records the duration, and memory high-water mark, of named phase(s) of work.
+
+Instrumented code wraps each phase in :meth:`Profiler.phase`. Profiling is disabled by default, in which case the module's
+:data:`profiler` is a :class:`Null` profiler whose phase(s) are a shared, no-op context manager; the cost of an
+instrumented phase is then a single method call.
+
+Once enabled (see :func:`enable`), phase(s) are timed with the system-wide monotonic clock, so event(s) recorded in
+worker process(es) can be merged into the parent's timeline. The resident set size high-water mark is recorded per
+phase; with `memory=True`, `tracemalloc`'s traced peak (since the previous phase ended) is recorded as well.
+
+Recorded event(s) are summarized in a table (:func:`summary`), or exported in the Chrome trace-event format
+(:func:`trace`), viewable with `chrome://tracing` or https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+class Event:
+    """
+    A completed phase.
+
+    :ivar name: The phase's name, e.g. `import` or `json-schema`.
+    :ivar category: The phase's category, e.g. the instrumented subsystem.
+    :ivar start: The phase's start time, in nanoseconds of the monotonic clock.
+    :ivar duration: The phase's duration, in nanoseconds.
+    :ivar pid: The recording process's identifier.
+    :ivar tid: The recording thread's identifier.
+    :ivar rss: The process's resident set size high-water mark at the phase's end, in bytes, if available.
+    :ivar traced: The `tracemalloc` peak during the phase, in bytes, if traced.
+    :ivar arguments: Additional phase argument(s), e.g. the model's name.
+    """
+
+    __slots__ = ("name", "category", "start", "duration", "pid", "tid", "rss", "traced", "arguments")
+
+    def __init__(self, name: str, category: str, start: int, duration: int, pid: int, tid: int, rss: typing.Optional[int] = None, traced: typing.Optional[int] = None, arguments: typing.Optional[typing.Dict[str, typing.Any]] = None):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.duration = duration
+        self.pid = pid
+        self.tid = tid
+        self.rss = rss
+        self.traced = traced
+        self.arguments = arguments or {}
+
+    def __repr__(self) -> str:
+        return "Event(name=%r, category=%r, duration=%d)" % (self.name, self.category, self.duration)
+
+class _Null:
+    """
+    A reusable, no-op phase context manager.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *arguments: typing.Any) -> None:
+        return None
+
+_null = _Null()
+
+class Null:
+    """
+    The disabled profiler; every phase is a no-op.
+    """
+
+    enabled = False
+    memory = False
+
+    def phase(self, name: str, category: str = "polyium", **arguments: typing.Any) -> _Null:
+        return _null
+
+    def collect(self) -> typing.List[Event]:
+        return []
+
+    def extend(self, events: typing.Iterable[Event]) -> None:
+        return None
+
+    def events(self) -> typing.List[Event]:
+        return []
+
+def rss() -> typing.Optional[int]:
+    """
+    Returns the current process's resident set size high-water mark, in bytes, if available.
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    maximum = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes; macOS, bytes.
+    return maximum if sys.platform == "darwin" else maximum * 1024
+
+class _Phase:
+    __slots__ = ("profiler", "name", "category", "arguments", "start")
+
+    def __init__(self, profiler: Profiler, name: str, category: str, arguments: typing.Dict[str, typing.Any]):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.arguments = arguments
+
+    def __enter__(self) -> _Phase:
+        self.start = time.monotonic_ns()
+
+        return self
+
+    def __exit__(self, *arguments: typing.Any) -> None:
+        end = time.monotonic_ns()
+
+        traced = None
+
+        if self.profiler.memory:
+            import tracemalloc
+
+            if tracemalloc.is_tracing():
+                traced = tracemalloc.get_traced_memory()[1]
+
+                tracemalloc.reset_peak()
+
+        self.profiler.record(Event(self.name, self.category, self.start, end - self.start, os.getpid(), threading.get_ident(), rss(), traced, self.arguments))
+
+class Profiler:
+    """
+    The enabled profiler; records an :class:`Event` per completed phase. Thread-safe.
+
+    :ivar memory: Whether `tracemalloc` peak(s) are recorded.
+    """
+
+    enabled = True
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+
+        self._events: typing.List[Event] = []
+        self._lock = threading.Lock()
+
+        if memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    def phase(self, name: str, category: str = "polyium", **arguments: typing.Any) -> _Phase:
+        """
+        Returns a context manager timing a phase.
+
+        Parameters
+        ----------
+        name : str
+            The phase's name.
+        category : str
+            The phase's category.
+        arguments : typing.Any
+            Additional (JSON-compatible) phase argument(s).
+        """
+
+        return _Phase(self, name, category, arguments)
+
+    def record(self, event: Event) -> None:
+        with self._lock:
+            self._events.append(event)
+
+    def collect(self) -> typing.List[Event]:
+        """
+        Removes and returns every recorded event; used to transfer a worker process's event(s) to the parent.
+        """
+
+        with self._lock:
+            events, self._events = self._events, []
+
+        return events
+
+    def extend(self, events: typing.Iterable[Event]) -> None:
+        with self._lock:
+            self._events.extend(events)
+
+    def events(self) -> typing.List[Event]:
+        with self._lock:
+            return list(self._events)
+
+# The process's profiler; disabled unless enabled through `enable`.
+profiler: typing.Union[Null, Profiler] = Null()
+
+def enable(memory: bool = False) -> Profiler:
+    """
+    Enables (or re-enables) profiling for the current process.
+
+    Parameters
+    ----------
+    memory : bool
+        Whether to trace memory allocation(s) with `tracemalloc`; accurate, but slows allocation-heavy phase(s).
+
+    Returns
+    -------
+    Profiler
+        The process's profiler.
+    """
+
+    global profiler
+
+    if not isinstance(profiler, Profiler) or profiler.memory != memory:
+        profiler = Profiler(memory=memory)
+
+    return profiler
+
+def disable() -> None:
+    global profiler
+
+    if profiler.memory:
+        import tracemalloc
+
+        tracemalloc.stop()
+
+    profiler = Null()
+
+def state() -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """
+    Returns the current profiling configuration (None if disabled), for propagation to worker process(es).
+    """
+
+    return {"memory": profiler.memory} if profiler.enabled else None
+
+def configure(configuration: typing.Optional[typing.Dict[str, typing.Any]]) -> None:
+    """
+    Applies a profiling configuration returned by :func:`state` within a worker process's initializer.
+
+    The worker's profiler is always replaced, as a forked worker would otherwise inherit (and then report again) the
+    parent's event(s).
+    """
+
+    global profiler
+
+    if configuration is not None:
+        profiler = Profiler(**configuration)
+
+def summary(events: typing.Iterable[Event]) -> str:
+    """
+    Returns a table of each phase's count, total, mean, and maximum duration, and memory high-water mark(s).
+    """
+
+    phases: typing.Dict[typing.Tuple[str, str], typing.List[Event]] = {}
+
+    for event in events:
+        phases.setdefault((event.category, event.name), []).append(event)
+
+    lines = ["%-12s %-16s %8s %12s %12s %12s %12s %12s" % ("category", "phase", "count", "total", "mean", "max", "rss", "traced")]
+
+    for (category, name), group in sorted(phases.items(), key=lambda item: -sum(event.duration for event in item[1])):
+        total = sum(event.duration for event in group)
+
+        resident = max((event.rss for event in group if event.rss is not None), default=None)
+        traced = max((event.traced for event in group if event.traced is not None), default=None)
+
+        lines.append("%-12s %-16s %8d %10.2fms %10.2fms %10.2fms %12s %12s" % (
+            category, name, len(group), total / 1e6, total / len(group) / 1e6, max(event.duration for event in group) / 1e6,
+            "-" if resident is None else "%.1fMiB" % (resident / 1048576), "-" if traced is None else "%.1fMiB" % (traced / 1048576),
+        ))
+
+    return "\n".join(lines)
+
+def trace(events: typing.Iterable[Event]) -> typing.Dict[str, typing.Any]:
+    """
+    Returns the event(s) in the Chrome trace-event format, as complete ("X") event(s) with microsecond timestamp(s).
+    """
+
+    events = list(events)
+
+    origin = min((event.start for event in events), default=0)
+
+    records = []
+
+    for event in events:
+        arguments = dict(event.arguments)
+
+        if event.rss is not None:
+            arguments["rss"] = event.rss
+
+        if event.traced is not None:
+            arguments["traced"] = event.traced
+
+        records.append({"name": event.name, "cat": event.category, "ph": "X", "ts": (event.start - origin) / 1e3, "dur": event.duration / 1e3, "pid": event.pid, "tid": event.tid, "args": arguments})
+
+    return {"traceEvents": records, "displayTimeUnit": "ms"}
+
+def export(path: typing.Union[str, os.PathLike], events: typing.Iterable[Event]) -> None:
+    """
+    Writes the event(s) as a Chrome trace-event JSON file, creating parent directories as necessary.
+    """
+
+    directory = os.path.dirname(os.fspath(path))
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(trace(events), handle)
@@ -0,0 +1,102 @@
+import json
+import pathlib
+
+import pydantic
+import pytest
+import logging
+
+import polyium.internal.profiling as module
+import polyium.schemas.generator
+
+logger = logging.getLogger(__name__)
+
+class Example(pydantic.BaseModel):
+    name: str
+
+@pytest.fixture()
+def profiler() -> module.Profiler:
+    try:
+        yield module.enable()
+    finally:
+        module.disable()
+
+def test_disabled(request: pytest.FixtureRequest):
+    """
+    Tests that the disabled profiler shares a single no-op phase, and records nothing.
+    """
+
+    assert not module.profiler.enabled
+    assert module.state() is None
+
+    with module.profiler.phase("example", model="example") as phase:
+        assert phase is None
+
+    assert module.profiler.phase("a") is module.profiler.phase("b")
+    assert module.profiler.events() == []
+
+def test_phases(request: pytest.FixtureRequest, profiler: module.Profiler):
+    with profiler.phase("outer", "test"):
+        with profiler.phase("inner", "test", model="example"):
+            pass
+
+    events = profiler.events()
+
+    logger.debug("Events: %s", events)
+
+    assert [event.name for event in events] == ["inner", "outer"]
+    assert events[0].arguments == {"model": "example"}
+    assert events[1].start <= events[0].start and events[0].duration <= events[1].duration
+    assert module.state() == {"memory": False}
+
+    assert profiler.collect() == events
+    assert profiler.events() == []
+
+def test_memory(request: pytest.FixtureRequest):
+    profiler = module.enable(memory=True)
+
+    try:
+        with profiler.phase("allocate"):
+            buffer = bytearray(4 * 1048576)
+
+        assert profiler.events()[0].traced >= len(buffer)
+    finally:
+        module.disable()
+
+def test_generate(request: pytest.FixtureRequest, profiler: module.Profiler):
+    """
+    Tests that each generation phase is recorded per model.
+    """
+
+    results = list(polyium.schemas.generator.generate([Example], jobs=1))
+
+    assert results[0].successful
+
+    names = {(event.name, event.arguments.get("model")) for event in profiler.events()}
+
+    assert ("json-schema", results[0].task.name) in names
+    assert ("serialize", results[0].task.name) in names
+
+def test_export(request: pytest.FixtureRequest, profiler: module.Profiler, directory: pathlib.Path):
+    """
+    Tests the chrome trace-event export, and the summary table.
+    """
+
+    for _ in range(3):
+        with profiler.phase("example", "test"):
+            pass
+
+    path = directory.joinpath("example.trace.json")
+
+    module.export(path, profiler.events())
+
+    trace = json.loads(path.read_text())
+
+    assert len(trace["traceEvents"]) == 3
+    assert trace["traceEvents"][0]["ts"] == 0
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+
+    summary = module.summary(profiler.events())
+
+    logger.debug("Summary:\n%s", summary)
+
+    assert summary.splitlines()[1].split()[:3] == ["test", "example", "3"]
@@ -1,19 +1,12 @@
 """
-The versioning module provides a dataclass for working with the auto-generated `__version__.py` file.
-"""
-import typing
-
-import packaging
-import packaging.version
-
-import logging
-
-import dataclasses
+The versioning module provides a class for working with the auto-generated `__version__.py` file.
 
+The module is imported by the command-line's `--version` fast-path, so it avoids `dataclasses` (and thereby `inspect`),
+and `packaging` is only imported for version string(s) that aren't a plain `major.minor.micro` release.
+"""
 
-logger = logging.getLogger(__name__)
+from __future__ import annotations
 
-@dataclasses.dataclass
 class Version:
     """
     Represents a version with major, minor, and micro components.
@@ -31,9 +24,9 @@ class Version:
     :type literal: str
     """
 
-    tuple: typing.Tuple[int, int, int] = (0, 0, 0)
+    def __init__(self, tuple: tuple[int, int, int] = (0, 0, 0)):
+        self.tuple = tuple
 
-    def __post_init__(self):
         try:
             import polyium.internal.__version__
 
@@ -41,11 +34,46 @@ class Version:
 
             self.literal = string
 
-            v = packaging.version.parse(string)
-
-            self.tuple = (v.major, v.minor, v.micro)
+            self.tuple = parse(string)
         except ModuleNotFoundError as e:
-            logger.warning("Unable to import version information from __version__.py: %s", str(e))
+            import logging
+
+            logging.getLogger(__name__).warning("Unable to import version information from __version__.py: %s", str(e))
 
     def __str__(self):
         return "%d.%d.%d" % self.tuple
+
+    def __repr__(self):
+        return "Version(tuple=%r)" % (self.tuple,)
+
+    def __eq__(self, other):
+        if not isinstance(other, Version):
+            return NotImplemented
+
+        return self.tuple == other.tuple
+
+def parse(string: str) -> tuple[int, int, int]:
+    """
+    Parses a version string into a (major, minor, micro) tuple.
+
+    Parameters
+    ----------
+    string : str
+        The version string, e.g. `1.2.3` or `1.2.3rc1`.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        The version's release component(s).
+    """
+
+    partials = string.split(".")
+
+    if len(partials) == 3 and all(partial.isdigit() for partial in partials):
+        return int(partials[0]), int(partials[1]), int(partials[2])
+
+    import packaging.version
+
+    v = packaging.version.parse(string)
+
+    return v.major, v.minor, v.micro
@@ -17,3 +17,9 @@ def test_versioning_tuple():
 
 def test_versioning_string_dunder_method():
     assert len(str(polyium.internal.versioning.Version()).split(".")) == 3
+
+def test_versioning_parse():
+    assert polyium.internal.versioning.parse("1.2.3") == (1, 2, 3)
+
+def test_versioning_parse_pre_release():
+    assert polyium.internal.versioning.parse("1.2.3rc1") == (1, 2, 3)
@@ -2,6 +2,7 @@
 The base module for fragrance models.
 """
 import os
+import functools
 import tempfile
 import typing
 import pathlib
@@ -16,6 +17,29 @@ from pydantic import Field, WithJsonSchema
 
 logger = logging.getLogger(__name__)
 
+# The directory field(s) of a :class:`Lazy` model, resolved upon first read.
+DIRECTORIES = frozenset({"working_directory", "artifacts_directory", "temporary_directory"})
+
+@functools.lru_cache(maxsize=1024)
+def location(directory: str, raw: str) -> pathlib.Path:
+    """
+    Resolves a raw (possibly relative) path against a directory, memoized process-wide.
+
+    Parameters
+    ----------
+    directory : str
+        The (absolute) directory relative path(s) are resolved against; typically the process's current working directory.
+    raw : str
+        The unevaluated path.
+
+    Returns
+    -------
+    pathlib.Path
+        The absolute, resolved path.
+    """
+
+    return pathlib.Path(directory).joinpath(raw).resolve()
+
 class Base(polyium.models.internal.base.Model):
     """
     A base class representing a fragrance input-output model.
@@ -99,3 +123,130 @@ class Base(polyium.models.internal.base.Model):
             self.artifacts_directory.mkdir(parents=True, exist_ok=True)
 
         logger.debug("Verified Valid Artifacts Directory: %s. Exists: %s", str(self.artifacts_directory), str(self.artifacts_directory.exists()))
+
+class Lazy(Base):
+    """
+    A :class:`Base` model whose directory field(s) are resolved upon first access, rather than upon construction.
+
+    Constructing an instance performs no system call(s): every directory field is resolved in place (memoized
+    process-wide, per working directory and raw path) when any directory field is first read, or the model is serialized
+    (`model_dump`, `model_dump_json`, and so `jsonify`); only reads of :data:`DIRECTORIES` are intercepted. An assigned
+    directory is re-resolved upon its next read. Directories are only created once an artifact path is requested through
+    :meth:`artifact`. A user-specified temporary directory is created, and applied to `tempfile.tempdir`, upon
+    resolution.
+    """
+
+    working_directory: typing.Annotated[pathlib.Path, Field(strict=False), WithJsonSchema({})] = Field(default=".", description=Base.model_fields["working_directory"].description)
+
+    _resolved: bool = pydantic.PrivateAttr(default=False)
+    _created: bool = pydantic.PrivateAttr(default=False)
+
+    def model_post_init(self, __context: typing.Any) -> None:
+        pass
+
+    def __getattribute__(self, name: str) -> typing.Any:
+        if name in DIRECTORIES:
+            private = object.__getattribute__(self, "__pydantic_private__")
+
+            if private is not None and not private["_resolved"]:
+                object.__getattribute__(self, "resolve")()
+
+        return super().__getattribute__(name)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        super().__setattr__(name, value)
+
+        # An assigned directory is re-resolved upon its next read.
+        if name in DIRECTORIES:
+            self._resolved = False
+
+    def resolve(self) -> "Lazy":
+        """
+        Resolves (and verifies) every directory field in place, unless already resolved; called upon a directory
+        field's first read.
+
+        Returns
+        -------
+        Lazy
+            The instance, whose directory field(s) now hold resolved, absolute path(s).
+
+        Raises
+        ------
+        ValueError
+            If the working or artifacts directory exists as a non-directory. As with :meth:`Base.model_post_init`, a
+            missing directory is accepted (and only created by :meth:`artifact`, as configured).
+        """
+
+        if self._resolved:
+            return self
+
+        values = self.__dict__
+
+        default_tempdir = tempfile.gettempdir()
+
+        current = os.getcwd()
+
+        temporary_directory = location(current, str(values["temporary_directory"]))
+        working_directory = location(current, str(values["working_directory"]))
+        artifacts_directory = location(str(working_directory), str(values["artifacts_directory"]))
+
+        if working_directory.exists() and working_directory.is_dir() is False:
+            raise ValueError(f"Working directory '{working_directory}' is not a valid directory.")
+
+        if artifacts_directory.exists() and artifacts_directory.is_dir() is False:
+            raise ValueError(f"Artifacts directory '{artifacts_directory}' is not a valid directory.")
+
+        if str(temporary_directory) != default_tempdir:
+            temporary_directory.mkdir(parents=True, exist_ok=True)
+
+            tempfile.tempdir = str(temporary_directory)
+
+            logger.debug("Updated tempfile.tempdir to: %s", str(tempfile.tempdir))
+
+        values["temporary_directory"] = temporary_directory
+        values["working_directory"] = working_directory
+        values["artifacts_directory"] = artifacts_directory
+
+        self._resolved = True
+
+        logger.debug("Resolved Working Directory: %s, Artifacts Directory: %s", str(working_directory), str(artifacts_directory))
+
+        return self
+
+    def artifact(self, *partials: str) -> pathlib.Path:
+        """
+        Returns the path of an artifact, creating the working and artifacts directories (as configured) upon first use.
+
+        Parameters
+        ----------
+        partials : str
+            The artifact's path segment(s), relative to the artifacts directory.
+
+        Returns
+        -------
+        pathlib.Path
+            The artifact's absolute path.
+        """
+
+        self.resolve()
+
+        if not self._created:
+            if self.create_working_directory:
+                self.working_directory.mkdir(parents=True, exist_ok=True)
+
+            if self.create_artifacts_directory:
+                self.artifacts_directory.mkdir(parents=True, exist_ok=True)
+
+            self._created = True
+
+        return self.artifacts_directory.joinpath(*partials)
+
+    def model_dump(self, **kwargs: typing.Any) -> typing.Dict[str, typing.Any]:
+        self.resolve()
+
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: typing.Any) -> str:
+        self.resolve()
+
+        return super().model_dump_json(**kwargs)
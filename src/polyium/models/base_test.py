@@ -89,3 +89,89 @@ def test_base_instance_model_schema(request: pytest.FixtureRequest):
     content = json.dumps(v, indent=4, sort_keys=False)
 
     logger.debug("Schema: %s", content)
+
+def test_lazy_construction(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """
+    Tests that constructing a lazy instance performs no filesystem call(s), and that its directories are resolved (and
+    memoized) upon first access.
+    """
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Unexpected System Call")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(polyium.models.base.os, "getcwd", fail)
+        patch.setattr(pathlib.Path, "resolve", fail)
+        patch.setattr(pathlib.Path, "exists", fail)
+        patch.setattr(pathlib.Path, "mkdir", fail)
+
+        instance = polyium.models.base.Lazy(artifacts_directory="lazy-artifacts", create_artifacts_directory=True)
+
+    polyium.models.base.location.cache_clear()
+
+    assert instance.working_directory == pathlib.Path.cwd().resolve()
+    assert instance.artifacts_directory == pathlib.Path.cwd().resolve().joinpath("lazy-artifacts")
+    assert not instance.artifacts_directory.exists()
+    assert repr(str(instance.artifacts_directory)) in repr(instance)
+
+    polyium.models.base.Lazy().resolve()
+
+    assert polyium.models.base.location.cache_info().hits > 0
+
+def test_lazy_artifact(request: pytest.FixtureRequest):
+    """
+    Tests that directories are only created once an artifact path is requested.
+    """
+
+    temporary = pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name)
+
+    shutil.rmtree(temporary, ignore_errors=True)
+
+    instance = polyium.models.base.Lazy(working_directory=temporary, create_working_directory=True, create_artifacts_directory=True)
+
+    try:
+        assert not temporary.exists()
+
+        path = instance.artifact("schema.json")
+
+        assert path == temporary.joinpath("artifacts", "schema.json")
+        assert path.parent.is_dir()
+    finally:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+def test_lazy_working_directory(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that, as with :meth:`polyium.models.base.Base.model_post_init`, a missing working directory is accepted (and
+    not created), while one existing as a non-directory isn't.
+    """
+
+    missing = directory.joinpath("missing")
+
+    assert polyium.models.base.Lazy(working_directory=missing).working_directory == missing
+    assert not missing.exists()
+
+    directory.joinpath("file").touch()
+
+    with pytest.raises(ValueError):
+        polyium.models.base.Lazy(working_directory=directory.joinpath("file")).working_directory
+
+def test_lazy_serialization(request: pytest.FixtureRequest):
+    """
+    Tests that serialization, and re-assignment, observe resolved directories.
+    """
+
+    instance = polyium.models.base.Lazy()
+
+    content = json.loads(instance.model_dump_json(by_alias=True))
+
+    assert content["working-directory"] == str(pathlib.Path.cwd().resolve())
+
+    instance.artifacts_directory = pathlib.Path("other")
+
+    assert instance.artifacts_directory == pathlib.Path.cwd().resolve().joinpath("other")
+    assert instance.resolve() is instance
+
+    instance.artifacts_directory = pathlib.Path("another")
+
+    assert json.loads(instance.jsonify())["artifacts_directory"] == str(pathlib.Path.cwd().resolve().joinpath("another"))
+    assert instance.model_dump()["artifacts_directory"] == pathlib.Path.cwd().resolve().joinpath("another")
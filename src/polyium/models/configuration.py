@@ -2,9 +2,9 @@ import typing
 
 import pydantic
 
-import polyium.models.internal.utilities
+import polyium.models.internal.naming
 
-def default(title: typing.Optional[str] = None, metaschema: str = "https://json-schema.org/draft/2020-12/schema", **kwargs: typing.Any) -> pydantic.ConfigDict:
+def default(title: typing.Optional[str] = None, metaschema: str = "https://json-schema.org/draft/2020-12/schema", style: str = "train", **kwargs: typing.Any) -> pydantic.ConfigDict:
     """
     Creates a configuration dictionary for a Pydantic model with specified default
     settings, while allowing additional custom configurations to be passed.
@@ -21,6 +21,9 @@ def default(title: typing.Optional[str] = None, metaschema: str = "https://json-
 
     Parameters
     ----------
+    style : str
+        The naming style of field alias(es), field title(s), and model title(s): "train" (the default; or "kebab"),
+        "camel", "pascal", or "screaming-snake". See `polyium.models.internal.naming`.
     kwargs : pydantic.ConfigDict
         Additional configurations to override or extend the default values of the
         configuration dictionary.
@@ -32,6 +35,8 @@ def default(title: typing.Optional[str] = None, metaschema: str = "https://json-
         configurations. This can be applied to Pydantic model configuration.
     """
 
+    naming = polyium.models.internal.naming.style(style)
+
     if "json_schema_extra" not in kwargs:
         kwargs["json_schema_extra"] = {}
 
@@ -48,9 +53,9 @@ def default(title: typing.Optional[str] = None, metaschema: str = "https://json-
         strict=True,
         use_enum_values=True,
         use_attribute_docstrings=True,
-        alias_generator=polyium.models.internal.utilities.snake_case_to_train_case_alias_generator,
-        model_title_generator=polyium.models.internal.utilities.snake_case_to_train_case_model_title_generator,
-        field_title_generator=polyium.models.internal.utilities.snake_case_to_train_case_field_title_generator,
+        alias_generator=naming.alias,
+        model_title_generator=naming.model_title,
+        field_title_generator=naming.field_title,
         json_schema_serialization_defaults_required=True,
     )
 
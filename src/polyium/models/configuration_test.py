@@ -70,3 +70,31 @@ def test_field_aliases(request: pytest.FixtureRequest):
     assert "example-field-name" in schema["properties"]
 
     assert schema["properties"]["example-field-name"]["title"] == "example-field-name"
+
+@pytest.mark.parametrize("style, alias, title", [
+    ("kebab", "example-field-name", "h-t-t-p-server"),
+    ("camel", "exampleFieldName", "httpServer"),
+    ("pascal", "ExampleFieldName", "HTTPServer"),
+    ("screaming-snake", "EXAMPLE_FIELD_NAME", "HTTP_SERVER"),
+])
+def test_naming_style(request: pytest.FixtureRequest, style: str, alias: str, title: str):
+    """
+    Tests that the naming style applies to field aliases, field titles, and model titles.
+    """
+
+    class HTTPServer(pydantic.BaseModel):
+        model_config = module.default(style=style)
+
+        example_field_name: str = pydantic.Field(...)
+
+    schema = HTTPServer.model_json_schema()
+
+    logger.info("[%s] Content: %s", request.node.name, json.dumps(schema, indent=4))
+
+    assert list(schema["properties"]) == [alias]
+    assert schema["properties"][alias]["title"] == alias
+    assert schema["title"] == title
+
+def test_naming_style_unknown(request: pytest.FixtureRequest):
+    with pytest.raises(ValueError):
+        module.default(style="unknown")
@@ -1,6 +1,7 @@
 import pydantic
 
 import polyium.models.configuration
+import polyium.utilities.encodings
 
 class Model(pydantic.BaseModel):
     """
@@ -33,3 +34,24 @@ class Model(pydantic.BaseModel):
         """
 
         return self.model_dump_json(indent=4)
+
+    def encode(self, encoding: str = "pretty") -> bytes:
+        """
+        Serializes the object using the given output encoding.
+
+        JSON encodings other than "canonical" are serialized directly by pydantic; "canonical"
+        JSON and the binary encodings are produced from the object's JSON-compatible dump.
+
+        :param encoding: One of "pretty", "minified", "canonical", "cbor", or "msgpack";
+            see `polyium.utilities.encodings`.
+        :return: The encoded representation of the object.
+        :rtype: bytes
+        """
+
+        if encoding == "pretty":
+            return self.model_dump_json(indent=4).encode("utf-8")
+
+        if encoding == "minified":
+            return self.model_dump_json().encode("utf-8")
+
+        return polyium.utilities.encodings.encode(self.model_dump(mode="json"), encoding)
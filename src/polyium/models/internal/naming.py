@@ -0,0 +1,168 @@
+"""
+The naming module converts field and model name(s) into alias(es) and title(s) according to a naming style.
+
+Conversion(s) are invoked for every field of every model build, so pattern(s) are precompiled and result(s) are memoized
+(within a bounded cache) per style. Styles are pluggable: see :func:`register`, and the `style` parameter of
+`polyium.models.configuration.default`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import re
+import typing
+
+import pydantic.fields
+
+# The maximum number of memoized conversion(s), per style and name kind.
+MAXIMUM = 16384
+
+# A position preceding any uppercase character, other than the first; i.e. every uppercase character starts a word.
+uppercase = re.compile(r"(?<!^)(?=[A-Z])")
+
+# A word boundary within a mixed-case identifier, keeping acronym(s) whole, e.g. `HTTPServer` -> `HTTP`, `Server`.
+boundary = re.compile(r"[_\-\s]+|(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+def words(value: str) -> typing.List[str]:
+    """
+    Splits a snake_case, kebab-case, camelCase, or PascalCase identifier into its word(s).
+
+    Parameters
+    ----------
+    value : str
+        The identifier.
+
+    Returns
+    -------
+    list[str]
+        The non-empty word(s), with their original casing.
+    """
+
+    return [word for word in boundary.split(value) if word]
+
+def capitalize(word: str) -> str:
+    """
+    Uppercases a word's first character, preserving the remainder (e.g. acronyms).
+    """
+
+    return word[:1].upper() + word[1:]
+
+def train(value: str) -> str:
+    """
+    Converts a snake_case field name to train-case, e.g. `example_field_name` -> `example-field-name`.
+    """
+
+    return value.replace("_", "-").lower()
+
+def train_model(value: str) -> str:
+    """
+    Converts a PascalCase model name to train-case, e.g. `ExampleModel` -> `example-model`.
+    """
+
+    return uppercase.sub("-", value).lower()
+
+def camel(value: str) -> str:
+    """
+    Converts an identifier to camelCase, e.g. `example_field_name` -> `exampleFieldName`.
+    """
+
+    partials = words(value)
+
+    return "".join([partials[0].lower(), *(capitalize(partial) for partial in partials[1:])]) if partials else value
+
+def pascal(value: str) -> str:
+    """
+    Converts an identifier to PascalCase, e.g. `example_field_name` -> `ExampleFieldName`.
+    """
+
+    return "".join(capitalize(partial) for partial in words(value)) or value
+
+def screaming_snake(value: str) -> str:
+    """
+    Converts an identifier to SCREAMING_SNAKE_CASE, e.g. `ExampleModel` -> `EXAMPLE_MODEL`.
+    """
+
+    return "_".join(partial.upper() for partial in words(value)) or value
+
+@dataclasses.dataclass(frozen=True)
+class Style:
+    """
+    A naming style, providing pydantic's alias, field title, and model title generator(s).
+
+    Construct through :func:`register`, which memoizes the conversion function(s).
+
+    :ivar name: The style's name.
+    :ivar field: Converts a (snake_case) field name.
+    :ivar model: Converts a (PascalCase) model name.
+    """
+
+    name: str
+    field: typing.Callable[[str], str]
+    model: typing.Callable[[str], str]
+
+    def alias(self, field_name: str) -> str:
+        return self.field(field_name)
+
+    def field_title(self, field_name: str, info: pydantic.fields.FieldInfo | pydantic.fields.ComputedFieldInfo) -> str:
+        return self.field(field_name)
+
+    def model_title(self, model: type) -> str:
+        return self.model(model.__name__)
+
+styles: typing.Dict[str, Style] = {}
+
+def register(name: str, field: typing.Callable[[str], str], model: typing.Optional[typing.Callable[[str], str]] = None, aliases: typing.Iterable[str] = ()) -> Style:
+    """
+    Registers (or replaces) a naming style.
+
+    Parameters
+    ----------
+    name : str
+        The style's name.
+    field : typing.Callable[[str], str]
+        Converts a field name.
+    model : typing.Callable[[str], str] | None
+        Converts a model name; defaults to the field conversion.
+    aliases : typing.Iterable[str]
+        Additional name(s) under which the style is registered.
+
+    Returns
+    -------
+    Style
+        The registered style.
+    """
+
+    model = model or field
+
+    memoized = functools.lru_cache(maxsize=MAXIMUM)(field)
+
+    instance = Style(name=name, field=memoized, model=memoized if model is field else functools.lru_cache(maxsize=MAXIMUM)(model))
+
+    for key in (name, *aliases):
+        styles[key] = instance
+
+    return instance
+
+def style(name: typing.Union[str, Style]) -> Style:
+    """
+    Returns a registered naming style.
+
+    Raises
+    ------
+    ValueError
+        If no style is registered under the given name.
+    """
+
+    if isinstance(name, Style):
+        return name
+
+    if name not in styles:
+        raise ValueError("Unknown naming style \"%s\" (expected one of: %s)" % (name, ", ".join(sorted(styles))))
+
+    return styles[name]
+
+register("train", train, train_model, aliases=("train-case", "kebab", "kebab-case"))
+register("camel", camel, aliases=("camel-case",))
+register("pascal", pascal, aliases=("pascal-case",))
+register("screaming-snake", screaming_snake, aliases=("screaming-snake-case",))
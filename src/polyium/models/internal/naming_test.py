@@ -0,0 +1,68 @@
+import pytest
+import logging
+
+import polyium.models.internal.naming as module
+import polyium.models.internal.utilities
+
+logger = logging.getLogger(__name__)
+
+@pytest.mark.parametrize("value, expected", [
+    ("example_field_name", ["example", "field", "name"]),
+    ("exampleFieldName", ["example", "Field", "Name"]),
+    ("HTTPServerError", ["HTTP", "Server", "Error"]),
+    ("version2_id", ["version2", "id"]),
+    ("__private", ["private"]),
+])
+def test_words(request: pytest.FixtureRequest, value: str, expected: list):
+    assert module.words(value) == expected
+
+@pytest.mark.parametrize("value", ["example_field_name", "a__b", "_leading", "Mixed_Case", "HTTPServer", "User2Profile", ""])
+def test_train_compatibility(request: pytest.FixtureRequest, value: str):
+    """
+    Tests that the train-case style reproduces the original, uncached conversion(s) exactly.
+    """
+
+    import re
+
+    assert module.styles["train"].field(value) == "-".join(partial.lower() for partial in value.split("_"))
+    assert module.styles["train"].model(value) == re.sub(r"(?<!^)(?=[A-Z])", "-", value).lower()
+
+    assert polyium.models.internal.utilities.snake_case_to_train_case(value) == module.train(value)
+    assert polyium.models.internal.utilities.pascal_to_train_case(value) == module.train_model(value)
+
+@pytest.mark.parametrize("name, expected", [
+    ("camel", "userIdValue"),
+    ("pascal", "UserIdValue"),
+    ("screaming-snake", "USER_ID_VALUE"),
+    ("kebab", "user-id-value"),
+])
+def test_styles(request: pytest.FixtureRequest, name: str, expected: str):
+    assert module.style(name).alias("user_id_value") == expected
+
+def test_memoized(request: pytest.FixtureRequest):
+    style = module.style("camel")
+
+    style.field.cache_clear()
+
+    style.alias("memoized_field")
+    style.alias("memoized_field")
+
+    information = style.field.cache_info()
+
+    assert information.hits == 1
+    assert information.maxsize == module.MAXIMUM
+
+def test_register(request: pytest.FixtureRequest):
+    """
+    Tests that a custom style can be registered, and selected by name or alias.
+    """
+
+    instance = module.register("dotted", lambda value: ".".join(module.words(value)).lower(), aliases=("dot-case",))
+
+    try:
+        assert module.style("dot-case") is instance
+        assert instance.alias("example_field") == "example.field"
+        assert instance.model_title(type("ExampleModel", (), {})) == "example.model"
+    finally:
+        module.styles.pop("dotted")
+        module.styles.pop("dot-case")
@@ -3,10 +3,10 @@ General utilities.
 """
 from __future__ import annotations
 
-import re
-
 import pydantic.fields
 
+import polyium.models.internal.naming
+
 def pascal_to_train_case(s: str) -> str:
     """
     Converts a given string from PascalCase to train-case.
@@ -20,8 +20,7 @@ def pascal_to_train_case(s: str) -> str:
     :return: A new string in train-case format.
     """
 
-    
-    return re.sub(r"(?<!^)(?=[A-Z])", "-", s).lower()
+    return polyium.models.internal.naming.styles["train"].model(s)
 
 def snake_case_to_train_case(snake: str) -> str:
     """
@@ -43,14 +42,10 @@ def snake_case_to_train_case(snake: str) -> str:
         A string converted to train-case format.
     """
 
-    partials = snake.split("_")
-
-    return "-".join(partial.lower() for partial in partials).lower()
+    return polyium.models.internal.naming.styles["train"].field(snake)
 
 def snake_case_to_train_case_field_title_generator(field_name: str, info: pydantic.fields.FieldInfo | pydantic.fields.ComputedFieldInfo) -> str | None:
-    partials = field_name.split("_")
-
-    return "-".join(partial.lower() for partial in partials).lower()
+    return snake_case_to_train_case(field_name)
 
 def snake_case_to_train_case_model_title_generator(model: type) -> str | None:
     return pascal_to_train_case(model.__name__)
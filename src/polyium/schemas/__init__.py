@@ -0,0 +1,3 @@
+"""
+The schemas package contains the resolution, generation, and output logic for pydantic model JSON schema(s).
+"""
@@ -0,0 +1,327 @@
+"""
+The bundle module consolidates the `$defs` of many JSON schema(s) into a single, deduplicated definitions document.
+
+Each definition is hashed structurally (Merkle-style: a `$ref` contributes the hash of the definition it references,
+rather than its local name), so identical nested type(s) are emitted once regardless of the schema(s) that embed them,
+or of the name(s) they were given there. Every schema's `$ref`(s) are then rewritten to the shared document.
+
+Every bundle document is given a `$id` beneath a shared base URI (see :data:`BASE`), against which the relative `$ref`(s)
+to the shared document resolve; a validator locates the shared document by that `$id`, or (see
+`polyium.cli.validate`) as a sibling file of the bundled schema.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import typing
+
+logger = logging.getLogger(__name__)
+
+# The shared definitions document's file name, relative to the bundled schema(s).
+DEFINITIONS = "defs.json"
+
+# The default base URI of a bundle's document(s); the reserved `.invalid` domain (RFC 2606) ensures it's only used to
+# resolve the document(s) against one another, and is never retrieved.
+BASE = "https://json-schema-cli.invalid/bundle/"
+
+# The prefix of a local definition reference.
+PREFIX = "#/$defs/"
+
+@dataclasses.dataclass(frozen=True)
+class Statistics:
+    """
+    A summary of a bundle's deduplication.
+
+    :ivar schemas: The number of bundled schema(s).
+    :ivar definitions: The total number of definition(s) across all input schema(s).
+    :ivar unique: The number of unique definition(s) in the shared document.
+    :ivar before: The total size of the input schema(s), in bytes.
+    :ivar after: The total size of the bundle's document(s), in bytes.
+    """
+
+    schemas: int = 0
+    definitions: int = 0
+    unique: int = 0
+    before: int = 0
+    after: int = 0
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+    @property
+    def ratio(self) -> float:
+        """
+        The size reduction factor, e.g. `10.0` for a bundle a tenth of the input's size.
+        """
+
+        return self.before / self.after if self.after else 0.0
+
+@dataclasses.dataclass
+class Bundle:
+    """
+    A set of consolidated schema document(s).
+
+    :ivar documents: The serialized document(s), keyed by file name; includes the shared definitions document.
+    :ivar statistics: The bundle's deduplication statistics.
+    """
+
+    documents: typing.Dict[str, str]
+    statistics: Statistics
+
+def references(value: typing.Any, replace: typing.Callable[[str], typing.Optional[str]]) -> typing.Any:
+    """
+    Returns a copy of a JSON value with every local `$ref` (i.e. `#/$defs/<name>`) substituted.
+
+    Parameters
+    ----------
+    value : typing.Any
+        The JSON value.
+    replace : typing.Callable[[str], str | None]
+        Maps a referenced definition's name to the replacement `$ref` value; None retains the original.
+    """
+
+    if isinstance(value, dict):
+        result = {}
+
+        for key, item in value.items():
+            if key == "$ref" and isinstance(item, str) and item.startswith(PREFIX):
+                replacement = replace(item[len(PREFIX):])
+
+                result[key] = item if replacement is None else replacement
+            else:
+                result[key] = references(item, replace)
+
+        return result
+
+    if isinstance(value, list):
+        return [references(item, replace) for item in value]
+
+    return value
+
+def canonical(value: typing.Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+def components(graph: typing.Mapping[str, typing.Iterable[str]]) -> typing.List[typing.List[str]]:
+    """
+    Computes the strongly connected component(s) of a reference graph (Tarjan's algorithm, iteratively).
+
+    Returns
+    -------
+    list[list[str]]
+        The component(s), in reverse topological order: every component precedes the component(s) referencing it.
+    """
+
+    index: typing.Dict[str, int] = {}
+    low: typing.Dict[str, int] = {}
+    stack: typing.List[str] = []
+    active: typing.Set[str] = set()
+    result: typing.List[typing.List[str]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        active.add(root)
+
+        work = [(root, iter(graph[root]))]
+
+        while work:
+            node, children = work[-1]
+
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    active.add(child)
+
+                    work.append((child, iter(graph[child])))
+
+                    break
+
+                if child in active:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+
+                if work:
+                    low[work[-1][0]] = min(low[work[-1][0]], low[node])
+
+                if low[node] == index[node]:
+                    component: typing.List[str] = []
+
+                    while not component or component[-1] != node:
+                        component.append(stack.pop())
+                        active.discard(component[-1])
+
+                    result.append(component)
+
+    return result
+
+def digests(definitions: typing.Mapping[str, typing.Any]) -> typing.Dict[str, str]:
+    """
+    Computes the structural hash of every definition of a single schema.
+
+    Mutually recursive definition(s) (a strongly connected component of the reference graph) are hashed as a unit: each
+    member's hash covers the whole component, traversed from that member, with a reference within the component
+    contributing the referenced member's position in that traversal. The hash is thus independent of the member(s)'
+    name(s), yet distinguishes component(s) of the same shape but different content.
+
+    Parameters
+    ----------
+    definitions : typing.Mapping[str, typing.Any]
+        The schema's `$defs`.
+
+    Returns
+    -------
+    dict[str, str]
+        The hexadecimal hash of each definition, keyed by local name.
+    """
+
+    def targets(value: typing.Any) -> typing.List[str]:
+        found: typing.List[str] = []
+
+        references(value, lambda target: found.append(target))
+
+        return found
+
+    # Every definition, with key(s) sorted, so that a traversal's order is independent of key order.
+    ordered = {name: json.loads(canonical(value)) for name, value in definitions.items()}
+
+    graph = {name: [target for target in targets(value) if target in ordered] for name, value in ordered.items()}
+
+    memo: typing.Dict[str, str] = {}
+
+    def external(target: str) -> str:
+        return "#%s" % memo[target] if target in memo else "#missing:%s" % target
+
+    for component in components(graph):
+        members = set(component)
+
+        if len(component) == 1 and component[0] not in graph[component[0]]:
+            memo[component[0]] = hashlib.sha256(canonical(references(ordered[component[0]], external)).encode("utf-8")).hexdigest()
+
+            continue
+
+        hashes: typing.Dict[str, str] = {}
+
+        for member in component:
+            positions = {member: 0}
+            pending = [member]
+            parts: typing.List[str] = []
+
+            def internal(target: str) -> str:
+                if target not in members:
+                    return external(target)
+
+                if target not in positions:
+                    positions[target] = len(positions)
+                    pending.append(target)
+
+                return "#component:%d" % positions[target]
+
+            while pending:
+                parts.append(canonical(references(ordered[pending.pop(0)], internal)))
+
+            hashes[member] = hashlib.sha256(("component:%s" % "\n".join(parts)).encode("utf-8")).hexdigest()
+
+        memo.update(hashes)
+
+    return memo
+
+def consolidate(schemas: typing.Mapping[str, typing.Union[str, typing.Dict[str, typing.Any]]], indent: typing.Optional[int] = 4, base: str = BASE) -> Bundle:
+    """
+    Consolidates many schema(s) into a bundle of schema document(s) and a shared, deduplicated definitions document.
+
+    Definitions keep their original name where unambiguous; distinct definitions sharing a name are suffixed with a
+    prefix of their structural hash, so name(s) are stable for a given set of definitions.
+
+    Parameters
+    ----------
+    schemas : typing.Mapping[str, str | dict[str, typing.Any]]
+        The schema(s), serialized or parsed, keyed by name (e.g. a model's fully-qualified name).
+    indent : int | None
+        The output's JSON indentation.
+    base : str
+        The base URI of every document's `$id` (i.e. `<base><name>.json`, and `<base>defs.json`); replaces any `$id`
+        of the input schema(s).
+
+    Returns
+    -------
+    Bundle
+        A `<name>.json` document per schema, and the shared :data:`DEFINITIONS` document.
+    """
+
+    before = 0
+
+    parsed: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+
+    for name, schema in schemas.items():
+        if isinstance(schema, str):
+            before += len(schema.encode("utf-8")) + 1
+
+            schema = json.loads(schema)
+        else:
+            before += len(json.dumps(schema, indent=indent).encode("utf-8")) + 1
+
+        parsed[name] = schema
+
+    total = 0
+
+    # The hash of every local definition, per schema.
+    local: typing.Dict[str, typing.Dict[str, str]] = {}
+
+    # A representative (schema, local name) per unique hash.
+    unique: typing.Dict[str, typing.Tuple[str, str]] = {}
+
+    for name, schema in parsed.items():
+        definitions = schema.get("$defs", {})
+
+        total += len(definitions)
+
+        local[name] = digests(definitions)
+
+        for key, digest in local[name].items():
+            unique.setdefault(digest, (name, key))
+
+    # Assign stable name(s), disambiguating distinct definitions that share a name.
+    claimed: typing.Dict[str, typing.List[str]] = {}
+
+    for digest, (_, key) in unique.items():
+        claimed.setdefault(key, []).append(digest)
+
+    stable: typing.Dict[str, str] = {}
+
+    for key, candidates in claimed.items():
+        for digest in candidates:
+            stable[digest] = key if len(candidates) == 1 else "%s_%s" % (key, digest[:8])
+
+    def rewrite(name: str, value: typing.Any, prefix: str) -> typing.Any:
+        return references(value, lambda target: "%s%s" % (prefix, stable[local[name][target]]) if target in local[name] else None)
+
+    shared: typing.Dict[str, typing.Any] = {}
+
+    for digest, (name, key) in sorted(unique.items(), key=lambda item: stable[item[0]]):
+        shared[stable[digest]] = rewrite(name, parsed[name]["$defs"][key], PREFIX)
+
+    documents: typing.Dict[str, str] = {}
+
+    for name, schema in parsed.items():
+        body = {key: value for key, value in schema.items() if key not in ("$id", "$defs")}
+
+        documents["%s.json" % name] = json.dumps({"$id": "%s%s.json" % (base, name), **rewrite(name, body, "%s%s" % (DEFINITIONS, PREFIX))}, indent=indent)
+
+    documents[DEFINITIONS] = json.dumps({"$id": "%s%s" % (base, DEFINITIONS), "$defs": shared}, indent=indent)
+
+    after = sum(len(content.encode("utf-8")) + 1 for content in documents.values())
+
+    statistics = Statistics(schemas=len(parsed), definitions=total, unique=len(unique), before=before, after=after)
+
+    logger.debug("Bundled %d Schema(s): %d of %d Definition(s) Unique", statistics.schemas, statistics.unique, statistics.definitions)
+
+    return Bundle(documents=documents, statistics=statistics)
@@ -0,0 +1,188 @@
+import json
+import typing
+
+import jsonschema
+import pydantic
+import pytest
+import logging
+import referencing
+
+import polyium.schemas.bundle as module
+
+logger = logging.getLogger(__name__)
+
+class Address(pydantic.BaseModel):
+    street: str
+    city: str
+
+class Contact(pydantic.BaseModel):
+    email: str
+    address: Address
+
+class User(pydantic.BaseModel):
+    name: str
+    contact: Contact
+
+class Company(pydantic.BaseModel):
+    name: str
+    contacts: typing.List[Contact]
+    headquarters: Address
+
+class Node(pydantic.BaseModel):
+    value: int
+    children: typing.List["Node"] = []
+
+class Tree(pydantic.BaseModel):
+    root: Node
+
+def schemas(*models: typing.Type[pydantic.BaseModel]) -> typing.Dict[str, str]:
+    return {model.__name__: json.dumps(model.model_json_schema(), indent=4) for model in models}
+
+def registry(bundle: module.Bundle) -> referencing.Registry:
+    """
+    Registers every bundle document by its own `$id`.
+    """
+
+    return [referencing.Resource.from_contents(json.loads(content), default_specification=referencing.jsonschema.DRAFT202012) for content in bundle.documents.values()] @ referencing.Registry()
+
+def test_consolidate_deduplicates(request: pytest.FixtureRequest):
+    """
+    Tests that definition(s) shared by many schema(s) are emitted once, and that each schema's reference(s) are
+    rewritten to the shared document.
+    """
+
+    bundle = module.consolidate(schemas(User, Company))
+
+    logger.debug("Statistics: %s", bundle.statistics)
+
+    assert set(bundle.documents) == {"User.json", "Company.json", module.DEFINITIONS}
+    assert bundle.statistics.definitions == 4
+    assert bundle.statistics.unique == 2
+
+    shared = json.loads(bundle.documents[module.DEFINITIONS])["$defs"]
+
+    assert set(shared) == {"Address", "Contact"}
+    assert shared["Contact"]["properties"]["address"] == {"$ref": "#/$defs/Address"}
+
+    user = json.loads(bundle.documents["User.json"])
+
+    assert "$defs" not in user
+    assert user["properties"]["contact"] == {"$ref": "defs.json#/$defs/Contact"}
+
+def test_consolidate_validates(request: pytest.FixtureRequest):
+    """
+    Tests that a bundled schema validates instance(s) identically to the original schema.
+    """
+
+    bundle = module.consolidate(schemas(User, Company))
+
+    validator = jsonschema.Draft202012Validator(json.loads(bundle.documents["Company.json"]), registry=registry(bundle))
+
+    valid = {"name": "Example", "contacts": [{"email": "a@example.com", "address": {"street": "Main", "city": "Town"}}], "headquarters": {"street": "Main", "city": "Town"}}
+    invalid = {"name": "Example", "contacts": [{"email": "a@example.com", "address": {"street": "Main"}}], "headquarters": {"street": "Main", "city": "Town"}}
+
+    assert validator.is_valid(valid)
+    assert not validator.is_valid(invalid)
+
+def test_consolidate_identifiers(request: pytest.FixtureRequest):
+    """
+    Tests that every bundle document is identified beneath a shared base, so that a bundled schema's relative reference(s)
+    resolve to the shared definitions document.
+    """
+
+    bundle = module.consolidate(schemas(User), base="https://example.com/schemas/")
+
+    assert json.loads(bundle.documents["User.json"])["$id"] == "https://example.com/schemas/User.json"
+    assert json.loads(bundle.documents[module.DEFINITIONS])["$id"] == "https://example.com/schemas/defs.json"
+
+    validator = jsonschema.Draft202012Validator(json.loads(bundle.documents["User.json"]), registry=registry(bundle))
+
+    errors = list(validator.iter_errors({"name": "Example", "contact": {"email": "a@example.com", "address": {"street": "Main"}}}))
+
+    assert [list(error.absolute_path) for error in errors] == [["contact", "address"]]
+    assert validator.is_valid({"name": "Example", "contact": {"email": "a@example.com", "address": {"street": "Main", "city": "Town"}}})
+
+def test_consolidate_disambiguates(request: pytest.FixtureRequest):
+    """
+    Tests that structurally different definition(s) sharing a name are both retained, under stable, distinct name(s).
+    """
+
+    first = {"type": "object", "properties": {"item": {"$ref": "#/$defs/Item"}}, "$defs": {"Item": {"type": "string"}}}
+    second = {"type": "object", "properties": {"item": {"$ref": "#/$defs/Item"}}, "$defs": {"Item": {"type": "integer"}}}
+
+    bundle = module.consolidate({"first": first, "second": second})
+
+    shared = json.loads(bundle.documents[module.DEFINITIONS])["$defs"]
+
+    assert len(shared) == 2
+    assert all(name.startswith("Item_") for name in shared)
+
+    references = {json.loads(bundle.documents["%s.json" % name])["properties"]["item"]["$ref"] for name in ("first", "second")}
+
+    assert references == {"defs.json#/$defs/%s" % name for name in shared}
+    assert module.consolidate({"second": second, "first": first}).documents[module.DEFINITIONS] == bundle.documents[module.DEFINITIONS]
+
+def test_consolidate_recursive(request: pytest.FixtureRequest):
+    """
+    Tests that recursive definition(s) are hashed, deduplicated, and rewritten.
+    """
+
+    bundle = module.consolidate(schemas(Tree, Node))
+
+    shared = json.loads(bundle.documents[module.DEFINITIONS])["$defs"]
+
+    assert set(shared) == {"Node"}
+    assert shared["Node"]["properties"]["children"]["items"] == {"$ref": "#/$defs/Node"}
+
+    validator = jsonschema.Draft202012Validator(json.loads(bundle.documents["Tree.json"]), registry=registry(bundle))
+
+    assert validator.is_valid({"root": {"value": 1, "children": [{"value": 2}]}})
+    assert not validator.is_valid({"root": {"value": 1, "children": [{"value": "2"}]}})
+
+def test_consolidate_cycles(request: pytest.FixtureRequest):
+    """
+    Tests that mutually recursive definition(s) of the same shape, but different leaves, aren't merged, while identical
+    cycle(s) are, irrespective of name(s) and definition order.
+    """
+
+    def cycle(first: str, second: str, leaf: str) -> typing.Dict[str, typing.Any]:
+        return {
+            "type": "object",
+            "properties": {"root": {"$ref": "#/$defs/%s" % first}},
+            "$defs": {
+                first: {"type": "object", "properties": {"value": {"type": leaf}, "child": {"$ref": "#/$defs/%s" % second}}},
+                second: {"type": "object", "properties": {"parent": {"$ref": "#/$defs/%s" % first}}},
+            },
+        }
+
+    one, two = cycle("A", "B", "integer"), cycle("C", "D", "string")
+
+    bundle = module.consolidate({"one": one, "two": two})
+
+    assert bundle.statistics.unique == 4
+
+    validator = jsonschema.Draft202012Validator(json.loads(bundle.documents["two.json"]), registry=registry(bundle))
+
+    assert validator.is_valid({"root": {"value": "text", "child": {"parent": {"value": "text"}}}})
+    assert not validator.is_valid({"root": {"value": "text", "child": {"parent": {"value": 1}}}})
+
+    three = cycle("E", "F", "integer")
+    three["$defs"] = dict(reversed(list(three["$defs"].items())))
+
+    assert module.consolidate({"one": one, "three": three}).statistics.unique == 2
+    assert module.digests(three["$defs"]) == {"E": module.digests(one["$defs"])["A"], "F": module.digests(one["$defs"])["B"]}
+
+def test_consolidate_savings(request: pytest.FixtureRequest):
+    """
+    Tests that the bundle is smaller than its input(s) when many schema(s) share a nested type.
+    """
+
+    models = [pydantic.create_model("Model%d" % index, contact=(Contact, ...), company=(Company, ...)) for index in range(20)]
+
+    bundle = module.consolidate(schemas(*models))
+
+    logger.debug("Saved %d of %d Bytes (%.1fx)", bundle.statistics.saved, bundle.statistics.before, bundle.statistics.ratio)
+
+    assert bundle.statistics.unique == 3
+    assert bundle.statistics.saved > 0
+    assert bundle.statistics.ratio > 1
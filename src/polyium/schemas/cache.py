@@ -0,0 +1,573 @@
+"""
+The cache module provides a persistent, content-addressed cache of generated JSON schema(s).
+
+Entries are keyed by a module's fingerprint: a digest of the module's source, the source(s) of its transitively imported
+first-party module(s), the pydantic version, and the source(s) backing `polyium.models.configuration.default()`. A
+module is first-party if it belongs to polyium, or a target's package, or if its source lies outside both the standard
+library and the installed package directories, whatever its package. Because fingerprints are computed from source text
+and `ast`-derived import graphs, unchanged model(s) are served without their module(s) being imported.
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import logging
+import os
+import pathlib
+import sys
+import sysconfig
+import tempfile
+import typing
+
+logger = logging.getLogger(__name__)
+
+# Incremented whenever the on-disk entry format, or the fingerprint composition, changes.
+FORMAT = 2
+
+# The default upper-bound of the cache's total size, in bytes.
+MAXIMUM_BYTES = 256 * 1024 * 1024
+
+def default(temporary_directory: typing.Union[str, os.PathLike]) -> pathlib.Path:
+    """
+    Returns the default cache directory, relative to a (typically `polyium.models.base.Base`) temporary directory.
+    """
+
+    return pathlib.Path(temporary_directory).joinpath("json-schema-cli", "cache")
+
+def imports(source: typing.Union[str, bytes], module: str, package: bool = False) -> typing.List[str]:
+    """
+    Extracts the absolute name(s) of all module(s) imported by the given source.
+
+    Parent package(s) of an imported module are included (as they are executed upon import), and the target(s) of
+    `from x import y` statement(s) are included as `x.y` candidate(s), since `y` may itself be a submodule.
+
+    Parameters
+    ----------
+    source : str | bytes
+        The module's source code.
+    module : str
+        The module's fully-qualified name; used to resolve relative import(s).
+    package : bool
+        Whether the module is a package's `__init__` module.
+
+    Returns
+    -------
+    list[str]
+        The sorted, imported module name(s) and candidate(s).
+    """
+
+    tree = ast.parse(source)
+
+    names: typing.Set[str] = set()
+
+    parent = module if package else module.rpartition(".")[0]
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+
+            if node.level > 0:
+                partials = parent.split(".")
+
+                if node.level - 1 >= len(partials):
+                    continue
+
+                anchor = ".".join(partials[:len(partials) - (node.level - 1)])
+
+                base = "%s.%s" % (anchor, base) if base else anchor
+
+            if base:
+                names.add(base)
+
+            names.update("%s.%s" % (base, alias.name) if base else alias.name for alias in node.names if alias.name != "*")
+
+    # Include parent package(s), which are executed as part of importing any submodule.
+    for name in list(names):
+        partials = name.split(".")
+
+        names.update(".".join(partials[:index]) for index in range(1, len(partials)))
+
+    return sorted(names)
+
+class Locator:
+    """
+    Locates the source file(s) of first-party module(s) without importing them.
+
+    A top-level package is first-party if it's explicitly named, or if its source lies outside the standard library and
+    installed package (site-packages) directories; e.g. a sibling package on the module search path that a target
+    package's model(s) import. Only the top-level package's specification is looked up through the import system;
+    nested module(s) are resolved by walking the package's search location(s) on the filesystem.
+
+    :ivar packages: The top-level package name(s) that are always first-party.
+    """
+
+    def __init__(self, packages: typing.Iterable[str]):
+        self.packages = frozenset(packages)
+
+        paths = sysconfig.get_paths()
+
+        excluded = [paths[key] for key in ("stdlib", "platstdlib", "purelib", "platlib") if key in paths]
+
+        self._excluded = tuple(os.path.join(os.path.realpath(path), "") for path in excluded)
+
+        self._roots: typing.Dict[str, typing.Tuple[typing.Optional[str], typing.List[str]]] = {}
+        self._sources: typing.Dict[str, typing.Optional[typing.Tuple[str, bool]]] = {}
+
+    def _root(self, name: str) -> typing.Tuple[typing.Optional[str], typing.List[str]]:
+        if name not in self._roots:
+            try:
+                specification = importlib.util.find_spec(name)
+            except (ImportError, ValueError):
+                specification = None
+
+            if specification is None:
+                self._roots[name] = (None, [])
+            else:
+                origin = specification.origin if specification.has_location else None
+
+                self._roots[name] = (origin, list(specification.submodule_search_locations or []))
+
+        return self._roots[name]
+
+    def first_party(self, name: str) -> bool:
+        """
+        Determines whether a top-level package is first-party, by name or by the location of its source.
+        """
+
+        if name in self.packages:
+            return True
+
+        origin, locations = self._root(name)
+
+        paths = [origin] if origin is not None else list(locations)
+
+        return bool(paths) and not any(os.path.realpath(path).startswith(self._excluded) for path in paths)
+
+    def find(self, module: str) -> typing.Optional[typing.Tuple[str, bool]]:
+        """
+        Finds a first-party module's source file.
+
+        Parameters
+        ----------
+        module : str
+            The fully-qualified module name.
+
+        Returns
+        -------
+        tuple[str, bool] | None
+            The module's source path and whether it's a package, or None if the module isn't a first-party source module.
+        """
+
+        if module in self._sources:
+            return self._sources[module]
+
+        partials = module.split(".")
+
+        result: typing.Optional[typing.Tuple[str, bool]] = None
+
+        if self.first_party(partials[0]):
+            origin, locations = self._root(partials[0])
+
+            if len(partials) == 1:
+                if origin is not None and origin.endswith(".py"):
+                    result = (origin, bool(locations))
+            else:
+                for location in locations:
+                    base = os.path.join(location, *partials[1:])
+
+                    if os.path.isfile(base + ".py"):
+                        result = (base + ".py", False)
+                        break
+
+                    if os.path.isfile(os.path.join(base, "__init__.py")):
+                        result = (os.path.join(base, "__init__.py"), True)
+                        break
+
+        self._sources[module] = result
+
+        return result
+
+    def invalidate(self) -> None:
+        """
+        Discards all memoized lookup(s), e.g. after module(s) have been created or deleted.
+        """
+
+        self._sources.clear()
+
+@dataclasses.dataclass
+class Source:
+    """
+    The memoized digest and import(s) of a source file, valid for the recorded modification time and size.
+    """
+
+    mtime: int
+    size: int
+    digest: str
+    imports: typing.List[str]
+
+class Fingerprinter:
+    """
+    Computes module fingerprint(s) from source text and the transitive first-party import graph.
+
+    Source digest(s) and import list(s) are memoized per file by modification time and size, and may be persisted
+    across invocation(s) through :meth:`load` and :meth:`save`.
+
+    :ivar locator: The first-party module locator.
+    :ivar salt: Additional, invocation-wide key material (e.g. generation option(s)).
+    """
+
+    def __init__(self, packages: typing.Iterable[str], salt: typing.Mapping[str, typing.Any] | None = None):
+        # Polyium is named explicitly, as it may itself be installed (e.g. into site-packages).
+        self.locator = Locator({"polyium", *packages})
+
+        self.salt = dict(salt or {})
+
+        self._sources: typing.Dict[str, Source] = {}
+        self._closures: typing.Dict[str, typing.List[str]] = {}
+        self._modified = False
+        self._environment: typing.Optional[str] = None
+
+    def load(self, path: pathlib.Path) -> None:
+        """
+        Loads persisted source metadata; missing or corrupt file(s) are ignored.
+        """
+
+        try:
+            content = json.loads(path.read_text(encoding="utf-8"))
+
+            if content.get("format") == FORMAT:
+                self._sources = {key: Source(**value) for key, value in content["sources"].items()}
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.debug("Unable to Load Source Metadata (%s): %s", str(path), e)
+
+    def save(self, path: pathlib.Path) -> None:
+        """
+        Atomically persists source metadata, if modified since loaded.
+        """
+
+        if not self._modified:
+            return
+
+        content = json.dumps({"format": FORMAT, "sources": {key: dataclasses.asdict(value) for key, value in self._sources.items()}})
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=".%s." % path.name)
+
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                handle.write(content)
+
+            os.replace(temporary, path)
+        except BaseException:
+            pathlib.Path(temporary).unlink(missing_ok=True)
+            raise
+
+        self._modified = False
+
+    def source(self, module: str) -> typing.Optional[Source]:
+        """
+        Returns the (memoized) source metadata of a first-party module.
+        """
+
+        location = self.locator.find(module)
+
+        if location is None:
+            return None
+
+        path, package = location
+
+        statistics = os.stat(path)
+
+        memoized = self._sources.get(path)
+
+        if memoized is not None and memoized.mtime == statistics.st_mtime_ns and memoized.size == statistics.st_size:
+            return memoized
+
+        content = pathlib.Path(path).read_bytes()
+
+        try:
+            names = imports(content, module, package=package)
+        except SyntaxError as e:
+            logger.debug("Unable to Parse Module Source (%s): %s", path, e)
+
+            names = []
+
+        memoized = Source(mtime=statistics.st_mtime_ns, size=statistics.st_size, digest=hashlib.sha256(content).hexdigest(), imports=names)
+
+        self._sources[path] = memoized
+        self._modified = True
+
+        return memoized
+
+    def invalidate(self) -> None:
+        """
+        Discards memoized module location(s) and import closure(s); source digest(s) remain valid by modification time.
+        """
+
+        self.locator.invalidate()
+
+        self._closures.clear()
+
+    def dependencies(self, module: str) -> typing.List[str]:
+        """
+        Returns the first-party module(s) directly imported by a module.
+        """
+
+        source = self.source(module)
+
+        if source is None:
+            return []
+
+        return [name for name in source.imports if name != module and self.locator.find(name) is not None]
+
+    def closure(self, module: str) -> typing.List[str]:
+        """
+        Returns the sorted, transitive set of first-party module(s) imported by a module, including itself.
+        """
+
+        if module in self._closures:
+            return self._closures[module]
+
+        visited: typing.Set[str] = set()
+        pending = [module]
+
+        while pending:
+            name = pending.pop()
+
+            if name in visited:
+                continue
+
+            source = self.source(name)
+
+            if source is None:
+                continue
+
+            visited.add(name)
+
+            pending.extend(candidate for candidate in source.imports if candidate not in visited)
+
+        self._closures[module] = sorted(visited)
+
+        return self._closures[module]
+
+    def environment(self) -> str:
+        """
+        Returns the digest of invocation-wide key material: the cache format, python and pydantic version(s),
+        the model configuration source(s), and the salt.
+        """
+
+        if self._environment is None:
+            try:
+                version = importlib.metadata.version("pydantic")
+            except importlib.metadata.PackageNotFoundError:
+                version = None
+
+            configuration = {name: self.source(name).digest for name in self.closure("polyium.models.configuration")}
+
+            material = {"format": FORMAT, "python": list(sys.version_info[:2]), "pydantic": version, "configuration": configuration, "salt": self.salt}
+
+            self._environment = hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+        return self._environment
+
+    def fingerprint(self, module: str) -> typing.Optional[str]:
+        """
+        Computes a module's fingerprint.
+
+        Parameters
+        ----------
+        module : str
+            The fully-qualified module name.
+
+        Returns
+        -------
+        str | None
+            The hexadecimal fingerprint, or None if the module's source cannot be located (and so cannot be cached).
+        """
+
+        if self.source(module) is None:
+            return None
+
+        digest = hashlib.sha256(self.environment().encode("utf-8"))
+
+        for name in self.closure(module):
+            digest.update(b"\0%s\0%s" % (name.encode("utf-8"), self.source(name).digest.encode("utf-8")))
+
+        return digest.hexdigest()
+
+@dataclasses.dataclass
+class Entry:
+    """
+    A cached module's generated schema(s).
+
+    :ivar module: The module's fully-qualified name.
+    :ivar defined: The name(s) of all model(s) defined within the module.
+    :ivar models: A mapping of the name used to reference a model from the module, to the model's defining module,
+        qualified name, and serialized schema.
+    """
+
+    module: str
+    defined: typing.List[str] = dataclasses.field(default_factory=list)
+    models: typing.Dict[str, typing.Dict[str, str]] = dataclasses.field(default_factory=dict)
+
+@dataclasses.dataclass(frozen=True)
+class Statistics:
+    """
+    A summary of the cache's on-disk state.
+    """
+
+    directory: pathlib.Path
+    entries: int
+    bytes: int
+
+class Cache:
+    """
+    A size-bounded, least-recently-used, on-disk cache of :class:`Entry` object(s) keyed by fingerprint.
+
+    Recency is tracked through entry file modification time(s), which are refreshed upon every hit.
+
+    :ivar directory: The cache's root directory.
+    :ivar maximum: The maximum total size of all entries, in bytes.
+    """
+
+    def __init__(self, directory: typing.Union[str, os.PathLike], maximum: int = MAXIMUM_BYTES):
+        self.directory = pathlib.Path(directory)
+        self.maximum = maximum
+
+    @property
+    def sources(self) -> pathlib.Path:
+        """
+        The path of the persisted source metadata used by :class:`Fingerprinter`.
+        """
+
+        return self.directory.joinpath("sources.json")
+
+    @property
+    def index(self) -> pathlib.Path:
+        """
+        The path of the persisted model discovery index used by `polyium.schemas.discovery.Index`.
+        """
+
+        return self.directory.joinpath("discovery.json")
+
+    def path(self, fingerprint: str) -> pathlib.Path:
+        return self.directory.joinpath("entries", fingerprint[:2], "%s.json" % fingerprint)
+
+    def get(self, fingerprint: str) -> typing.Optional[Entry]:
+        """
+        Returns the entry for a fingerprint, marking it as recently used, or None on a miss.
+        """
+
+        path = self.path(fingerprint)
+
+        try:
+            entry = Entry(**json.loads(path.read_text(encoding="utf-8")))
+
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("Discarding Corrupt Cache Entry (%s): %s", str(path), e)
+
+            path.unlink(missing_ok=True)
+
+            return None
+
+        return entry
+
+    def put(self, fingerprint: str, entry: Entry) -> None:
+        """
+        Atomically stores the entry for a fingerprint.
+        """
+
+        path = self.path(fingerprint)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=".%s." % path.name)
+
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(dataclasses.asdict(entry), handle)
+
+            os.replace(temporary, path)
+        except BaseException:
+            pathlib.Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def entries(self) -> typing.List[typing.Tuple[pathlib.Path, os.stat_result]]:
+        """
+        Lists all entries with their stat result(s), least-recently used first.
+        """
+
+        entries: typing.List[typing.Tuple[pathlib.Path, os.stat_result]] = []
+
+        root = self.directory.joinpath("entries")
+
+        if not root.is_dir():
+            return entries
+
+        with os.scandir(root) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+
+                with os.scandir(shard.path) as files:
+                    entries.extend((pathlib.Path(file.path), file.stat()) for file in files if file.name.endswith(".json") and not file.name.startswith("."))
+
+        entries.sort(key=lambda entry: entry[1].st_mtime_ns)
+
+        return entries
+
+    def statistics(self) -> Statistics:
+        entries = self.entries()
+
+        return Statistics(directory=self.directory, entries=len(entries), bytes=sum(statistics.st_size for _, statistics in entries))
+
+    def prune(self, maximum: typing.Optional[int] = None, entries: typing.Optional[int] = None) -> int:
+        """
+        Evicts least-recently used entries until the cache is within the given bound(s).
+
+        Parameters
+        ----------
+        maximum : int | None
+            The maximum total size, in bytes. Defaults to the cache's configured maximum.
+        entries : int | None
+            The maximum number of entries; unbounded if not specified.
+
+        Returns
+        -------
+        int
+            The number of evicted entries.
+        """
+
+        maximum = self.maximum if maximum is None else maximum
+
+        listing = self.entries()
+
+        total = sum(statistics.st_size for _, statistics in listing)
+        count = len(listing)
+
+        evicted = 0
+
+        for path, statistics in listing:
+            if total <= maximum and (entries is None or count <= entries):
+                break
+
+            path.unlink(missing_ok=True)
+
+            total -= statistics.st_size
+            count -= 1
+            evicted += 1
+
+        logger.debug("Evicted %d Cache Entries: %s", evicted, str(self.directory))
+
+        return evicted
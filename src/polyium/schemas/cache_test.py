@@ -0,0 +1,166 @@
+import os
+import pathlib
+import sys
+import textwrap
+
+import pytest
+import logging
+
+import polyium.schemas.cache as module
+import polyium.schemas.generator
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture()
+def directory(directory: pathlib.Path) -> pathlib.Path:
+    """
+    Populates the temporary directory with a first-party model package.
+    """
+
+    package = directory.joinpath("source", "cached_package")
+    package.mkdir(parents=True)
+
+    package.joinpath("__init__.py").write_text("")
+    package.joinpath("common.py").write_text(textwrap.dedent("""
+        import pydantic
+
+        class Address(pydantic.BaseModel):
+            street: str
+    """))
+    package.joinpath("users.py").write_text(textwrap.dedent("""
+        import pydantic
+
+        from .common import Address
+
+        class User(pydantic.BaseModel):
+            address: Address
+    """))
+
+    sys.path.insert(0, str(directory.joinpath("source")))
+
+    try:
+        yield directory
+    finally:
+        sys.path.remove(str(directory.joinpath("source")))
+
+        for name in [name for name in sys.modules if name.startswith("cached_package")]:
+            del sys.modules[name]
+
+def test_imports_relative(request: pytest.FixtureRequest):
+    source = "import os.path\nfrom . import sibling\nfrom ..parent import name\n"
+
+    names = module.imports(source, "root.package.module")
+
+    assert "os" in names
+    assert "os.path" in names
+    assert "root.package.sibling" in names
+    assert "root.parent" in names
+    assert "root.parent.name" in names
+
+def test_imports_relative_package(request: pytest.FixtureRequest):
+    assert "root.package.sibling" in module.imports("from .sibling import value\n", "root.package", package=True)
+
+def test_locator(request: pytest.FixtureRequest):
+    locator = module.Locator({"polyium"})
+
+    path, package = locator.find("polyium.models.base")
+
+    assert path.endswith("base.py")
+    assert package is False
+
+    assert locator.find("polyium.models")[1] is True
+    assert locator.find("pydantic") is None
+
+def test_fingerprint_closure(request: pytest.FixtureRequest):
+    """
+    Tests that a module's fingerprint covers its transitive first-party import(s).
+    """
+
+    instance = module.Fingerprinter({"polyium"})
+
+    closure = instance.closure("polyium.models.base")
+
+    logger.debug("[%s] Closure: %s", request.node.name, closure)
+
+    assert "polyium.models.configuration" in closure
+    assert "polyium.models.internal.naming" in closure
+
+def test_fingerprint_salt(request: pytest.FixtureRequest):
+    a = module.Fingerprinter({"polyium"}, salt={"mode": "validation"}).fingerprint("polyium.models.base")
+    b = module.Fingerprinter({"polyium"}, salt={"mode": "serialization"}).fingerprint("polyium.models.base")
+
+    assert a is not None
+    assert a == module.Fingerprinter({"polyium"}, salt={"mode": "validation"}).fingerprint("polyium.models.base")
+    assert a != b
+
+def test_fingerprint_cross_package(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that a fingerprint covers a first-party module of another top-level package, while standard library and
+    installed module(s) are excluded.
+    """
+
+    shared = directory.joinpath("source", "cached_shared")
+    shared.mkdir()
+    shared.joinpath("__init__.py").write_text("LIMIT = 1\n")
+
+    directory.joinpath("source", "cached_package", "limits.py").write_text("import json\nimport pydantic\n\nfrom cached_shared import LIMIT\n")
+
+    instance = module.Fingerprinter({"cached_package"})
+
+    assert instance.closure("cached_package.limits") == ["cached_package.limits", "cached_shared"]
+
+    limits, users = instance.fingerprint("cached_package.limits"), instance.fingerprint("cached_package.users")
+
+    shared.joinpath("__init__.py").write_text("LIMIT = 100\n")
+
+    instance = module.Fingerprinter({"cached_package"})
+
+    assert instance.fingerprint("cached_package.limits") != limits
+    assert instance.fingerprint("cached_package.users") == users
+
+def test_cache_prune(request: pytest.FixtureRequest, directory: pathlib.Path):
+    cache = module.Cache(directory.joinpath("cache"))
+
+    for index in range(4):
+        cache.put("%064d" % index, module.Entry(module="example", defined=["Example"], models={}))
+
+        # Assign distinct, increasing modification time(s) regardless of the filesystem's timestamp granularity.
+        os.utime(cache.path("%064d" % index), (index + 1, index + 1))
+
+    # Mark the first entry as most-recently used.
+    assert cache.get("%064d" % 0) is not None
+
+    assert cache.statistics().entries == 4
+
+    assert cache.prune(entries=1) == 3
+
+    assert cache.get("%064d" % 0) is not None
+    assert cache.get("%064d" % 3) is None
+
+def test_batch_cache_hit(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that unchanged module(s) are served from the cache without being imported, and that a change to a transitively
+    imported module invalidates its importer(s).
+    """
+
+    cache = module.Cache(directory.joinpath("cache"))
+
+    results = list(polyium.schemas.generator.batch(["cached_package.*:*"], jobs=1, cache=cache))
+
+    assert sorted(result.task.name for result in results) == ["cached_package.common.Address", "cached_package.users.User"]
+
+    for name in [name for name in sys.modules if name.startswith("cached_package.")]:
+        del sys.modules[name]
+
+    cached = list(polyium.schemas.generator.batch(["cached_package.*:*"], jobs=1, cache=cache))
+
+    assert [result.content for result in cached] == [result.content for result in results]
+
+    assert "cached_package.users" not in sys.modules
+
+    with directory.joinpath("source", "cached_package", "common.py").open("a") as handle:
+        handle.write("\n# Modification\n")
+
+    list(polyium.schemas.generator.batch(["cached_package.users:User"], jobs=1, cache=cache))
+
+    assert "cached_package.users" in sys.modules
@@ -0,0 +1,443 @@
+"""
+The diff module structurally compares JSON schema(s), classifying every change as breaking or non-breaking.
+
+A change is breaking if a document valid against the old schema may be invalid against the new one (e.g. a removed
+field, a new required field, a narrowed type, or a shrunk enum).
+
+Unchanged file(s) are skipped by their content alone, without being parsed. Within a changed schema, every subtree is
+hashed Merkle-style (a node's hash derives from its children's hashes, each computed once), so identical subtree(s) are
+skipped with a single comparison, and only the path(s) leading to a change are descended.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import typing
+
+logger = logging.getLogger(__name__)
+
+# Keyword(s) that don't affect validation.
+ANNOTATIONS = frozenset({"title", "description", "examples", "default", "$comment", "deprecated", "readOnly", "writeOnly", "$schema", "$id"})
+
+# Keyword(s) whose value is a single subschema.
+SUBSCHEMAS = frozenset({"items", "additionalProperties", "additionalItems", "unevaluatedProperties", "unevaluatedItems", "contains", "propertyNames", "not", "if", "then", "else"})
+
+# Keyword(s) whose value maps name(s) to subschema(s), where an added or removed entry is non-breaking.
+DEFINITIONS = frozenset({"$defs", "definitions"})
+
+# Keyword(s) whose value is a list of alternative subschema(s).
+ALTERNATIVES = frozenset({"anyOf", "oneOf"})
+
+# Keyword(s) whose value is a positional list of subschema(s).
+POSITIONAL = frozenset({"allOf", "prefixItems"})
+
+# Numeric lower and upper bound keyword(s); a higher lower bound, or a lower upper bound, is breaking.
+MINIMUMS = frozenset({"minimum", "exclusiveMinimum", "minLength", "minItems", "minProperties", "minContains"})
+MAXIMUMS = frozenset({"maximum", "exclusiveMaximum", "maxLength", "maxItems", "maxProperties", "maxContains"})
+
+@dataclasses.dataclass(frozen=True)
+class Change:
+    """
+    A single schema change.
+
+    :ivar schema: The schema's path, relative to the compared directories.
+    :ivar pointer: The JSON pointer of the changed location within the schema.
+    :ivar kind: The change's classification, e.g. `removed-field` or `added-optional-field`.
+    :ivar breaking: Whether a document valid against the old schema may be invalid against the new schema.
+    :ivar old: The old value, if any.
+    :ivar new: The new value, if any.
+    """
+
+    schema: str
+    pointer: str
+    kind: str
+    breaking: bool
+    old: typing.Any = None
+    new: typing.Any = None
+
+@dataclasses.dataclass
+class Report:
+    """
+    The outcome of a comparison.
+
+    :ivar changes: Every change, ordered by schema and pointer.
+    :ivar schemas: The number of compared schema(s).
+    :ivar unchanged: The number of schema(s) skipped as byte-for-byte identical.
+    :ivar subtrees: The number of identical subtree(s) skipped within changed schema(s).
+    """
+
+    changes: typing.List[Change] = dataclasses.field(default_factory=list)
+    schemas: int = 0
+    unchanged: int = 0
+    subtrees: int = 0
+
+    @property
+    def breaking(self) -> typing.List[Change]:
+        return [change for change in self.changes if change.breaking]
+
+    def serialize(self) -> typing.Dict[str, typing.Any]:
+        """
+        Returns a JSON-compatible representation of the report.
+        """
+
+        return {
+            "schemas": self.schemas,
+            "unchanged": self.unchanged,
+            "breaking": len(self.breaking),
+            "changes": [dataclasses.asdict(change) for change in self.changes],
+        }
+
+def escape(token: str) -> str:
+    """
+    Escapes a JSON pointer reference token (RFC 6901).
+    """
+
+    return token.replace("~", "~0").replace("/", "~1")
+
+def types(schema: typing.Any) -> typing.Optional[typing.FrozenSet[str]]:
+    """
+    Returns a schema's permitted type(s), or None if unconstrained.
+    """
+
+    value = schema.get("type") if isinstance(schema, dict) else None
+
+    if value is None:
+        return None
+
+    return frozenset([value] if isinstance(value, str) else value)
+
+def covered(kind: str, permitted: typing.Optional[typing.FrozenSet[str]]) -> bool:
+    return permitted is None or kind in permitted or (kind == "integer" and "number" in permitted)
+
+class Comparator:
+    """
+    Compares two version(s) of a single schema, collecting change(s).
+
+    Subtree hash(es) are memoized by object identity, so both document(s) must remain unmodified during a comparison.
+
+    :ivar schema: The schema's name, recorded on each change.
+    :ivar changes: The collected change(s).
+    :ivar skipped: The number of identical subtree(s) skipped.
+    """
+
+    def __init__(self, schema: str):
+        self.schema = schema
+        self.changes: typing.List[Change] = []
+        self.skipped = 0
+
+        self._digests: typing.Dict[int, bytes] = {}
+
+    def digest(self, value: typing.Any) -> bytes:
+        """
+        Returns a subtree's Merkle hash; a container's hash derives from its (memoized) children's hash(es).
+        """
+
+        key = id(value)
+
+        if key in self._digests:
+            return self._digests[key]
+
+        hasher = hashlib.blake2b(digest_size=16)
+
+        if isinstance(value, dict):
+            hasher.update(b"{")
+
+            for name in sorted(value):
+                hasher.update(json.dumps(name).encode("utf-8"))
+                hasher.update(self.digest(value[name]))
+        elif isinstance(value, list):
+            hasher.update(b"[")
+
+            for item in value:
+                hasher.update(self.digest(item))
+        else:
+            hasher.update(json.dumps(value).encode("utf-8"))
+
+        # Scalar(s) may be interned and shared; only container(s) are memoized by identity.
+        if isinstance(value, (dict, list)):
+            self._digests[key] = hasher.digest()
+
+        return hasher.digest()
+
+    def record(self, pointer: str, kind: str, breaking: bool, old: typing.Any = None, new: typing.Any = None) -> None:
+        self.changes.append(Change(schema=self.schema, pointer=pointer or "/", kind=kind, breaking=breaking, old=old, new=new))
+
+    def compare(self, old: typing.Any, new: typing.Any, pointer: str = "") -> None:
+        """
+        Compares two (sub)schema(s), recording every change beneath the given pointer.
+        """
+
+        if self.digest(old) == self.digest(new):
+            self.skipped += 1
+
+            return
+
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            # Boolean schema(s); `true` (or `{}`) accepts everything, and `false` nothing.
+            self.record(pointer, "schema-changed", not (new is True or new == {}), old, new)
+
+            return
+
+        for keyword in sorted(old.keys() | new.keys()):
+            present = (keyword in old, keyword in new)
+
+            before, after = old.get(keyword), new.get(keyword)
+
+            if present == (True, True) and self.digest(before) == self.digest(after):
+                self.skipped += 1
+
+                continue
+
+            location = "%s/%s" % (pointer, escape(keyword))
+
+            if keyword in ANNOTATIONS:
+                self.record(location, "annotation-changed", False, before, after)
+            elif keyword == "properties":
+                self.properties(old, new, location)
+            elif keyword == "required":
+                self.required(old, new, location)
+            elif keyword == "type":
+                self.type(old, new, location)
+            elif keyword == "enum":
+                self.enum(before, after, location)
+            elif keyword in DEFINITIONS or keyword in ("patternProperties", "dependentSchemas"):
+                self.mapping(before or {}, after or {}, location, additions=keyword in DEFINITIONS)
+            elif keyword in SUBSCHEMAS:
+                self.subschema(before, after, location)
+            elif keyword in ALTERNATIVES:
+                self.alternatives(before, after, location)
+            elif keyword in POSITIONAL:
+                self.positional(before, after, location)
+            elif keyword in MINIMUMS or keyword in MAXIMUMS:
+                self.bound(keyword, before, after, location)
+            elif keyword == "$ref":
+                self.record(location, "reference-changed", True, before, after)
+            elif keyword == "const":
+                self.record(location, "const-changed", present[1], before, after)
+            else:
+                self.record(location, "constraint-changed", present[1], before, after)
+
+    def properties(self, old: typing.Dict[str, typing.Any], new: typing.Dict[str, typing.Any], pointer: str) -> None:
+        before, after = old.get("properties", {}), new.get("properties", {})
+
+        required = set(new.get("required", []))
+
+        for name in sorted(before.keys() | after.keys()):
+            location = "%s/%s" % (pointer, escape(name))
+
+            if name not in after:
+                self.record(location, "removed-field", True, before[name], None)
+            elif name not in before:
+                if name in required:
+                    self.record(location, "new-required", True, None, after[name])
+                else:
+                    self.record(location, "added-optional-field", False, None, after[name])
+            else:
+                self.compare(before[name], after[name], location)
+
+    def required(self, old: typing.Dict[str, typing.Any], new: typing.Dict[str, typing.Any], pointer: str) -> None:
+        before, after = set(old.get("required", [])), set(new.get("required", []))
+
+        previous, declared = old.get("properties", {}), new.get("properties", {})
+
+        # Newly required propert(ies) that are themselves new, or required field(s) that were removed, are reported by
+        # `properties`.
+        for name in sorted(after - before):
+            if name in previous or name not in declared:
+                self.record(pointer, "new-required", True, None, name)
+
+        for name in sorted(before - after):
+            if name in declared:
+                self.record(pointer, "required-removed", False, name, None)
+
+    def type(self, old: typing.Dict[str, typing.Any], new: typing.Dict[str, typing.Any], pointer: str) -> None:
+        before, after = types(old), types(new)
+
+        narrowed = before is None or any(not covered(kind, after) for kind in before)
+        widened = after is None or any(not covered(kind, before) for kind in after)
+
+        if narrowed and widened:
+            self.record(pointer, "type-changed", True, old.get("type"), new.get("type"))
+        elif narrowed:
+            self.record(pointer, "narrowed-type", True, old.get("type"), new.get("type"))
+        else:
+            self.record(pointer, "widened-type", False, old.get("type"), new.get("type"))
+
+    def enum(self, before: typing.Optional[typing.List[typing.Any]], after: typing.Optional[typing.List[typing.Any]], pointer: str) -> None:
+        if before is None or after is None:
+            self.record(pointer, "enum-added" if before is None else "enum-removed", before is None, before, after)
+
+            return
+
+        old = {self.digest(value): value for value in before}
+        new = {self.digest(value): value for value in after}
+
+        removed = [value for key, value in old.items() if key not in new]
+        added = [value for key, value in new.items() if key not in old]
+
+        if removed:
+            self.record(pointer, "enum-shrink", True, removed, None)
+
+        if added:
+            self.record(pointer, "enum-extend", False, None, added)
+
+    def mapping(self, before: typing.Dict[str, typing.Any], after: typing.Dict[str, typing.Any], pointer: str, additions: bool) -> None:
+        for name in sorted(before.keys() | after.keys()):
+            location = "%s/%s" % (pointer, escape(name))
+
+            if name not in after:
+                self.record(location, "removed-definition" if additions else "constraint-removed", False, before[name], None)
+            elif name not in before:
+                self.record(location, "added-definition" if additions else "constraint-added", not additions, None, after[name])
+            else:
+                self.compare(before[name], after[name], location)
+
+    def subschema(self, before: typing.Any, after: typing.Any, pointer: str) -> None:
+        if before is None:
+            self.record(pointer, "constraint-added", not (after is True or after == {}), None, after)
+        elif after is None:
+            self.record(pointer, "constraint-removed", False, before, None)
+        else:
+            self.compare(before, after, pointer)
+
+    def alternatives(self, before: typing.Optional[typing.List[typing.Any]], after: typing.Optional[typing.List[typing.Any]], pointer: str) -> None:
+        if before is None or after is None:
+            self.record(pointer, "constraint-added" if before is None else "constraint-removed", before is None, before, after)
+
+            return
+
+        old = {self.digest(value): value for value in before}
+        new = {self.digest(value): value for value in after}
+
+        removed = [value for key, value in old.items() if key not in new]
+        added = [value for key, value in new.items() if key not in old]
+
+        if len(removed) == 1 and len(added) == 1:
+            # A single modified alternative; descend, so the change is classified precisely.
+            self.compare(removed[0], added[0], "%s/%d" % (pointer, after.index(added[0])))
+
+            return
+
+        for value in removed:
+            self.record(pointer, "variant-removed", True, value, None)
+
+        for value in added:
+            self.record(pointer, "variant-added", False, None, value)
+
+    def positional(self, before: typing.Optional[typing.List[typing.Any]], after: typing.Optional[typing.List[typing.Any]], pointer: str) -> None:
+        before, after = before or [], after or []
+
+        for index in range(max(len(before), len(after))):
+            location = "%s/%d" % (pointer, index)
+
+            if index >= len(after):
+                self.record(location, "constraint-removed", False, before[index], None)
+            elif index >= len(before):
+                self.record(location, "constraint-added", True, None, after[index])
+            else:
+                self.compare(before[index], after[index], location)
+
+    def bound(self, keyword: str, before: typing.Any, after: typing.Any, pointer: str) -> None:
+        if after is None:
+            self.record(pointer, "constraint-removed", False, before, None)
+        elif before is None:
+            self.record(pointer, "constraint-added", True, None, after)
+        else:
+            tightened = after > before if keyword in MINIMUMS else after < before
+
+            self.record(pointer, "constraint-tightened" if tightened else "constraint-loosened", tightened, before, after)
+
+def files(directory: pathlib.Path) -> typing.Dict[str, pathlib.Path]:
+    """
+    Returns every (non-hidden) JSON schema file beneath a directory, keyed by its relative POSIX path.
+
+    Profiling trace(s) (i.e. `*.trace.json`, see `polyium.cli.main.profile`) aren't schema(s), and are excluded.
+    """
+
+    directory = pathlib.Path(directory)
+
+    found: typing.Dict[str, pathlib.Path] = {}
+
+    for root, directories, names in os.walk(directory):
+        directories[:] = [name for name in directories if not name.startswith(".")]
+
+        for name in names:
+            if name.endswith(".json") and not name.startswith(".") and not name.endswith(".trace.json"):
+                path = pathlib.Path(root, name)
+
+                found[path.relative_to(directory).as_posix()] = path
+
+    return found
+
+def compare(old: typing.Any, new: typing.Any, schema: str = "") -> typing.Tuple[typing.List[Change], int]:
+    """
+    Compares two version(s) of a single (parsed) schema.
+
+    Returns
+    -------
+    tuple[list[Change], int]
+        The change(s), and the number of identical subtree(s) skipped.
+    """
+
+    comparator = Comparator(schema)
+    comparator.compare(old, new)
+
+    return comparator.changes, comparator.skipped
+
+def diff(old: typing.Union[str, pathlib.Path], new: typing.Union[str, pathlib.Path]) -> Report:
+    """
+    Compares every schema file of two directories.
+
+    A schema only present in the old directory is a breaking `removed-schema` change; only present in the new
+    directory, a non-breaking `added-schema` change.
+
+    Parameters
+    ----------
+    old : str | pathlib.Path
+        The baseline (e.g. previously released) schema directory.
+    new : str | pathlib.Path
+        The regenerated schema directory.
+
+    Returns
+    -------
+    Report
+        The comparison's change(s) and statistics.
+    """
+
+    before, after = files(pathlib.Path(old)), files(pathlib.Path(new))
+
+    report = Report()
+
+    for name in sorted(before.keys() | after.keys()):
+        report.schemas += 1
+
+        if name not in after:
+            report.changes.append(Change(schema=name, pointer="/", kind="removed-schema", breaking=True))
+
+            continue
+
+        if name not in before:
+            report.changes.append(Change(schema=name, pointer="/", kind="added-schema", breaking=False))
+
+            continue
+
+        previous, current = before[name].read_bytes(), after[name].read_bytes()
+
+        if previous == current:
+            report.unchanged += 1
+
+            continue
+
+        changes, skipped = compare(json.loads(previous), json.loads(current), schema=name)
+
+        report.changes.extend(changes)
+        report.subtrees += skipped
+
+    logger.debug("Compared %d Schema(s); %d Unchanged, %d Identical Subtree(s) Skipped", report.schemas, report.unchanged, report.subtrees)
+
+    return report
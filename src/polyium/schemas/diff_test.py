@@ -0,0 +1,113 @@
+import copy
+import json
+import pathlib
+
+import pytest
+import logging
+
+import polyium.schemas.diff as module
+
+logger = logging.getLogger(__name__)
+
+baseline = {
+    "type": "object",
+    "title": "user",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "age": {"type": "integer"},
+        "role": {"enum": ["admin", "member", "guest"]},
+        "address": {"$ref": "#/$defs/Address"},
+    },
+    "required": ["name"],
+    "$defs": {
+        "Address": {"type": "object", "properties": {"street": {"type": "string"}, "city": {"type": "string"}}, "required": ["street"]},
+    },
+}
+
+def kinds(changes: list) -> set:
+    return {(change.pointer, change.kind, change.breaking) for change in changes}
+
+def test_identical(request: pytest.FixtureRequest):
+    changes, skipped = module.compare(baseline, copy.deepcopy(baseline))
+
+    assert changes == []
+    assert skipped == 1
+
+@pytest.mark.parametrize("mutation, expectation", [
+    (lambda schema: schema["properties"].update(email={"type": "string"}), ("/properties/email", "added-optional-field", False)),
+    (lambda schema: schema["properties"].pop("age"), ("/properties/age", "removed-field", True)),
+    (lambda schema: schema["properties"]["age"].update(type="boolean"), ("/properties/age/type", "type-changed", True)),
+    (lambda schema: schema["properties"]["age"].update(type=["integer", "null"]), ("/properties/age/type", "widened-type", False)),
+    (lambda schema: schema["properties"]["role"].update(enum=["admin", "member"]), ("/properties/role/enum", "enum-shrink", True)),
+    (lambda schema: schema["properties"]["role"]["enum"].append("owner"), ("/properties/role/enum", "enum-extend", False)),
+    (lambda schema: schema["required"].append("age"), ("/required", "new-required", True)),
+    (lambda schema: schema["required"].clear(), ("/required", "required-removed", False)),
+    (lambda schema: schema["properties"]["name"].update(minLength=2), ("/properties/name/minLength", "constraint-tightened", True)),
+    (lambda schema: schema["properties"]["name"].update(description="The user's name."), ("/properties/name/description", "annotation-changed", False)),
+    (lambda schema: schema["$defs"]["Address"]["required"].append("city"), ("/$defs/Address/required", "new-required", True)),
+])
+def test_classification(request: pytest.FixtureRequest, mutation, expectation):
+    """
+    Tests that each change is located and classified, and that unchanged sibling subtree(s) are skipped.
+    """
+
+    modified = copy.deepcopy(baseline)
+
+    mutation(modified)
+
+    changes, skipped = module.compare(baseline, modified)
+
+    logger.debug("Changes: %s; Skipped %d Subtree(s)", changes, skipped)
+
+    assert kinds(changes) == {expectation}
+    assert skipped > 0
+
+def test_new_required_field(request: pytest.FixtureRequest):
+    modified = copy.deepcopy(baseline)
+
+    modified["properties"]["email"] = {"type": "string"}
+    modified["required"].append("email")
+
+    changes, _ = module.compare(baseline, modified)
+
+    assert kinds(changes) == {("/properties/email", "new-required", True)}
+
+def test_narrowed_type(request: pytest.FixtureRequest):
+    old = {"type": ["number", "null"]}
+
+    assert kinds(module.compare(old, {"type": "integer"})[0]) == {("/type", "narrowed-type", True)}
+    assert kinds(module.compare({"type": "integer"}, {"type": "number"})[0]) == {("/type", "widened-type", False)}
+
+def test_diff(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests a directory comparison: unchanged file(s) are skipped, and added or removed schema(s) are reported.
+    """
+
+    old, new = directory.joinpath("old"), directory.joinpath("new")
+
+    for path in (old, new):
+        path.mkdir(parents=True)
+
+        path.joinpath("unchanged.json").write_text(json.dumps(baseline))
+        path.joinpath(".json-schema-cli.manifest.json").write_text("{}")
+
+    modified = copy.deepcopy(baseline)
+    modified["properties"].pop("age")
+
+    old.joinpath("user.json").write_text(json.dumps(baseline))
+    new.joinpath("user.json").write_text(json.dumps(modified, indent=4))
+
+    old.joinpath("removed.json").write_text("{}")
+    new.joinpath("nested").mkdir()
+    new.joinpath("nested", "added.json").write_text("{}")
+
+    report = module.diff(old, new)
+
+    assert report.schemas == 4
+    assert report.unchanged == 1
+    assert {(change.schema, change.kind) for change in report.changes} == {("user.json", "removed-field"), ("removed.json", "removed-schema"), ("nested/added.json", "added-schema")}
+    assert len(report.breaking) == 2
+
+    serialized = json.loads(json.dumps(report.serialize()))
+
+    assert serialized["breaking"] == 2
@@ -0,0 +1,564 @@
+"""
+The discovery module finds pydantic model class(es) without importing (and so executing) any module.
+
+Package source(s) are parsed with `ast`, in parallel when many file(s) are stale, into a persisted :class:`Index` of
+every top-level class, its line, and its (import-resolved) base class(es). Base class chain(s) are then resolved across
+module(s), including re-export(s) and alias(es), to one of the known model :data:`ROOTS`. The index is updated
+incrementally: a file is only re-read if its modification time or size changed, and only re-parsed if its digest did.
+"""
+
+from __future__ import annotations
+
+import ast
+import concurrent.futures
+import dataclasses
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import typing
+
+import polyium.schemas.targets
+
+logger = logging.getLogger(__name__)
+
+# Incremented whenever the on-disk index format changes.
+FORMAT = 1
+
+# The fully-qualified base class(es) that identify a model.
+ROOTS = frozenset({
+    "pydantic.BaseModel",
+    "pydantic.main.BaseModel",
+    "pydantic.RootModel",
+    "pydantic.root_model.RootModel",
+    "pydantic_settings.BaseSettings",
+    "pydantic_settings.main.BaseSettings",
+    "polyium.models.internal.base.Model",
+    "polyium.models.base.Base",
+    "polyium.models.base.Lazy",
+})
+
+# The minimum number of stale file(s) for which parsing is distributed across worker process(es).
+PARALLEL_THRESHOLD = 64
+
+@dataclasses.dataclass
+class Definition:
+    """
+    A top-level class definition.
+
+    :ivar name: The class name.
+    :ivar line: The class statement's line number.
+    :ivar bases: The class's base(s), as fully-qualified name(s) where resolvable through the module's import(s).
+    """
+
+    name: str
+    line: int
+    bases: typing.List[str] = dataclasses.field(default_factory=list)
+
+@dataclasses.dataclass
+class File:
+    """
+    The parsed summary of a module's source file, valid for the recorded modification time and size.
+
+    :ivar module: The module's fully-qualified name.
+    :ivar mtime: The file's modification time, in nanoseconds.
+    :ivar size: The file's size, in bytes.
+    :ivar digest: The SHA-256 digest of the file's content.
+    :ivar definitions: The module's top-level class definition(s).
+    :ivar aliases: A mapping of module-level name(s) bound by import or assignment, to the fully-qualified name bound.
+    """
+
+    module: str
+    mtime: int
+    size: int
+    digest: str
+    definitions: typing.List[Definition] = dataclasses.field(default_factory=list)
+    aliases: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
+
+def statements(body: typing.Iterable[ast.stmt]) -> typing.Iterator[ast.stmt]:
+    """
+    Yields a module's top-level statement(s), including those nested within (module-level) conditional, `try`, and
+    `with` block(s), e.g. `if typing.TYPE_CHECKING:` import(s).
+    """
+
+    for node in body:
+        if isinstance(node, ast.If):
+            yield from statements(node.body)
+            yield from statements(node.orelse)
+        elif isinstance(node, ast.Try):
+            yield from statements(node.body)
+            yield from statements(node.orelse)
+            yield from statements(node.finalbody)
+
+            for handler in node.handlers:
+                yield from statements(handler.body)
+        elif isinstance(node, ast.With):
+            yield from statements(node.body)
+        else:
+            yield node
+
+def dotted(node: ast.expr) -> typing.Optional[str]:
+    """
+    Returns the dotted name of a `Name` or `Attribute` expression (e.g. `pydantic.BaseModel`), unwrapping subscript(s)
+    (e.g. `Model[T]`), or None for any other expression.
+    """
+
+    if isinstance(node, ast.Subscript):
+        return dotted(node.value)
+
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        value = dotted(node.value)
+
+        return None if value is None else "%s.%s" % (value, node.attr)
+
+    return None
+
+def summarize(source: typing.Union[str, bytes], module: str, package: bool = False) -> typing.Tuple[typing.List[Definition], typing.Dict[str, str]]:
+    """
+    Extracts the top-level class definition(s) and module-level alias(es) of a module's source.
+
+    Parameters
+    ----------
+    source : str | bytes
+        The module's source code.
+    module : str
+        The module's fully-qualified name; used to resolve relative import(s) and local name(s).
+    package : bool
+        Whether the module is a package's `__init__` module.
+
+    Returns
+    -------
+    tuple[list[Definition], dict[str, str]]
+        The class definition(s), and the alias(es).
+
+    Raises
+    ------
+    SyntaxError
+        If the source cannot be parsed.
+    """
+
+    tree = ast.parse(source)
+
+    parent = module if package else module.rpartition(".")[0]
+
+    aliases: typing.Dict[str, str] = {}
+    definitions: typing.List[Definition] = []
+
+    def qualify(name: str) -> str:
+        head, _, tail = name.partition(".")
+
+        if head in aliases:
+            return "%s.%s" % (aliases[head], tail) if tail else aliases[head]
+
+        if any(definition.name == head for definition in definitions):
+            return "%s.%s" % (module, name)
+
+        return name
+
+    for node in statements(tree.body):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+                else:
+                    head = alias.name.partition(".")[0]
+
+                    aliases[head] = head
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+
+            if node.level > 0:
+                partials = parent.split(".")
+
+                if node.level - 1 >= len(partials):
+                    continue
+
+                anchor = ".".join(partials[:len(partials) - (node.level - 1)])
+
+                base = "%s.%s" % (anchor, base) if base else anchor
+
+            for alias in node.names:
+                if alias.name != "*":
+                    aliases[alias.asname or alias.name] = "%s.%s" % (base, alias.name) if base else alias.name
+        elif isinstance(node, ast.ClassDef):
+            bases = [qualify(name) for name in (dotted(base) for base in node.bases) if name is not None]
+
+            # A (re-)definition shadows any alias of the same name.
+            aliases.pop(node.name, None)
+
+            definitions = [definition for definition in definitions if definition.name != node.name]
+            definitions.append(Definition(name=node.name, line=node.lineno, bases=bases))
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            value = dotted(node.value)
+
+            if value is not None:
+                aliases[node.targets[0].id] = qualify(value)
+
+    return definitions, aliases
+
+def parse(path: str, module: str, package: bool = False) -> File:
+    """
+    Reads and summarizes a module's source file; a source that cannot be parsed is summarized without definition(s).
+
+    Parameters
+    ----------
+    path : str
+        The source file's path.
+    module : str
+        The module's fully-qualified name.
+    package : bool
+        Whether the module is a package's `__init__` module.
+
+    Returns
+    -------
+    File
+        The file's summary.
+    """
+
+    statistics = os.stat(path)
+
+    content = pathlib.Path(path).read_bytes()
+
+    file = File(module=module, mtime=statistics.st_mtime_ns, size=statistics.st_size, digest=hashlib.sha256(content).hexdigest())
+
+    try:
+        file.definitions, file.aliases = summarize(content, module, package=package)
+    except (SyntaxError, ValueError) as e:
+        logger.warning("Unable to Parse Module Source (%s): %s", path, e)
+
+    return file
+
+def sources(package: str) -> typing.Iterator[typing.Tuple[str, str, bool]]:
+    """
+    Yields the source file(s) of a package (or module) and its submodule(s), without importing any of them.
+
+    Only the top-level package's specification is looked up through the import system; nested package(s) are resolved
+    and walked on the filesystem. As with `polyium.schemas.targets.submodules`, only directories containing an
+    `__init__.py` are considered package(s).
+
+    Parameters
+    ----------
+    package : str
+        The fully-qualified package (or module) name.
+
+    Yields
+    ------
+    tuple[str, str, bool]
+        The source path, the module's fully-qualified name, and whether the module is a package's `__init__` module.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the package cannot be found.
+    """
+
+    top, _, remainder = package.partition(".")
+
+    specification = importlib.util.find_spec(top)
+
+    if specification is None:
+        raise ModuleNotFoundError("No module named '%s'" % top, name=top)
+
+    if specification.submodule_search_locations is None:
+        if not remainder and specification.origin and specification.origin.endswith(".py"):
+            yield specification.origin, top, False
+
+        return
+
+    found = False
+
+    for location in specification.submodule_search_locations:
+        base = os.path.join(location, *remainder.split(".")) if remainder else location
+
+        if remainder and os.path.isfile(base + ".py"):
+            found = True
+
+            yield base + ".py", package, False
+
+            continue
+
+        if not os.path.isdir(base):
+            continue
+
+        found = True
+
+        for directory, directories, files in os.walk(base):
+            if directory != base and "__init__.py" not in files:
+                directories[:] = []
+                continue
+
+            directories[:] = sorted(name for name in directories if name != "__pycache__" and not name.startswith(".") and name.isidentifier())
+
+            relative = os.path.relpath(directory, base)
+
+            prefix = package if relative == "." else "%s.%s" % (package, relative.replace(os.sep, "."))
+
+            for name in sorted(files):
+                if not name.endswith(".py"):
+                    continue
+
+                stem = name[:-3]
+
+                if stem == "__init__":
+                    yield os.path.join(directory, name), prefix, True
+                elif stem.isidentifier():
+                    yield os.path.join(directory, name), "%s.%s" % (prefix, stem), False
+
+    if not found:
+        raise ModuleNotFoundError("No module named '%s'" % package, name=package)
+
+class Index:
+    """
+    A persisted, incrementally updated index of the class definition(s) of one or more package(s).
+
+    :ivar path: The index file's path, or None for an in-memory index.
+    :ivar roots: The fully-qualified base class(es) that identify a model.
+    :ivar files: The indexed file summaries, keyed by absolute source path.
+    """
+
+    def __init__(self, path: typing.Optional[typing.Union[str, os.PathLike]] = None, roots: typing.Iterable[str] = ROOTS):
+        self.path = None if path is None else pathlib.Path(path)
+        self.roots = frozenset(roots)
+
+        self.files: typing.Dict[str, File] = {}
+
+        self._modified = False
+
+    def load(self) -> None:
+        """
+        Loads the persisted index; a missing or corrupt file is ignored.
+        """
+
+        if self.path is None:
+            return
+
+        try:
+            content = json.loads(self.path.read_text(encoding="utf-8"))
+
+            if content.get("format") == FORMAT:
+                self.files = {
+                    key: File(**{**value, "definitions": [Definition(**definition) for definition in value["definitions"]]})
+                    for key, value in content["files"].items()
+                }
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.debug("Unable to Load Discovery Index (%s): %s", str(self.path), e)
+
+    def save(self) -> None:
+        """
+        Atomically persists the index, if modified since loaded.
+        """
+
+        if self.path is None or not self._modified:
+            return
+
+        content = json.dumps({"format": FORMAT, "files": {key: dataclasses.asdict(value) for key, value in self.files.items()}})
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        descriptor, temporary = tempfile.mkstemp(dir=self.path.parent, prefix=".%s." % self.path.name)
+
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                handle.write(content)
+
+            os.replace(temporary, self.path)
+        except BaseException:
+            pathlib.Path(temporary).unlink(missing_ok=True)
+            raise
+
+        self._modified = False
+
+    def update(self, packages: typing.Iterable[str], jobs: typing.Optional[int] = None) -> int:
+        """
+        Brings the index up-to-date with the current source(s) of the given package(s).
+
+        Parameters
+        ----------
+        packages : typing.Iterable[str]
+            The fully-qualified package name(s).
+        jobs : int | None
+            The maximum number of worker process(es) used to parse stale file(s). Defaults to the system's CPU count.
+
+        Returns
+        -------
+        int
+            The number of (re-)parsed file(s).
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If a package cannot be found.
+        """
+
+        packages = sorted(set(packages))
+
+        current: typing.Dict[str, typing.Tuple[str, bool]] = {}
+
+        for package in packages:
+            for path, module, is_package in sources(package):
+                current[os.path.abspath(path)] = (module, is_package)
+
+        # Forget file(s) that were deleted from (or moved within) the updated package(s).
+        for path in [path for path, file in self.files.items() if path not in current and any(self.within(file.module, package) for package in packages)]:
+            del self.files[path]
+
+            self._modified = True
+
+        stale: typing.List[typing.Tuple[str, str, bool]] = []
+
+        for path, (module, is_package) in current.items():
+            file = self.files.get(path)
+
+            if file is None or file.module != module:
+                stale.append((path, module, is_package))
+                continue
+
+            statistics = os.stat(path)
+
+            if file.mtime == statistics.st_mtime_ns and file.size == statistics.st_size:
+                continue
+
+            # Touched, but not necessarily modified.
+            if file.size == statistics.st_size and hashlib.sha256(pathlib.Path(path).read_bytes()).hexdigest() == file.digest:
+                file.mtime = statistics.st_mtime_ns
+
+                self._modified = True
+
+                continue
+
+            stale.append((path, module, is_package))
+
+        if not stale:
+            return 0
+
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(stale) // PARALLEL_THRESHOLD))
+
+        if jobs == 1:
+            files = [parse(*arguments) for arguments in stale]
+        else:
+            logger.debug("Parsing %d Source File(s) Across %d Worker Process(es)", len(stale), jobs)
+
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+                files = list(executor.map(parse, *zip(*stale), chunksize=max(1, len(stale) // (jobs * 4))))
+
+        for (path, _, _), file in zip(stale, files):
+            self.files[path] = file
+
+        self._modified = True
+
+        logger.debug("Parsed %d of %d Source File(s)", len(stale), len(current))
+
+        return len(stale)
+
+    @staticmethod
+    def within(module: str, package: str) -> bool:
+        return module == package or module.startswith(package + ".")
+
+    def modules(self) -> typing.Dict[str, File]:
+        """
+        Returns the indexed file summaries, keyed by module name.
+        """
+
+        return {file.module: file for file in self.files.values()}
+
+    def models(self, packages: typing.Optional[typing.Iterable[str]] = None) -> typing.Dict[str, typing.List[Definition]]:
+        """
+        Resolves which indexed class(es) are model(s), i.e. (transitively) derive from one of the :attr:`roots`.
+
+        Parameters
+        ----------
+        packages : typing.Iterable[str] | None
+            Restricts the result to module(s) within the given package(s); all indexed module(s) if None.
+
+        Returns
+        -------
+        dict[str, list[Definition]]
+            The model definition(s), keyed by module and sorted by module name; module(s) without model(s) are omitted.
+        """
+
+        modules = self.modules()
+
+        resolved: typing.Dict[str, bool] = {}
+
+        # Name(s) currently being resolved, mapped to their depth; reaching one of them means the current result is only
+        # provisional (an in-progress name counts as False), unless that name is the current one, or one beneath it.
+        visiting: typing.Dict[str, int] = {}
+
+        def search(name: str) -> typing.Tuple[bool, int]:
+            """
+            Returns whether the name derives from a root, and the depth of the shallowest in-progress name reached.
+            """
+
+            if name in self.roots:
+                return True, len(visiting)
+
+            if name in resolved:
+                return resolved[name], len(visiting)
+
+            if name in visiting:
+                return False, visiting[name]
+
+            depth = visiting[name] = len(visiting)
+
+            result, lowest = False, depth
+
+            module, _, attribute = name.rpartition(".")
+
+            file = modules.get(module)
+
+            if file is not None:
+                definition = next((definition for definition in file.definitions if definition.name == attribute), None)
+
+                references = definition.bases if definition is not None else [file.aliases[attribute]] if attribute in file.aliases else []
+
+                for reference in references:
+                    result, reached = search(reference)
+
+                    lowest = min(lowest, reached)
+
+                    if result:
+                        break
+
+            del visiting[name]
+
+            # A False result that relied upon an in-progress ancestor isn't memoized, as the ancestor may yet resolve True.
+            if result or lowest >= depth:
+                resolved[name] = result
+
+                return result, depth
+
+            return result, lowest
+
+        def lookup(name: str) -> bool:
+            return search(name)[0]
+
+        selected = None if packages is None else sorted(set(packages))
+
+        models: typing.Dict[str, typing.List[Definition]] = {}
+
+        for module in sorted(modules):
+            if selected is not None and not any(self.within(module, package) for package in selected):
+                continue
+
+            definitions = [definition for definition in modules[module].definitions if lookup("%s.%s" % (module, definition.name))]
+
+            if definitions:
+                models[module] = definitions
+
+        return models
+
+    def specifications(self, packages: typing.Optional[typing.Iterable[str]] = None) -> typing.List[polyium.schemas.targets.Specification]:
+        """
+        Returns an explicit `module:Model` specification per discovered model (see :meth:`models`).
+        """
+
+        return [
+            polyium.schemas.targets.Specification(module=module, name=definition.name)
+            for module, definitions in self.models(packages).items() for definition in definitions
+        ]
@@ -0,0 +1,193 @@
+import os
+import pathlib
+import sys
+import textwrap
+
+import pytest
+import logging
+
+import polyium.schemas.discovery as module
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture()
+def directory(directory: pathlib.Path) -> pathlib.Path:
+    """
+    Populates the temporary directory with a first-party package, whose model(s) are spread across module(s) and
+    re-export(s), alongside a model-free module with import side effect(s).
+    """
+
+    package = directory.joinpath("source", "discovered_package")
+    package.joinpath("models").mkdir(parents=True)
+    package.joinpath("scripts").mkdir(parents=True)
+
+    package.joinpath("__init__.py").write_text("")
+    package.joinpath("models", "__init__.py").write_text("from .base import Base as Exported\n")
+    package.joinpath("models", "base.py").write_text(textwrap.dedent("""
+        import typing
+
+        import pydantic as pd
+
+        T = typing.TypeVar("T")
+
+        class Base(pd.BaseModel):
+            identifier: int
+
+        class Generic(Base, typing.Generic[T]):
+            value: T
+
+        class Plain:
+            pass
+    """))
+    package.joinpath("models", "users.py").write_text(textwrap.dedent("""
+        from discovered_package.models import Exported
+        from . import base
+
+        Alias = base.Generic
+
+        class User(Exported):
+            name: str
+
+        class Tagged(Alias[str]):
+            pass
+
+        class Unrelated(object):
+            pass
+    """))
+    package.joinpath("helpers.py").write_text("raise RuntimeError(\"imported\")\n")
+
+    # Not a package (no __init__.py), and so not discovered.
+    package.joinpath("scripts", "model.py").write_text("import pydantic\n\nclass Script(pydantic.BaseModel):\n    pass\n")
+
+    sys.path.insert(0, str(directory.joinpath("source")))
+
+    try:
+        yield directory
+    finally:
+        sys.path.remove(str(directory.joinpath("source")))
+
+def test_summarize(request: pytest.FixtureRequest):
+    source = textwrap.dedent("""
+        import pydantic
+        import collections.abc as abc
+        from ..shared import Mixin
+
+        if True:
+            from .sibling import Sibling as Renamed
+
+        class Model(pydantic.main.BaseModel, Mixin, abc.Mapping):
+            pass
+
+        class Child(Model, Renamed):
+            pass
+    """)
+
+    definitions, aliases = module.summarize(source, "application.models.module")
+
+    logger.debug("Aliases: %s", aliases)
+
+    assert aliases["Renamed"] == "application.models.sibling.Sibling"
+    assert [definition.name for definition in definitions] == ["Model", "Child"]
+    assert definitions[0].bases == ["pydantic.main.BaseModel", "application.shared.Mixin", "collections.abc.Mapping"]
+    assert definitions[1].bases == ["application.models.module.Model", "application.models.sibling.Sibling"]
+    assert definitions[1].line == 12
+
+def test_models(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that base class chain(s) are resolved across module(s), re-export(s), and alias(es), without any import.
+    """
+
+    index = module.Index()
+
+    assert index.update(["discovered_package"]) == 5
+
+    models = {key: [definition.name for definition in definitions] for key, definitions in index.models().items()}
+
+    logger.debug("Model(s): %s", models)
+
+    assert models == {
+        "discovered_package.models.base": ["Base", "Generic"],
+        "discovered_package.models.users": ["User", "Tagged"],
+    }
+
+    assert not any(name.startswith("discovered_package") for name in sys.modules)
+
+def test_models_restricted(request: pytest.FixtureRequest, directory: pathlib.Path):
+    index = module.Index()
+    index.update(["discovered_package"])
+
+    assert list(index.models(["discovered_package.models.users"])) == ["discovered_package.models.users"]
+
+    assert [str(specification) for specification in index.specifications(["discovered_package.models.base"])] == [
+        "discovered_package.models.base:Base",
+        "discovered_package.models.base:Generic",
+    ]
+
+def test_models_cycle(request: pytest.FixtureRequest):
+    """
+    Tests that a class reached through a cycle (while its base chain is still being resolved) isn't memoized as a
+    non-model.
+    """
+
+    index = module.Index()
+
+    index.files = {
+        "a.py": module.File(module="cyclic.a", mtime=0, size=0, digest="", definitions=[module.Definition(name="A", line=1, bases=["cyclic.b.B", "pydantic.BaseModel"])]),
+        "b.py": module.File(module="cyclic.b", mtime=0, size=0, digest="", definitions=[module.Definition(name="B", line=1, bases=["cyclic.a.A"])]),
+        "c.py": module.File(module="cyclic.c", mtime=0, size=0, digest="", definitions=[module.Definition(name="C", line=1, bases=["cyclic.d.D"])]),
+        "d.py": module.File(module="cyclic.d", mtime=0, size=0, digest="", definitions=[module.Definition(name="D", line=1, bases=["cyclic.c.C"])]),
+    }
+
+    models = {key: [definition.name for definition in definitions] for key, definitions in index.models().items()}
+
+    assert models == {"cyclic.a": ["A"], "cyclic.b": ["B"]}
+
+def test_update_incremental(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that only modified file(s) are re-parsed, that touched-but-unmodified file(s) are not, and that deleted
+    file(s) are forgotten, across persisted index(es).
+    """
+
+    path = directory.joinpath("index.json")
+
+    index = module.Index(path)
+    index.update(["discovered_package"])
+    index.save()
+
+    assert path.is_file()
+
+    users = directory.joinpath("source", "discovered_package", "models", "users.py")
+
+    index = module.Index(path)
+    index.load()
+
+    assert index.update(["discovered_package"]) == 0
+
+    statistics = os.stat(users)
+
+    os.utime(users, ns=(statistics.st_atime_ns, statistics.st_mtime_ns + 1_000_000_000))
+
+    assert index.update(["discovered_package"]) == 0
+
+    users.write_text(users.read_text() + "\nclass Extra(User):\n    pass\n")
+
+    assert index.update(["discovered_package"]) == 1
+    assert [definition.name for definition in index.models()["discovered_package.models.users"]] == ["User", "Tagged", "Extra"]
+
+    users.unlink()
+
+    assert index.update(["discovered_package"]) == 0
+    assert "discovered_package.models.users" not in index.models()
+
+def test_update_missing(request: pytest.FixtureRequest):
+    with pytest.raises(ModuleNotFoundError):
+        module.Index().update(["nonexistent_discovered_package"])
+
+def test_parse_invalid(request: pytest.FixtureRequest, directory: pathlib.Path):
+    path = directory.joinpath("source", "discovered_package", "helpers.py")
+    path.write_text("class Broken(:\n")
+
+    file = module.parse(str(path), "discovered_package.helpers")
+
+    assert file.definitions == []
+    assert file.size == path.stat().st_size
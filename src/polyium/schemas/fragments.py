@@ -0,0 +1,239 @@
+"""
+The fragments module memoizes the JSON schema fragment of every model, across top-level model(s) and generation(s).
+
+Pydantic's `GenerateJsonSchema` is single-use: generating the schema(s) of many top-level model(s) rebuilds the fragment of
+every shared nested model once per top-level model. :class:`Generator` instead memoizes each model's fragment (and the
+definition(s) created while generating it) per model class, mode, `by_alias`, and reference template, for the lifetime of
+the process; a later generator replays a memoized fragment rather than regenerating it.
+
+A fragment's `$ref`(s) embed the definition name(s) allocated by the generator that created it. Before a fragment is
+replayed, its reference(s) are re-allocated (in their original order), and the fragment is only used if every name is
+identical and every referenced definition is available; otherwise the model is generated (and memoized) again. Fragments
+referencing a definition that's still being generated (i.e. mutually recursive model(s)) aren't memoized.
+
+Memoized fragment(s) reference their model class(es), and must be invalidated (see :func:`invalidate`) once a model's
+module is reloaded.
+
+Memoization relies upon private `GenerateJsonSchema` state (see :data:`internals`), present from pydantic 2.10 through
+(at least) 2.14; should any of it be missing, :class:`Generator` behaves as a plain `GenerateJsonSchema`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import typing
+
+import pydantic.json_schema
+
+logger = logging.getLogger(__name__)
+
+@dataclasses.dataclass(frozen=True)
+class Fragment:
+    """
+    A memoized model fragment.
+
+    :ivar value: The model's JSON schema fragment.
+    :ivar references: Every referenced definition's core reference and mode, with its JSON reference, in allocation order.
+    :ivar definitions: Every definition the fragment references, directly or transitively.
+    :ivar models: Every model class the fragment was generated from, including nested model(s).
+    """
+
+    value: typing.Dict[str, typing.Any]
+    references: typing.Tuple[typing.Tuple[typing.Tuple[str, str], str], ...]
+    definitions: typing.Dict[str, typing.Any]
+    models: typing.FrozenSet[type]
+
+# The private `GenerateJsonSchema` attribute(s) that fragment memoization relies upon.
+internals = ("_core_defs_invalid_for_json_schema", "core_to_defs_refs", "core_to_json_refs", "defs_to_core_refs", "json_to_defs_refs", "get_cache_defs_ref_schema")
+
+_fragments: typing.Dict[typing.Tuple[typing.Any, ...], Fragment] = {}
+
+_counters = {"hits": 0, "misses": 0}
+
+def copy(value: typing.Any) -> typing.Any:
+    """
+    Returns a deep copy of a JSON value's container(s).
+    """
+
+    if isinstance(value, dict):
+        return {key: copy(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [copy(item) for item in value]
+
+    return value
+
+def references(value: typing.Any, found: typing.Set[str]) -> typing.Set[str]:
+    """
+    Collects every `$ref` within a JSON value.
+    """
+
+    if isinstance(value, dict):
+        reference = value.get("$ref")
+
+        if isinstance(reference, str):
+            found.add(reference)
+
+        for item in value.values():
+            references(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            references(item, found)
+
+    return found
+
+def invalidate(modules: typing.Optional[typing.Iterable[str]] = None) -> int:
+    """
+    Drops memoized fragment(s).
+
+    Parameters
+    ----------
+    modules : typing.Iterable[str] | None
+        The module(s) whose model(s) changed; every fragment generated from any of their model(s) (including as a nested
+        model) is dropped. Defaults to every fragment.
+
+    Returns
+    -------
+    int
+        The number of dropped fragment(s).
+    """
+
+    if modules is None:
+        count = len(_fragments)
+
+        _fragments.clear()
+    else:
+        names = set(modules)
+
+        stale = [key for key, fragment in _fragments.items() if any(model.__module__ in names for model in fragment.models)]
+
+        for key in stale:
+            del _fragments[key]
+
+        count = len(stale)
+
+    if count:
+        logger.debug("Invalidated %d Memoized Fragment(s)", count)
+
+    return count
+
+def statistics() -> typing.Dict[str, int]:
+    """
+    Returns the number of memoized fragment(s), and the process's fragment hit(s) and miss(es).
+    """
+
+    return dict(_counters, fragments=len(_fragments))
+
+class Generator(pydantic.json_schema.GenerateJsonSchema):
+    """
+    A JSON schema generator memoizing model fragment(s) across instance(s); see the module's documentation.
+    """
+
+    def __init__(self, *arguments: typing.Any, **kwargs: typing.Any):
+        super().__init__(*arguments, **kwargs)
+
+        # Whether fragment(s) are memoized; otherwise, the generator behaves as a plain `GenerateJsonSchema`.
+        self._memoizing = all(hasattr(self, name) for name in internals)
+
+        # The model class(es) of every fragment being generated, innermost last.
+        self._models: typing.List[typing.Set[type]] = []
+
+        # Generated fragment(s), memoized once every definition is complete (see :meth:`get_json_ref_counts`).
+        self._pending: typing.List[typing.Tuple[typing.Tuple[typing.Any, ...], typing.Tuple[str, str], typing.Dict[str, typing.Any], typing.Set[type]]] = []
+
+    def _replay(self, fragment: Fragment) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        for (core, mode), reference in fragment.references:
+            if mode != self.mode or self.get_cache_defs_ref_schema(core)[1]["$ref"] != reference:
+                return None
+
+        for name, value in fragment.definitions.items():
+            if name not in self.definitions:
+                self.definitions[name] = copy(value)
+
+        return copy(fragment.value)
+
+    def _memoize(self, key: typing.Tuple[typing.Any, ...], own: typing.Tuple[str, str], value: typing.Dict[str, typing.Any], models: typing.Set[type]) -> None:
+        # The fragment's definition(s): the closure of its reference(s), excluding the model's own (recursive) definition.
+        names: typing.Set[str] = set()
+        unvisited = references(value, set())
+
+        while unvisited:
+            name = self.json_to_defs_refs.get(unvisited.pop())
+
+            if name is None or name not in self.definitions:
+                # A reference not allocated by the generator (e.g. an explicit `$ref` within `json_schema_extra`).
+                return
+
+            if name in names:
+                continue
+
+            names.add(name)
+
+            if self.defs_to_core_refs[name] != own:
+                references(self.definitions[name], unvisited)
+
+        order = {core: index for index, core in enumerate(self.core_to_defs_refs)}
+
+        allocations = sorted((self.defs_to_core_refs[name] for name in names), key=order.__getitem__)
+
+        if any(mode != self.mode for _, mode in allocations):
+            return
+
+        _fragments[key] = Fragment(
+            value=value,
+            references=tuple((core, self.core_to_json_refs[core]) for core in allocations),
+            definitions={name: copy(self.definitions[name]) for name in names if self.defs_to_core_refs[name] != own},
+            models=frozenset(models),
+        )
+
+    def get_json_ref_counts(self, json_schema: typing.Any) -> typing.Dict[str, int]:
+        # Called once every definition is generated, yet before definition(s) are garbage collected and renamed.
+        pending, self._pending = self._pending, []
+
+        if self._memoizing and not self._core_defs_invalid_for_json_schema:
+            for key, own, value, models in pending:
+                self._memoize(key, own, value, models)
+
+        return super().get_json_ref_counts(json_schema)
+
+    def model_schema(self, schema: typing.Any) -> typing.Dict[str, typing.Any]:
+        if not self._memoizing:
+            return super().model_schema(schema)
+
+        model = schema["cls"]
+        reference = schema.get("ref")
+
+        # The `union_format` option was only introduced with pydantic 2.12.
+        key = (type(self), model, reference, self.mode, self.by_alias, self.ref_template, getattr(self, "union_format", "any_of"))
+
+        fragment = _fragments.get(key) if reference is not None else None
+
+        if fragment is not None:
+            value = self._replay(fragment)
+
+            if value is not None:
+                _counters["hits"] += 1
+
+                if self._models:
+                    self._models[-1].update(fragment.models)
+
+                return value
+
+        _counters["misses"] += 1
+
+        self._models.append({model})
+
+        try:
+            value = super().model_schema(schema)
+        finally:
+            models = self._models.pop()
+
+        if self._models:
+            self._models[-1].update(models)
+
+        if reference is not None:
+            # Copied before any `__get_pydantic_json_schema__` wrapper(s) modify the returned fragment.
+            self._pending.append((key, (reference, self.mode), copy(value), models))
+
+        return value
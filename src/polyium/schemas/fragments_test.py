@@ -0,0 +1,116 @@
+import typing
+
+import pydantic
+import pytest
+import logging
+
+import polyium.schemas.fragments as module
+
+logger = logging.getLogger(__name__)
+
+class Address(pydantic.BaseModel):
+    street: str
+
+class Contact(pydantic.BaseModel):
+    home: Address
+    work: typing.Optional[Address] = None
+
+class User(pydantic.BaseModel):
+    contact: Contact
+    addresses: typing.List[Address] = []
+
+class Tree(pydantic.BaseModel):
+    name: str
+    children: typing.List["Tree"] = []
+
+class Left(pydantic.BaseModel):
+    right: typing.Optional["Right"] = None
+
+class Right(pydantic.BaseModel):
+    left: typing.Optional[Left] = None
+    address: Address
+
+Left.model_rebuild()
+
+class Page(pydantic.BaseModel):
+    tree: Tree
+    left: Left
+    user: User
+
+models = [Address, Contact, User, Tree, Left, Right, Page]
+
+@pytest.fixture(autouse=True)
+def fragments():
+    module.invalidate()
+
+    try:
+        yield
+    finally:
+        module.invalidate()
+
+@pytest.mark.parametrize("mode", ["validation", "serialization"])
+def test_equivalence(request: pytest.FixtureRequest, mode: str):
+    """
+    Tests that memoized schema(s) are identical to pydantic's, whether their fragment(s) were replayed or generated.
+    """
+
+    expected = [model.model_json_schema(mode=mode) for model in models]
+
+    for _ in range(2):
+        assert [model.model_json_schema(mode=mode, schema_generator=module.Generator) for model in models] == expected
+
+    assert [model.model_json_schema(mode=mode, schema_generator=module.Generator) for model in reversed(models)] == list(reversed(expected))
+
+    logger.debug("Statistics: %s", module.statistics())
+
+def test_unsupported(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """
+    Tests that, should pydantic lack any private state memoization relies upon, schema(s) are generated unmemoized.
+    """
+
+    monkeypatch.setattr(module, "internals", (*module.internals, "missing_attribute"))
+
+    before = module.statistics()
+
+    assert [model.model_json_schema(schema_generator=module.Generator) for model in models] == [model.model_json_schema() for model in models]
+
+    assert module.statistics() == before
+
+def test_memoized(request: pytest.FixtureRequest):
+    """
+    Tests that a shared nested model is only generated once, across top-level model(s).
+    """
+
+    before = module.statistics()
+
+    for model in (Address, Contact, User):
+        model.model_json_schema(schema_generator=module.Generator)
+
+    after = module.statistics()
+
+    # Each model is generated once; Address is then replayed within Contact and User, and Contact within User.
+    assert after["misses"] - before["misses"] == 3
+    assert after["hits"] - before["hits"] == 3
+    assert after["fragments"] == 3
+
+def test_options(request: pytest.FixtureRequest):
+    """
+    Tests that fragment(s) are memoized per mode, alias usage, and reference template.
+    """
+
+    User.model_json_schema(schema_generator=module.Generator)
+
+    schema = User.model_json_schema(schema_generator=module.Generator, ref_template="#/components/schemas/{model}")
+
+    assert schema == User.model_json_schema(ref_template="#/components/schemas/{model}")
+    assert module.statistics()["fragments"] == 6
+
+def test_invalidate(request: pytest.FixtureRequest):
+    for model in models:
+        model.model_json_schema(schema_generator=module.Generator)
+
+    total = module.statistics()["fragments"]
+
+    assert module.invalidate(["unrelated.module"]) == 0
+    assert module.invalidate([__name__]) == total
+    assert module.statistics()["fragments"] == 0
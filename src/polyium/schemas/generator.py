@@ -0,0 +1,491 @@
+"""
+The generator module builds JSON schema(s) for pydantic model(s), optionally across a pool of worker process(es).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import importlib
+import itertools
+import json
+import logging
+import os
+import sys
+import typing
+
+import pydantic
+
+import polyium.internal.pool
+import polyium.internal.profiling
+import polyium.schemas.cache
+import polyium.schemas.fragments
+import polyium.schemas.optimization
+import polyium.schemas.targets
+
+logger = logging.getLogger(__name__)
+
+Mode = typing.Literal["validation", "serialization"]
+
+@dataclasses.dataclass(frozen=True)
+class Task:
+    """
+    A picklable unit of schema generation work, referencing a model by its module and qualified name.
+
+    :ivar module: The model's defining module.
+    :ivar qualname: The model's qualified name within its module.
+    :ivar mode: The JSON schema generation mode.
+    :ivar by_alias: Whether to use field alias(es) as property name(s).
+    :ivar indent: The JSON serialization indentation, or None for a single-line output.
+    :ivar passes: The optimization pass(es) applied to the generated schema (see `polyium.schemas.optimization`).
+    """
+
+    module: str
+    qualname: str
+    mode: Mode = "validation"
+    by_alias: bool = True
+    indent: typing.Optional[int] = 4
+    passes: typing.Tuple[str, ...] = ()
+
+    @classmethod
+    def create(cls, model: type[pydantic.BaseModel], **kwargs: typing.Any) -> Task:
+        return cls(module=model.__module__, qualname=model.__qualname__, **kwargs)
+
+    @property
+    def name(self) -> str:
+        """
+        The task's fully-qualified model name, e.g. `myapp.models.User`.
+        """
+
+        return "%s.%s" % (self.module, self.qualname)
+
+    @property
+    def importable(self) -> bool:
+        """
+        Whether the model can be re-imported by reference from another process.
+        """
+
+        return "<locals>" not in self.qualname and self.module != "__main__"
+
+    def model(self) -> type[pydantic.BaseModel]:
+        """
+        Imports and returns the task's model class.
+        """
+
+        value: typing.Any = importlib.import_module(self.module)
+
+        for attribute in self.qualname.split("."):
+            value = getattr(value, attribute)
+
+        return value
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    """
+    The outcome of a schema generation :class:`Task`.
+
+    :ivar task: The originating task.
+    :ivar content: The serialized JSON schema, if successful.
+    :ivar error: A description of the failure, if unsuccessful.
+    :ivar events: The task's profiling event(s), if profiling is enabled (see `polyium.internal.profiling`).
+    """
+
+    task: Task
+    content: typing.Optional[str] = None
+    error: typing.Optional[str] = None
+    events: typing.Tuple[polyium.internal.profiling.Event, ...] = ()
+
+    @property
+    def successful(self) -> bool:
+        return self.error is None
+
+@dataclasses.dataclass(frozen=True)
+class Resolution:
+    """
+    The model(s) of a module, resolved by :func:`resolve` (possibly within a worker process).
+
+    :ivar module: The resolved module.
+    :ivar members: A task per resolved model, keyed (and ordered) by the name used to reference it from the module.
+    :ivar requested: The name(s) of the member(s) selected by a target specification.
+    :ivar defined: The name(s) of the member(s) defined within the module itself.
+    :ivar events: The resolution's profiling event(s), if profiling is enabled (see `polyium.internal.profiling`).
+    """
+
+    module: str
+    members: typing.Dict[str, Task]
+    requested: typing.Tuple[str, ...] = ()
+    defined: typing.Tuple[str, ...] = ()
+    events: typing.Tuple[polyium.internal.profiling.Event, ...] = ()
+
+def schema(model: type[pydantic.BaseModel], mode: Mode = "validation", by_alias: bool = True) -> typing.Dict[str, typing.Any]:
+    """
+    Generates the JSON schema of a pydantic model, reusing the memoized fragment(s) of every model already generated
+    by the current process (see `polyium.schemas.fragments`).
+
+    Parameters
+    ----------
+    model : type[pydantic.BaseModel]
+        The model class.
+    mode : Mode
+        The JSON schema generation mode.
+    by_alias : bool
+        Whether to use field alias(es) as property name(s).
+
+    Returns
+    -------
+    dict[str, typing.Any]
+        The model's JSON schema.
+    """
+
+    return model.model_json_schema(by_alias=by_alias, mode=mode, schema_generator=polyium.schemas.fragments.Generator)
+
+def execute(task: Task, model: typing.Optional[type[pydantic.BaseModel]] = None) -> Result:
+    """
+    Executes a single schema generation task.
+
+    Exceptions are captured into the :class:`Result` so a single failing model doesn't abort an entire batch.
+
+    Parameters
+    ----------
+    task : Task
+        The schema generation task.
+    model : type[pydantic.BaseModel] | None
+        The already-resolved model class; imported by reference when not provided.
+
+    Returns
+    -------
+    Result
+        The generation result.
+    """
+
+    profiler = polyium.internal.profiling.profiler
+
+    try:
+        if model is None:
+            with profiler.phase("import", "generator", model=task.name):
+                model = task.model()
+
+        if not model.__pydantic_complete__:
+            with profiler.phase("core-schema", "generator", model=task.name):
+                model.model_rebuild()
+
+        with profiler.phase("json-schema", "generator", model=task.name):
+            value = schema(model, mode=task.mode, by_alias=task.by_alias)
+
+        if task.passes:
+            with profiler.phase("optimize", "generator", model=task.name):
+                value = polyium.schemas.optimization.optimize(value, task.passes)
+
+        with profiler.phase("serialize", "generator", model=task.name):
+            content = json.dumps(value, indent=task.indent)
+    except Exception as e:
+        logger.debug("Schema Generation Failure (%s): %s", task.name, e, exc_info=True)
+
+        return Result(task=task, error="%s: %s" % (type(e).__name__, e), events=tuple(profiler.collect()))
+
+    return Result(task=task, content=content, events=tuple(profiler.collect()))
+
+def initialize(path: typing.List[str], profiling: typing.Optional[typing.Dict[str, typing.Any]] = None) -> None:
+    """
+    Initializes a worker process with the parent's module search path, and profiling configuration.
+
+    Parameters
+    ----------
+    path : list[str]
+        The parent process's `sys.path`.
+    profiling : dict[str, typing.Any] | None
+        The parent process's profiling configuration, see `polyium.internal.profiling.state`.
+    """
+
+    for entry in reversed(path):
+        if entry not in sys.path:
+            sys.path.insert(0, entry)
+
+    polyium.internal.profiling.configure(profiling)
+
+def resolve(module: str, names: typing.Sequence[str], complete: bool, options: typing.Dict[str, typing.Any]) -> Resolution:
+    """
+    Imports a module, and resolves the model(s) selected by the given model name(s) or pattern(s).
+
+    Parameters
+    ----------
+    module : str
+        The fully-qualified module name.
+    names : typing.Sequence[str]
+        The model component(s) of every specification targeting the module.
+    complete : bool
+        Whether to additionally resolve every model defined within the module (e.g. to cache them all).
+    options : dict[str, typing.Any]
+        Additional :class:`Task` option(s), e.g. `mode`, `by_alias`, `indent`, or `passes`.
+
+    Returns
+    -------
+    Resolution
+        The module's resolved model(s).
+
+    Raises
+    ------
+    ImportError
+        If the module cannot be imported.
+    LookupError
+        If an explicit model name cannot be resolved.
+    """
+
+    profiler = polyium.internal.profiling.profiler
+
+    with profiler.phase("import", "generator", module=module):
+        members = polyium.schemas.targets.Specification(module=module).members(module) if complete else {}
+
+        requested: typing.Dict[str, None] = {}
+
+        for name in names:
+            selection = polyium.schemas.targets.Specification(module=module, name=name).members(module)
+
+            members.update(selection)
+            requested.update(dict.fromkeys(selection))
+
+    return Resolution(
+        module=module,
+        members={name: Task.create(model, **options) for name, model in members.items()},
+        requested=tuple(requested),
+        defined=tuple(name for name, model in members.items() if model.__module__ == module),
+        events=tuple(profiler.collect()),
+    )
+
+def distribute(tasks: typing.Sequence[Task], models: typing.Sequence[typing.Optional[type[pydantic.BaseModel]]], workers: typing.Optional[polyium.internal.pool.Pool] = None) -> typing.Iterator[Result]:
+    """
+    Executes task(s) across a worker pool, yielding results in task order.
+
+    Task(s) whose model cannot be imported by reference (e.g. defined within a function) are executed in the current
+    process, using the given model class; as is every task, if no pool is provided.
+
+    Parameters
+    ----------
+    tasks : typing.Sequence[Task]
+        The schema generation task(s).
+    models : typing.Sequence[type[pydantic.BaseModel] | None]
+        Each task's resolved model class, if any; required for task(s) that cannot be imported by reference.
+    workers : polyium.internal.pool.Pool | None
+        The worker pool.
+
+    Yields
+    ------
+    Result
+        A result per task.
+    """
+
+    profiler = polyium.internal.profiling.profiler
+
+    if workers is None:
+        for task, model in zip(tasks, models):
+            result = execute(task, model)
+
+            profiler.extend(result.events)
+
+            yield result
+
+        return
+
+    importable = [task for task in tasks if task.importable]
+
+    logger.debug("Generating %d Schema(s) Across %d Worker Process(es)", len(tasks), workers.jobs)
+
+    # Batch task(s) per inter-process round-trip; small enough chunk(s) to still balance uneven model sizes.
+    chunksize = max(1, len(importable) // (workers.jobs * 4))
+
+    results = workers.map(execute, importable, chunksize=chunksize)
+
+    for task, model in zip(tasks, models):
+        result = next(results) if task.importable else execute(task, model)
+
+        # Worker event(s) are merged into the parent's profiler, on a shared (monotonic) timeline.
+        profiler.extend(result.events)
+
+        yield result
+
+def pool(jobs: int, tasks: typing.Optional[int] = polyium.internal.pool.MAXIMUM_TASKS, memory: typing.Optional[int] = polyium.internal.pool.MAXIMUM_MEMORY) -> polyium.internal.pool.Pool:
+    """
+    Creates a worker pool, whose worker(s) share the current process's module search path and profiling configuration.
+    """
+
+    return polyium.internal.pool.Pool(jobs, initializer=initialize, initargs=(list(sys.path), polyium.internal.profiling.state()), tasks=tasks, memory=memory)
+
+def generate(models: typing.Sequence[type[pydantic.BaseModel]], jobs: typing.Optional[int] = None, max_tasks: typing.Optional[int] = polyium.internal.pool.MAXIMUM_TASKS, max_memory: typing.Optional[int] = polyium.internal.pool.MAXIMUM_MEMORY, **kwargs: typing.Any) -> typing.Iterator[Result]:
+    """
+    Generates the JSON schema(s) of many pydantic models, yielding results in the order of the given models.
+
+    Work is distributed across a pool (see `polyium.internal.pool`) sized to the number of available CPU core(s),
+    unless `jobs` is specified. Model(s) that cannot be imported by reference (e.g. defined within a function) are
+    generated in the current process.
+
+    Parameters
+    ----------
+    models : typing.Sequence[type[pydantic.BaseModel]]
+        The model class(es).
+    jobs : int | None
+        The maximum number of worker process(es). Defaults to the system's CPU count.
+    max_tasks : int | None
+        The number of task(s) after which a worker process is replaced.
+    max_memory : int | None
+        The resident set size, in bytes, beyond which a worker process is replaced.
+    kwargs : typing.Any
+        Additional :class:`Task` option(s), e.g. `mode`, `by_alias`, `indent`, or `passes`.
+
+    Yields
+    ------
+    Result
+        A result per model.
+    """
+
+    tasks = [Task.create(model, **kwargs) for model in models]
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, sum(1 for task in tasks if task.importable)))
+
+    if jobs == 1:
+        yield from distribute(tasks, models)
+
+        return
+
+    with pool(jobs, tasks=max_tasks, memory=max_memory) as workers:
+        yield from distribute(tasks, models, workers)
+
+def batch(specifications: typing.Iterable[typing.Union[str, polyium.schemas.targets.Specification]], jobs: typing.Optional[int] = None, cache: typing.Optional[polyium.schemas.cache.Cache] = None, max_tasks: typing.Optional[int] = polyium.internal.pool.MAXIMUM_TASKS, max_memory: typing.Optional[int] = polyium.internal.pool.MAXIMUM_MEMORY, **kwargs: typing.Any) -> typing.Iterator[Result]:
+    """
+    Resolves target specification(s) and generates their JSON schema(s), serving unchanged module(s) from cache.
+
+    When a cache is provided, each resolved module is fingerprinted without being imported; a hit yields the cached
+    schema(s) directly, while a miss imports the module, generates schema(s) for every model it defines (so that later
+    specification(s) targeting the same module are also served), and stores the result(s).
+
+    With more than a single job, target module(s) are imported by worker process(es) alone (see :func:`resolve`); the
+    current process only imports a module defining a model that cannot be imported by reference.
+
+    Parameters
+    ----------
+    specifications : typing.Iterable[str | polyium.schemas.targets.Specification]
+        The target specification(s).
+    jobs : int | None
+        The maximum number of worker process(es). Defaults to the system's CPU count.
+    cache : polyium.schemas.cache.Cache | None
+        The optional schema cache.
+    max_tasks : int | None
+        The number of task(s) after which a worker process is replaced.
+    max_memory : int | None
+        The resident set size, in bytes, beyond which a worker process is replaced.
+    kwargs : typing.Any
+        Additional :class:`Task` option(s), e.g. `mode`, `by_alias`, `indent`, or `passes`.
+
+    Yields
+    ------
+    Result
+        A result per resolved model, without duplicate(s).
+
+    Raises
+    ------
+    ImportError
+        If a target module cannot be found or imported.
+    LookupError
+        If an explicit target model cannot be resolved.
+    """
+
+    specifications = [polyium.schemas.targets.Specification.parse(value) if isinstance(value, str) else value for value in specifications]
+
+    fingerprinter: typing.Optional[polyium.schemas.cache.Fingerprinter] = None
+
+    if cache is not None:
+        options = {key: value for key, value in dataclasses.asdict(Task(module="", qualname="", **kwargs)).items() if key not in ("module", "qualname")}
+
+        fingerprinter = polyium.schemas.cache.Fingerprinter({specification.module.split(".")[0] for specification in specifications}, salt=options)
+        fingerprinter.load(cache.sources)
+
+    emitted: typing.Set[str] = set()
+
+    # Module(s) that must be imported, with their fingerprint and the specification(s) targeting them.
+    pending: typing.Dict[str, typing.Tuple[typing.Optional[str], typing.List[polyium.schemas.targets.Specification]]] = {}
+
+    entries: typing.Dict[str, typing.Optional[polyium.schemas.cache.Entry]] = {}
+
+    for specification in specifications:
+        for module in specification.modules():
+            fingerprint = fingerprinter.fingerprint(module) if fingerprinter is not None else None
+
+            if fingerprint is not None and module not in entries:
+                entries[module] = cache.get(fingerprint)
+
+            entry = entries.get(module)
+
+            names = [name for name in entry.defined if specification.matches(name)] if entry is not None and polyium.schemas.targets.is_pattern(specification.name) else [specification.name]
+
+            if entry is None or module in pending or any(name not in entry.models for name in names):
+                pending.setdefault(module, (fingerprint, []))[1].append(specification)
+
+                continue
+
+            logger.debug("Cache Hit (%s): %s", module, fingerprint)
+
+            for name in names:
+                record = entry.models[name]
+
+                task = Task(module=record["module"], qualname=record["qualname"], **kwargs)
+
+                if task.name not in emitted:
+                    emitted.add(task.name)
+
+                    yield Result(task=task, content=record["content"])
+
+    jobs = max(1, jobs or os.cpu_count() or 1)
+
+    profiler = polyium.internal.profiling.profiler
+
+    with contextlib.ExitStack() as stack:
+        # Module(s) are imported (and model(s) resolved) within worker process(es) alone, isolating the current process
+        # from every model module's side effect(s); unless a single job is requested.
+        workers = stack.enter_context(pool(jobs, tasks=max_tasks, memory=max_memory)) if jobs > 1 and pending else None
+
+        arguments = (list(pending), [[specification.name for specification in targets] for _, targets in pending.values()], [fingerprint is not None for fingerprint, _ in pending.values()], itertools.repeat(kwargs))
+
+        resolutions: typing.List[Resolution] = list(workers.map(resolve, *arguments) if workers is not None else map(resolve, *arguments))
+
+        # Every resolved task, de-duplicated across module(s), with the module and name first referencing it.
+        tasks: typing.Dict[str, typing.Tuple[Task, str, str]] = {}
+
+        for resolution in resolutions:
+            profiler.extend(resolution.events)
+
+            for name, task in resolution.members.items():
+                tasks.setdefault(task.name, (task, resolution.module, name))
+
+        requested = {resolution.members[name].name for resolution in resolutions for name in resolution.requested}
+
+        models = [
+            None if workers is not None and task.importable else polyium.schemas.targets.Specification(module=module, name=name).members(module)[name]
+            for task, module, name in tasks.values()
+        ]
+
+        results: typing.Dict[str, Result] = {}
+
+        for result in distribute([task for task, _, _ in tasks.values()], models, workers):
+            results[result.task.name] = result
+
+            if result.task.name in requested and result.task.name not in emitted:
+                emitted.add(result.task.name)
+
+                yield result
+
+    if cache is None or fingerprinter is None:
+        return
+
+    for resolution, (fingerprint, _) in zip(resolutions, pending.values()):
+        if fingerprint is None:
+            continue
+
+        records = {
+            name: {"module": task.module, "qualname": task.qualname, "content": results[task.name].content}
+            for name, task in resolution.members.items() if results[task.name].successful
+        }
+
+        cache.put(fingerprint, polyium.schemas.cache.Entry(module=resolution.module, defined=list(resolution.defined), models=records))
+
+    fingerprinter.save(cache.sources)
+
+    cache.prune()
@@ -0,0 +1,117 @@
+import json
+import pathlib
+import shutil
+import sys
+import tempfile
+import textwrap
+
+import pydantic
+import pytest
+import logging
+
+import polyium.models.base
+import polyium.models.configuration
+import polyium.models.internal.base
+import polyium.schemas.generator as module
+
+logger = logging.getLogger(__name__)
+
+def test_task_model(request: pytest.FixtureRequest):
+    instance = module.Task.create(polyium.models.base.Base)
+
+    assert instance.name == "polyium.models.base.Base"
+    assert instance.importable
+    assert instance.model() is polyium.models.base.Base
+
+def test_execute(request: pytest.FixtureRequest):
+    result = module.execute(module.Task.create(polyium.models.base.Base))
+
+    assert result.successful
+
+    schema = json.loads(result.content)
+
+    assert schema["$schema"] == "https://json-schema.org/draft/2020-12/schema"
+    assert "working-directory" in schema["properties"]
+
+def test_execute_passes(request: pytest.FixtureRequest):
+    result = module.execute(module.Task.create(polyium.models.base.Base, passes=("strip-annotations", "sort-keys")))
+
+    schema = json.loads(result.content)
+
+    assert list(schema) == sorted(schema)
+    assert "description" not in schema["properties"]["working-directory"]
+
+def test_execute_failure(request: pytest.FixtureRequest):
+    result = module.execute(module.Task(module="polyium.models.base", qualname="Missing"))
+
+    logger.debug("[%s] Error: %s", request.node.name, result.error)
+
+    assert not result.successful
+    assert result.content is None
+
+def test_generate_process_pool(request: pytest.FixtureRequest):
+    """
+    Tests that result(s) are yielded in model order when generated across worker processes, including local model(s)
+    that can only be generated in the current process.
+    """
+
+    class Instance(pydantic.BaseModel):
+        model_config = polyium.models.configuration.default()
+
+        example_field_name: str = pydantic.Field(...)
+
+    models = [polyium.models.base.Base, Instance, polyium.models.internal.base.Model]
+
+    results = list(module.generate(models, jobs=2, indent=None))
+
+    assert [result.task.qualname for result in results] == ["Base", "%s.<locals>.Instance" % request.node.name, "Model"]
+
+    assert all(result.successful for result in results)
+
+    assert "\n" not in results[0].content
+
+def test_batch_isolated(request: pytest.FixtureRequest):
+    """
+    Tests that target module(s) are only imported by worker process(es), so their side effect(s) never reach the current
+    process.
+    """
+
+    directory = pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name)
+
+    shutil.rmtree(directory, ignore_errors=True)
+
+    package = directory.joinpath("isolated_package")
+    package.mkdir(parents=True)
+
+    package.joinpath("__init__.py").write_text("")
+    package.joinpath("models.py").write_text(textwrap.dedent("""
+        import tempfile
+
+        import pydantic
+
+        tempfile.tempdir = "/nonexistent"
+
+        class Example(pydantic.BaseModel):
+            name: str
+
+        class Other(pydantic.BaseModel):
+            example: Example
+    """))
+
+    sys.path.insert(0, str(directory))
+
+    try:
+        results = list(module.batch(["isolated_package.models:*", "isolated_package.models:Example"], jobs=2, max_tasks=1))
+
+        assert [result.task.qualname for result in results] == ["Example", "Other"]
+        assert all(result.successful for result in results)
+
+        assert "isolated_package.models" not in sys.modules
+        assert tempfile.gettempdir() != "/nonexistent"
+    finally:
+        sys.path.remove(str(directory))
+
+        for name in [name for name in sys.modules if name.startswith("isolated_package")]:
+            del sys.modules[name]
+
+        shutil.rmtree(directory, ignore_errors=True)
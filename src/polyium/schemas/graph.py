@@ -0,0 +1,164 @@
+"""
+The graph module tracks which pydantic model(s) reference which, so that a change to one model only requires
+regenerating the schema(s) of the model(s) that (transitively) embed it.
+
+Edges are derived from field and computed-field annotations (i.e. the model(s) that would appear in a schema's `$defs`)
+and from pydantic model base class(es).
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import typing
+
+import pydantic
+
+import polyium.schemas.targets
+
+logger = logging.getLogger(__name__)
+
+def name(model: type[pydantic.BaseModel]) -> str:
+    """
+    Returns a model's fully-qualified name, e.g. `myapp.models.User`.
+    """
+
+    return "%s.%s" % (model.__module__, model.__qualname__)
+
+def annotations(annotation: typing.Any, found: typing.Set[type[pydantic.BaseModel]]) -> None:
+    """
+    Recursively collects the pydantic model(s) referenced by a type annotation into `found`.
+    """
+
+    if polyium.schemas.targets.is_model(annotation):
+        found.add(annotation)
+        return
+
+    for argument in typing.get_args(annotation):
+        annotations(argument, found)
+
+def references(model: type[pydantic.BaseModel]) -> typing.Set[type[pydantic.BaseModel]]:
+    """
+    Returns the model(s) directly referenced by a model's field(s), computed field(s), and pydantic base class(es).
+
+    Parameters
+    ----------
+    model : type[pydantic.BaseModel]
+        The model class.
+
+    Returns
+    -------
+    set[type[pydantic.BaseModel]]
+        The directly referenced model class(es), excluding the model itself.
+    """
+
+    found: typing.Set[type[pydantic.BaseModel]] = set()
+
+    for field in model.model_fields.values():
+        annotations(field.annotation, found)
+
+    for field in model.model_computed_fields.values():
+        annotations(field.return_type, found)
+
+    found.update(base for base in model.__bases__ if polyium.schemas.targets.is_model(base))
+
+    found.discard(model)
+
+    return found
+
+class Graph:
+    """
+    A directed model dependency graph, keyed by fully-qualified model name so that it survives module reload(s).
+
+    :ivar models: The known model(s), keyed by name.
+    :ivar edges: A mapping of model name to the name(s) of the model(s) it references.
+    """
+
+    def __init__(self):
+        self.models: typing.Dict[str, type[pydantic.BaseModel]] = {}
+        self.edges: typing.Dict[str, typing.Set[str]] = {}
+
+        self._reverse: typing.Dict[str, typing.Set[str]] = collections.defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.models
+
+    def add(self, model: type[pydantic.BaseModel]) -> None:
+        """
+        Adds (or replaces) a model and, recursively, every model it references.
+        """
+
+        pending = [model]
+
+        while pending:
+            current = pending.pop()
+
+            key = name(current)
+
+            if self.models.get(key) is current:
+                continue
+
+            self.models[key] = current
+
+            for target in self.edges.pop(key, set()):
+                self._reverse[target].discard(key)
+
+            referenced = references(current)
+
+            self.edges[key] = {name(target) for target in referenced}
+
+            for target in self.edges[key]:
+                self._reverse[target].add(key)
+
+            pending.extend(target for target in referenced if self.models.get(name(target)) is not target)
+
+    def discard(self, module: str) -> typing.Set[str]:
+        """
+        Removes every model defined in the given module.
+
+        Returns
+        -------
+        set[str]
+            The removed model name(s).
+        """
+
+        removed = {key for key, model in self.models.items() if model.__module__ == module}
+
+        for key in removed:
+            del self.models[key]
+
+            for target in self.edges.pop(key, set()):
+                self._reverse[target].discard(key)
+
+        return removed
+
+    def defined(self, module: str) -> typing.Set[str]:
+        """
+        Returns the name(s) of the known model(s) defined in the given module.
+        """
+
+        return {key for key, model in self.models.items() if model.__module__ == module}
+
+    def dependents(self, names: typing.Iterable[str]) -> typing.Set[str]:
+        """
+        Returns the given model name(s) and the name(s) of every model that transitively references them.
+        """
+
+        result: typing.Set[str] = set()
+
+        pending = list(names)
+
+        while pending:
+            key = pending.pop()
+
+            if key in result:
+                continue
+
+            result.add(key)
+
+            pending.extend(self._reverse.get(key, ()))
+
+        return result
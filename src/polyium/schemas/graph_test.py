@@ -0,0 +1,61 @@
+import typing
+
+import pydantic
+import pytest
+import logging
+
+import polyium.schemas.graph as module
+
+logger = logging.getLogger(__name__)
+
+class Address(pydantic.BaseModel):
+    street: str
+
+class User(pydantic.BaseModel):
+    addresses: typing.Optional[typing.List[Address]] = None
+
+class Administrator(User):
+    level: int = 0
+
+class Group(pydantic.BaseModel):
+    members: typing.Dict[str, User] = {}
+
+class Unrelated(pydantic.BaseModel):
+    value: int = 0
+
+def test_references(request: pytest.FixtureRequest):
+    assert module.references(User) == {Address}
+    assert module.references(Administrator) == {User, Address}
+    assert module.references(Unrelated) == set()
+
+def test_graph_add_recursive(request: pytest.FixtureRequest):
+    """
+    Tests that adding a model also adds every model it transitively references.
+    """
+
+    graph = module.Graph()
+
+    graph.add(Group)
+
+    assert module.name(Address) in graph
+    assert module.name(User) in graph
+
+def test_graph_dependents(request: pytest.FixtureRequest):
+    graph = module.Graph()
+
+    for model in (Group, Administrator, Unrelated):
+        graph.add(model)
+
+    dependents = graph.dependents([module.name(Address)])
+
+    logger.debug("[%s] Dependents: %s", request.node.name, dependents)
+
+    assert dependents == {module.name(model) for model in (Address, User, Administrator, Group)}
+
+def test_graph_discard(request: pytest.FixtureRequest):
+    graph = module.Graph()
+
+    graph.add(Group)
+
+    assert graph.discard(__name__) == {module.name(model) for model in (Address, User, Group)}
+    assert len(graph) == 0
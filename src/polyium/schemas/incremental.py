@@ -0,0 +1,251 @@
+"""
+The incremental module regenerates only the JSON schema(s) affected by source change(s).
+
+A :class:`Session` combines two dependency graphs: the first-party module import graph (derived from source via
+`polyium.schemas.cache.Fingerprinter`), which determines the module(s) that must be reloaded and in which order, and the
+model reference graph (`polyium.schemas.graph.Graph`), which determines the model(s) whose schema(s) actually changed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import os
+import pathlib
+import sys
+import typing
+
+import pydantic
+
+import polyium.schemas.cache
+import polyium.schemas.fragments
+import polyium.schemas.generator
+import polyium.schemas.graph
+import polyium.schemas.targets
+
+logger = logging.getLogger(__name__)
+
+class Session:
+    """
+    A stateful, incremental schema generation session.
+
+    :ivar specifications: The target specification(s).
+    :ivar options: Additional `polyium.schemas.generator.Task` option(s).
+    :ivar graph: The model reference graph.
+    :ivar fingerprinter: The source-derived module import graph.
+    """
+
+    def __init__(self, specifications: typing.Iterable[typing.Union[str, polyium.schemas.targets.Specification]], **options: typing.Any):
+        self.specifications = [polyium.schemas.targets.Specification.parse(value) if isinstance(value, str) else value for value in specifications]
+        self.options = options
+
+        self.graph = polyium.schemas.graph.Graph()
+        self.fingerprinter = polyium.schemas.cache.Fingerprinter({specification.module.split(".")[0] for specification in self.specifications})
+
+        # The target module(s), and the requested model name(s) per target module.
+        self._targets: typing.Dict[str, typing.Set[str]] = {}
+
+        # The specification(s) resolving to each target module, as of the most recent resolution.
+        self._specifications: typing.Dict[str, typing.List[polyium.schemas.targets.Specification]] = {}
+
+        # The source path of every known first-party module.
+        self._files: typing.Dict[str, str] = {}
+
+    def roots(self) -> typing.List[str]:
+        """
+        Returns the source tree(s) to watch: the search location(s) of the target(s)' top-level package(s).
+        """
+
+        roots: typing.Set[str] = set()
+
+        for package in sorted({specification.module.split(".")[0] for specification in self.specifications}):
+            locations = polyium.schemas.targets.locations(package)
+
+            if locations is None:
+                location = self.fingerprinter.locator.find(package)
+
+                if location is not None:
+                    roots.add(os.path.dirname(location[0]))
+            else:
+                roots.update(locations)
+
+        return sorted(roots)
+
+    def modules(self) -> typing.List[str]:
+        """
+        Resolves the current target module(s), including module(s) created since the session started.
+        """
+
+        self._specifications = {}
+
+        for specification in self.specifications:
+            for module in specification.modules():
+                self._specifications.setdefault(module, []).append(specification)
+
+        return sorted(self._specifications)
+
+    def _resolve(self, module: str) -> None:
+        """
+        Registers the requested model(s) of a (freshly imported) target module in the graph.
+        """
+
+        self.graph.discard(module)
+
+        requested: typing.Set[str] = set()
+
+        for specification in self._specifications.get(module, []):
+            for model in specification.members(module).values():
+                self.graph.add(model)
+
+                requested.add(polyium.schemas.graph.name(model))
+
+        self._targets[module] = requested
+
+    def _index(self) -> None:
+        self._files = {}
+
+        for target in self._targets:
+            for module in self.fingerprinter.closure(target):
+                location = self.fingerprinter.locator.find(module)
+
+                if location is not None:
+                    self._files[os.path.abspath(location[0])] = module
+
+    def _generate(self, names: typing.Iterable[str], jobs: typing.Optional[int] = None) -> typing.List[polyium.schemas.generator.Result]:
+        requested = set().union(*self._targets.values()) if self._targets else set()
+
+        models: typing.List[type[pydantic.BaseModel]] = [self.graph.models[name] for name in sorted(names) if name in requested and name in self.graph.models]
+
+        return list(polyium.schemas.generator.generate(models, jobs=jobs, **self.options))
+
+    def load(self, jobs: typing.Optional[int] = None) -> typing.List[polyium.schemas.generator.Result]:
+        """
+        Imports every target module, builds the graph(s), and generates every requested schema.
+
+        Parameters
+        ----------
+        jobs : int | None
+            The maximum number of worker process(es) used for the initial generation.
+
+        Returns
+        -------
+        list[polyium.schemas.generator.Result]
+            A result per requested model.
+        """
+
+        for module in self.modules():
+            self._resolve(module)
+
+        self._index()
+
+        logger.debug("Loaded %d Target Module(s), %d Model(s), %d Source File(s)", len(self._targets), len(self.graph), len(self._files))
+
+        return self._generate(set().union(*self._targets.values()) if self._targets else set(), jobs=jobs)
+
+    def order(self, modules: typing.Iterable[str]) -> typing.List[str]:
+        """
+        Topologically sorts module(s) so that every module follows the (first-party) module(s) it imports.
+        """
+
+        modules = set(modules)
+
+        ordered: typing.List[str] = []
+        visited: typing.Set[str] = set()
+
+        def visit(module: str) -> None:
+            if module in visited:
+                return
+
+            visited.add(module)
+
+            for dependency in sorted(self.fingerprinter.dependencies(module)):
+                if dependency in modules:
+                    visit(dependency)
+
+            ordered.append(module)
+
+        for module in sorted(modules):
+            visit(module)
+
+        return ordered
+
+    def update(self, paths: typing.Iterable[str]) -> typing.List[polyium.schemas.generator.Result]:
+        """
+        Applies a batch of changed source path(s): reloads the affected module(s) in import order, and regenerates only
+        the schema(s) whose input(s) changed.
+
+        Parameters
+        ----------
+        paths : typing.Iterable[str]
+            The changed (created, modified, or deleted) source path(s).
+
+        Returns
+        -------
+        list[polyium.schemas.generator.Result]
+            A result per regenerated model.
+
+        Raises
+        ------
+        Exception
+            Any exception raised while re-importing a changed module (e.g. a `SyntaxError`); the session remains usable
+            and the module will be retried upon its next change.
+        """
+
+        importlib.invalidate_caches()
+
+        self.fingerprinter.invalidate()
+
+        previous = set(self._targets)
+        current = set(self.modules())
+
+        for module in previous - current:
+            logger.info("Target Module Removed: %s", module)
+
+            self.graph.discard(module)
+            self._targets.pop(module, None)
+
+        changed = {self._files[path] for path in (os.path.abspath(path) for path in paths) if path in self._files}
+        changed |= current - previous
+
+        if not changed:
+            return []
+
+        known = set(self._files.values()) | current
+
+        reloading = {module for module in known if module in changed or changed.intersection(self.fingerprinter.closure(module))}
+
+        # Model-defining module(s) invalidate only the model(s) referencing theirs; other module(s) (e.g. constants or
+        # validators) invalidate every model of their importer(s).
+        modeled = {module for module in changed if self.graph.defined(module)}
+
+        # Memoized fragment(s) of a reloaded module's model(s) (or of any model nesting them) would otherwise be served stale.
+        polyium.schemas.fragments.invalidate(reloading)
+
+        for module in self.order(reloading):
+            location = self.fingerprinter.locator.find(module)
+
+            # Bytecode cache(s) are validated by whole-second modification time and size, which a rapid, same-size edit
+            # would not invalidate.
+            if module in changed and location is not None:
+                pathlib.Path(importlib.util.cache_from_source(location[0])).unlink(missing_ok=True)
+
+            if module in sys.modules:
+                importlib.reload(sys.modules[module])
+            else:
+                importlib.import_module(module)
+
+            if module in current:
+                self._resolve(module)
+
+        self._index()
+
+        affected = self.graph.dependents(name for module in modeled | (changed & current) for name in self.graph.defined(module))
+
+        for module in reloading:
+            if module in current and (changed - modeled).intersection(self.fingerprinter.closure(module)):
+                affected |= self.graph.dependents(self.graph.defined(module))
+
+        logger.debug("Changed Module(s): %s, Reloaded: %d, Affected Model(s): %d", sorted(changed), len(reloading), len(affected))
+
+        return self._generate(affected, jobs=1)
@@ -0,0 +1,102 @@
+import json
+import pathlib
+import sys
+import textwrap
+
+import pytest
+import logging
+
+import polyium.schemas.incremental as module
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture()
+def directory(directory: pathlib.Path) -> pathlib.Path:
+    """
+    Populates the temporary directory with a first-party model package.
+    """
+
+    package = directory.joinpath("incremental_package")
+    package.mkdir(parents=True)
+
+    package.joinpath("__init__.py").write_text("")
+    package.joinpath("constants.py").write_text("MAXIMUM = 10\n")
+    package.joinpath("common.py").write_text(textwrap.dedent("""
+        import pydantic
+
+        class Address(pydantic.BaseModel):
+            street: str
+    """))
+    package.joinpath("users.py").write_text(textwrap.dedent("""
+        import pydantic
+
+        from .common import Address
+
+        class User(pydantic.BaseModel):
+            address: Address
+    """))
+    package.joinpath("limits.py").write_text(textwrap.dedent("""
+        import pydantic
+
+        from .constants import MAXIMUM
+
+        class Limit(pydantic.BaseModel):
+            value: int = pydantic.Field(le=MAXIMUM)
+    """))
+
+    sys.path.insert(0, str(directory))
+
+    try:
+        yield directory
+    finally:
+        sys.path.remove(str(directory))
+
+        for name in [name for name in sys.modules if name.startswith("incremental_package")]:
+            del sys.modules[name]
+
+def test_session_update(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that a change to a nested model only regenerates the model(s) embedding it.
+    """
+
+    session = module.Session(["incremental_package.*:*"])
+
+    assert len(session.load(jobs=1)) == 3
+
+    path = directory.joinpath("incremental_package", "common.py")
+
+    path.write_text(path.read_text() + "    city: str = \"\"\n")
+
+    results = session.update([str(path)])
+
+    assert sorted(result.task.name for result in results) == ["incremental_package.common.Address", "incremental_package.users.User"]
+
+    assert "city" in json.loads(results[1].content)["$defs"]["Address"]["properties"]
+
+def test_session_update_non_model_module(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that a change to a module without model(s) regenerates the model(s) of its importer(s).
+    """
+
+    session = module.Session(["incremental_package.*:*"])
+    session.load(jobs=1)
+
+    path = directory.joinpath("incremental_package", "constants.py")
+    path.write_text("MAXIMUM = 20\n")
+
+    results = session.update([str(path)])
+
+    assert [result.task.name for result in results] == ["incremental_package.limits.Limit"]
+
+    assert json.loads(results[0].content)["properties"]["value"]["maximum"] == 20
+
+def test_session_update_created_module(request: pytest.FixtureRequest, directory: pathlib.Path):
+    session = module.Session(["incremental_package.*:*"])
+    session.load(jobs=1)
+
+    path = directory.joinpath("incremental_package", "groups.py")
+    path.write_text("import pydantic\n\nclass Group(pydantic.BaseModel):\n    name: str\n")
+
+    results = session.update([str(path)])
+
+    assert [result.task.name for result in results] == ["incremental_package.groups.Group"]
@@ -0,0 +1,419 @@
+"""
+The optimization module post-processes generated JSON schema(s) through a pipeline of composable pass(es).
+
+Every pass preserves the schema's validation semantics; it only drops annotation(s), or restructures the document.
+Available pass(es), always applied in the order listed:
+
+- `strip-annotations`: removes `title`, `description`, `examples`, and `$comment` annotation(s).
+- `collapse-allof`: removes empty `allOf` entries, and merges a single-entry `allOf` into its enclosing schema.
+- `collapse-unions`: merges an `anyOf` of plain type schema(s), e.g. `anyOf: [{"type": "string"}, {"type": "null"}]`,
+  into a single schema with a `type` array.
+- `inline-definitions`: replaces every reference to a non-recursive, single-use definition with the definition itself.
+- `hoist-subschemas`: moves identical subschema(s) repeated within a document into shared definition(s), where doing so
+  reduces the document's size.
+- `sort-keys`: sorts every object's key(s), for byte-stable, more compressible output.
+
+Pass(es) are selected per output profile (see :data:`profiles`): `docs` retains every annotation, while `runtime` targets
+the smallest document, for validator(s) loading schema(s) at startup.
+"""
+
+from __future__ import annotations
+
+import json
+import typing
+
+# The prefix of a local definition reference.
+PREFIX = "#/$defs/"
+
+# Keyword(s) whose value is a single subschema.
+_SCHEMA = frozenset(("items", "additionalItems", "additionalProperties", "unevaluatedItems", "unevaluatedProperties", "propertyNames", "contains", "not", "if", "then", "else", "contentSchema"))
+
+# Keyword(s) whose value is a list of subschema(s).
+_SCHEMA_LISTS = frozenset(("allOf", "anyOf", "oneOf", "prefixItems", "items"))
+
+# Keyword(s) whose value maps name(s) to subschema(s).
+_SCHEMA_MAPS = frozenset(("properties", "patternProperties", "dependentSchemas", "$defs", "definitions"))
+
+# Keyword(s) identifying a schema resource or location, whose subschema(s) must not be moved.
+_IDENTIFIERS = frozenset(("$id", "$anchor", "$dynamicAnchor", "$dynamicRef"))
+
+ANNOTATIONS = ("title", "description", "examples", "$comment")
+
+# The instance type(s) each type-specific keyword applies to; other instance type(s) ignore the keyword.
+TYPED: typing.Dict[str, typing.FrozenSet[str]] = {
+    **dict.fromkeys(("minLength", "maxLength", "pattern", "format", "contentEncoding", "contentMediaType"), frozenset(("string",))),
+    **dict.fromkeys(("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf"), frozenset(("number", "integer"))),
+    **dict.fromkeys(("items", "prefixItems", "minItems", "maxItems", "uniqueItems", "contains", "minContains", "maxContains"), frozenset(("array",))),
+    **dict.fromkeys(("properties", "patternProperties", "additionalProperties", "required", "minProperties", "maxProperties", "propertyNames", "dependentRequired"), frozenset(("object",))),
+}
+
+Pass = typing.Callable[[typing.Dict[str, typing.Any]], typing.Dict[str, typing.Any]]
+
+def canonical(value: typing.Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+def children(schema: typing.Dict[str, typing.Any], function: typing.Callable[[typing.Dict[str, typing.Any]], typing.Any]) -> typing.Dict[str, typing.Any]:
+    """
+    Returns a copy of a schema with the given function applied to each of its immediate subschema(s).
+
+    Boolean subschema(s), and non-schema keyword value(s) (e.g. `enum`, `const`, or `default`), are retained as-is.
+    """
+
+    result = {}
+
+    for key, item in schema.items():
+        if key in _SCHEMA and isinstance(item, dict):
+            item = function(item)
+        elif key in _SCHEMA_LISTS and isinstance(item, list):
+            item = [function(entry) if isinstance(entry, dict) else entry for entry in item]
+        elif key in _SCHEMA_MAPS and isinstance(item, dict):
+            item = {name: function(entry) if isinstance(entry, dict) else entry for name, entry in item.items()}
+
+        result[key] = item
+
+    return result
+
+def references(value: typing.Any, found: typing.List[str]) -> typing.List[str]:
+    """
+    Collects the name of every locally referenced definition within a JSON value, once per reference.
+    """
+
+    if isinstance(value, dict):
+        reference = value.get("$ref")
+
+        if isinstance(reference, str) and reference.startswith(PREFIX):
+            found.append(unescape(reference[len(PREFIX):]))
+
+        for item in value.values():
+            references(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            references(item, found)
+
+    return found
+
+def unescape(name: str) -> str:
+    """
+    Decodes a JSON pointer (RFC 6901) reference token.
+    """
+
+    return name.replace("~1", "/").replace("~0", "~")
+
+def escape(name: str) -> str:
+    return name.replace("~", "~0").replace("/", "~1")
+
+def strip_annotations(schema: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    def visit(node: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        return {key: item for key, item in children(node, visit).items() if key not in ANNOTATIONS}
+
+    return visit(schema)
+
+def collapse_allof(schema: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    def visit(node: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        node = children(node, visit)
+
+        if not isinstance(node.get("allOf"), list):
+            return node
+
+        entries = [entry for entry in node["allOf"] if entry is not True and entry != {}]
+
+        # A single entry is merged, unless it shares a keyword with its enclosing schema, or its unevaluated keyword(s)
+        # would then observe the enclosing schema's own evaluation(s).
+        mergeable = len(entries) == 1 and isinstance(entries[0], dict) and "unevaluatedProperties" not in entries[0] and "unevaluatedItems" not in entries[0]
+
+        if mergeable and any(key in node for key in entries[0]):
+            mergeable = False
+
+        result: typing.Dict[str, typing.Any] = {}
+
+        for key, item in node.items():
+            if key != "allOf":
+                result[key] = item
+            elif mergeable:
+                result.update(entries[0])
+            elif entries:
+                result[key] = entries
+
+        return result
+
+    return visit(schema)
+
+def collapse_unions(schema: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    def merge(node: typing.Dict[str, typing.Any]) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        entries = node["anyOf"]
+
+        if "type" in node or len(entries) < 2 or not all(isinstance(entry, dict) and isinstance(entry.get("type"), str) for entry in entries):
+            return None
+
+        types = [entry["type"] for entry in entries]
+
+        if len(set(types)) != len(types):
+            return None
+
+        merged: typing.Dict[str, typing.Any] = {"type": types}
+
+        for entry in entries:
+            for key, item in entry.items():
+                if key == "type":
+                    continue
+
+                # A type-specific keyword may only be hoisted if every other merged type ignores it; an "integer" is
+                # also a "number", so number keyword(s) are never merged alongside both.
+                if key not in TYPED or key in merged or key in node or TYPED[key].intersection(types) != {entry["type"]}:
+                    return None
+
+                merged[key] = item
+
+        result: typing.Dict[str, typing.Any] = {}
+
+        for key, item in node.items():
+            if key == "anyOf":
+                result.update(merged)
+            else:
+                result[key] = item
+
+        return result
+
+    def visit(node: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        node = children(node, visit)
+
+        if isinstance(node.get("anyOf"), list):
+            return merge(node) or node
+
+        return node
+
+    return visit(schema)
+
+def inline_definitions(schema: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    definitions = schema.get("$defs")
+
+    if not isinstance(definitions, dict) or not definitions:
+        return schema
+
+    counts: typing.Dict[str, int] = {}
+
+    for name in references(schema, []):
+        counts[name] = counts.get(name, 0) + 1
+
+    edges = {name: set(references(value, [])) for name, value in definitions.items()}
+
+    def recursive(name: str) -> bool:
+        visited: typing.Set[str] = set()
+        unvisited = list(edges[name])
+
+        while unvisited:
+            target = unvisited.pop()
+
+            if target == name:
+                return True
+
+            if target in visited or target not in edges:
+                continue
+
+            visited.add(target)
+            unvisited.extend(edges[target])
+
+        return False
+
+    candidates = {name for name in definitions if counts.get(name) == 1 and not recursive(name)}
+
+    inlined: typing.Set[str] = set()
+    expanded: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+
+    def visit(node: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        reference = node.get("$ref")
+
+        if isinstance(reference, str) and reference.startswith(PREFIX) and unescape(reference[len(PREFIX):]) in candidates:
+            name = unescape(reference[len(PREFIX):])
+
+            if name not in expanded:
+                expanded[name] = visit(definitions[name]) if isinstance(definitions[name], dict) else definitions[name]
+
+            siblings = {key: item for key, item in node.items() if key != "$ref"}
+
+            if isinstance(expanded[name], dict) and not any(key in expanded[name] for key in siblings):
+                inlined.add(name)
+
+                return {**expanded[name], **children(siblings, visit)}
+
+        return children(node, visit)
+
+    result = visit({key: item for key, item in schema.items() if key != "$defs"})
+
+    remaining = {name: visit(value) if isinstance(value, dict) else value for name, value in definitions.items() if name not in inlined}
+
+    if remaining:
+        result["$defs"] = remaining
+
+    return result
+
+def hoist_subschemas(schema: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    definitions = dict(schema.get("$defs", {})) if isinstance(schema.get("$defs"), dict) else {}
+    document = {key: item for key, item in schema.items() if key != "$defs"}
+
+    index = 0
+
+    while True:
+        # The structural key of every (hoistable) subschema, by identity; and the occurrence(s) of each key.
+        keys: typing.Dict[int, str] = {}
+        occurrences: typing.Dict[str, typing.List[typing.Any]] = {}
+
+        def encode(value: typing.Any) -> str:
+            return collect(value) if isinstance(value, dict) else canonical(value)
+
+        def collect(node: typing.Dict[str, typing.Any], root: bool = False) -> str:
+            # Equivalent to (though built bottom-up, rather than re-serializing every subtree) the node's canonical form.
+            parts = []
+
+            for key in sorted(node):
+                item = node[key]
+
+                if key in _SCHEMA and isinstance(item, dict):
+                    encoded = collect(item)
+                elif key in _SCHEMA_LISTS and isinstance(item, list):
+                    encoded = "[%s]" % ",".join(encode(entry) for entry in item)
+                elif key in _SCHEMA_MAPS and isinstance(item, dict):
+                    encoded = "{%s}" % ",".join("%s:%s" % (canonical(name), encode(item[name])) for name in sorted(item))
+                else:
+                    encoded = canonical(item)
+
+                parts.append("%s:%s" % (canonical(key), encoded))
+
+            content = "{%s}" % ",".join(parts)
+
+            # A subschema containing an identifier (conservatively, anywhere within its content) is never moved.
+            if not root and not any("\"%s\":" % identifier in content for identifier in _IDENTIFIERS):
+                keys[id(node)] = content
+
+                occurrences.setdefault(content, [0, node])[0] += 1
+
+            return content
+
+        # The document's root, and each definition itself, are never hoisted; only their subschema(s).
+        collect(document, root=True)
+
+        for value in definitions.values():
+            if isinstance(value, dict):
+                collect(value, root=True)
+
+        # The byte(s) saved by replacing every occurrence with a reference, less the added definition.
+        def saving(key: str) -> int:
+            count = occurrences[key][0]
+
+            return (count - 1) * len(key) - count * len(canonical({"$ref": PREFIX + "Subschema%d" % index})) - len(canonical({"Subschema%d" % index: None}))
+
+        candidates = sorted((key for key, (count, _) in occurrences.items() if count > 1 and saving(key) > 0), key=saving, reverse=True)
+
+        if not candidates:
+            break
+
+        # Candidate(s) neither containing, nor contained by, a better candidate have disjoint occurrence(s), and are
+        # thus hoisted within the same round; the remainder are re-counted in the next round.
+        selected: typing.Dict[str, str] = {}
+
+        for key in candidates:
+            if any(key in other or other in key for other in selected):
+                continue
+
+            while "Subschema%d" % index in definitions:
+                index += 1
+
+            selected[key] = "Subschema%d" % index
+
+            index += 1
+
+        def replace(node: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+            key = keys.get(id(node))
+
+            return {"$ref": PREFIX + escape(selected[key])} if key in selected else children(node, replace)
+
+        document = children(document, replace)
+        definitions = {key: children(value, replace) if isinstance(value, dict) else value for key, value in definitions.items()}
+
+        for key, name in selected.items():
+            definitions[name] = occurrences[key][1]
+
+    if definitions:
+        document["$defs"] = definitions
+
+    return document
+
+def sort_keys(schema: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    def visit(value: typing.Any) -> typing.Any:
+        if isinstance(value, dict):
+            return {key: visit(value[key]) for key in sorted(value)}
+
+        if isinstance(value, list):
+            return [visit(item) for item in value]
+
+        return value
+
+    return visit(schema)
+
+passes: typing.Dict[str, Pass] = {
+    "strip-annotations": strip_annotations,
+    "collapse-allof": collapse_allof,
+    "collapse-unions": collapse_unions,
+    "inline-definitions": inline_definitions,
+    "hoist-subschemas": hoist_subschemas,
+    "sort-keys": sort_keys,
+}
+
+profiles: typing.Dict[str, typing.Tuple[str, ...]] = {
+    "default": (),
+    "docs": ("collapse-allof",),
+    "runtime": tuple(passes),
+}
+
+def select(profile: str = "default", additional: typing.Iterable[str] = ()) -> typing.Tuple[str, ...]:
+    """
+    Returns the pass(es) of an output profile, with any additional pass(es), in application order.
+
+    Raises
+    ------
+    ValueError
+        If the profile, or any pass, is unknown.
+    """
+
+    if profile not in profiles:
+        raise ValueError("Unknown output profile \"%s\" (expected one of: %s)" % (profile, ", ".join(profiles)))
+
+    selected = set(profiles[profile])
+
+    for name in additional:
+        if name not in passes:
+            raise ValueError("Unknown optimization pass \"%s\" (expected one of: %s)" % (name, ", ".join(passes)))
+
+        selected.add(name)
+
+    return tuple(name for name in passes if name in selected)
+
+def optimize(schema: typing.Dict[str, typing.Any], names: typing.Iterable[str]) -> typing.Dict[str, typing.Any]:
+    """
+    Applies optimization pass(es) to a JSON schema, without modifying it.
+
+    Parameters
+    ----------
+    schema : dict[str, typing.Any]
+        The JSON schema.
+    names : typing.Iterable[str]
+        The pass(es), see :data:`passes`; applied in the given order (see :func:`select`).
+
+    Returns
+    -------
+    dict[str, typing.Any]
+        The optimized JSON schema.
+
+    Raises
+    ------
+    ValueError
+        If a pass is unknown.
+    """
+
+    for name in names:
+        if name not in passes:
+            raise ValueError("Unknown optimization pass \"%s\" (expected one of: %s)" % (name, ", ".join(passes)))
+
+        schema = passes[name](schema)
+
+    return schema
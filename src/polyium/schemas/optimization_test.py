@@ -0,0 +1,139 @@
+import enum
+import typing
+
+import jsonschema
+import pydantic
+import pytest
+import logging
+
+import polyium.models.base
+import polyium.schemas.optimization as module
+
+logger = logging.getLogger(__name__)
+
+class Color(str, enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+class Range(pydantic.BaseModel):
+    """
+    An inclusive range.
+    """
+
+    lower: typing.Optional[int] = pydantic.Field(None, ge=0, description="The lower bound.")
+    upper: typing.Optional[float] = pydantic.Field(None, le=100)
+
+class Node(pydantic.BaseModel):
+    title: str = pydantic.Field(..., min_length=1, examples=["Root"])
+    children: typing.List["Node"] = []
+
+class Document(pydantic.BaseModel):
+    primary: Range
+    secondary: typing.Optional[Range] = None
+    ranges: typing.Dict[str, typing.Tuple[int, int]] = {}
+    windows: typing.List[typing.Tuple[int, int]] = []
+    color: Color = Color.RED
+    tree: typing.Optional[Node] = None
+    value: typing.Union[int, str, None] = None
+    amount: typing.Union[int, float] = 0
+
+instances = [
+    {"primary": {}},
+    {"primary": {"lower": 1, "upper": 2.5}, "color": "green", "value": "text"},
+    {"primary": {"lower": -1}},
+    {"primary": {"upper": 101}},
+    {"primary": {}, "secondary": None, "value": None, "amount": 1.5},
+    {"primary": {}, "secondary": {"lower": "1"}},
+    {"primary": {}, "color": "blue"},
+    {"primary": {}, "tree": {"title": "a", "children": [{"title": "b"}, {"title": ""}]}},
+    {"primary": {}, "tree": {"title": "a", "children": [{"title": "b", "children": []}]}},
+    {"primary": {}, "ranges": {"a": [1, 2]}, "windows": [[1, 2], [3, 4]]},
+    {"primary": {}, "windows": [[1, "2"]]},
+    {"primary": {}, "value": 1.5},
+    {},
+]
+
+@pytest.mark.parametrize("profile", list(module.profiles))
+@pytest.mark.parametrize("model", [Document, polyium.models.base.Base])
+def test_equivalence(request: pytest.FixtureRequest, profile: str, model: type[pydantic.BaseModel]):
+    """
+    Tests that every output profile's schema(s) accept and reject exactly the instance(s) the original schema does.
+    """
+
+    schema = model.model_json_schema()
+
+    optimized = module.optimize(schema, module.select(profile))
+
+    logger.debug("[%s] %d Bytes Optimized to %d Bytes", request.node.name, len(module.canonical(schema)), len(module.canonical(optimized)))
+
+    assert schema == model.model_json_schema()
+    assert len(module.canonical(optimized)) <= len(module.canonical(schema))
+
+    jsonschema.Draft202012Validator.check_schema(optimized)
+
+    original, validator = jsonschema.Draft202012Validator(schema), jsonschema.Draft202012Validator(optimized)
+
+    for instance in instances:
+        assert validator.is_valid(instance) == original.is_valid(instance), instance
+
+def test_strip_annotations(request: pytest.FixtureRequest):
+    """
+    Tests that annotation(s) are removed, but not a property named after an annotation.
+    """
+
+    optimized = module.optimize(Node.model_json_schema(), ["strip-annotations"])
+
+    assert optimized == {
+        "$defs": {"Node": {"properties": {"title": {"minLength": 1, "type": "string"}, "children": {"default": [], "items": {"$ref": "#/$defs/Node"}, "type": "array"}}, "required": ["title"], "type": "object"}},
+        "$ref": "#/$defs/Node",
+    }
+
+def test_collapse_unions(request: pytest.FixtureRequest):
+    schema = {"anyOf": [{"type": "string", "maxLength": 4}, {"type": "null"}], "default": None}
+
+    assert module.optimize(schema, ["collapse-unions"]) == {"type": ["string", "null"], "maxLength": 4, "default": None}
+
+    # An "integer" is also a "number", so a number bound cannot be shared by both.
+    schema = {"anyOf": [{"type": "integer", "minimum": 5}, {"type": "number"}]}
+
+    assert module.optimize(schema, ["collapse-unions"]) == schema
+
+    schema = {"anyOf": [{"$ref": "#/$defs/Range"}, {"type": "null"}]}
+
+    assert module.optimize(schema, ["collapse-unions"]) == schema
+
+def test_collapse_allof(request: pytest.FixtureRequest):
+    schema = {"properties": {"a": {"allOf": [{"$ref": "#/$defs/A"}], "default": 1}, "b": {"allOf": [{}, {"type": "string"}], "type": "integer"}}}
+
+    assert module.optimize(schema, ["collapse-allof"]) == {"properties": {"a": {"$ref": "#/$defs/A", "default": 1}, "b": {"allOf": [{"type": "string"}], "type": "integer"}}}
+
+def test_inline_definitions(request: pytest.FixtureRequest):
+    """
+    Tests that single-use definition(s) are inlined, but not recursive or shared definition(s).
+    """
+
+    optimized = module.optimize(Document.model_json_schema(), ["inline-definitions"])
+
+    assert set(optimized["$defs"]) == {"Node", "Range"}
+    assert optimized["properties"]["color"]["enum"] == ["red", "green"]
+
+def test_hoist_subschemas(request: pytest.FixtureRequest):
+    item = {"type": "object", "properties": {"first": {"type": "string"}, "second": {"type": "integer", "minimum": 0}}}
+
+    schema = {"type": "object", "properties": {"a": item, "b": {"type": "array", "items": item}, "c": {"type": "string"}}}
+
+    optimized = module.optimize(schema, ["hoist-subschemas"])
+
+    assert optimized["$defs"] == {"Subschema0": item}
+    assert optimized["properties"]["a"] == optimized["properties"]["b"]["items"] == {"$ref": "#/$defs/Subschema0"}
+    assert optimized["properties"]["c"] == {"type": "string"}
+
+def test_select(request: pytest.FixtureRequest):
+    assert module.select() == ()
+    assert module.select("docs", ["sort-keys", "strip-annotations"]) == ("strip-annotations", "collapse-allof", "sort-keys")
+
+    with pytest.raises(ValueError, match="Unknown output profile"):
+        module.select("unknown")
+
+    with pytest.raises(ValueError, match="Unknown optimization pass"):
+        module.optimize({}, ["unknown"])
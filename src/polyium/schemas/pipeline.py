@@ -0,0 +1,159 @@
+"""
+The pipeline module overlaps CPU-bound schema generation with I/O-bound artifact write(s).
+
+A :class:`Pipeline` sits between the generating (producer) thread and a :class:`polyium.schemas.writer.Writer`: each
+submitted artifact is handed to an asyncio event loop, running in a background thread, which dispatches every write
+(i.e. the read and hash of the previous artifact, and the atomic replacement of a changed one) to a thread pool. The
+producer returns to generating while write(s) are in flight, hiding most of the write latency on slow (e.g. network
+mounted) volume(s).
+
+Back-pressure keeps memory bounded: at most `capacity` artifact(s) are queued or in flight, beyond which a submission
+blocks until a write completes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import typing
+
+import polyium.internal.profiling
+import polyium.schemas.writer
+
+logger = logging.getLogger(__name__)
+
+# The default number of concurrent write(s).
+CONCURRENCY = 16
+
+# The default number of artifact(s) queued or in flight, beyond which a submission blocks.
+CAPACITY = 256
+
+class Pipeline:
+    """
+    An asynchronous, bounded artifact write queue.
+
+    Usable as a context manager; :meth:`close` must otherwise be called to wait for every pending write. The first
+    failed write is raised by the next :meth:`submit`, or by :meth:`close`.
+
+    :ivar writer: The underlying (thread-safe) writer.
+    :ivar concurrency: The maximum number of concurrent write(s).
+    :ivar capacity: The maximum number of artifact(s) queued or in flight.
+    """
+
+    def __init__(self, writer: polyium.schemas.writer.Writer, concurrency: int = CONCURRENCY, capacity: int = CAPACITY):
+        self.writer = writer
+        self.concurrency = max(1, concurrency)
+        self.capacity = max(self.concurrency, capacity)
+
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._errors: typing.List[BaseException] = []
+        self._closed = False
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="writer")
+        self._loop = asyncio.new_event_loop()
+        self._queue: asyncio.Queue[typing.Optional[typing.Tuple[str, typing.Union[str, bytes]]]] = asyncio.Queue()
+
+        self._thread = threading.Thread(target=self._loop.run_forever, name="pipeline", daemon=True)
+        self._thread.start()
+
+        self._consumer = asyncio.run_coroutine_threadsafe(self._consume(), self._loop)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        return False
+
+    def _write(self, name: str, content: typing.Union[str, bytes]) -> None:
+        try:
+            with polyium.internal.profiling.profiler.phase("write", "writer", artifact=name):
+                self.writer.write(name, content)
+        finally:
+            self._slots.release()
+
+    def _collect(self, futures: typing.Iterable[asyncio.Future]) -> None:
+        for future in futures:
+            if future.exception() is not None:
+                logger.debug("Unable to Write Artifact: %s", future.exception())
+
+                self._errors.append(future.exception())
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        pending: typing.Set[asyncio.Future] = set()
+
+        while True:
+            item = await self._queue.get()
+
+            if item is None:
+                break
+
+            if len(pending) >= self.concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                self._collect(done)
+
+            pending.add(loop.run_in_executor(self._executor, self._write, *item))
+
+        if pending:
+            done, _ = await asyncio.wait(pending)
+
+            self._collect(done)
+
+    def submit(self, name: str, content: typing.Union[str, bytes]) -> None:
+        """
+        Queues an artifact's write, blocking while the pipeline is at capacity.
+
+        Parameters
+        ----------
+        name : str
+            The file's path, relative to the writer's output directory.
+        content : str | bytes
+            The file's content; text is UTF-8 encoded.
+
+        Raises
+        ------
+        OSError
+            If a previously submitted write failed.
+        """
+
+        if self._errors:
+            raise self._errors[0]
+
+        if self._closed:
+            raise RuntimeError("Unable to Submit Artifact to a Closed Pipeline: %s" % name)
+
+        self._slots.acquire()
+
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (name, content))
+
+    def close(self) -> None:
+        """
+        Waits for every pending write, and stops the pipeline's event loop and thread pool.
+
+        Raises
+        ------
+        OSError
+            If any write failed.
+        """
+
+        if not self._closed:
+            self._closed = True
+
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+
+            try:
+                self._consumer.result()
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+                self._executor.shutdown()
+
+        if self._errors:
+            raise self._errors[0]
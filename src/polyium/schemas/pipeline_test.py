@@ -0,0 +1,101 @@
+import pathlib
+import threading
+import time
+
+import pytest
+import logging
+
+import polyium.schemas.pipeline as module
+import polyium.schemas.writer
+
+logger = logging.getLogger(__name__)
+
+class Slow(polyium.schemas.writer.Writer):
+    """
+    A writer whose write(s) are delayed, recording the peak number of concurrent write(s).
+    """
+
+    def __init__(self, *arguments, **kwargs):
+        super().__init__(*arguments, **kwargs)
+
+        self.active = 0
+        self.peak = 0
+        self.guard = threading.Lock()
+
+    def write(self, name, content):
+        with self.guard:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+        try:
+            time.sleep(0.01)
+
+            return super().write(name, content)
+        finally:
+            with self.guard:
+                self.active -= 1
+
+def test_pipeline(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that every submitted artifact is written (or skipped, if unchanged) once the pipeline is closed.
+    """
+
+    with polyium.schemas.writer.Writer(directory) as writer, module.Pipeline(writer, concurrency=4) as pipeline:
+        for index in range(100):
+            pipeline.submit("nested/%d.json" % index, "{\"index\": %d}\n" % index)
+
+    assert writer.statistics().written == 100
+    assert directory.joinpath("nested", "42.json").read_text() == "{\"index\": 42}\n"
+
+    with polyium.schemas.writer.Writer(directory) as writer, module.Pipeline(writer) as pipeline:
+        for index in range(100):
+            pipeline.submit("nested/%d.json" % index, b"{\"index\": %d}\n" % index)
+
+    assert writer.statistics().skipped == 100
+
+    with pytest.raises(RuntimeError):
+        pipeline.submit("closed.json", "{}\n")
+
+def test_backpressure(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that concurrent write(s) are bounded, and that submission(s) block once the pipeline is at capacity.
+    """
+
+    writer = Slow(directory, fsync=False)
+
+    pipeline = module.Pipeline(writer, concurrency=2, capacity=4)
+
+    start = time.perf_counter()
+
+    for index in range(8):
+        pipeline.submit("%d.json" % index, "{}\n")
+
+    # Submitting 8 write(s) of 10ms each, 2 at a time, with 4 slot(s), blocks until at least 2 rounds completed.
+    elapsed = time.perf_counter() - start
+
+    pipeline.close()
+    writer.close()
+
+    logger.debug("Submission(s) Blocked for %.3fs; Peak Concurrency: %d", elapsed, writer.peak)
+
+    assert elapsed >= 0.015
+    assert writer.peak == 2
+    assert writer.statistics().written == 8
+
+def test_failure(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that a failed write is raised upon close.
+    """
+
+    directory.joinpath("file").write_text("")
+
+    writer = polyium.schemas.writer.Writer(directory, manifest=False)
+
+    pipeline = module.Pipeline(writer)
+    pipeline.submit("file/nested.json", "{}\n")
+
+    with pytest.raises(OSError):
+        pipeline.close()
+
+    with pytest.raises(OSError):
+        pipeline.submit("other.json", "{}\n")
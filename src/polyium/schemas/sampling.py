@@ -0,0 +1,721 @@
+"""
+The sampling module generates seeded, reproducible instance(s) conforming to a JSON schema, e.g. for load testing.
+
+A :class:`Sampler` compiles a schema once into a tree of sampling function(s), which are then applied per record. The
+output is streamed as newline-delimited JSON, in shard(s) of a fixed number of record(s): every shard draws from its own
+random generator, seeded by the global seed and the shard's index, so the output is identical for a given seed and
+shard size regardless of the number of worker process(es). At most two shard(s) per worker are in flight at any time,
+so memory use is independent of the number of record(s).
+
+Supported keyword(s) are `type`, `enum`, `const`, `$ref` (local, including recursive, definition(s)), `allOf`,
+`anyOf`, `oneOf`, `properties`, `required`, `additionalProperties`, `minProperties`, `maxProperties`, `items`,
+`prefixItems`, `minItems`, `maxItems`, `uniqueItems`, `minLength`, `maxLength`, `pattern`, `format`, `minimum`,
+`maximum`, `exclusiveMinimum`, `exclusiveMaximum`, and `multipleOf`. Other keyword(s) (e.g. `not`, or `if`) are
+ignored, and a `oneOf` branch is chosen without excluding the other(s); such schema(s) may yield invalid instance(s).
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import dataclasses
+import datetime
+import itertools
+import json
+import logging
+import math
+import os
+import random
+import re._constants
+import re._parser
+import string
+import typing
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# The default number of record(s) per shard.
+SHARD_SIZE = 4096
+
+# The span of a numeric range lacking a bound.
+RANGE = 1000000
+
+ALPHABET = string.ascii_letters + string.digits
+
+# Maps every random byte onto the alphabet; marginally non-uniform, though far cheaper than sampling each character.
+_TRANSLATION = bytes(ord(ALPHABET[value % len(ALPHABET)]) for value in range(256))
+
+_LOWERCASE = bytes(ord(string.ascii_lowercase[value % 26]) for value in range(256))
+
+# The character(s) sampled for a regular expression's character categor(ies).
+_CATEGORIES = {
+    re._constants.CATEGORY_DIGIT: string.digits,
+    re._constants.CATEGORY_NOT_DIGIT: string.ascii_letters,
+    re._constants.CATEGORY_WORD: string.ascii_letters + string.digits + "_",
+    re._constants.CATEGORY_NOT_WORD: "-.,:; ",
+    re._constants.CATEGORY_SPACE: " ",
+    re._constants.CATEGORY_NOT_SPACE: string.ascii_letters + string.digits,
+}
+
+_PRINTABLE = string.ascii_letters + string.digits + string.punctuation + " "
+
+# A sampling function, given the record's context.
+Function = typing.Callable[["_Context"], typing.Any]
+
+@dataclasses.dataclass(frozen=True)
+class Options:
+    """
+    The size distribution and edge-case bias of sampled instance(s).
+
+    :ivar max_items: The number of item(s) (or entries) beyond the minimum of an array (or map) lacking a maximum.
+    :ivar max_length: The number of character(s) beyond the minimum of a string lacking a maximum length.
+    :ivar max_depth: The reference depth beyond which recursive structure(s) are kept minimal.
+    :ivar distribution: The size distribution; "uniform" across the allowed range, or "geometric" favoring small size(s).
+    :ivar edge: The probability of sampling an edge case instead: a minimum or maximum size or length, a boundary
+        number, or the next enum value in turn (so every enum value is eventually sampled).
+    :ivar optional: The probability of including an optional property.
+    """
+
+    max_items: int = 8
+    max_length: int = 16
+    max_depth: int = 4
+    distribution: typing.Literal["uniform", "geometric"] = "uniform"
+    edge: float = 0.1
+    optional: float = 0.5
+
+class _Context:
+    """
+    The state of a shard's sampling: its random generator, enum rotation counter(s), and current reference depth.
+    """
+
+    def __init__(self, generator: random.Random, options: Options):
+        self.random = generator
+        self.options = options
+        self.counters: typing.Dict[int, int] = collections.defaultdict(int)
+        self.depth = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.depth >= self.options.max_depth
+
+    def edge(self) -> bool:
+        return self.random.random() < self.options.edge
+
+    def size(self, lower: int, upper: int) -> int:
+        upper = max(lower, upper)
+
+        if self.exhausted:
+            return lower
+
+        if self.edge():
+            return self.random.choice((lower, upper))
+
+        if self.options.distribution == "geometric":
+            return min(upper, lower + int(self.random.expovariate(4.0 / max(1, upper - lower))))
+
+        return lower + int(self.random.random() * (upper - lower + 1))
+
+    def rotate(self, key: int, count: int) -> int:
+        index = self.counters[key] % count
+
+        self.counters[key] += 1
+
+        return index
+
+def _date(generator: random.Random) -> datetime.date:
+    return datetime.date(2000, 1, 1) + datetime.timedelta(days=generator.randrange(365 * 40))
+
+def _time(generator: random.Random) -> str:
+    return "%02d:%02d:%02dZ" % (generator.randrange(24), generator.randrange(60), generator.randrange(60))
+
+def _text(generator: random.Random, length: int) -> str:
+    return generator.randbytes(length).translate(_TRANSLATION).decode("ascii")
+
+def _word(generator: random.Random) -> str:
+    return generator.randbytes(generator.randint(3, 10)).translate(_LOWERCASE).decode("ascii")
+
+formats: typing.Dict[str, typing.Callable[[random.Random], str]] = {
+    "date-time": lambda generator: "%sT%s" % (_date(generator).isoformat(), _time(generator)),
+    "date": lambda generator: _date(generator).isoformat(),
+    "time": _time,
+    "duration": lambda generator: "P%dDT%dS" % (generator.randrange(30), generator.randrange(86400)),
+    "email": lambda generator: "%s@%s.com" % (_word(generator), _word(generator)),
+    "hostname": lambda generator: "%s.example.com" % _word(generator),
+    "uri": lambda generator: "https://%s.example.com/%s" % (_word(generator), _word(generator)),
+    "uuid": lambda generator: str(uuid.UUID(int=generator.getrandbits(128), version=4)),
+    "ipv4": lambda generator: ".".join(str(generator.randrange(256)) for _ in range(4)),
+    "ipv6": lambda generator: ":".join("%x" % generator.randrange(65536) for _ in range(8)),
+}
+
+formats["uri-reference"] = formats["iri"] = formats["uri"]
+formats["idn-email"] = formats["email"]
+formats["idn-hostname"] = formats["hostname"]
+
+def _expression(context: _Context, tokens: typing.Any, groups: typing.Dict[int, str]) -> str:
+    """
+    Samples a string matching a parsed regular expression; look-around assertion(s) and anchor(s) are ignored.
+    """
+
+    constants = re._constants
+
+    output: typing.List[str] = []
+
+    for operator, argument in tokens:
+        if operator is constants.LITERAL:
+            output.append(chr(argument))
+        elif operator is constants.NOT_LITERAL:
+            output.append(context.random.choice([character for character in _PRINTABLE if ord(character) != argument]))
+        elif operator is constants.ANY:
+            output.append(context.random.choice(ALPHABET))
+        elif operator is constants.IN:
+            output.append(_character(context, argument))
+        elif operator in (constants.MAX_REPEAT, constants.MIN_REPEAT, constants.POSSESSIVE_REPEAT):
+            lower, upper, pattern = argument
+
+            upper = lower + 3 if upper is constants.MAXREPEAT else upper
+
+            output.extend(_expression(context, pattern, groups) for _ in range(context.random.randint(lower, upper)))
+        elif operator is constants.SUBPATTERN:
+            group, _, _, pattern = argument
+
+            value = _expression(context, pattern, groups)
+
+            if group is not None:
+                groups[group] = value
+
+            output.append(value)
+        elif operator is constants.ATOMIC_GROUP:
+            output.append(_expression(context, argument, groups))
+        elif operator is constants.BRANCH:
+            output.append(_expression(context, context.random.choice(argument[1]), groups))
+        elif operator is constants.GROUPREF:
+            output.append(groups.get(argument, ""))
+
+    return "".join(output)
+
+def _character(context: _Context, items: typing.Any) -> str:
+    constants = re._constants
+
+    characters: typing.List[str] = []
+    negated = False
+
+    for operator, argument in items:
+        if operator is constants.NEGATE:
+            negated = True
+        elif operator is constants.LITERAL:
+            characters.append(chr(argument))
+        elif operator is constants.RANGE:
+            characters.extend(chr(value) for value in range(argument[0], min(argument[1], argument[0] + 255) + 1))
+        elif operator is constants.CATEGORY:
+            characters.extend(_CATEGORIES.get(argument, ""))
+
+    if negated:
+        excluded = set(characters)
+
+        characters = [character for character in _PRINTABLE if character not in excluded]
+
+    return context.random.choice(characters) if characters else ""
+
+def _referencing(schema: typing.Any) -> bool:
+    """
+    Whether a (sub)schema contains a `$ref`, without following it.
+    """
+
+    if isinstance(schema, dict):
+        return "$ref" in schema or any(_referencing(item) for item in schema.values())
+
+    if isinstance(schema, list):
+        return any(_referencing(item) for item in schema)
+
+    return False
+
+def _bounds(schema: typing.Dict[str, typing.Any], integer: bool) -> typing.Tuple[float, float]:
+    lower, upper = schema.get("minimum"), schema.get("maximum")
+
+    exclusive = schema.get("exclusiveMinimum")
+
+    # Boolean exclusive bound(s) (draft 4) modify the inclusive bound(s).
+    if isinstance(exclusive, bool):
+        exclusive = lower if exclusive else None
+
+        lower = None if exclusive is not None else lower
+
+    if isinstance(exclusive, (int, float)):
+        candidate = math.floor(exclusive) + 1 if integer else math.nextafter(exclusive, math.inf)
+
+        lower = candidate if lower is None else max(lower, candidate)
+
+    exclusive = schema.get("exclusiveMaximum")
+
+    if isinstance(exclusive, bool):
+        exclusive = upper if exclusive else None
+
+        upper = None if exclusive is not None else upper
+
+    if isinstance(exclusive, (int, float)):
+        candidate = math.ceil(exclusive) - 1 if integer else math.nextafter(exclusive, -math.inf)
+
+        upper = candidate if upper is None else min(upper, candidate)
+
+    if integer:
+        lower = None if lower is None else math.ceil(lower)
+        upper = None if upper is None else math.floor(upper)
+
+    if lower is None and upper is None:
+        lower, upper = -RANGE, RANGE
+    elif lower is None:
+        lower = upper - RANGE
+    elif upper is None:
+        upper = lower + RANGE
+
+    return lower, upper
+
+class Sampler:
+    """
+    A JSON schema, compiled into sampling function(s).
+
+    :ivar schema: The JSON schema.
+    :ivar options: The size distribution and edge-case bias.
+    """
+
+    def __init__(self, schema: typing.Dict[str, typing.Any], options: typing.Optional[Options] = None):
+        self.schema = schema
+        self.options = options or Options()
+
+        self._references: typing.Dict[str, Function] = {}
+        self._keys = itertools.count()
+
+        self._root = self._compile(schema)
+
+    def sample(self, generator: random.Random) -> typing.Any:
+        """
+        Samples a single instance.
+        """
+
+        return self._root(_Context(generator, self.options))
+
+    def shard(self, seed: int, index: int, count: int) -> bytes:
+        """
+        Samples a shard's record(s), deterministically for the given seed and shard index.
+
+        Returns
+        -------
+        bytes
+            The record(s), as newline-delimited (and newline-terminated) JSON.
+        """
+
+        context = _Context(random.Random("%d:%d" % (seed, index)), self.options)
+
+        encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+        return "".join("%s\n" % encoder.encode(self._root(context)) for _ in range(count)).encode("utf-8")
+
+    def _reference(self, reference: str) -> Function:
+        if reference in self._references:
+            return self._references[reference]
+
+        if reference == "#":
+            target = self.schema
+        elif reference.startswith(("#/$defs/", "#/definitions/")):
+            keyword, name = reference[2:].split("/", 1)
+
+            target = self.schema.get(keyword, {}).get(name.replace("~1", "/").replace("~0", "~"))
+
+            if target is None:
+                raise ValueError("Unresolvable Reference: %s" % reference)
+        else:
+            raise ValueError("Unsupported (Non-Local) Reference: %s" % reference)
+
+        compiled: typing.List[Function] = []
+
+        def function(context: _Context) -> typing.Any:
+            context.depth += 1
+
+            try:
+                return compiled[0](context)
+            finally:
+                context.depth -= 1
+
+        # Registered before compiling the target, so a recursive reference resolves to this very function.
+        self._references[reference] = function
+
+        compiled.append(self._compile(target))
+
+        return function
+
+    def _resolve(self, schema: typing.Any) -> typing.Any:
+        while isinstance(schema, dict) and isinstance(schema.get("$ref"), str) and schema["$ref"].startswith("#/"):
+            keyword, name = schema["$ref"][2:].split("/", 1)
+
+            schema = self.schema.get(keyword, {}).get(name.replace("~1", "/").replace("~0", "~"), {})
+
+        return schema
+
+    def _compile(self, schema: typing.Any) -> Function:
+        if schema is True or schema == {}:
+            return self._any()
+
+        if schema is False:
+            raise ValueError("Unsatisfiable Schema: false")
+
+        if "allOf" in schema:
+            # Every entry is merged into a single schema: property map(s) and required name(s) are combined, and any
+            # other keyword is overridden by the last entry defining it.
+            merged = {key: value for key, value in schema.items() if key != "allOf"}
+
+            for entry in schema["allOf"]:
+                entry = self._resolve(entry)
+
+                if not isinstance(entry, dict):
+                    continue
+
+                for key, value in entry.items():
+                    if key == "properties" and isinstance(merged.get(key), dict):
+                        merged[key] = {**merged[key], **value}
+                    elif key == "required" and isinstance(merged.get(key), list):
+                        merged[key] = list(dict.fromkeys(merged[key] + value))
+                    else:
+                        merged[key] = value
+
+            return self._compile(merged)
+
+        if isinstance(schema.get("$ref"), str):
+            return self._reference(schema["$ref"])
+
+        if "const" in schema:
+            value = schema["const"]
+
+            return lambda context: value
+
+        if isinstance(schema.get("enum"), list):
+            return self._enum(schema["enum"])
+
+        for keyword in ("anyOf", "oneOf"):
+            if isinstance(schema.get(keyword), list):
+                return self._union(schema[keyword])
+
+        types = schema.get("type")
+
+        if isinstance(types, list):
+            return self._union([{**schema, "type": value} for value in types])
+
+        if types is None:
+            if "properties" in schema or "additionalProperties" in schema or "required" in schema:
+                types = "object"
+            elif "items" in schema or "prefixItems" in schema:
+                types = "array"
+            elif "minLength" in schema or "maxLength" in schema or "pattern" in schema or "format" in schema:
+                types = "string"
+            elif "minimum" in schema or "maximum" in schema or "multipleOf" in schema:
+                types = "number"
+            else:
+                return self._any()
+
+        if types == "object":
+            return self._object(schema)
+
+        if types == "array":
+            return self._array(schema)
+
+        if types == "string":
+            return self._string(schema)
+
+        if types in ("integer", "number"):
+            return self._number(schema, integer=types == "integer")
+
+        if types == "boolean":
+            return lambda context: context.random.random() < 0.5
+
+        if types == "null":
+            return lambda context: None
+
+        raise ValueError("Unsupported Type: %s" % types)
+
+    def _any(self) -> Function:
+        return lambda context: _text(context.random, context.size(0, context.options.max_length))
+
+    def _enum(self, values: typing.List[typing.Any]) -> Function:
+        key = next(self._keys)
+
+        if not values:
+            raise ValueError("Unsatisfiable Schema: Empty Enum")
+
+        def function(context: _Context) -> typing.Any:
+            if context.edge():
+                return values[context.rotate(key, len(values))]
+
+            return context.random.choice(values)
+
+        return function
+
+    def _union(self, branches: typing.List[typing.Any]) -> Function:
+        functions = [self._compile(branch) for branch in branches]
+
+        # The branch(es) to prefer beyond the maximum depth, terminating recursive structure(s).
+        terminal = [function for function, branch in zip(functions, branches) if not _referencing(branch)] or functions
+
+        if len(functions) == 1:
+            return functions[0]
+
+        return lambda context: context.random.choice(terminal if context.exhausted else functions)(context)
+
+    def _object(self, schema: typing.Dict[str, typing.Any]) -> Function:
+        properties = {name: self._compile(value) for name, value in schema.get("properties", {}).items() if value is not False}
+
+        required = [name for name in schema.get("required", []) if name in properties]
+        optional = [name for name in properties if name not in required]
+
+        additional = schema.get("additionalProperties", True)
+        additional = None if additional is False else self._compile(additional if isinstance(additional, dict) else {})
+
+        minimum = schema.get("minProperties", 0)
+        maximum = schema.get("maxProperties")
+
+        # Map(s) (i.e. schema(s) without property definition(s)) are sampled with a number of additional entries.
+        mapping = not properties and isinstance(schema.get("additionalProperties"), dict)
+
+        def function(context: _Context) -> typing.Any:
+            selected = list(required)
+
+            if not context.exhausted:
+                if context.edge():
+                    selected.extend(optional if context.random.random() < 0.5 else ())
+                else:
+                    selected.extend(name for name in optional if context.random.random() < context.options.optional)
+
+            if len(selected) < minimum:
+                chosen = set(selected)
+
+                selected.extend(itertools.islice((name for name in optional if name not in chosen), minimum - len(selected)))
+
+            if maximum is not None:
+                selected = selected[:max(maximum, len(required))]
+
+            result = {name: properties[name](context) for name in selected}
+
+            if additional is not None:
+                count = max(0, minimum - len(result))
+
+                if mapping:
+                    count = max(count, context.size(minimum, maximum if maximum is not None else minimum + context.options.max_items))
+
+                while count > 0:
+                    name = _word(context.random)
+
+                    if name not in properties and name not in result:
+                        result[name] = additional(context)
+
+                        count -= 1
+
+            return result
+
+        return function
+
+    def _array(self, schema: typing.Dict[str, typing.Any]) -> Function:
+        prefix = [self._compile(value) for value in schema.get("prefixItems", [])]
+
+        items = schema.get("items", True)
+        items = None if items is False else self._compile(items if isinstance(items, dict) else {})
+
+        minimum = schema.get("minItems", 0)
+        maximum = schema.get("maxItems", len(prefix) if items is None else max(minimum, len(prefix)) + self.options.max_items)
+
+        unique = schema.get("uniqueItems", False)
+
+        def function(context: _Context) -> typing.Any:
+            count = context.size(minimum, maximum)
+
+            if items is None:
+                count = min(count, len(prefix))
+
+            if not unique:
+                return [(prefix[index] if index < len(prefix) else items)(context) for index in range(count)]
+
+            # Distinct item(s) are sampled until the target count is reached, within a bounded number of attempt(s).
+            result: typing.List[typing.Any] = []
+            seen: typing.Set[str] = set()
+
+            for _ in range(count * 8):
+                if len(result) >= count:
+                    break
+
+                index = len(result)
+
+                value = (prefix[index] if index < len(prefix) else items)(context)
+
+                encoded = json.dumps(value, sort_keys=True)
+
+                if encoded not in seen:
+                    seen.add(encoded)
+                    result.append(value)
+
+            return result
+
+        return function
+
+    def _string(self, schema: typing.Dict[str, typing.Any]) -> Function:
+        minimum = schema.get("minLength", 0)
+        maximum = schema.get("maxLength", minimum + self.options.max_length)
+
+        if schema.get("format") in formats:
+            generate = formats[schema["format"]]
+
+            return lambda context: generate(context.random)
+
+        if isinstance(schema.get("pattern"), str):
+            tokens = re._parser.parse(schema["pattern"])
+
+            def function(context: _Context) -> str:
+                value = ""
+
+                # Pattern(s) constrain the sampled length only loosely; a few attempt(s) are made to satisfy the bound(s).
+                for _ in range(8):
+                    value = _expression(context, tokens, {})
+
+                    if minimum <= len(value) <= maximum:
+                        break
+
+                return value
+
+            return function
+
+        return lambda context: _text(context.random, context.size(minimum, maximum))
+
+    def _number(self, schema: typing.Dict[str, typing.Any], integer: bool) -> Function:
+        lower, upper = _bounds(schema, integer)
+
+        multiple = schema.get("multipleOf")
+
+        if isinstance(multiple, (int, float)) and multiple > 0:
+            first, last = math.ceil(lower / multiple), math.floor(upper / multiple)
+
+            if first > last:
+                raise ValueError("Unsatisfiable Schema: No Multiple of %s in [%s, %s]" % (multiple, lower, upper))
+
+            convert = int if integer or float(multiple).is_integer() else float
+
+            def scale(factor: int) -> typing.Union[int, float]:
+                return convert(factor * multiple)
+
+            def valid(value: typing.Union[int, float]) -> bool:
+                return lower <= value <= upper and (value / multiple).is_integer()
+
+            # A floating-point product may not divide exactly (e.g. 3 * 0.1); each edge is the valid multiple nearest to
+            # its bound, within a few factor(s).
+            edges = [value for value in (
+                next((scale(factor) for factor in range(first, min(first + 8, last + 1)) if valid(scale(factor))), None),
+                next((scale(factor) for factor in range(last, max(last - 8, first - 1), -1) if valid(scale(factor))), None),
+            ) if value is not None] + ([0] if first <= 0 <= last else [])
+
+            if not edges:
+                raise ValueError("Unsatisfiable Schema: No Representable Multiple of %s in [%s, %s]" % (multiple, lower, upper))
+
+            def function(context: _Context) -> typing.Any:
+                if context.edge():
+                    return context.random.choice(edges)
+
+                # A few factor(s) are attempted, before an edge.
+                for _ in range(8):
+                    value = scale(context.random.randint(first, last))
+
+                    if valid(value):
+                        return value
+
+                return context.random.choice(edges)
+
+            return function
+
+        if lower > upper:
+            raise ValueError("Unsatisfiable Schema: Empty Range [%s, %s]" % (lower, upper))
+
+        edges = [lower, upper] + ([0] if lower <= 0 <= upper else [])
+
+        if integer:
+            return lambda context: context.random.choice(edges) if context.edge() else context.random.randint(lower, upper)
+
+        return lambda context: context.random.choice(edges) if context.edge() else min(upper, max(lower, context.random.uniform(lower, upper)))
+
+# The worker process's sampler, compiled once by :func:`initialize`.
+sampler: typing.Optional[Sampler] = None
+
+def initialize(schema: typing.Dict[str, typing.Any], options: Options) -> None:
+    """
+    Initializes a worker process's sampler.
+    """
+
+    global sampler
+
+    sampler = Sampler(schema, options)
+
+def shard(seed: int, index: int, count: int) -> bytes:
+    """
+    Samples a shard within a worker process, see :meth:`Sampler.shard`.
+    """
+
+    if sampler is None:
+        raise RuntimeError("The worker's sampler has not been initialized")
+
+    return sampler.shard(seed, index, count)
+
+def stream(schema: typing.Dict[str, typing.Any], count: int, seed: int = 0, jobs: typing.Optional[int] = None, size: int = SHARD_SIZE, options: typing.Optional[Options] = None) -> typing.Iterator[bytes]:
+    """
+    Samples record(s) conforming to a JSON schema, streaming newline-delimited JSON shard(s) in order.
+
+    Parameters
+    ----------
+    schema : dict[str, typing.Any]
+        The JSON schema.
+    count : int
+        The number of record(s).
+    seed : int
+        The seed; the output is reproducible for a given seed, shard size, and option(s).
+    jobs : int | None
+        The number of worker process(es). Defaults to the system's CPU count; a single job samples in-process.
+    size : int
+        The number of record(s) per shard.
+    options : Options | None
+        The size distribution and edge-case bias.
+
+    Yields
+    ------
+    bytes
+        Every shard's record(s), as newline-delimited JSON.
+
+    Raises
+    ------
+    ValueError
+        If the schema is unsupported or unsatisfiable.
+    """
+
+    options = options or Options()
+    size = max(1, size)
+
+    # Compiled upfront, in the current process, so an unsupported schema is raised before any worker starts.
+    instance = Sampler(schema, options)
+
+    total = math.ceil(count / size) if count > 0 else 0
+
+    # Lazily enumerated, as (index, record count) pair(s).
+    shards = ((index, min(size, count - index * size)) for index in range(total))
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, total))
+
+    if jobs == 1:
+        for index, records in shards:
+            yield instance.shard(seed, index, records)
+
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=initialize, initargs=(schema, options)) as executor:
+        pending: collections.deque[concurrent.futures.Future] = collections.deque()
+
+        for index, records in shards:
+            pending.append(executor.submit(shard, seed, index, records))
+
+            if len(pending) < jobs * 2:
+                continue
+
+            yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,123 @@
+import datetime
+import enum
+import json
+import typing
+import uuid
+
+import jsonschema
+import pydantic
+import pytest
+import logging
+
+import polyium.models.base
+import polyium.schemas.sampling as module
+
+logger = logging.getLogger(__name__)
+
+class Level(str, enum.Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+class Node(pydantic.BaseModel):
+    name: str = pydantic.Field(..., min_length=1, max_length=8)
+    children: typing.List["Node"] = []
+    parent: typing.Optional["Node"] = None
+
+class Event(pydantic.BaseModel):
+    identifier: uuid.UUID
+    created: datetime.datetime
+    day: datetime.date
+    level: Level = Level.LOW
+    code: str = pydantic.Field(..., pattern=r"^[A-Z]{3}-\d{2,4}$")
+    count: int = pydantic.Field(0, ge=0, lt=10)
+    ratio: float = pydantic.Field(0.5, gt=0, le=1)
+    step: int = pydantic.Field(0, multiple_of=5, ge=-20, le=20)
+    fraction: float = pydantic.Field(0, multiple_of=0.1)
+    tags: typing.List[str] = pydantic.Field(default_factory=list, max_length=3)
+    unique: typing.Set[int] = set()
+    window: typing.Tuple[int, str]
+    attributes: typing.Dict[str, typing.Union[int, bool, None]] = {}
+    email: str = pydantic.Field("a@example.com", json_schema_extra={"format": "email"})
+    literal: typing.Literal["fixed"] = "fixed"
+    tree: typing.Optional[Node] = None
+
+@pytest.mark.parametrize("options", [module.Options(), module.Options(distribution="geometric", edge=0.0, optional=1.0), module.Options(edge=1.0, max_depth=1)])
+@pytest.mark.parametrize("model", [Event, Node, polyium.models.base.Base])
+def test_valid(request: pytest.FixtureRequest, model: type[pydantic.BaseModel], options: module.Options):
+    """
+    Tests that every sampled record conforms to its schema, including format(s), across option(s).
+    """
+
+    schema = model.model_json_schema()
+
+    validator = jsonschema.Draft202012Validator(schema, format_checker=jsonschema.Draft202012Validator.FORMAT_CHECKER)
+
+    lines = b"".join(module.stream(schema, 500, seed=3, jobs=1, size=128, options=options)).splitlines()
+
+    assert len(lines) == 500
+
+    for line in lines:
+        errors = list(validator.iter_errors(json.loads(line)))
+
+        assert not errors, (line, errors[0].message if errors else None)
+
+def test_reproducible(request: pytest.FixtureRequest):
+    """
+    Tests that the output only depends upon the seed and shard size, not upon the number of worker process(es).
+    """
+
+    schema = Event.model_json_schema()
+
+    single = b"".join(module.stream(schema, 1000, seed=7, jobs=1, size=100))
+
+    assert b"".join(module.stream(schema, 1000, seed=7, jobs=2, size=100)) == single
+    assert b"".join(module.stream(schema, 1000, seed=8, jobs=1, size=100)) != single
+
+    assert list(module.stream(schema, 0)) == []
+
+def test_edge_cases(request: pytest.FixtureRequest):
+    """
+    Tests that edge case(s) cover every enum value, boundary number(s), and minimum and maximum length(s).
+    """
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "level": {"enum": ["low", "medium", "high"]},
+            "count": {"type": "integer", "minimum": 3, "exclusiveMaximum": 9},
+            "name": {"type": "string", "minLength": 2, "maxLength": 5},
+        },
+        "required": ["level", "count", "name"],
+    }
+
+    records = [json.loads(line) for line in b"".join(module.stream(schema, 100, options=module.Options(edge=1.0))).splitlines()]
+
+    assert [record["level"] for record in records[:3]] == ["low", "medium", "high"]
+    assert {record["count"] for record in records} == {3, 8}
+    assert {len(record["name"]) for record in records} == {2, 5}
+
+def test_multiple_of(request: pytest.FixtureRequest):
+    """
+    Tests that a floating-point multipleOf is only ever sampled as an exact multiple, including at the edge(s).
+    """
+
+    schema = {"type": "number", "multipleOf": 0.1, "minimum": 0.15, "maximum": 0.35}
+
+    validator = jsonschema.Draft202012Validator(schema)
+
+    for edge in (0.0, 1.0):
+        values = [json.loads(line) for line in b"".join(module.stream(schema, 200, seed=5, jobs=1, options=module.Options(edge=edge))).splitlines()]
+
+        assert all(validator.is_valid(value) for value in values), values
+        assert 0.2 in values
+
+    with pytest.raises(ValueError, match="Unsatisfiable"):
+        list(module.stream({"type": "number", "multipleOf": 0.1, "minimum": 0.25, "maximum": 0.35}, 1))
+
+def test_unsatisfiable(request: pytest.FixtureRequest):
+    with pytest.raises(ValueError, match="Unsatisfiable"):
+        list(module.stream({"type": "object", "properties": {"never": False, "value": {"type": "integer", "minimum": 5, "maximum": 4}}}, 1))
+
+    with pytest.raises(ValueError, match="Non-Local"):
+        list(module.stream({"$ref": "https://example.com/schema.json"}, 1))
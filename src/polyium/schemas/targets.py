@@ -0,0 +1,321 @@
+"""
+The targets module resolves `module:Model` specification(s), including glob pattern(s), into pydantic model classes.
+
+Module resolution is performed against the import system's finders and doesn't import the matched module(s); only
+model resolution requires importing a module.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import fnmatch
+import importlib
+import importlib.util
+import inspect
+import logging
+import os
+import pkgutil
+import typing
+
+import pydantic
+
+logger = logging.getLogger(__name__)
+
+def is_pattern(value: str) -> bool:
+    """
+    Determines whether the given value contains any glob wildcard character(s).
+
+    Parameters
+    ----------
+    value : str
+        The value to inspect.
+
+    Returns
+    -------
+    bool
+        True if the value contains a wildcard, otherwise False.
+    """
+
+    return any(character in value for character in "*?[")
+
+def is_model(value: typing.Any) -> bool:
+    """
+    Determines whether the given value is a concrete pydantic model class.
+
+    Parameters
+    ----------
+    value : typing.Any
+        The value to inspect.
+
+    Returns
+    -------
+    bool
+        True if the value is a subclass of `pydantic.BaseModel` (excluding `pydantic.BaseModel` itself), otherwise False.
+    """
+
+    return inspect.isclass(value) and issubclass(value, pydantic.BaseModel) and value is not pydantic.BaseModel
+
+def submodules(name: str, locations: typing.Iterable[str]) -> typing.Iterator[typing.Tuple[str, typing.Optional[typing.List[str]]]]:
+    """
+    Yields the direct submodule(s) of a package without importing them.
+
+    Parameters
+    ----------
+    name : str
+        The fully-qualified name of the parent package.
+    locations : typing.Iterable[str]
+        The parent package's submodule search location(s).
+
+    Yields
+    ------
+    tuple[str, list[str] | None]
+        The submodule's fully-qualified name, and its own search location(s) if the submodule is a package.
+    """
+
+    for information in pkgutil.iter_modules(list(locations)):
+        qualified = "%s.%s" % (name, information.name)
+
+        if information.ispkg:
+            finder = typing.cast(typing.Any, information.module_finder)
+
+            yield qualified, [os.path.join(finder.path, information.name)]
+        else:
+            yield qualified, None
+
+def locations(name: str) -> typing.Optional[typing.List[str]]:
+    """
+    Returns the submodule search location(s) of a module if it's a package.
+
+    Parameters
+    ----------
+    name : str
+        The fully-qualified module name.
+
+    Returns
+    -------
+    list[str] | None
+        The package's search location(s), or None if the module is not a package.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the module cannot be found.
+    """
+
+    specification = importlib.util.find_spec(name)
+
+    if specification is None:
+        raise ModuleNotFoundError("No module named '%s'" % name, name=name)
+
+    if specification.submodule_search_locations is None:
+        return None
+
+    return list(specification.submodule_search_locations)
+
+@dataclasses.dataclass(frozen=True)
+class Specification:
+    """
+    A parsed `module:Model` target specification.
+
+    Both the module and model component(s) may contain glob pattern(s). A module segment of `*` matches a single
+    package level, while `**` matches zero or more package levels. An omitted model component is equivalent to `*`.
+
+    :ivar module: The module name, or module name pattern.
+    :ivar name: The model name, or model name pattern.
+    """
+
+    module: str
+    name: str = "*"
+
+    @classmethod
+    def parse(cls, value: str) -> Specification:
+        """
+        Parses a `module:Model` specification string.
+
+        Parameters
+        ----------
+        value : str
+            The specification string, e.g. `myapp.models:User` or `myapp.models.*:*`.
+
+        Returns
+        -------
+        Specification
+            The parsed specification.
+
+        Raises
+        ------
+        ValueError
+            If the specification is missing a module component.
+        """
+
+        module, _, name = value.strip().partition(":")
+
+        if module == "" or any(segment == "" for segment in module.split(".")):
+            raise ValueError("Invalid target specification (expected \"module:Model\"): %s" % value)
+
+        return cls(module=module, name=name or "*")
+
+    def __str__(self) -> str:
+        return "%s:%s" % (self.module, self.name)
+
+    def modules(self) -> typing.List[str]:
+        """
+        Resolves the specification's module component into a list of module name(s).
+
+        Module(s) are discovered through the import system's finders, and are not imported. Parent package(s) of the
+        non-pattern prefix are imported as a side effect of the import system's specification lookup.
+
+        Returns
+        -------
+        list[str]
+            The sorted, matching module name(s).
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If the specification's module (or non-pattern prefix) cannot be found.
+        """
+
+        segments = self.module.split(".")
+
+        if not any(is_pattern(segment) for segment in segments):
+            if importlib.util.find_spec(self.module) is None:
+                raise ModuleNotFoundError("No module named '%s'" % self.module, name=self.module)
+
+            return [self.module]
+
+        index = next(index for index, segment in enumerate(segments) if is_pattern(segment))
+
+        if index == 0:
+            raise ValueError("Target specification's top-level package cannot be a pattern: %s" % self)
+
+        prefix = ".".join(segments[:index])
+
+        matches: typing.Set[str] = set()
+
+        self._walk(prefix, locations(prefix), segments[index:], matches)
+
+        return sorted(matches)
+
+    def _walk(self, name: str, search: typing.Optional[typing.List[str]], segments: typing.List[str], matches: typing.Set[str]) -> None:
+        if not segments:
+            matches.add(name)
+            return
+
+        segment, remaining = segments[0], segments[1:]
+
+        if segment == "**":
+            # Zero levels consumed.
+            self._walk(name, search, remaining, matches)
+
+            if search is None:
+                return
+
+            # One level consumed, with the recursive segment retained.
+            for child, nested in submodules(name, search):
+                self._walk(child, nested, segments, matches)
+
+            return
+
+        if search is None:
+            return
+
+        for child, nested in submodules(name, search):
+            if fnmatch.fnmatchcase(child.rpartition(".")[-1], segment):
+                self._walk(child, nested, remaining, matches)
+
+    def matches(self, name: str) -> bool:
+        """
+        Determines whether a model name, as referenced from a module, satisfies the specification's model component.
+
+        Parameters
+        ----------
+        name : str
+            The model's attribute name within its module.
+
+        Returns
+        -------
+        bool
+            True if the name matches the model pattern, or equals the explicit model name.
+        """
+
+        return fnmatch.fnmatchcase(name, self.name) if is_pattern(self.name) else name == self.name
+
+    def members(self, module: str) -> typing.Dict[str, type[pydantic.BaseModel]]:
+        """
+        Imports the given module and resolves the specification's model component against it.
+
+        A pattern only matches model(s) defined within the module itself, while an explicit name may reference a
+        re-exported or nested (dot-separated) model.
+
+        Parameters
+        ----------
+        module : str
+            The fully-qualified module name, typically sourced from :meth:`modules`.
+
+        Returns
+        -------
+        dict[str, type[pydantic.BaseModel]]
+            The matching model class(es), keyed and ordered by the name used to reference them from the module.
+
+        Raises
+        ------
+        LookupError
+            If an explicit model name doesn't exist or isn't a pydantic model.
+        """
+
+        instance = importlib.import_module(module)
+
+        if not is_pattern(self.name):
+            value: typing.Any = instance
+
+            for attribute in self.name.split("."):
+                value = getattr(value, attribute, None)
+
+            if not is_model(value):
+                raise LookupError("Unable to resolve pydantic model \"%s\" in module \"%s\"" % (self.name, module))
+
+            return {self.name: value}
+
+        members = {
+            key: value for key, value in sorted(vars(instance).items())
+            if is_model(value) and value.__module__ == instance.__name__ and self.matches(key)
+        }
+
+        logger.debug("Resolved %d Model(s) from Module: %s", len(members), module)
+
+        return members
+
+    def models(self, module: str) -> typing.List[type[pydantic.BaseModel]]:
+        """
+        Imports the given module and returns the de-duplicated model class(es) resolved by :meth:`members`.
+        """
+
+        return list(dict.fromkeys(self.members(module).values()))
+
+def resolve(specifications: typing.Iterable[typing.Union[str, Specification]]) -> typing.List[type[pydantic.BaseModel]]:
+    """
+    Resolves many target specification(s) into a de-duplicated list of pydantic model classes.
+
+    Parameters
+    ----------
+    specifications : typing.Iterable[str | Specification]
+        The target specification(s).
+
+    Returns
+    -------
+    list[type[pydantic.BaseModel]]
+        The resolved model class(es), in specification order and without duplicate(s).
+    """
+
+    models: typing.Dict[type[pydantic.BaseModel], None] = {}
+
+    for specification in specifications:
+        if isinstance(specification, str):
+            specification = Specification.parse(specification)
+
+        for module in specification.modules():
+            for model in specification.models(module):
+                models.setdefault(model, None)
+
+    return list(models)
@@ -0,0 +1,74 @@
+import pytest
+import logging
+
+import polyium.models.base
+import polyium.models.internal.base
+import polyium.schemas.targets as module
+
+logger = logging.getLogger(__name__)
+
+def test_specification_parse(request: pytest.FixtureRequest):
+    instance = module.Specification.parse("polyium.models.base:Base")
+
+    assert instance.module == "polyium.models.base"
+    assert instance.name == "Base"
+
+def test_specification_parse_default_name(request: pytest.FixtureRequest):
+    assert module.Specification.parse("polyium.models.base").name == "*"
+
+@pytest.mark.parametrize("value", [":Base", "polyium..models:Base", ""])
+def test_specification_parse_invalid(request: pytest.FixtureRequest, value: str):
+    with pytest.raises(ValueError):
+        module.Specification.parse(value)
+
+def test_specification_modules_pattern(request: pytest.FixtureRequest):
+    """
+    Tests that a single-level module pattern doesn't match nested package module(s).
+    """
+
+    modules = module.Specification.parse("polyium.models.*:*").modules()
+
+    logger.debug("[%s] Modules: %s", request.node.name, modules)
+
+    assert "polyium.models.base" in modules
+    assert "polyium.models.internal.base" not in modules
+
+def test_specification_modules_recursive_pattern(request: pytest.FixtureRequest):
+    modules = module.Specification.parse("polyium.models.**:*").modules()
+
+    logger.debug("[%s] Modules: %s", request.node.name, modules)
+
+    assert "polyium.models" in modules
+    assert "polyium.models.base" in modules
+    assert "polyium.models.internal.base" in modules
+
+def test_specification_modules_not_found(request: pytest.FixtureRequest):
+    with pytest.raises(ModuleNotFoundError):
+        module.Specification.parse("polyium.non_existent_module:*").modules()
+
+def test_specification_models_explicit(request: pytest.FixtureRequest):
+    """
+    Tests that an explicit model name resolves re-exported model(s).
+    """
+
+    models = module.Specification.parse("polyium.models.base:polyium.models.internal.base.Model").models("polyium.models.base")
+
+    assert models == [polyium.models.internal.base.Model]
+
+def test_specification_models_pattern(request: pytest.FixtureRequest):
+    """
+    Tests that a model pattern only resolves model(s) defined within the module.
+    """
+
+    models = module.Specification.parse("polyium.models.base:*").models("polyium.models.base")
+
+    assert models == [polyium.models.base.Base, polyium.models.base.Lazy]
+
+def test_specification_models_not_found(request: pytest.FixtureRequest):
+    with pytest.raises(LookupError):
+        module.Specification.parse("polyium.models.base:Missing").models("polyium.models.base")
+
+def test_resolve(request: pytest.FixtureRequest):
+    models = module.resolve(["polyium.models.**:*", "polyium.models.base:Base"])
+
+    assert models == [polyium.models.base.Base, polyium.models.base.Lazy, polyium.models.internal.base.Model]
@@ -0,0 +1,264 @@
+"""
+The writer module writes generated artifact(s) to a directory atomically, skipping file(s) whose content is unchanged.
+
+Unchanged output(s) are detected through a sidecar manifest of content digest(s), validated against each file's
+modification time and size, falling back to hashing the file on disk. Changed file(s) are written to a temporary file
+that's atomically renamed into place.
+
+Durability costs one `fsync` per written file, plus one per directory. A file's data must reach the disk before its
+rename does, or a crash may leave an empty or partial file in place of the previous content; as the standard library
+offers no portable way to synchronize a batch of file(s) at once, each temporary file is synchronized before it's
+renamed. The rename(s) themselves are then made durable with a single `fsync` per directory, upon close. Unchanged
+file(s) cost neither, and `fsync=False` skips both, e.g. for output that's regenerated anyway.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+import typing
+
+logger = logging.getLogger(__name__)
+
+# Incremented whenever the manifest's format changes.
+FORMAT = 1
+
+# The sidecar manifest's file name, within the output directory.
+MANIFEST = ".json-schema-cli.manifest.json"
+
+_umask: typing.Optional[int] = None
+
+def umask() -> int:
+    """
+    Returns the process's (memoized) file mode creation mask; `tempfile.mkstemp` creates file(s) with a `0o600` mode,
+    which is restored to the mode a plain `open` would have created.
+    """
+
+    global _umask
+
+    if _umask is None:
+        _umask = os.umask(0)
+
+        os.umask(_umask)
+
+    return _umask
+
+@dataclasses.dataclass(frozen=True)
+class Statistics:
+    """
+    A summary of a :class:`Writer`'s I/O.
+
+    :ivar written: The number of file(s) written.
+    :ivar skipped: The number of unchanged file(s) skipped.
+    :ivar bytes: The number of byte(s) written.
+    :ivar saved: The number of byte(s) not written, due to skipped file(s).
+    """
+
+    written: int = 0
+    skipped: int = 0
+    bytes: int = 0
+    saved: int = 0
+
+class Writer:
+    """
+    A thread-safe, hash-skipping, atomic artifact writer.
+
+    Usable as a context manager; :meth:`close` must otherwise be called to make the write(s) durable and persist the
+    manifest.
+
+    :ivar directory: The output directory.
+    :ivar manifest: Whether to use (and maintain) the sidecar manifest.
+    :ivar fsync: Whether to `fsync` each written file (before its rename), and once upon close, their directories.
+    """
+
+    def __init__(self, directory: typing.Union[str, os.PathLike], manifest: bool = True, fsync: bool = True):
+        self.directory = pathlib.Path(directory)
+        self.manifest = manifest
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._entries: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        self._modified = False
+        self._directories: typing.Set[pathlib.Path] = set()
+        self._statistics = Statistics()
+        self._mode = 0o666 & ~umask()
+
+        if manifest:
+            self._load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        return False
+
+    @property
+    def path(self) -> pathlib.Path:
+        """
+        The sidecar manifest's path.
+        """
+
+        return self.directory.joinpath(MANIFEST)
+
+    def _load(self) -> None:
+        try:
+            content = json.loads(self.path.read_text(encoding="utf-8"))
+
+            if content.get("format") == FORMAT:
+                self._entries = dict(content["files"])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.debug("Unable to Load Artifact Manifest (%s): %s", str(self.path), e)
+
+    def _save(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix=".%s." % MANIFEST)
+
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump({"format": FORMAT, "files": self._entries}, handle, sort_keys=True)
+
+            os.replace(temporary, self.path)
+        except BaseException:
+            pathlib.Path(temporary).unlink(missing_ok=True)
+            raise
+
+        self._directories.add(self.directory)
+
+    def _unchanged(self, name: str, path: pathlib.Path, digest: str, size: int) -> bool:
+        try:
+            statistics = os.stat(path)
+        except FileNotFoundError:
+            return False
+
+        if statistics.st_size != size:
+            return False
+
+        entry = self._entries.get(name)
+
+        if entry is not None and entry.get("digest") == digest and entry.get("mtime") == statistics.st_mtime_ns and entry.get("size") == size:
+            return True
+
+        # The manifest is missing or stale (e.g. the file was modified externally); compare against the file itself.
+        try:
+            unchanged = hashlib.sha256(path.read_bytes()).hexdigest() == digest
+        except OSError:
+            return False
+
+        if unchanged and self.manifest:
+            with self._lock:
+                self._entries[name] = {"digest": digest, "mtime": statistics.st_mtime_ns, "size": size}
+                self._modified = True
+
+        return unchanged
+
+    def write(self, name: str, content: typing.Union[str, bytes]) -> bool:
+        """
+        Writes a file, relative to the output directory, unless its content is unchanged.
+
+        Parameters
+        ----------
+        name : str
+            The file's path, relative to the output directory.
+        content : str | bytes
+            The file's content; text is UTF-8 encoded.
+
+        Returns
+        -------
+        bool
+            True if the file was written, or False if it was skipped.
+        """
+
+        data = content.encode("utf-8") if isinstance(content, str) else content
+
+        digest = hashlib.sha256(data).hexdigest()
+
+        path = self.directory.joinpath(name)
+
+        if self._unchanged(name, path, digest, len(data)):
+            with self._lock:
+                self._statistics = dataclasses.replace(self._statistics, skipped=self._statistics.skipped + 1, saved=self._statistics.saved + len(data))
+
+            logger.debug("Skipped Unchanged Artifact: %s", str(path))
+
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=".%s." % path.name)
+
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                handle.write(data)
+
+                # The data must be durable before the rename; see the module's docstring.
+                if self.fsync:
+                    handle.flush()
+
+                    os.fsync(handle.fileno())
+
+            os.chmod(temporary, self._mode)
+
+            os.replace(temporary, path)
+        except BaseException:
+            pathlib.Path(temporary).unlink(missing_ok=True)
+            raise
+
+        statistics = os.stat(path)
+
+        with self._lock:
+            if self.manifest:
+                self._entries[name] = {"digest": digest, "mtime": statistics.st_mtime_ns, "size": len(data)}
+                self._modified = True
+
+            self._directories.add(path.parent)
+
+            self._statistics = dataclasses.replace(self._statistics, written=self._statistics.written + 1, bytes=self._statistics.bytes + len(data))
+
+        logger.debug("Wrote Artifact: %s", str(path))
+
+        return True
+
+    def statistics(self) -> Statistics:
+        with self._lock:
+            return self._statistics
+
+    def close(self) -> None:
+        """
+        Persists the manifest (if modified), and `fsync`s every directory containing a written file.
+        """
+
+        with self._lock:
+            if self.manifest and self._modified:
+                self._save()
+
+                self._modified = False
+
+            directories, self._directories = self._directories, set()
+
+        if not self.fsync:
+            return
+
+        for directory in sorted(directories):
+            try:
+                descriptor = os.open(directory, os.O_RDONLY)
+            except OSError as e:
+                logger.debug("Unable to Open Directory for Synchronization (%s): %s", str(directory), e)
+                continue
+
+            try:
+                os.fsync(descriptor)
+            except OSError as e:
+                logger.debug("Unable to Synchronize Directory (%s): %s", str(directory), e)
+            finally:
+                os.close(descriptor)
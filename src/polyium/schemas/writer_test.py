@@ -0,0 +1,81 @@
+import concurrent.futures
+import pathlib
+
+import pytest
+import logging
+
+import polyium.schemas.writer as module
+
+logger = logging.getLogger(__name__)
+
+def test_writer_skips_unchanged(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that unchanged file(s) are neither rewritten nor have their modification time(s) changed.
+    """
+
+    with module.Writer(directory) as writer:
+        assert writer.write("a.json", "{}\n")
+        assert writer.write("nested/b.json", b"[]\n")
+
+    assert writer.statistics() == module.Statistics(written=2, skipped=0, bytes=6, saved=0)
+    assert directory.joinpath(module.MANIFEST).is_file()
+
+    mtime = directory.joinpath("a.json").stat().st_mtime_ns
+
+    with module.Writer(directory) as writer:
+        assert not writer.write("a.json", "{}\n")
+        assert not writer.write("nested/b.json", "[]\n")
+        assert writer.write("a.json", "{\"a\": 1}\n")
+
+    statistics = writer.statistics()
+
+    logger.debug("Statistics: %s", statistics)
+
+    assert statistics.written == 1
+    assert statistics.skipped == 2
+    assert statistics.saved == 6
+    assert directory.joinpath("a.json").read_text() == "{\"a\": 1}\n"
+    assert directory.joinpath("a.json").stat().st_mtime_ns >= mtime
+
+def test_writer_without_manifest(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that, without a (valid) manifest, unchanged file(s) are detected by their content.
+    """
+
+    directory.joinpath("a.json").write_text("{}\n")
+    directory.joinpath(module.MANIFEST).write_text("corrupt")
+
+    with module.Writer(directory) as writer:
+        assert not writer.write("a.json", "{}\n")
+        assert writer.write("b.json", "{}\n")
+
+    with module.Writer(directory, manifest=False, fsync=False) as writer:
+        assert not writer.write("a.json", "{}\n")
+        assert writer.write("a.json", "[]\n")
+
+def test_writer_external_modification(request: pytest.FixtureRequest, directory: pathlib.Path):
+    with module.Writer(directory) as writer:
+        writer.write("a.json", "{}\n")
+
+    directory.joinpath("a.json").write_text("[]\n")
+
+    with module.Writer(directory) as writer:
+        assert writer.write("a.json", "{}\n")
+
+    assert directory.joinpath("a.json").read_text() == "{}\n"
+
+def test_writer_atomic(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that no temporary file(s) remain, and that written file(s) receive the default file mode.
+    """
+
+    with module.Writer(directory) as writer:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda index: writer.write("%d.json" % index, "%d\n" % index), range(64)))
+
+    assert writer.statistics().written == 64
+    assert sorted(path.name for path in directory.iterdir() if path.name.startswith(".")) == [module.MANIFEST]
+    assert directory.joinpath("0.json").stat().st_mode & 0o777 == 0o666 & ~module.umask()
+
+    with module.Writer(directory) as writer:
+        assert not any(writer.write("%d.json" % index, "%d\n" % index) for index in range(64))
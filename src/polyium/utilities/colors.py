@@ -1,5 +1,262 @@
+"""
+Terminal styling: ANSI escape sequence(s), applied only where the output stream supports them.
+
+A stream's :class:`Capabilities` are detected once (one `isatty` system call, and one read of the `CI` environment
+variable) and cached per stream until :func:`refresh` is called. A :class:`Style` precomputes its escape sequence, and
+styles compose (e.g. `styles["bold"] + styles["red"]`) into a single sequence. A :class:`Renderer` buffers large output
+(e.g. tables, or progress frames) into a single `write` per frame.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import io
 import os
 import sys
+import threading
+import typing
+import weakref
+
+@dataclasses.dataclass(frozen=True)
+class Capabilities:
+    """
+    The styling capabilities of an output stream.
+
+    :ivar terminal: Whether the stream is attached to a terminal.
+    :ivar color: Whether ANSI escape sequence(s) should be emitted; i.e. a terminal, outside of continuous integration.
+    """
+
+    terminal: bool = False
+    color: bool = False
+
+    @classmethod
+    def detect(cls, stream: typing.Any) -> Capabilities:
+        """
+        Detects a stream's capabilities; a stream without a (valid) file descriptor, e.g. an `io.StringIO` or a
+        closed stream, falls back to its own `isatty`, if any.
+        """
+
+        try:
+            terminal = os.isatty(stream.fileno())
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            try:
+                terminal = bool(stream.isatty())
+            except (AttributeError, OSError, ValueError):
+                terminal = False
+
+        continuous = os.getenv("CI", default="")
+
+        return cls(terminal=terminal, color=terminal and (continuous == "" or continuous == "false"))
+
+_cache: weakref.WeakKeyDictionary[typing.Any, Capabilities] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+def capabilities(stream: typing.Any = None) -> Capabilities:
+    """
+    Returns the (cached) capabilities of a stream.
+
+    Parameters
+    ----------
+    stream : typing.Any
+        The output stream; defaults to the current `sys.stdout`.
+
+    Returns
+    -------
+    Capabilities
+        The stream's capabilities.
+    """
+
+    stream = sys.stdout if stream is None else stream
+
+    try:
+        return _cache[stream]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weakly referenceable; detected on every call.
+        return Capabilities.detect(stream)
+
+    instance = Capabilities.detect(stream)
+
+    with _lock:
+        _cache[stream] = instance
+
+    return instance
+
+def refresh(stream: typing.Any = None) -> None:
+    """
+    Discards cached capabilities, e.g. after the `CI` environment variable changes or a stream is redirected.
+
+    Parameters
+    ----------
+    stream : typing.Any
+        The stream whose capabilities are discarded; all stream(s) if None.
+    """
+
+    with _lock:
+        if stream is None:
+            _cache.clear()
+        else:
+            try:
+                _cache.pop(stream, None)
+            except TypeError:
+                pass
+
+class Style:
+    """
+    A composable text style, rendered as a single, precomputed ANSI escape sequence.
+
+    :ivar codes: The style's SGR (select graphic rendition) parameter(s).
+    """
+
+    reset = "\033[0m"
+
+    def __init__(self, *codes: int):
+        self.codes = codes
+
+        self.prefix = "\033[%sm" % ";".join(str(code) for code in codes)
+
+    def __add__(self, other: Style) -> Style:
+        return Style(*self.codes, *other.codes)
+
+    def __repr__(self) -> str:
+        return "Style(%s)" % ", ".join(str(code) for code in self.codes)
+
+    def __call__(self, input: str, stream: typing.Any = None) -> str:
+        """
+        Styles the input if the stream (defaulting to `sys.stdout`) supports color.
+        """
+
+        if not self.codes or not capabilities(stream).color:
+            return input
+
+        return self.prefix + input + self.reset
+
+    def apply(self, input: str) -> str:
+        """
+        Styles the input unconditionally, e.g. for content destined for a stream already known to support color.
+        """
+
+        return self.prefix + input + self.reset if self.codes else input
+
+styles: typing.Dict[str, Style] = {
+    "bold": Style(1),
+    "dim": Style(2),
+    "italic": Style(3),
+    "underline": Style(4),
+    "strikethrough": Style(9),
+    "red": Style(91),
+    "blue": Style(34),
+    "green": Style(32),
+    "yellow": Style(33),
+    "magenta": Style(35),
+    "cyan": Style(36),
+    "white": Style(39),
+    "default": Style(39),
+    "black": Style(90),
+    "purple": Style(95),
+    "gray": Style(37),
+}
+
+def style(*names: str) -> Style:
+    """
+    Composes named style(s), e.g. `style("bold", "red")`, into a single style.
+
+    Raises
+    ------
+    KeyError
+        If a style name is unknown.
+    """
+
+    instance = Style()
+
+    for name in names:
+        instance = instance + styles[name]
+
+    return instance
+
+class Renderer:
+    """
+    A buffered renderer that emits each frame of output with a single `write` call.
+
+    Line(s) are accumulated by :meth:`line` and emitted by :meth:`flush`; :meth:`frame` replaces the previously
+    rendered frame in-place on a terminal (e.g. for progress output), or appends it otherwise.
+
+    :ivar stream: The output stream; defaults to the current `sys.stdout`.
+    """
+
+    def __init__(self, stream: typing.Any = None):
+        self.stream = sys.stdout if stream is None else stream
+
+        self._buffer: typing.List[str] = []
+        self._height = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+        return False
+
+    @property
+    def capabilities(self) -> Capabilities:
+        return capabilities(self.stream)
+
+    def style(self, input: str, *names: str) -> str:
+        """
+        Styles the input with the named style(s), if the renderer's stream supports color.
+        """
+
+        return style(*names).apply(input) if self.capabilities.color else input
+
+    def line(self, text: str = "") -> None:
+        """
+        Buffers a line of output.
+        """
+
+        self._buffer.append(text)
+        self._buffer.append("\n")
+
+    def write(self, text: str) -> None:
+        """
+        Buffers raw output.
+        """
+
+        self._buffer.append(text)
+
+    def flush(self) -> None:
+        """
+        Emits all buffered output with a single write.
+        """
+
+        if not self._buffer:
+            return
+
+        content = "".join(self._buffer)
+
+        self._buffer.clear()
+
+        self.stream.write(content)
+        self.stream.flush()
+
+    def frame(self, lines: typing.Iterable[str]) -> None:
+        """
+        Emits a frame of line(s) with a single write, replacing the previous frame on a terminal.
+        """
+
+        lines = list(lines)
+
+        if self._height and self.capabilities.terminal:
+            # Move the cursor to the start of the previous frame, and clear to the end of the screen.
+            self._buffer.append("\033[%dF\033[J" % self._height)
+
+        for text in lines:
+            self.line(text)
+
+        self._height = len(lines)
+
+        self.flush()
 
 def bold(input: str) -> str:
     """Returns bold ANSI color escape sequence(s).
@@ -13,10 +270,7 @@ def bold(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[1m{input}\033[0m"
-
-    return input
+    return styles["bold"](input)
 
 def dim(input: str) -> str:
     """Returns dim ANSI color escape sequence(s).
@@ -30,10 +284,7 @@ def dim(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[2m{input}\033[0m"
-
-    return input
+    return styles["dim"](input)
 
 def italic(input: str) -> str:
     """Returns italic ANSI color escape sequence(s).
@@ -47,10 +298,7 @@ def italic(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[3m{input}\033[0m"
-
-    return input
+    return styles["italic"](input)
 
 def underline(input: str) -> str:
     """Returns an underline ANSI color escape sequence(s).
@@ -64,10 +312,7 @@ def underline(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[4m{input}\033[0m"
-
-    return input
+    return styles["underline"](input)
 
 def strikethrough(input: str) -> str:
     """Returns strikethrough ANSI color escape sequence(s). Warning, this is rarely available across TTYs.
@@ -81,10 +326,7 @@ def strikethrough(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[9m{input}\033[0m"
-
-    return input
+    return styles["strikethrough"](input)
 
 def red(input: str) -> str:
     """Returns red ANSI color escape sequence(s).
@@ -98,10 +340,7 @@ def red(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[91m{input}\033[0m"
-
-    return input
+    return styles["red"](input)
 
 def blue(input: str) -> str:
     """Returns blue ANSI color escape sequence(s).
@@ -115,10 +354,7 @@ def blue(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[34m{input}\033[0m"
-
-    return input
+    return styles["blue"](input)
 
 def green(input: str) -> str:
     """Returns green ANSI color escape sequence(s).
@@ -132,10 +368,7 @@ def green(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[32m{input}\033[0m"
-
-    return input
+    return styles["green"](input)
 
 def yellow(input: str) -> str:
     """Returns yellow ANSI color escape sequence(s).
@@ -149,10 +382,7 @@ def yellow(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[33m{input}\033[0m"
-
-    return input
+    return styles["yellow"](input)
 
 def magenta(input: str) -> str:
     """Returns magenta ANSI color escape sequence(s).
@@ -166,10 +396,7 @@ def magenta(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[35m{input}\033[0m"
-
-    return input
+    return styles["magenta"](input)
 
 def cyan(input: str) -> str:
     """Returns cyan ANSI color escape sequence(s).
@@ -183,10 +410,7 @@ def cyan(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[36m{input}\033[0m"
-
-    return input
+    return styles["cyan"](input)
 
 def white(input: str) -> str:
     """Returns white ANSI color escape sequence(s). White is another reference to what is ANSI default color.
@@ -200,10 +424,7 @@ def white(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[39m{input}\033[0m"
-
-    return input
+    return styles["white"](input)
 
 def default(input: str) -> str:
     """Returns default ANSI color escape sequence(s). White is another reference to what is ANSI white color, in most cases.
@@ -216,11 +437,8 @@ def default(input: str) -> str:
     -------
     str
     """
-    
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[39m{input}\033[0m"
 
-    return input
+    return styles["default"](input)
 
 def black(input: str) -> str:
     """Returns gray-black ANSI color escape sequence(s).
@@ -234,10 +452,7 @@ def black(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[90m{input}\033[0m"
-
-    return input
+    return styles["black"](input)
 
 def purple(input: str) -> str:
     """Returns purple ANSI color escape sequence(s).
@@ -251,10 +466,7 @@ def purple(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[95m{input}\033[0m"
-
-    return input
+    return styles["purple"](input)
 
 def gray(input: str) -> str:
     """Returns gray ANSI color escape sequence(s).
@@ -268,7 +480,4 @@ def gray(input: str) -> str:
     str
     """
 
-    if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
-        return f"\033[37m{input}\033[0m"
-
-    return input
+    return styles["gray"](input)
@@ -1,4 +1,6 @@
+import io
 import os
+import sys
 
 import logging
 
@@ -181,3 +183,85 @@ def test_gray():
 
     if os.getenv("CI") == "true":
         assert v == "gray"
+
+class Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+def test_capabilities_without_fileno(monkeypatch):
+    """
+    Tests that a stream without a file descriptor is detected without raising.
+    """
+
+    stream = io.StringIO()
+
+    assert polyium.utilities.colors.capabilities(stream) == polyium.utilities.colors.Capabilities(terminal=False, color=False)
+
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    assert polyium.utilities.colors.red("red") == "red"
+
+def test_capabilities_cached(monkeypatch):
+    """
+    Tests that capabilities are detected once per stream, until refreshed.
+    """
+
+    stream = Terminal()
+
+    monkeypatch.delenv("CI", raising=False)
+
+    assert polyium.utilities.colors.capabilities(stream).color is True
+
+    monkeypatch.setenv("CI", "true")
+
+    assert polyium.utilities.colors.capabilities(stream).color is True
+
+    polyium.utilities.colors.refresh(stream)
+
+    assert polyium.utilities.colors.capabilities(stream).color is False
+
+def test_style_composition(monkeypatch):
+    stream = Terminal()
+
+    monkeypatch.delenv("CI", raising=False)
+
+    polyium.utilities.colors.refresh(stream)
+
+    composite = polyium.utilities.colors.style("bold", "red")
+
+    assert composite("text", stream) == "\033[1;91mtext\033[0m"
+    assert polyium.utilities.colors.styles["bold"]("text", stream) == "\033[1mtext\033[0m"
+    assert composite("text", io.StringIO()) == "text"
+
+def test_renderer(monkeypatch):
+    """
+    Tests that each frame is emitted with a single write, replacing the previous frame on a terminal.
+    """
+
+    stream = Terminal()
+
+    writes = []
+
+    original = stream.write
+
+    def write(content: str) -> int:
+        writes.append(content)
+
+        return original(content)
+
+    monkeypatch.setattr(stream, "write", write)
+
+    renderer = polyium.utilities.colors.Renderer(stream)
+
+    with renderer:
+        for index in range(100):
+            renderer.line("row %d" % index)
+
+    assert len(writes) == 1
+    assert writes[0].count("\n") == 100
+
+    renderer.frame(["progress: 1/2", "pending: 1"])
+    renderer.frame(["progress: 2/2", "pending: 0"])
+
+    assert len(writes) == 3
+    assert writes[2].startswith("\033[2F\033[J")
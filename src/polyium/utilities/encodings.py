@@ -0,0 +1,443 @@
+"""
+The encodings module serializes JSON-compatible value(s) into a selectable output format.
+
+Available encoding(s):
+
+- `pretty`: indented JSON (the original output format).
+- `minified`: JSON without insignificant whitespace.
+- `canonical`: minified JSON with sorted key(s) and unescaped unicode; byte-stable for a given value, and thus suitable
+  for hashing and comparison.
+- `cbor`: Concise Binary Object Representation (RFC 8949).
+- `msgpack`: MessagePack.
+
+The binary encoding(s) are implemented in pure Python, so no (optional) dependency is required. Each encoding pairs an
+encoder with a decoder, such that `decode(encode(value)) == value` for any JSON-compatible value.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import struct
+import typing
+
+@dataclasses.dataclass(frozen=True)
+class Encoding:
+    """
+    An output format.
+
+    :ivar name: The encoding's name.
+    :ivar extension: The file extension of encoded output, including the leading period.
+    :ivar binary: Whether encoded output is binary, rather than (utf-8) text.
+    :ivar encode: Serializes a JSON-compatible value.
+    :ivar decode: Deserializes encoded output.
+    """
+
+    name: str
+    extension: str
+    binary: bool
+    encode: typing.Callable[[typing.Any], bytes]
+    decode: typing.Callable[[bytes], typing.Any]
+
+def pretty(value: typing.Any) -> bytes:
+    return json.dumps(value, indent=4).encode("utf-8")
+
+def minified(value: typing.Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+def canonical(value: typing.Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+def parse(content: bytes) -> typing.Any:
+    return json.loads(content)
+
+_uint8 = struct.Struct(">B")
+_uint16 = struct.Struct(">H")
+_uint32 = struct.Struct(">I")
+_uint64 = struct.Struct(">Q")
+_int8 = struct.Struct(">b")
+_int16 = struct.Struct(">h")
+_int32 = struct.Struct(">i")
+_int64 = struct.Struct(">q")
+_float16 = struct.Struct(">e")
+_float32 = struct.Struct(">f")
+_float64 = struct.Struct(">d")
+
+def _cbor_head(buffer: bytearray, major: int, argument: int) -> None:
+    """
+    Appends a CBOR data item's initial byte, and its (shortest) argument.
+    """
+
+    major <<= 5
+
+    if argument < 24:
+        buffer.append(major | argument)
+    elif argument < 0x100:
+        buffer.append(major | 24)
+        buffer.append(argument)
+    elif argument < 0x10000:
+        buffer.append(major | 25)
+        buffer += _uint16.pack(argument)
+    elif argument < 0x100000000:
+        buffer.append(major | 26)
+        buffer += _uint32.pack(argument)
+    else:
+        buffer.append(major | 27)
+        buffer += _uint64.pack(argument)
+
+def _cbor_encode(buffer: bytearray, value: typing.Any) -> None:
+    if isinstance(value, str):
+        content = value.encode("utf-8")
+
+        _cbor_head(buffer, 3, len(content))
+
+        buffer += content
+    elif value is None:
+        buffer.append(0xF6)
+    elif value is True:
+        buffer.append(0xF5)
+    elif value is False:
+        buffer.append(0xF4)
+    elif isinstance(value, int):
+        if 0 <= value < 0x10000000000000000:
+            _cbor_head(buffer, 0, value)
+        elif -0x10000000000000000 <= value < 0:
+            _cbor_head(buffer, 1, -1 - value)
+        else:
+            # Bignum(s); tag 2 (unsigned) or 3 (negative).
+            magnitude = value if value >= 0 else -1 - value
+
+            content = magnitude.to_bytes((magnitude.bit_length() + 7) // 8, "big")
+
+            _cbor_head(buffer, 6, 2 if value >= 0 else 3)
+            _cbor_head(buffer, 2, len(content))
+
+            buffer += content
+    elif isinstance(value, float):
+        buffer.append(0xFB)
+        buffer += _float64.pack(value)
+    elif isinstance(value, dict):
+        _cbor_head(buffer, 5, len(value))
+
+        for key, item in value.items():
+            _cbor_encode(buffer, key)
+            _cbor_encode(buffer, item)
+    elif isinstance(value, (list, tuple)):
+        _cbor_head(buffer, 4, len(value))
+
+        for item in value:
+            _cbor_encode(buffer, item)
+    elif isinstance(value, (bytes, bytearray)):
+        _cbor_head(buffer, 2, len(value))
+
+        buffer += value
+    else:
+        raise TypeError("Unable to Encode Type (%s) as CBOR" % type(value).__name__)
+
+def cbor(value: typing.Any) -> bytes:
+    buffer = bytearray()
+
+    _cbor_encode(buffer, value)
+
+    return bytes(buffer)
+
+def _cbor_decode(content: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+    initial = content[offset]
+
+    offset += 1
+
+    major, information = initial >> 5, initial & 0x1F
+
+    if major == 7:
+        if information == 20:
+            return False, offset
+        if information == 21:
+            return True, offset
+        if information in (22, 23):
+            return None, offset
+        if information == 25:
+            return _float16.unpack_from(content, offset)[0], offset + 2
+        if information == 26:
+            return _float32.unpack_from(content, offset)[0], offset + 4
+        if information == 27:
+            return _float64.unpack_from(content, offset)[0], offset + 8
+
+        raise ValueError("Unsupported CBOR Simple Value (%d) at Offset %d" % (information, offset - 1))
+
+    if information < 24:
+        argument = information
+    elif information == 24:
+        argument, offset = content[offset], offset + 1
+    elif information == 25:
+        argument, offset = _uint16.unpack_from(content, offset)[0], offset + 2
+    elif information == 26:
+        argument, offset = _uint32.unpack_from(content, offset)[0], offset + 4
+    elif information == 27:
+        argument, offset = _uint64.unpack_from(content, offset)[0], offset + 8
+    else:
+        raise ValueError("Unsupported CBOR Argument (%d) at Offset %d" % (information, offset - 1))
+
+    if major == 0:
+        return argument, offset
+    if major == 1:
+        return -1 - argument, offset
+    if major == 2:
+        return bytes(content[offset:offset + argument]), offset + argument
+    if major == 3:
+        return str(content[offset:offset + argument], "utf-8"), offset + argument
+    if major == 4:
+        items = []
+
+        for _ in range(argument):
+            item, offset = _cbor_decode(content, offset)
+
+            items.append(item)
+
+        return items, offset
+    if major == 5:
+        mapping = {}
+
+        for _ in range(argument):
+            key, offset = _cbor_decode(content, offset)
+            item, offset = _cbor_decode(content, offset)
+
+            mapping[key] = item
+
+        return mapping, offset
+
+    # Tag(s); only bignum(s) are interpreted, any other tag's content is returned as is.
+    item, offset = _cbor_decode(content, offset)
+
+    if argument == 2:
+        return int.from_bytes(item, "big"), offset
+    if argument == 3:
+        return -1 - int.from_bytes(item, "big"), offset
+
+    return item, offset
+
+def uncbor(content: bytes) -> typing.Any:
+    value, _ = _cbor_decode(memoryview(content), 0)
+
+    return value
+
+def _msgpack_length(buffer: bytearray, length: int, fix: typing.Optional[int], fixed: int, codes: typing.Tuple[typing.Optional[int], int, int]) -> None:
+    """
+    Appends a MessagePack length-prefixed header: a fix-format (if the length fits within `fixed`), or the shortest of
+    the 8-bit, 16-bit, and 32-bit format(s).
+    """
+
+    if fix is not None and length < fixed:
+        buffer.append(fix | length)
+    elif codes[0] is not None and length < 0x100:
+        buffer.append(codes[0])
+        buffer.append(length)
+    elif length < 0x10000:
+        buffer.append(codes[1])
+        buffer += _uint16.pack(length)
+    elif length < 0x100000000:
+        buffer.append(codes[2])
+        buffer += _uint32.pack(length)
+    else:
+        raise ValueError("Unable to Encode Length (%d) as MessagePack" % length)
+
+def _msgpack_encode(buffer: bytearray, value: typing.Any) -> None:
+    if isinstance(value, str):
+        content = value.encode("utf-8")
+
+        _msgpack_length(buffer, len(content), 0xA0, 32, (0xD9, 0xDA, 0xDB))
+
+        buffer += content
+    elif value is None:
+        buffer.append(0xC0)
+    elif value is True:
+        buffer.append(0xC3)
+    elif value is False:
+        buffer.append(0xC2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            buffer.append(value)
+        elif -32 <= value < 0:
+            buffer.append(value & 0xFF)
+        elif 0 <= value < 0x100:
+            buffer.append(0xCC)
+            buffer.append(value)
+        elif 0 <= value < 0x10000:
+            buffer.append(0xCD)
+            buffer += _uint16.pack(value)
+        elif 0 <= value < 0x100000000:
+            buffer.append(0xCE)
+            buffer += _uint32.pack(value)
+        elif 0 <= value < 0x10000000000000000:
+            buffer.append(0xCF)
+            buffer += _uint64.pack(value)
+        elif -0x80 <= value < 0:
+            buffer.append(0xD0)
+            buffer += _int8.pack(value)
+        elif -0x8000 <= value < 0:
+            buffer.append(0xD1)
+            buffer += _int16.pack(value)
+        elif -0x80000000 <= value < 0:
+            buffer.append(0xD2)
+            buffer += _int32.pack(value)
+        elif -0x8000000000000000 <= value < 0:
+            buffer.append(0xD3)
+            buffer += _int64.pack(value)
+        else:
+            raise ValueError("Unable to Encode Integer (%d) as MessagePack; Out of 64-Bit Range" % value)
+    elif isinstance(value, float):
+        buffer.append(0xCB)
+        buffer += _float64.pack(value)
+    elif isinstance(value, dict):
+        _msgpack_length(buffer, len(value), 0x80, 16, (None, 0xDE, 0xDF))
+
+        for key, item in value.items():
+            _msgpack_encode(buffer, key)
+            _msgpack_encode(buffer, item)
+    elif isinstance(value, (list, tuple)):
+        _msgpack_length(buffer, len(value), 0x90, 16, (None, 0xDC, 0xDD))
+
+        for item in value:
+            _msgpack_encode(buffer, item)
+    elif isinstance(value, (bytes, bytearray)):
+        _msgpack_length(buffer, len(value), None, 0, (0xC4, 0xC5, 0xC6))
+
+        buffer += value
+    else:
+        raise TypeError("Unable to Encode Type (%s) as MessagePack" % type(value).__name__)
+
+def msgpack(value: typing.Any) -> bytes:
+    buffer = bytearray()
+
+    _msgpack_encode(buffer, value)
+
+    return bytes(buffer)
+
+# Fixed-width MessagePack scalar format(s): code -> (struct, width).
+_msgpack_scalars: typing.Dict[int, typing.Tuple[struct.Struct, int]] = {
+    0xCA: (_float32, 4), 0xCB: (_float64, 8),
+    0xCC: (_uint8, 1), 0xCD: (_uint16, 2), 0xCE: (_uint32, 4), 0xCF: (_uint64, 8),
+    0xD0: (_int8, 1), 0xD1: (_int16, 2), 0xD2: (_int32, 4), 0xD3: (_int64, 8),
+}
+
+# Length-prefixed MessagePack format(s): code -> (kind, length struct, width).
+_msgpack_prefixed: typing.Dict[int, typing.Tuple[str, struct.Struct, int]] = {
+    0xC4: ("bin", _uint8, 1), 0xC5: ("bin", _uint16, 2), 0xC6: ("bin", _uint32, 4),
+    0xD9: ("str", _uint8, 1), 0xDA: ("str", _uint16, 2), 0xDB: ("str", _uint32, 4),
+    0xDC: ("array", _uint16, 2), 0xDD: ("array", _uint32, 4),
+    0xDE: ("map", _uint16, 2), 0xDF: ("map", _uint32, 4),
+}
+
+def _msgpack_decode(content: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+    code = content[offset]
+
+    offset += 1
+
+    if code < 0x80:
+        return code, offset
+    if code >= 0xE0:
+        return code - 0x100, offset
+    if code == 0xC0:
+        return None, offset
+    if code == 0xC2:
+        return False, offset
+    if code == 0xC3:
+        return True, offset
+
+    if code in _msgpack_scalars:
+        structure, width = _msgpack_scalars[code]
+
+        return structure.unpack_from(content, offset)[0], offset + width
+
+    if 0xA0 <= code < 0xC0:
+        kind, length = "str", code & 0x1F
+    elif 0x90 <= code < 0xA0:
+        kind, length = "array", code & 0x0F
+    elif 0x80 <= code < 0x90:
+        kind, length = "map", code & 0x0F
+    elif code in _msgpack_prefixed:
+        kind, structure, width = _msgpack_prefixed[code]
+
+        length, offset = structure.unpack_from(content, offset)[0], offset + width
+    else:
+        raise ValueError("Unsupported MessagePack Format (0x%02X) at Offset %d" % (code, offset - 1))
+
+    if kind == "str":
+        return str(content[offset:offset + length], "utf-8"), offset + length
+    if kind == "bin":
+        return bytes(content[offset:offset + length]), offset + length
+    if kind == "array":
+        items = []
+
+        for _ in range(length):
+            item, offset = _msgpack_decode(content, offset)
+
+            items.append(item)
+
+        return items, offset
+
+    mapping = {}
+
+    for _ in range(length):
+        key, offset = _msgpack_decode(content, offset)
+        item, offset = _msgpack_decode(content, offset)
+
+        mapping[key] = item
+
+    return mapping, offset
+
+def unmsgpack(content: bytes) -> typing.Any:
+    value, _ = _msgpack_decode(memoryview(content), 0)
+
+    return value
+
+encodings: typing.Dict[str, Encoding] = {
+    "pretty": Encoding(name="pretty", extension=".json", binary=False, encode=pretty, decode=parse),
+    "minified": Encoding(name="minified", extension=".json", binary=False, encode=minified, decode=parse),
+    "canonical": Encoding(name="canonical", extension=".json", binary=False, encode=canonical, decode=parse),
+    "cbor": Encoding(name="cbor", extension=".cbor", binary=True, encode=cbor, decode=uncbor),
+    "msgpack": Encoding(name="msgpack", extension=".msgpack", binary=True, encode=msgpack, decode=unmsgpack),
+}
+
+def encoding(name: typing.Union[str, Encoding]) -> Encoding:
+    """
+    Returns a registered encoding.
+
+    Raises
+    ------
+    ValueError
+        If no encoding is registered under the given name.
+    """
+
+    if isinstance(name, Encoding):
+        return name
+
+    if name not in encodings:
+        raise ValueError("Unknown encoding \"%s\" (expected one of: %s)" % (name, ", ".join(encodings)))
+
+    return encodings[name]
+
+def encode(value: typing.Any, name: typing.Union[str, Encoding] = "pretty") -> bytes:
+    """
+    Serializes a JSON-compatible value.
+
+    Parameters
+    ----------
+    value : typing.Any
+        The value; dict(s), list(s), str(s), int(s), float(s), bool(s), and None.
+    name : str | Encoding
+        The encoding, see :data:`encodings`.
+
+    Returns
+    -------
+    bytes
+        The encoded output.
+    """
+
+    return encoding(name).encode(value)
+
+def decode(content: bytes, name: typing.Union[str, Encoding] = "pretty") -> typing.Any:
+    """
+    Deserializes encoded output, see :func:`encode`.
+    """
+
+    return encoding(name).decode(content)
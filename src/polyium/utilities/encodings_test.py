@@ -0,0 +1,103 @@
+import json
+import typing
+
+import pytest
+import logging
+
+import polyium.models.internal.base
+import polyium.utilities.encodings as module
+
+logger = logging.getLogger(__name__)
+
+value = {
+    "name": "Example",
+    "unicode": "naïve ✓",
+    "integers": [0, 1, 23, 24, 255, 256, 65535, 65536, 2 ** 32, 2 ** 64 - 1, -1, -32, -33, -128, -129, -(2 ** 63)],
+    "floats": [0.0, 1.5, -2.25, 1e300],
+    "flags": [True, False, None],
+    "nested": {"items": [{"index": index, "label": "x" * index} for index in range(40)]},
+    "long": "y" * 70000,
+}
+
+@pytest.mark.parametrize("name", list(module.encodings))
+def test_round_trip(request: pytest.FixtureRequest, name: str):
+    """
+    Tests that every encoding decodes its own output to the original value.
+    """
+
+    content = module.encode(value, name)
+
+    logger.debug("Encoding (%s): %d Bytes", name, len(content))
+
+    assert isinstance(content, bytes)
+    assert module.decode(content, name) == value
+
+def test_cbor_vectors(request: pytest.FixtureRequest):
+    """
+    Tests CBOR output against RFC 8949 appendix A example(s).
+    """
+
+    assert module.cbor(0) == bytes.fromhex("00")
+    assert module.cbor(24) == bytes.fromhex("1818")
+    assert module.cbor(1000000) == bytes.fromhex("1a000f4240")
+    assert module.cbor(-1) == bytes.fromhex("20")
+    assert module.cbor(-1000) == bytes.fromhex("3903e7")
+    assert module.cbor(18446744073709551616) == bytes.fromhex("c249010000000000000000")
+    assert module.cbor(1.1) == bytes.fromhex("fb3ff199999999999a")
+    assert module.cbor("IETF") == bytes.fromhex("6449455446")
+    assert module.cbor([1, [2, 3], [4, 5]]) == bytes.fromhex("8301820203820405")
+    assert module.cbor({"a": 1, "b": [2, 3]}) == bytes.fromhex("a26161016162820203")
+    assert module.uncbor(bytes.fromhex("f97c00")) == float("inf")
+
+def test_msgpack_vectors(request: pytest.FixtureRequest):
+    """
+    Tests MessagePack output against the specification's format(s).
+    """
+
+    assert module.msgpack(None) == bytes.fromhex("c0")
+    assert module.msgpack(127) == bytes.fromhex("7f")
+    assert module.msgpack(128) == bytes.fromhex("cc80")
+    assert module.msgpack(-32) == bytes.fromhex("e0")
+    assert module.msgpack(-33) == bytes.fromhex("d0df")
+    assert module.msgpack("a") == bytes.fromhex("a161")
+    assert module.msgpack({"a": [1, True]}) == bytes.fromhex("81a1619201c3")
+
+    with pytest.raises(ValueError):
+        module.msgpack(2 ** 64)
+
+def test_canonical(request: pytest.FixtureRequest):
+    """
+    Tests that canonical JSON is independent of key order, and compact.
+    """
+
+    first = module.canonical({"b": 1, "a": {"d": [1, 2], "c": "é"}})
+    second = module.canonical({"a": {"c": "é", "d": [1, 2]}, "b": 1})
+
+    assert first == second == '{"a":{"c":"é","d":[1,2]},"b":1}'.encode("utf-8")
+
+    with pytest.raises(ValueError):
+        module.canonical(float("nan"))
+
+def test_unknown(request: pytest.FixtureRequest):
+    with pytest.raises(ValueError):
+        module.encoding("yaml")
+
+    with pytest.raises(TypeError):
+        module.cbor(object())
+
+def test_model_encode(request: pytest.FixtureRequest):
+    """
+    Tests a model's encoding(s), where every encoding represents the same JSON-compatible dump.
+    """
+
+    class Example(polyium.models.internal.base.Model):
+        example_name: str
+        example_values: typing.List[int]
+
+    instance = Example(example_name="Example", example_values=[1, 2, 3])
+
+    assert instance.encode() == bytes(instance)
+    assert instance.encode("minified") == b'{"example_name":"Example","example_values":[1,2,3]}'
+
+    for name in module.encodings:
+        assert module.decode(instance.encode(name), name) == json.loads(instance.jsonify())
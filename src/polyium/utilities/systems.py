@@ -8,14 +8,22 @@ such as file and directory validations in system-level applications.
 
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
 import logging
 import os
 import pathlib
 import platform
+import queue
 import shutil
 import stat
 import tempfile
+import threading
 import typing
+import uuid
 
 import packaging.version
 
@@ -42,6 +50,263 @@ def append_file_stem(path: pathlib.Path, addition: str) -> pathlib.Path:
 
     return instance
 
+@functools.lru_cache(maxsize=None)
+def credentials() -> typing.Tuple[typing.Optional[int], typing.FrozenSet[int]]:
+    """
+    Returns the process's real user ID and group ID(s), as used by `os.access`; memoized, as they're constant for the
+    lifetime of a typical process.
+
+    Returns
+    -------
+    tuple[int | None, frozenset[int]]
+        The real user ID (None where unsupported, e.g. Windows), and the real and supplementary group ID(s).
+    """
+
+    if not hasattr(os, "getuid"):
+        return None, frozenset()
+
+    return os.getuid(), frozenset({os.getgid(), *os.getgroups()})
+
+@dataclasses.dataclass(frozen=True)
+class Snapshot:
+    """
+    A point-in-time view of a descriptor's metadata, answering every permission question from a single `stat` result.
+
+    Access check(s) are derived from the permission bits and the process's real credentials, mirroring `os.access`;
+    unlike `os.access`, they don't account for access control list(s) or read-only mount(s).
+
+    :ivar statistics: The captured stat result.
+    """
+
+    statistics: os.stat_result
+
+    @property
+    def mode(self) -> int:
+        return self.statistics.st_mode
+
+    @property
+    def permissions(self) -> int:
+        """
+        The permission bits, e.g. `0o755`.
+        """
+
+        return self.statistics.st_mode & 0o777
+
+    def has_permissions(self, permissions: int) -> bool:
+        return self.permissions == permissions
+
+    def is_file(self) -> bool:
+        return stat.S_ISREG(self.statistics.st_mode)
+
+    def is_dir(self) -> bool:
+        return stat.S_ISDIR(self.statistics.st_mode)
+
+    def is_symlink(self) -> bool:
+        return stat.S_ISLNK(self.statistics.st_mode)
+
+    def is_user_readable(self) -> bool:
+        return bool(self.statistics.st_mode & stat.S_IRUSR)
+
+    def is_group_readable(self) -> bool:
+        return bool(self.statistics.st_mode & stat.S_IRGRP)
+
+    def allows(self, user: int, group: int, other: int) -> bool:
+        """
+        Determines whether the process's real credentials are granted the given user, group, or other permission bit.
+        """
+
+        uid, groups = credentials()
+
+        if uid is None:
+            return bool(self.statistics.st_mode & user)
+
+        if uid == 0:
+            # The superuser may read and write anything, and execute anything executable by anyone.
+            return user != stat.S_IXUSR or bool(self.statistics.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)) or self.is_dir()
+
+        if self.statistics.st_uid == uid:
+            return bool(self.statistics.st_mode & user)
+
+        if self.statistics.st_gid in groups:
+            return bool(self.statistics.st_mode & group)
+
+        return bool(self.statistics.st_mode & other)
+
+    def is_private(self) -> bool:
+        """
+        Determines whether the descriptor is owned by the process's real user, and isn't writable by its group or other
+        user(s); always true where ownership is unsupported (e.g. Windows).
+        """
+
+        uid, _ = credentials()
+
+        if uid is None:
+            return True
+
+        return self.statistics.st_uid == uid and not self.statistics.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def is_readable(self) -> bool:
+        return self.allows(stat.S_IRUSR, stat.S_IRGRP, stat.S_IROTH)
+
+    def is_writable(self) -> bool:
+        return self.allows(stat.S_IWUSR, stat.S_IWGRP, stat.S_IWOTH)
+
+    def is_executable(self) -> bool:
+        """
+        Determines whether the descriptor is an executable file; see `Descriptor.is_executable`.
+        """
+
+        return self.is_file() and self.allows(stat.S_IXUSR, stat.S_IXGRP, stat.S_IXOTH)
+
+def remove(path: typing.Union[str, os.PathLike], jobs: typing.Optional[int] = None, threshold: int = 1024) -> None:
+    """
+    Recursively deletes a directory tree, unlinking file(s) across a pool of thread(s) for very wide tree(s).
+
+    File deletion is bound by system call latency rather than CPU, and releases the GIL, so a tree with at least
+    `threshold` entries is deleted by unlinking every file concurrently, then removing the (emptied) directories
+    deepest-first. Smaller trees are deleted with `shutil.rmtree`.
+
+    Either way, failure(s) propagate, as with `shutil.rmtree`; only entries removed concurrently are ignored.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The directory to delete.
+    jobs : int | None
+        The number of thread(s); defaults to four per CPU core, up to 32.
+    threshold : int
+        The minimum number of entries for which the deletion is parallelized.
+
+    Raises
+    ------
+    OSError
+        If the directory doesn't exist, or any entry cannot be deleted.
+    """
+
+    path = os.fspath(path)
+
+    files: typing.List[str] = []
+    directories: typing.List[str] = [path]
+
+    index = 0
+
+    while index < len(directories):
+        try:
+            with os.scandir(directories[index]) as iterator:
+                for entry in iterator:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except FileNotFoundError:
+            # Only a nested directory may vanish concurrently; the tree itself must exist.
+            if index == 0:
+                raise
+
+        index += 1
+
+    if len(files) + len(directories) < threshold:
+        shutil.rmtree(path)
+        return
+
+    jobs = jobs or min(32, (os.cpu_count() or 1) * 4)
+
+    def unlink(partials: typing.List[str]) -> None:
+        for partial in partials:
+            try:
+                os.unlink(partial)
+            except FileNotFoundError:
+                pass
+
+    size = max(64, len(files) // (jobs * 4))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="remove") as executor:
+        list(executor.map(unlink, (files[offset:offset + size] for offset in range(0, len(files), size))))
+
+    # Directories were discovered breadth-first; removing them in reverse order removes children before parents.
+    for directory in reversed(directories):
+        try:
+            os.rmdir(directory)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Entries created during deletion; fall back to a serial deletion.
+            shutil.rmtree(directory)
+
+class Reaper:
+    """
+    Deletes directory trees on a background (daemon) thread.
+
+    Pending deletion(s) are drained upon interpreter exit, so renamed tree(s) aren't leaked. Unlike a foreground
+    deletion (see :func:`remove`), failure(s) are logged rather than raised, as no caller awaits them.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue[typing.Optional[str]] = queue.Queue()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._registered = False
+
+    def submit(self, path: typing.Union[str, os.PathLike]) -> None:
+        """
+        Schedules a directory tree for deletion.
+        """
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="reaper", daemon=True)
+                self._thread.start()
+
+            # The thread is restarted within a forked child, which inherits the parent's exit handler(s).
+            if not self._registered:
+                atexit.register(self.wait)
+
+                self._registered = True
+
+        self._queue.put(os.fspath(path))
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+
+            try:
+                remove(path)
+            except Exception as e:
+                logger.warning("Unable to Remove Directory (%s): %s", path, e)
+            finally:
+                self._queue.task_done()
+
+    def wait(self) -> None:
+        """
+        Blocks until every scheduled deletion has completed.
+        """
+
+        self._queue.join()
+
+# The process-wide background deletion thread.
+reaper = Reaper()
+
+def tombstone(path: typing.Union[str, os.PathLike]) -> typing.Optional[pathlib.Path]:
+    """
+    Atomically renames a directory to a unique, hidden sibling, so it may be deleted without blocking its original path.
+
+    Returns
+    -------
+    pathlib.Path | None
+        The renamed path, or None if the directory doesn't exist.
+    """
+
+    path = pathlib.Path(path)
+
+    target = path.parent.joinpath(".%s.deleting-%s" % (path.name, uuid.uuid4().hex))
+
+    try:
+        os.rename(path, target)
+    except FileNotFoundError:
+        return None
+
+    return target
+
 class Descriptor(pathlib.Path):
     """
     Represents a file descriptor with additional methods to inspect its properties.
@@ -65,6 +330,38 @@ class Descriptor(pathlib.Path):
         except TypeError as e:
             super().__init__()
 
+    def snapshot(self, refresh: bool = False) -> Snapshot:
+        """
+        Returns a snapshot of the descriptor's metadata, answering every permission question from a single `stat` call.
+
+        The snapshot is memoized on the descriptor (descriptors yielded by `Directory.scan` carry the snapshot of their
+        directory entry); the individual `is_*` method(s) continue to query the filesystem on every call.
+
+        Parameters
+        ----------
+        refresh : bool
+            Whether to discard a memoized snapshot, and capture a new one.
+
+        Returns
+        -------
+        Snapshot
+            The descriptor's snapshot.
+
+        Raises
+        ------
+        OSError
+            If the descriptor's statistics cannot be retrieved.
+        """
+
+        snapshot = None if refresh else self.__dict__.get("_snapshot")
+
+        if snapshot is None:
+            snapshot = Snapshot(os.stat(self))
+
+            self.__dict__["_snapshot"] = snapshot
+
+        return snapshot
+
     def get_current_permissions(self):
         """
         Retrieves the current file permissions of a file.
@@ -271,7 +568,7 @@ class Executable(Descriptor):
 
 class Directory(Descriptor):
     @staticmethod
-    def temporary(suffix: typing.Optional[str] = None, prefix: typing.Optional[str] = None):
+    def temporary(suffix: typing.Optional[str] = None, prefix: typing.Optional[str] = None, background: bool = False):
         """
         Create and return a temporary directory. This has the same
         behavior as mkdtemp but can be used as a context manager. For
@@ -279,9 +576,16 @@ class Directory(Descriptor):
 
             with Directory.temporary() as tmpdir:
                 ...
+
+        If `background` is True, exiting the context renames the directory
+        and deletes it on a background thread (see `Directory.cleanup`).
         """
 
-        return Directory(tempfile.mkdtemp(suffix=suffix, prefix=prefix, dir=None), create=True)
+        instance = Directory(tempfile.mkdtemp(suffix=suffix, prefix=prefix, dir=None), create=True)
+
+        instance.background = background
+
+        return instance
 
     def __init__(self, *args, create: bool = True):
         super().__init__(*args)
@@ -297,8 +601,87 @@ class Directory(Descriptor):
             logger.error("Descriptor is not a directory: %s", str(self.path.resolve()))
             raise RuntimeError("Descriptor is not a directory: {}".format(str(self.path.resolve())))
 
-    def cleanup(self):
-        shutil.rmtree(self)
+    def cleanup(self, background: typing.Optional[bool] = None):
+        """
+        Deletes the directory tree.
+
+        Parameters
+        ----------
+        background : bool | None
+            Whether to atomically rename the directory and delete it on a background thread, returning immediately;
+            defaults to the directory's `background` attribute (see `Directory.temporary`).
+        """
+
+        if background is None:
+            background = getattr(self, "background", False)
+
+        if not background:
+            remove(self)
+            return
+
+        target = tombstone(self)
+
+        if target is not None:
+            reaper.submit(target)
+
+    def scan(self, recursive: bool = True) -> typing.Iterator[Descriptor]:
+        """
+        Lazily yields a descriptor per entry beneath the directory, top-down, using `os.scandir`.
+
+        Entries are classified from their directory entry type (without a `stat` call on most platforms), and yielded
+        as :class:`File`, :class:`Directory`, or (e.g. for symbolic links, which aren't followed) :class:`Descriptor`
+        instances, without the existence checks of their constructors. Each descriptor carries a :class:`Snapshot` of
+        its entry's (cached) stat result, so a complete permission profile costs at most one `stat` per entry.
+
+        Parameters
+        ----------
+        recursive : bool
+            Whether to descend into sub-directories.
+
+        Yields
+        ------
+        Descriptor
+            A descriptor per entry.
+        """
+
+        pending = [os.fspath(self)]
+
+        while pending:
+            directory = pending.pop()
+
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = list(iterator)
+            except OSError as e:
+                logger.warning("Unable to Scan Directory (%s): %s", directory, e)
+                continue
+
+            nested = []
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    cls = Directory
+
+                    nested.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    cls = File
+                else:
+                    cls = Descriptor
+
+                descriptor = cls.__new__(cls, entry.path)
+
+                # Bypass the subclass constructor's existence and type check(s).
+                Descriptor.__init__(descriptor, entry.path)
+
+                try:
+                    descriptor.__dict__["_snapshot"] = Snapshot(entry.stat(follow_symlinks=False))
+                except OSError as e:
+                    logger.debug("Unable to Stat Directory Entry (%s): %s", entry.path, e)
+
+                yield descriptor
+
+            if recursive:
+                pending.extend(reversed(nested))
 
     def __enter__(self):
         if not self.exists():
@@ -353,3 +736,96 @@ class File(Descriptor):
         if not self.is_file():
             logger.error("Descriptor is not a file: %s", str(self.path.resolve()))
             raise RuntimeError("Descriptor is not a file: {}".format(str(self.path.resolve())))
+
+class Pool:
+    """
+    A pool of reusable scratch directories.
+
+    A released directory is cleared by renaming it aside, (re-)creating it empty, and deleting the renamed tree on a
+    background thread, so neither acquisition nor release waits on the deletion of its content(s).
+
+    :ivar root: The parent of the pool's directories; defaults to the system's temporary directory.
+    :ivar size: The maximum number of idle directories retained for reuse.
+    :ivar prefix: The prefix of the pool's directory name(s).
+    """
+
+    def __init__(self, root: typing.Optional[typing.Union[str, os.PathLike]] = None, size: int = 4, prefix: str = "scratch-"):
+        self.root = root
+        self.size = size
+        self.prefix = prefix
+
+        self._idle: typing.List[Directory] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        return False
+
+    def acquire(self) -> Directory:
+        """
+        Returns an empty scratch directory, reusing an idle directory if available.
+        """
+
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+
+        return Directory(tempfile.mkdtemp(prefix=self.prefix, dir=self.root), create=True)
+
+    def release(self, directory: Directory) -> None:
+        """
+        Clears a scratch directory, in the background, and returns it to the pool (or deletes it, if the pool is full).
+        """
+
+        with self._lock:
+            retain = len(self._idle) < self.size
+
+        if not retain:
+            directory.cleanup(background=True)
+            return
+
+        target = tombstone(directory)
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if target is not None:
+            reaper.submit(target)
+
+        with self._lock:
+            self._idle.append(directory)
+
+    @contextlib.contextmanager
+    def directory(self) -> typing.Iterator[Directory]:
+        """
+        Acquires a scratch directory for the duration of a context, releasing it upon exit.
+        """
+
+        instance = self.acquire()
+
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def close(self, wait: bool = False) -> None:
+        """
+        Deletes every idle directory, in the background.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to block until every pending background deletion has completed.
+        """
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for directory in idle:
+            directory.cleanup(background=True)
+
+        if wait:
+            reaper.wait()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 import logging
 
@@ -56,3 +57,170 @@ def test_directory_temporary(request: pytest.FixtureRequest):
 
     assert directory.exists() is False
 
+
+@pytest.mark.parametrize("permissions", [0o644, 0o600, 0o755, 0o700, 0o444, 0o000])
+def test_snapshot_permissions(request: pytest.FixtureRequest, permissions: int):
+    """
+    Tests that a snapshot's answer(s) agree with the descriptor's individual system call(s).
+    """
+
+    instance = polyium.utilities.systems.Descriptor(tempfile.gettempdir(), "{}.test".format(request.node.name))
+
+    instance.touch()
+
+    try:
+        os.chmod(instance, permissions)
+
+        snapshot = instance.snapshot()
+
+        assert snapshot.permissions == instance.get_current_permissions() == permissions
+        assert snapshot.has_permissions(permissions)
+        assert snapshot.is_file() and not snapshot.is_dir()
+        assert snapshot.is_user_readable() == instance.is_user_readable()
+        assert snapshot.is_group_readable() == instance.is_group_readable()
+        assert snapshot.is_readable() == instance.is_readable()
+        assert snapshot.is_writable() == instance.is_writable()
+        assert snapshot.is_executable() == instance.is_executable()
+    finally:
+        instance.unlink()
+
+def test_snapshot_memoized(request: pytest.FixtureRequest):
+    instance = polyium.utilities.systems.Descriptor(tempfile.gettempdir(), "{}.test".format(request.node.name))
+
+    instance.touch()
+
+    try:
+        snapshot = instance.snapshot()
+
+        os.chmod(instance, 0o600)
+
+        assert instance.snapshot() is snapshot
+        assert instance.snapshot(refresh=True).permissions == 0o600
+    finally:
+        instance.unlink()
+
+def test_directory_scan(request: pytest.FixtureRequest):
+    """
+    Tests that a scan yields typed descriptor(s), with snapshot(s), for an entire tree.
+    """
+
+    with polyium.utilities.systems.Directory.temporary() as directory:
+        directory.joinpath("nested", "deeper").mkdir(parents=True)
+        directory.joinpath("a.json").touch()
+        directory.joinpath("nested", "b.json").touch()
+        directory.joinpath("nested", "deeper", "c.json").touch()
+
+        os.symlink(directory.joinpath("a.json"), directory.joinpath("link.json"))
+
+        descriptors = {str(descriptor.relative_to(directory)): descriptor for descriptor in directory.scan()}
+
+        logger.debug("Descriptor(s): %s", sorted(descriptors))
+
+        assert sorted(descriptors) == ["a.json", "link.json", "nested", os.path.join("nested", "b.json"), os.path.join("nested", "deeper"), os.path.join("nested", "deeper", "c.json")]
+
+        assert type(descriptors["a.json"]) is polyium.utilities.systems.File
+        assert type(descriptors["nested"]) is polyium.utilities.systems.Directory
+        assert type(descriptors["link.json"]) is polyium.utilities.systems.Descriptor
+
+        assert descriptors["link.json"].snapshot().is_symlink()
+        assert all(descriptor.snapshot().is_readable() for descriptor in descriptors.values())
+
+        assert sorted(str(descriptor.relative_to(directory)) for descriptor in directory.scan(recursive=False)) == ["a.json", "link.json", "nested"]
+
+def test_directory_temporary_background(request: pytest.FixtureRequest):
+    """
+    Tests that a background cleanup releases the directory's path immediately, and eventually deletes its content(s).
+    """
+
+    with polyium.utilities.systems.Directory.temporary(background=True) as directory:
+        directory.joinpath("nested").mkdir()
+        directory.joinpath("nested", "a.json").touch()
+
+    assert directory.exists() is False
+
+    polyium.utilities.systems.reaper.wait()
+
+    assert not [name for name in os.listdir(directory.parent) if name.startswith(".%s.deleting-" % directory.name)]
+
+@pytest.mark.parametrize("threshold", [0, 1024])
+def test_remove(request: pytest.FixtureRequest, threshold: int):
+    directory = polyium.utilities.systems.Directory(tempfile.gettempdir(), request.node.name, create=True)
+
+    for index in range(8):
+        directory.joinpath(str(index), "nested").mkdir(parents=True)
+
+        for position in range(16):
+            directory.joinpath(str(index), "nested", "%d.json" % position).touch()
+
+    os.symlink(tempfile.gettempdir(), directory.joinpath("link"))
+
+    polyium.utilities.systems.remove(directory, jobs=4, threshold=threshold)
+
+    assert directory.exists() is False
+    assert os.path.isdir(tempfile.gettempdir())
+
+@pytest.mark.parametrize("threshold", [0, 1024])
+def test_remove_missing(request: pytest.FixtureRequest, threshold: int):
+    """
+    Tests that a foreground deletion propagates failure(s), while a background deletion only logs them.
+    """
+
+    directory = polyium.utilities.systems.Directory(tempfile.gettempdir(), request.node.name, create=True)
+
+    os.rmdir(directory)
+
+    with pytest.raises(FileNotFoundError):
+        polyium.utilities.systems.remove(directory, threshold=threshold)
+
+    with pytest.raises(FileNotFoundError):
+        directory.cleanup(background=False)
+
+    reaper = polyium.utilities.systems.Reaper()
+    reaper.submit(directory)
+    reaper.wait()
+
+def test_reaper_exit_handler(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """
+    Tests that the reaper's exit handler is registered once, even if its thread is restarted (e.g. after a fork).
+    """
+
+    registered = []
+
+    monkeypatch.setattr(polyium.utilities.systems.atexit, "register", registered.append)
+
+    reaper = polyium.utilities.systems.Reaper()
+
+    for _ in range(2):
+        reaper.submit(os.path.join(tempfile.gettempdir(), "%s.missing" % request.node.name))
+        reaper.wait()
+
+        reaper._thread = None
+
+    assert registered == [reaper.wait]
+
+def test_pool(request: pytest.FixtureRequest):
+    """
+    Tests that released scratch directories are cleared and reused, up to the pool's size.
+    """
+
+    root = polyium.utilities.systems.Directory(tempfile.gettempdir(), request.node.name, create=True)
+
+    try:
+        with polyium.utilities.systems.Pool(root=root, size=1) as pool:
+            with pool.directory() as first:
+                first.joinpath("a.json").touch()
+
+            with pool.directory() as second, pool.directory() as third:
+                assert second == first
+                assert list(second.iterdir()) == []
+                assert third != first
+
+            # The innermost directory is released (and retained) first; the pool is then full.
+            assert third.exists() is True
+            assert second.exists() is False
+
+        polyium.utilities.systems.reaper.wait()
+
+        assert list(root.iterdir()) == []
+    finally:
+        root.cleanup()
@@ -0,0 +1,285 @@
+"""
+This module contains filesystem watcher(s) that report changed file(s) beneath a set of root directories.
+
+On Linux, change(s) are received from the kernel through `inotify` (via `ctypes`, without any third-party dependency);
+elsewhere, or if `inotify` is unavailable, directory tree(s) are periodically polled using `os.scandir` stat result(s).
+"""
+
+from __future__ import annotations
+
+import abc
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+class Watcher(abc.ABC):
+    """
+    The abstract base filesystem watcher.
+
+    :ivar roots: The watched root directories.
+    :ivar suffixes: The file suffix(es) for which change(s) are reported.
+    :ivar debounce: The quiet period, in seconds, used to coalesce a burst of change(s) into a single batch.
+    """
+
+    def __init__(self, roots: typing.Iterable[typing.Union[str, os.PathLike]], suffixes: typing.Tuple[str, ...] = (".py",), debounce: float = 0.05):
+        self.roots = sorted({os.path.abspath(root) for root in roots})
+        self.suffixes = suffixes
+        self.debounce = debounce
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        return False
+
+    def relevant(self, path: str) -> bool:
+        return path.endswith(self.suffixes) and "__pycache__" not in path
+
+    @abc.abstractmethod
+    def changes(self, timeout: typing.Optional[float] = None) -> typing.Set[str]:
+        """
+        Blocks until at least one relevant change occurs (or the timeout elapses), then returns the changed path(s).
+
+        Parameters
+        ----------
+        timeout : float | None
+            The maximum number of seconds to wait; waits indefinitely if None.
+
+        Returns
+        -------
+        set[str]
+            The absolute path(s) of created, modified, or deleted file(s); empty if the timeout elapsed.
+        """
+
+    def close(self) -> None:
+        ...
+
+class Polling(Watcher):
+    """
+    A portable watcher that compares successive `os.scandir` snapshot(s) of modification time and size.
+
+    :ivar interval: The number of seconds between snapshot(s).
+    """
+
+    def __init__(self, roots: typing.Iterable[typing.Union[str, os.PathLike]], interval: float = 0.5, **kwargs: typing.Any):
+        super().__init__(roots, **kwargs)
+
+        self.interval = interval
+
+        self._snapshot = self.snapshot()
+
+    def snapshot(self) -> typing.Dict[str, typing.Tuple[int, int]]:
+        """
+        Returns the modification time and size of every relevant file beneath the root directories.
+        """
+
+        snapshot: typing.Dict[str, typing.Tuple[int, int]] = {}
+
+        pending = list(self.roots)
+
+        while pending:
+            directory = pending.pop()
+
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name != "__pycache__" and not entry.name.startswith("."):
+                                pending.append(entry.path)
+                        elif self.relevant(entry.name):
+                            statistics = entry.stat()
+
+                            snapshot[entry.path] = (statistics.st_mtime_ns, statistics.st_size)
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+
+        return snapshot
+
+    def _difference(self) -> typing.Set[str]:
+        current = self.snapshot()
+
+        changed = {path for path in current.keys() | self._snapshot.keys() if current.get(path) != self._snapshot.get(path)}
+
+        self._snapshot = current
+
+        return changed
+
+    def changes(self, timeout: typing.Optional[float] = None) -> typing.Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            changed = self._difference()
+
+            if changed:
+                time.sleep(self.debounce)
+
+                return changed | self._difference()
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+            time.sleep(self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic())))
+
+class Inotify(Watcher):
+    """
+    A Linux watcher backed by the kernel's `inotify` interface; sub-directories created after construction are watched
+    automatically.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+    HEADER = struct.Struct("iIII")
+
+    def __init__(self, roots: typing.Iterable[typing.Union[str, os.PathLike]], **kwargs: typing.Any):
+        super().__init__(roots, **kwargs)
+
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+
+        self._descriptor = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self._descriptor < 0:
+            error = ctypes.get_errno()
+
+            raise OSError(error, "inotify_init1: %s" % os.strerror(error))
+
+        self._watches: typing.Dict[int, str] = {}
+
+        for root in self.roots:
+            self._watch(root)
+
+    def _watch(self, root: str) -> None:
+        for directory, directories, _ in os.walk(root):
+            directories[:] = [name for name in directories if name != "__pycache__" and not name.startswith(".")]
+
+            watch = self._libc.inotify_add_watch(self._descriptor, os.fsencode(directory), self.MASK)
+
+            if watch < 0:
+                logger.warning("Unable to Watch Directory (%s): %s", directory, os.strerror(ctypes.get_errno()))
+                continue
+
+            self._watches[watch] = directory
+
+    def _read(self) -> typing.Set[str]:
+        changed: typing.Set[str] = set()
+
+        while True:
+            try:
+                buffer = os.read(self._descriptor, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+
+            while offset < len(buffer):
+                watch, mask, _, length = self.HEADER.unpack_from(buffer, offset)
+
+                offset += self.HEADER.size
+
+                filename = os.fsdecode(buffer[offset:offset + length].rstrip(b"\0"))
+
+                offset += length
+
+                directory = self._watches.get(watch)
+
+                if mask & self.IN_IGNORED:
+                    self._watches.pop(watch, None)
+                    continue
+
+                if directory is None or not filename:
+                    continue
+
+                path = os.path.join(directory, filename)
+
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        self._watch(path)
+
+                        # File(s) may have been written before the new directory's watch was registered.
+                        for parent, _, files in os.walk(path):
+                            changed.update(os.path.join(parent, name) for name in files if self.relevant(name))
+                elif self.relevant(filename):
+                    changed.add(path)
+
+    def changes(self, timeout: typing.Optional[float] = None) -> typing.Set[str]:
+        poller = select.poll()
+        poller.register(self._descriptor, select.POLLIN)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+
+            if not poller.poll(None if remaining is None else int(remaining * 1000)):
+                return set()
+
+            changed = self._read()
+
+            # Coalesce the remainder of the burst.
+            while poller.poll(int(self.debounce * 1000)):
+                changed |= self._read()
+
+            if changed:
+                return changed
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+    def close(self) -> None:
+        if self._descriptor >= 0:
+            os.close(self._descriptor)
+
+            self._descriptor = -1
+
+def create(roots: typing.Iterable[typing.Union[str, os.PathLike]], polling: bool = False, interval: float = 0.5, **kwargs: typing.Any) -> Watcher:
+    """
+    Creates the most efficient watcher available on the current platform.
+
+    Parameters
+    ----------
+    roots : typing.Iterable[str | os.PathLike]
+        The root directories to watch.
+    polling : bool
+        Force the stat-polling watcher.
+    interval : float
+        The polling interval, in seconds, if the polling watcher is used.
+    kwargs : typing.Any
+        Additional :class:`Watcher` option(s).
+
+    Returns
+    -------
+    Watcher
+        An :class:`Inotify` watcher where available, otherwise a :class:`Polling` watcher.
+    """
+
+    roots = list(roots)
+
+    if not polling:
+        try:
+            return Inotify(roots, **kwargs)
+        except (OSError, AttributeError) as e:
+            logger.debug("Falling Back to Polling Watcher: %s", e)
+
+    return Polling(roots, interval=interval, **kwargs)
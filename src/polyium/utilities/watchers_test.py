@@ -0,0 +1,66 @@
+import pathlib
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+import logging
+
+import polyium.utilities.watchers
+
+logger = logging.getLogger(__name__)
+
+def modify(path: pathlib.Path, delay: float = 0.1):
+    """
+    Writes to the given path, from a background thread, after a delay.
+    """
+
+    def target():
+        time.sleep(delay)
+
+        path.write_text("value = 1\n")
+
+    thread = threading.Thread(target=target)
+    thread.start()
+
+    return thread
+
+@pytest.mark.parametrize("polling", [True, False])
+def test_watcher_changes(request: pytest.FixtureRequest, polling: bool):
+    if not polling and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is only available on Linux")
+
+    temporary = pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name)
+
+    shutil.rmtree(temporary, ignore_errors=True)
+
+    temporary.joinpath("package").mkdir(parents=True)
+
+    try:
+        with polyium.utilities.watchers.create([temporary], polling=polling, interval=0.02) as watcher:
+            assert isinstance(watcher, polyium.utilities.watchers.Polling if polling else polyium.utilities.watchers.Inotify)
+
+            thread = modify(temporary.joinpath("package", "module.py"))
+
+            changes = watcher.changes(timeout=5)
+
+            thread.join()
+
+            logger.debug("[%s] Changes: %s", request.node.name, changes)
+
+            assert str(temporary.joinpath("package", "module.py")) in changes
+
+            # Irrelevant suffix(es) are ignored.
+            thread = modify(temporary.joinpath("package", "notes.txt"))
+
+            assert watcher.changes(timeout=0.3) == set()
+
+            thread.join()
+    finally:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+def test_watcher_abstract(request: pytest.FixtureRequest):
+    with pytest.raises(TypeError):
+        polyium.utilities.watchers.Watcher(["."])
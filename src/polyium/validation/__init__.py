@@ -0,0 +1,3 @@
+"""
+The validation package validates JSON document(s) against generated JSON schema(s).
+"""
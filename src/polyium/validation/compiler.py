@@ -0,0 +1,915 @@
+"""
+The compiler module translates a JSON schema (draft 2020-12) into Python source code, for hot-path validation.
+
+Rather than interpreting the schema per document, as `jsonschema` does, the schema is translated once into straight-line
+check(s): keyword(s) become inline comparison(s) guarded by the instance's type, regular expression(s) are compiled at
+module level, and every non-recursive definition referenced once is inlined at its reference (other definition(s), and
+recursive one(s), become function(s)).
+
+The generated module is cached on disk, keyed by the schema's content hash (see `polyium.validation.validators.digest`)
+and the compiler's :data:`VERSION`, and is loaded via the import system, so its bytecode is cached as well. As a cached
+module is executed, it's only loaded from a directory private to the user (owned by the user, and writable by no one
+else), and only if the module is itself owned by the user; otherwise, the schema is compiled in-memory.
+
+A schema using a keyword that isn't supported (e.g. `unevaluatedProperties`, `$dynamicRef`, or a remote `$ref`), or
+declaring another draft, is instead compiled by `jsonschema` (see :func:`compile`).
+"""
+
+from __future__ import annotations
+
+import builtins
+import collections
+import fractions
+import importlib.util
+import itertools
+import logging
+import os
+import pathlib
+import tempfile
+import types
+import typing
+
+import jsonschema
+import jsonschema.exceptions
+import jsonschema.protocols
+import jsonschema.validators
+import referencing
+
+import polyium.utilities.systems
+import polyium.validation.validators
+
+logger = logging.getLogger(__name__)
+
+# The generated source's format version; part of the cache key.
+VERSION = 2
+
+# The only declared draft that's compiled.
+DRAFT = "https://json-schema.org/draft/2020-12/schema"
+
+# Keyword(s) that aren't compiled; a schema using any falls back to `jsonschema`.
+UNSUPPORTED = frozenset(("unevaluatedProperties", "unevaluatedItems", "$dynamicRef", "$dynamicAnchor", "$recursiveRef", "$recursiveAnchor", "$anchor"))
+
+# Keyword(s) of a (sub)schema that may be compiled into a single boolean expression.
+_EXPRESSIONS = frozenset(("type", "enum", "const", "title", "description", "default", "examples", "deprecated", "readOnly", "writeOnly", "$comment"))
+
+# Sentinel for an absent property.
+MISSING = object()
+
+class Unsupported(ValueError):
+    """
+    Raised when a schema cannot be compiled.
+    """
+
+def default() -> pathlib.Path:
+    """
+    Returns the default compiled validator directory, within the user's cache directory (`$XDG_CACHE_HOME`, or
+    `~/.cache`); unlike the shared temporary directory, no other user can plant a module there.
+    """
+
+    return pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home().joinpath(".cache")).joinpath("json-schema-cli", "validators")
+
+def trusted(path: typing.Union[str, os.PathLike]) -> bool:
+    """
+    Determines whether a compiled module (or its directory) may be executed: a regular file (or directory), rather than
+    a symbolic link, that's private to the user (see `polyium.utilities.systems.Snapshot.is_private`).
+    """
+
+    try:
+        snapshot = polyium.utilities.systems.Snapshot(os.lstat(path))
+    except FileNotFoundError:
+        return False
+
+    return (snapshot.is_file() or snapshot.is_dir()) and snapshot.is_private()
+
+def equal(one: typing.Any, two: typing.Any) -> bool:
+    """
+    Whether two JSON value(s) are equal; unlike Python's equality, a boolean never equals a number.
+    """
+
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+
+    if isinstance(one, bool) or isinstance(two, bool):
+        return one is two
+
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(equal(a, b) for a, b in zip(one, two))
+
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(equal(value, two[key]) for key, value in one.items())
+
+    return one == two
+
+def member(value: typing.Any, values: typing.Sequence[typing.Any]) -> bool:
+    return any(equal(value, candidate) for candidate in values)
+
+def _key(value: typing.Any) -> typing.Any:
+    if isinstance(value, bool) or value is None:
+        return ("literal", value)
+
+    if isinstance(value, (int, float)):
+        return ("number", value)
+
+    if isinstance(value, str):
+        return ("string", value)
+
+    if isinstance(value, list):
+        return ("array", tuple(_key(item) for item in value))
+
+    return ("object", frozenset((key, _key(item)) for key, item in value.items()))
+
+def unique(items: typing.List[typing.Any]) -> bool:
+    """
+    Whether every item of an array is distinct, by JSON equality.
+    """
+
+    return len({_key(item) for item in items}) == len(items)
+
+def multiple(value: typing.Union[int, float], divisor: typing.Union[int, float]) -> bool:
+    """
+    Whether a number is a multiple of the divisor, with the same floating-point semantics as `jsonschema`.
+    """
+
+    if isinstance(divisor, float):
+        quotient = value / divisor
+
+        try:
+            return int(quotient) == quotient
+        except OverflowError:
+            return (fractions.Fraction(value) / fractions.Fraction(divisor)).denominator == 1
+
+    return not value % divisor
+
+def valid(function: typing.Callable[..., None], value: typing.Any) -> bool:
+    """
+    Whether a value is valid under a compiled (sub)schema function, stopping at its first error.
+    """
+
+    errors: typing.List[typing.Tuple[typing.Tuple[typing.Any, ...], str]] = []
+
+    function(value, (), errors, True)
+
+    return not errors
+
+def _pointer(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+def _references(value: typing.Any, found: typing.List[str]) -> typing.List[str]:
+    if isinstance(value, dict):
+        if isinstance(value.get("$ref"), str):
+            found.append(value["$ref"])
+
+        for item in value.values():
+            _references(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _references(item, found)
+
+    return found
+
+class _Generator:
+    """
+    Translates a schema into a module's source code.
+    """
+
+    def __init__(self, schema: typing.Any):
+        self.schema = schema
+
+        self.constants: typing.List[str] = []
+        self.functions: typing.List[str] = []
+
+        self._names = itertools.count()
+        self._definitions: typing.Dict[str, str] = {}
+
+        references = _references(schema, [])
+
+        self._counts = collections.Counter(references)
+
+        # The reference(s) reachable from each referenced (sub)schema, without following them.
+        edges = {reference: set(_references(self.resolve(reference), [])) for reference in set(references)}
+
+        self._recursive: typing.Set[str] = set()
+
+        for reference in edges:
+            visited: typing.Set[str] = set()
+            unvisited = list(edges[reference])
+
+            while unvisited:
+                target = unvisited.pop()
+
+                if target == reference:
+                    self._recursive.add(reference)
+
+                    break
+
+                if target not in visited:
+                    visited.add(target)
+                    unvisited.extend(edges.get(target, ()))
+
+    def resolve(self, reference: str) -> typing.Any:
+        if not reference.startswith("#"):
+            raise Unsupported("Unsupported (Non-Local) Reference: %s" % reference)
+
+        value = self.schema
+
+        for token in filter(None, reference[1:].split("/")):
+            token = _pointer(token)
+
+            try:
+                value = value[int(token)] if isinstance(value, list) else value[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise Unsupported("Unresolvable Reference: %s" % reference) from None
+
+        return value
+
+    def name(self, prefix: str) -> str:
+        return "%s%d" % (prefix, next(self._names))
+
+    def constant(self, expression: str) -> str:
+        name = self.name("_c")
+
+        self.constants.append("%s = %s" % (name, expression))
+
+        return name
+
+    def function(self, schema: typing.Any, name: typing.Optional[str] = None) -> str:
+        """
+        Compiles a (sub)schema into a module-level function, returning the function's name.
+        """
+
+        name = name or self.name("_s")
+
+        lines: typing.List[str] = []
+
+        self.emit(schema, "x", ("path", ()), lines, 1, root=False)
+
+        self.functions.append("def %s(x, path, errors, first):\n%s\n" % (name, "\n".join(lines) or "    pass"))
+
+        return name
+
+    def definition(self, reference: str) -> str:
+        if reference not in self._definitions:
+            self._definitions[reference] = self.name("_d")
+
+            self.function(self.resolve(reference), self._definitions[reference])
+
+        return self._definitions[reference]
+
+    @staticmethod
+    def path(path: typing.Tuple[str, typing.Tuple[str, ...]]) -> str:
+        base, suffix = path
+
+        return "%s + (%s,)" % (base, ", ".join(suffix)) if suffix else base
+
+    def fail(self, lines: typing.List[str], depth: int, path: typing.Tuple[str, typing.Tuple[str, ...]], message: str) -> None:
+        pad = "    " * depth
+
+        lines.append("%serrors.append((%s, %s))" % (pad, self.path(path), message))
+        lines.append("%sif first:" % pad)
+        lines.append("%s    return" % pad)
+
+    @staticmethod
+    def type(name: str, variable: str) -> str:
+        if name == "string":
+            return "isinstance(%s, str)" % variable
+
+        if name == "integer":
+            return "(isinstance({0}, int) and not isinstance({0}, bool) or isinstance({0}, float) and {0}.is_integer())".format(variable)
+
+        if name == "number":
+            return "(isinstance({0}, (int, float)) and not isinstance({0}, bool))".format(variable)
+
+        if name == "boolean":
+            return "isinstance(%s, bool)" % variable
+
+        if name == "null":
+            return "%s is None" % variable
+
+        if name == "object":
+            return "isinstance(%s, dict)" % variable
+
+        if name == "array":
+            return "isinstance(%s, list)" % variable
+
+        raise Unsupported("Unsupported Type: %r" % name)
+
+    def membership(self, values: typing.List[typing.Any], variable: str) -> str:
+        if values and all(isinstance(value, str) for value in values):
+            return "(isinstance(%s, str) and %s in %s)" % (variable, variable, self.constant(repr(frozenset(values))))
+
+        return "member(%s, %s)" % (variable, self.constant(repr(values)))
+
+    def expression(self, schema: typing.Any, variable: str) -> typing.Optional[str]:
+        """
+        Returns a boolean expression equivalent to a (sub)schema of only `type`, `enum`, and `const`, if possible.
+        """
+
+        if schema is True or schema == {}:
+            return "True"
+
+        if not isinstance(schema, dict) or any(key not in _EXPRESSIONS for key in schema):
+            return None
+
+        conditions = []
+
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+
+            conditions.append("(%s)" % " or ".join(self.type(name, variable) for name in types))
+
+        if "enum" in schema:
+            conditions.append(self.membership(schema["enum"], variable))
+
+        if "const" in schema:
+            conditions.append("equal(%s, %s)" % (variable, self.constant(repr(schema["const"]))))
+
+        return " and ".join(conditions) or "True"
+
+    def validity(self, schema: typing.Any, variable: str) -> str:
+        """
+        Returns a boolean expression of whether a variable is valid under a (sub)schema.
+        """
+
+        expression = self.expression(schema, variable)
+
+        if expression is not None:
+            return expression
+
+        # A bare reference is validated by its definition's function, rather than a wrapper.
+        if isinstance(schema, dict) and isinstance(schema.get("$ref"), str) and all(key == "$ref" or key in _EXPRESSIONS - {"type", "enum", "const"} for key in schema):
+            self.resolve(schema["$ref"])
+
+            return "valid(%s, %s)" % (self.definition(schema["$ref"]), variable)
+
+        return "valid(%s, %s)" % (self.function(schema), variable)
+
+    def alternatives(self, schemas: typing.List[typing.Any], variable: str) -> typing.List[str]:
+        """
+        Returns the validity expression of each alternative, ordering inline expression(s) before function call(s).
+        """
+
+        return sorted((self.validity(schema, variable) for schema in schemas), key=lambda expression: expression.startswith("valid("))
+
+    def emit(self, schema: typing.Any, variable: str, path: typing.Tuple[str, typing.Tuple[str, ...]], lines: typing.List[str], depth: int, root: bool = False) -> None:
+        """
+        Emits the check(s) of a (sub)schema against a variable, at the given indentation depth.
+        """
+
+        pad = "    " * depth
+
+        if schema is True:
+            return
+
+        if schema is False:
+            self.fail(lines, depth, path, "\"False schema does not allow %%r\" %% (%s,)" % variable)
+
+            return
+
+        if not isinstance(schema, dict):
+            raise Unsupported("Invalid Schema: %r" % (schema,))
+
+        for keyword in schema:
+            if keyword in UNSUPPORTED:
+                raise Unsupported("Unsupported Keyword: %s" % keyword)
+
+        # Generated definition(s) repeat the root's `$schema`, which is harmless; another draft, or identifier, is not.
+        if not root and ("$id" in schema or str(schema.get("$schema", DRAFT)).rstrip("#") != DRAFT):
+            raise Unsupported("Unsupported Embedded Schema Resource")
+
+        if isinstance(schema.get("$ref"), str):
+            reference = schema["$ref"]
+
+            target = self.resolve(reference)
+
+            if self._counts[reference] == 1 and reference not in self._recursive:
+                self.emit(target, variable, path, lines, depth)
+            else:
+                lines.append("%s%s(%s, %s, errors, first)" % (pad, self.definition(reference), variable, self.path(path)))
+                lines.append("%sif first and errors:" % pad)
+                lines.append("%s    return" % pad)
+
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+
+            lines.append("%sif not (%s):" % (pad, " or ".join(self.type(name, variable) for name in types)))
+
+            self.fail(lines, depth + 1, path, "\"%%r is not of type %s\" %% (%s,)" % (", ".join(repr(name) for name in types).replace("%", "%%"), variable))
+
+        if "enum" in schema:
+            lines.append("%sif not %s:" % (pad, self.membership(schema["enum"], variable)))
+
+            self.fail(lines, depth + 1, path, "\"%%r is not one of %%r\" %% (%s, %s)" % (variable, self.constant(repr(schema["enum"]))))
+
+        if "const" in schema:
+            value = self.constant(repr(schema["const"]))
+
+            lines.append("%sif not equal(%s, %s):" % (pad, variable, value))
+
+            self.fail(lines, depth + 1, path, "\"%%r was expected\" %% (%s,)" % value)
+
+        for entry in schema.get("allOf", ()):
+            self.emit(entry, variable, path, lines, depth)
+
+        if "anyOf" in schema:
+            lines.append("%sif not (%s):" % (pad, " or ".join(self.alternatives(schema["anyOf"], variable))))
+
+            self.fail(lines, depth + 1, path, "\"%%r is not valid under any of the given schemas\" %% (%s,)" % variable)
+
+        if "oneOf" in schema:
+            count = self.name("n")
+
+            lines.append("%s%s = %s" % (pad, count, " + ".join("bool(%s)" % expression for expression in self.alternatives(schema["oneOf"], variable))))
+            lines.append("%sif %s == 0:" % (pad, count))
+
+            self.fail(lines, depth + 1, path, "\"%%r is not valid under any of the given schemas\" %% (%s,)" % variable)
+
+            lines.append("%selif %s > 1:" % (pad, count))
+
+            self.fail(lines, depth + 1, path, "\"%%r is valid under more than one of the given schemas\" %% (%s,)" % variable)
+
+        if "not" in schema:
+            lines.append("%sif %s:" % (pad, self.validity(schema["not"], variable)))
+
+            self.fail(lines, depth + 1, path, "\"%%r should not be valid under %%r\" %% (%s, %s)" % (variable, self.constant(repr(schema["not"]))))
+
+        if "if" in schema and ("then" in schema or "else" in schema):
+            lines.append("%sif %s:" % (pad, self.validity(schema["if"], variable)))
+
+            self.emit(schema.get("then", True), variable, path, lines, depth + 1)
+
+            lines.append("%s    pass" % pad)
+            lines.append("%selse:" % pad)
+
+            self.emit(schema.get("else", True), variable, path, lines, depth + 1)
+
+            lines.append("%s    pass" % pad)
+
+        if "format" in schema:
+            fmt = repr(schema["format"])
+
+            lines.append("%sif formats is not None and not formats.conforms(%s, %s):" % (pad, variable, fmt))
+
+            self.fail(lines, depth + 1, path, "\"%%r is not a %%r\" %% (%s, %s)" % (variable, fmt))
+
+        self.string(schema, variable, path, lines, depth)
+        self.number(schema, variable, path, lines, depth)
+        self.object(schema, variable, path, lines, depth)
+        self.array(schema, variable, path, lines, depth)
+
+    def string(self, schema: typing.Dict[str, typing.Any], variable: str, path: typing.Tuple[str, typing.Tuple[str, ...]], lines: typing.List[str], depth: int) -> None:
+        if not any(keyword in schema for keyword in ("minLength", "maxLength", "pattern")):
+            return
+
+        pad = "    " * (depth + 1)
+
+        lines.append("%sif isinstance(%s, str):" % ("    " * depth, variable))
+
+        if "minLength" in schema:
+            lines.append("%sif len(%s) < %d:" % (pad, variable, schema["minLength"]))
+
+            self.fail(lines, depth + 2, path, "\"%%r %s\" %% (%s,)" % ("should be non-empty" if schema["minLength"] == 1 else "is too short", variable))
+
+        if "maxLength" in schema:
+            lines.append("%sif len(%s) > %d:" % (pad, variable, schema["maxLength"]))
+
+            self.fail(lines, depth + 2, path, "\"%%r %s\" %% (%s,)" % ("is expected to be empty" if schema["maxLength"] == 0 else "is too long", variable))
+
+        if "pattern" in schema:
+            expression = self.constant("re.compile(%r)" % schema["pattern"])
+
+            lines.append("%sif %s.search(%s) is None:" % (pad, expression, variable))
+
+            self.fail(lines, depth + 2, path, "\"%%r does not match %%r\" %% (%s, %s.pattern)" % (variable, expression))
+
+        lines.append("%spass" % pad)
+
+    def number(self, schema: typing.Dict[str, typing.Any], variable: str, path: typing.Tuple[str, typing.Tuple[str, ...]], lines: typing.List[str], depth: int) -> None:
+        bounds = [
+            ("minimum", "<", "%%r is less than the minimum of %r"),
+            ("maximum", ">", "%%r is greater than the maximum of %r"),
+            ("exclusiveMinimum", "<=", "%%r is less than or equal to the minimum of %r"),
+            ("exclusiveMaximum", ">=", "%%r is greater than or equal to the maximum of %r"),
+        ]
+
+        if not any(keyword in schema for keyword, _, _ in bounds) and "multipleOf" not in schema:
+            return
+
+        pad = "    " * (depth + 1)
+
+        lines.append("%sif %s:" % ("    " * depth, self.type("number", variable)))
+
+        for keyword, operator, message in bounds:
+            if keyword in schema:
+                lines.append("%sif %s %s %r:" % (pad, variable, operator, schema[keyword]))
+
+                self.fail(lines, depth + 2, path, "%r %% (%s,)" % (message % schema[keyword], variable))
+
+        if "multipleOf" in schema:
+            lines.append("%sif not multiple(%s, %r):" % (pad, variable, schema["multipleOf"]))
+
+            self.fail(lines, depth + 2, path, "\"%%r is not a multiple of %s\" %% (%s,)" % (str(schema["multipleOf"]).replace("%", "%%"), variable))
+
+        lines.append("%spass" % pad)
+
+    def object(self, schema: typing.Dict[str, typing.Any], variable: str, path: typing.Tuple[str, typing.Tuple[str, ...]], lines: typing.List[str], depth: int) -> None:
+        keywords = ("properties", "required", "additionalProperties", "patternProperties", "minProperties", "maxProperties", "propertyNames", "dependentRequired", "dependentSchemas")
+
+        if not any(keyword in schema for keyword in keywords):
+            return
+
+        pad = "    " * (depth + 1)
+
+        lines.append("%sif isinstance(%s, dict):" % ("    " * depth, variable))
+
+        for name in schema.get("required", ()):
+            lines.append("%sif %r not in %s:" % (pad, name, variable))
+
+            self.fail(lines, depth + 2, path, "%r" % ("%r is a required property" % name))
+
+        if "minProperties" in schema:
+            lines.append("%sif len(%s) < %d:" % (pad, variable, schema["minProperties"]))
+
+            self.fail(lines, depth + 2, path, "\"%%r %s\" %% (%s,)" % ("should be non-empty" if schema["minProperties"] == 1 else "does not have enough properties", variable))
+
+        if "maxProperties" in schema:
+            lines.append("%sif len(%s) > %d:" % (pad, variable, schema["maxProperties"]))
+
+            self.fail(lines, depth + 2, path, "\"%%r %s\" %% (%s,)" % ("is expected to be empty" if schema["maxProperties"] == 0 else "has too many properties", variable))
+
+        for name, dependencies in schema.get("dependentRequired", {}).items():
+            for dependency in dependencies:
+                lines.append("%sif %r in %s and %r not in %s:" % (pad, name, variable, dependency, variable))
+
+                self.fail(lines, depth + 2, path, "%r" % ("%r is a dependency of %r" % (dependency, name)))
+
+        for name, dependent in schema.get("dependentSchemas", {}).items():
+            lines.append("%sif %r in %s:" % (pad, name, variable))
+
+            self.emit(dependent, variable, path, lines, depth + 2)
+
+            lines.append("%s    pass" % pad)
+
+        for name, subschema in schema.get("properties", {}).items():
+            if subschema is True or subschema == {}:
+                continue
+
+            value = self.name("v")
+
+            lines.append("%s%s = %s.get(%r, MISSING)" % (pad, value, variable, name))
+            lines.append("%sif %s is not MISSING:" % (pad, value))
+
+            self.emit(subschema, value, (path[0], path[1] + (repr(name),)), lines, depth + 2)
+
+            lines.append("%s    pass" % pad)
+
+        patterns = schema.get("patternProperties", {})
+
+        if patterns:
+            key, value = self.name("k"), self.name("v")
+
+            lines.append("%sfor %s, %s in %s.items():" % (pad, key, value, variable))
+
+            for pattern, subschema in patterns.items():
+                lines.append("%s    if %s.search(%s) is not None:" % (pad, self.constant("re.compile(%r)" % pattern), key))
+
+                self.emit(subschema, value, (path[0], path[1] + (key,)), lines, depth + 3)
+
+                lines.append("%s        pass" % pad)
+
+        if "propertyNames" in schema:
+            key = self.name("k")
+
+            lines.append("%sfor %s in %s:" % (pad, key, variable))
+
+            self.emit(schema["propertyNames"], key, path, lines, depth + 2)
+
+            lines.append("%s    pass" % pad)
+
+        additional = schema.get("additionalProperties", True)
+
+        if additional is not True and additional != {}:
+            names = self.constant(repr(frozenset(schema.get("properties", {}))))
+            expression = self.constant("re.compile(%r)" % "|".join(patterns)) if patterns else None
+
+            key = self.name("k")
+            condition = "%s not in %s" % (key, names) + (" and %s.search(%s) is None" % (expression, key) if expression else "")
+
+            if additional is False:
+                extras = self.name("e")
+
+                lines.append("%s%s = [%s for %s in %s if %s]" % (pad, extras, key, key, variable, condition))
+                lines.append("%sif %s:" % (pad, extras))
+
+                if "patternProperties" in schema:
+                    # As with `jsonschema`, extra(s) are instead reported as matching none of the pattern(s).
+                    regexes = self.constant(repr(", ".join(repr(pattern) for pattern in sorted(patterns))))
+
+                    message = "\"%%s %%s not match any of the regexes: %%s\" %% (\", \".join(repr(extra) for extra in sorted(%s)), \"does\" if len(%s) == 1 else \"do\", %s)" % (extras, extras, regexes)
+                else:
+                    message = "\"Additional properties are not allowed (%%s %%s unexpected)\" %% (\", \".join(repr(extra) for extra in sorted(%s, key=str)), \"was\" if len(%s) == 1 else \"were\")" % (extras, extras)
+
+                self.fail(lines, depth + 2, path, message)
+            else:
+                value = self.name("v")
+
+                lines.append("%sfor %s, %s in %s.items():" % (pad, key, value, variable))
+                lines.append("%s    if %s:" % (pad, condition))
+
+                self.emit(additional, value, (path[0], path[1] + (key,)), lines, depth + 3)
+
+                lines.append("%s        pass" % pad)
+
+        lines.append("%spass" % pad)
+
+    def array(self, schema: typing.Dict[str, typing.Any], variable: str, path: typing.Tuple[str, typing.Tuple[str, ...]], lines: typing.List[str], depth: int) -> None:
+        keywords = ("items", "prefixItems", "minItems", "maxItems", "uniqueItems", "contains")
+
+        if not any(keyword in schema for keyword in keywords):
+            return
+
+        pad = "    " * (depth + 1)
+
+        lines.append("%sif isinstance(%s, list):" % ("    " * depth, variable))
+
+        if "minItems" in schema:
+            lines.append("%sif len(%s) < %d:" % (pad, variable, schema["minItems"]))
+
+            self.fail(lines, depth + 2, path, "\"%%r %s\" %% (%s,)" % ("should be non-empty" if schema["minItems"] == 1 else "is too short", variable))
+
+        if "maxItems" in schema:
+            lines.append("%sif len(%s) > %d:" % (pad, variable, schema["maxItems"]))
+
+            self.fail(lines, depth + 2, path, "\"%%r %s\" %% (%s,)" % ("is expected to be empty" if schema["maxItems"] == 0 else "is too long", variable))
+
+        if schema.get("uniqueItems") is True:
+            lines.append("%sif not unique(%s):" % (pad, variable))
+
+            self.fail(lines, depth + 2, path, "\"%%r has non-unique elements\" %% (%s,)" % variable)
+
+        prefix = schema.get("prefixItems", [])
+
+        for index, subschema in enumerate(prefix):
+            lines.append("%sif len(%s) > %d:" % (pad, variable, index))
+
+            value = self.name("v")
+
+            lines.append("%s    %s = %s[%d]" % (pad, value, variable, index))
+
+            self.emit(subschema, value, (path[0], path[1] + (str(index),)), lines, depth + 2)
+
+            lines.append("%s    pass" % pad)
+
+        items = schema.get("items", True)
+
+        if items is False:
+            lines.append("%sif len(%s) > %d:" % (pad, variable, len(prefix)))
+
+            message = "\"Expected at most %d %s but found %%d extra: %%r\" %% (len(%s) - %d, %s[%d:] if len(%s) - %d != 1 else %s[%d])"
+            message %= (len(prefix), "item" if len(prefix) == 1 else "items", variable, len(prefix), variable, len(prefix), variable, len(prefix), variable, len(prefix))
+
+            self.fail(lines, depth + 2, path, message)
+        elif items is not True and items != {}:
+            index, value = self.name("i"), self.name("v")
+
+            lines.append("%sfor %s in range(%d, len(%s)):" % (pad, index, len(prefix), variable))
+            lines.append("%s    %s = %s[%s]" % (pad, value, variable, index))
+
+            self.emit(items, value, (path[0], path[1] + (index,)), lines, depth + 2)
+
+        if "contains" in schema:
+            value, count = self.name("v"), self.name("n")
+
+            minimum, maximum = schema.get("minContains", 1), schema.get("maxContains")
+
+            lines.append("%s%s = sum(1 for %s in %s if %s)" % (pad, count, value, variable, self.validity(schema["contains"], value)))
+
+            if maximum is not None:
+                lines.append("%sif %s > %d:" % (pad, count, maximum))
+
+                self.fail(lines, depth + 2, path, repr("Too many items match the given schema (expected at most %d)" % maximum))
+
+            if minimum > 0:
+                lines.append("%sif %s < %d:" % (pad, count, minimum))
+
+                message = "\"%%r does not contain items matching the given schema\" %% (%s,)" % variable
+                message += " if not %s else \"Too few items match the given schema (expected at least %d but only %%d matched)\" %% (%s,)" % (count, minimum, count)
+
+                self.fail(lines, depth + 2, path, message)
+
+        lines.append("%spass" % pad)
+
+    def generate(self, digest: str) -> str:
+        if isinstance(self.schema, dict) and "$schema" in self.schema and self.schema["$schema"].rstrip("#") != DRAFT:
+            raise Unsupported("Unsupported Draft: %s" % self.schema["$schema"])
+
+        lines: typing.List[str] = []
+
+        self.emit(self.schema, "x", ("path", ()), lines, 1, root=True)
+
+        self.functions.insert(0, "def validate(x, path, errors, first):\n%s\n" % ("\n".join(lines) or "    pass"))
+
+        return "\n".join([
+            "\"\"\"",
+            "Generated by polyium.validation.compiler (version %d) from a JSON schema (sha256: %s); do not edit." % (VERSION, digest),
+            "\"\"\"",
+            "",
+            "import re",
+            "",
+            "from polyium.validation.compiler import MISSING, equal, member, multiple, unique, valid",
+            "",
+            "# The format checker, assigned upon load; None if the format keyword isn't asserted.",
+            "formats = None",
+            "",
+            *self.constants,
+            "",
+            *self.functions,
+        ])
+
+def generate(schema: typing.Any) -> str:
+    """
+    Translates a JSON schema into a Python module's source code.
+
+    The module defines `validate(x, path, errors, first)`, which appends a `(path, message)` pair per failure to
+    `errors`, returning upon the first failure if `first` is true.
+
+    Raises
+    ------
+    Unsupported
+        If the schema uses an unsupported keyword, or draft.
+    """
+
+    return _Generator(schema).generate(polyium.validation.validators.digest(schema))
+
+class Compiled:
+    """
+    A validator executing a schema's generated source; implements the subset of `jsonschema.protocols.Validator` used
+    by this package (`is_valid`, `iter_errors`, and `validate`).
+
+    :ivar schema: The JSON schema.
+    :ivar source: The generated source code.
+    """
+
+    def __init__(self, schema: typing.Any, source: str, function: typing.Callable[..., None]):
+        self.schema = schema
+        self.source = source
+
+        self._function = function
+
+    def errors(self, instance: typing.Any, first: bool = False) -> typing.List[typing.Tuple[typing.Tuple[typing.Union[str, int], ...], str]]:
+        """
+        Validates an instance, returning a `(path, message)` pair per failure.
+
+        Parameters
+        ----------
+        instance : typing.Any
+            The instance.
+        first : bool
+            Whether to stop at the first failure.
+        """
+
+        errors: typing.List[typing.Tuple[typing.Tuple[typing.Union[str, int], ...], str]] = []
+
+        self._function(instance, (), errors, first)
+
+        return errors
+
+    def is_valid(self, instance: typing.Any) -> bool:
+        return not self.errors(instance, first=True)
+
+    def iter_errors(self, instance: typing.Any) -> typing.Iterator[jsonschema.exceptions.ValidationError]:
+        for path, message in self.errors(instance):
+            yield jsonschema.exceptions.ValidationError(message, path=collections.deque(path), instance=instance, schema=self.schema)
+
+    def validate(self, instance: typing.Any) -> None:
+        """
+        Raises
+        ------
+        jsonschema.exceptions.ValidationError
+            Upon the instance's first failure.
+        """
+
+        for path, message in self.errors(instance, first=True):
+            raise jsonschema.exceptions.ValidationError(message, path=collections.deque(path), instance=instance, schema=self.schema)
+
+def location(schema: typing.Any, directory: typing.Union[str, os.PathLike]) -> pathlib.Path:
+    """
+    Returns the path of a schema's compiled module, keyed by its content hash and :data:`VERSION`.
+    """
+
+    return pathlib.Path(directory).joinpath("polyium_validator_%s_%d.py" % (polyium.validation.validators.digest(schema)[:32], VERSION))
+
+def load(schema: typing.Any, directory: typing.Optional[typing.Union[str, os.PathLike]] = None, formats: bool = True) -> Compiled:
+    """
+    Loads a schema's compiled module from the directory, generating (and storing) it upon a miss.
+
+    Parameters
+    ----------
+    schema : typing.Any
+        The parsed schema.
+    directory : str | os.PathLike | None
+        The compiled module directory, created private to the user if missing; None compiles the generated source
+        in-memory, without caching it, as does a directory (or module) that isn't private to the user.
+    formats : bool
+        Whether to assert the `format` keyword using the draft's format checker.
+
+    Raises
+    ------
+    Unsupported
+        If the schema uses an unsupported keyword, or draft.
+    """
+
+    namespace: typing.Any
+
+    if directory is None:
+        source = generate(schema)
+
+        namespace = types.ModuleType("polyium_validator")
+
+        exec(builtins.compile(source, "<generated>", "exec"), namespace.__dict__)
+    else:
+        path = location(schema, directory)
+        name = path.stem
+
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        if not trusted(path.parent):
+            logger.warning("Untrusted Compiled Validator Directory (Not Private to the User), Compiling In-Memory: %s", path.parent)
+
+            return load(schema, None, formats=formats)
+
+        if os.path.lexists(path) and not trusted(path):
+            logger.warning("Untrusted Compiled Validator (Not Private to the User), Compiling In-Memory: %s", path)
+
+            return load(schema, None, formats=formats)
+
+        try:
+            source = path.read_text("utf-8")
+        except FileNotFoundError:
+            source = generate(schema)
+
+            # Written atomically, as concurrent process(es) may load (or store) the same schema's module.
+            descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=".%s." % name, suffix=".tmp")
+
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                    handle.write(source)
+
+                os.replace(temporary, path)
+            except BaseException:
+                pathlib.Path(temporary).unlink(missing_ok=True)
+
+                raise
+
+            logger.debug("Stored Compiled Validator: %s", path)
+
+        specification = importlib.util.spec_from_file_location(name, path)
+
+        namespace = importlib.util.module_from_spec(specification)
+
+        specification.loader.exec_module(namespace)
+
+    namespace.formats = jsonschema.Draft202012Validator.FORMAT_CHECKER if formats else None
+
+    return Compiled(schema, source, namespace.validate)
+
+def compile(schema: typing.Any, directory: typing.Optional[typing.Union[str, os.PathLike]] = None, formats: bool = True, registry: typing.Optional[referencing.Registry] = None) -> typing.Union[Compiled, jsonschema.protocols.Validator]:
+    """
+    Compiles a schema into generated Python source, falling back to a `jsonschema` validator if it's unsupported.
+
+    The schema is checked against its metaschema either way, unless its (trusted) compiled module is already stored.
+
+    Parameters
+    ----------
+    schema : typing.Any
+        The parsed schema.
+    directory : str | os.PathLike | None
+        The compiled module directory, see :func:`load`.
+    formats : bool
+        Whether to assert the `format` keyword.
+    registry : referencing.Registry | None
+        The registry of the fallback `jsonschema` validator (see `polyium.validation.validators.registry`); schema(s)
+        with non-local reference(s) are never compiled.
+
+    Raises
+    ------
+    jsonschema.exceptions.SchemaError
+        If the schema is invalid under its metaschema.
+    """
+
+    # A stored module's schema was checked before it was stored.
+    if directory is not None and trusted(directory) and trusted(location(schema, directory)):
+        return load(schema, directory, formats=formats)
+
+    cls = jsonschema.validators.validator_for(schema, default=polyium.validation.validators.default)
+
+    cls.check_schema(schema)
+
+    try:
+        if cls is not jsonschema.Draft202012Validator:
+            raise Unsupported("Unsupported Draft: %s" % cls.META_SCHEMA.get("$id"))
+
+        return load(schema, directory, formats=formats)
+    except Unsupported as e:
+        logger.debug("Unable to Compile Schema, Falling Back to jsonschema: %s", e)
+
+        return polyium.validation.validators.instantiate(cls, schema, formats, registry)
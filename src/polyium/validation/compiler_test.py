@@ -0,0 +1,220 @@
+import json
+import os
+import pathlib
+import typing
+
+import jsonschema
+import pydantic
+import pytest
+import logging
+
+import polyium.models.base
+import polyium.schemas.optimization
+import polyium.schemas.sampling
+import polyium.schemas.sampling_test
+import polyium.validation.compiler as module
+
+logger = logging.getLogger(__name__)
+
+def mutations(instance: typing.Any) -> typing.Iterator[typing.Any]:
+    """
+    Yields the instance, and a copy per property replaced (or removed), recursively.
+    """
+
+    yield instance
+
+    if isinstance(instance, dict):
+        for key, value in instance.items():
+            yield {k: v for k, v in instance.items() if k != key}
+
+            for replacement in [None, True, 1.5, -1, "", "x" * 9, [1, 1], {"extra": 1}, *mutations(value)]:
+                yield {**instance, key: replacement}
+
+    if isinstance(instance, list) and instance:
+        yield instance + instance[:1]
+
+        for replacement in mutations(instance[0]):
+            yield [replacement, *instance[1:]]
+
+@pytest.mark.parametrize("profile", ["default", "runtime"])
+@pytest.mark.parametrize("model", [polyium.schemas.sampling_test.Event, polyium.schemas.sampling_test.Node, polyium.models.base.Base])
+def test_equivalence(request: pytest.FixtureRequest, model: type[pydantic.BaseModel], profile: str):
+    """
+    Tests that compiled validator(s) report the same failure(s), at the same path(s), as `jsonschema`.
+    """
+
+    schema = polyium.schemas.optimization.optimize(model.model_json_schema(), polyium.schemas.optimization.select(profile))
+
+    validator = module.compile(schema)
+
+    assert isinstance(validator, module.Compiled)
+
+    reference = jsonschema.Draft202012Validator(schema, format_checker=jsonschema.Draft202012Validator.FORMAT_CHECKER)
+
+    count = 0
+
+    for line in b"".join(polyium.schemas.sampling.stream(schema, 20, seed=5, jobs=1)).splitlines():
+        for instance in mutations(json.loads(line)):
+            count += 1
+
+            expected = sorted((tuple(error.absolute_path), error.message) for error in reference.iter_errors(instance))
+
+            assert sorted(validator.errors(instance)) == expected, instance
+            assert validator.is_valid(instance) is not expected
+
+    logger.debug("[%s] Compared %d Instance(s)", request.node.name, count)
+
+def test_keywords(request: pytest.FixtureRequest):
+    schema = {
+        "type": "object",
+        "properties": {
+            "array": {"type": "array", "prefixItems": [{"type": "integer"}], "items": False, "uniqueItems": True, "contains": {"const": 1}, "maxContains": 1},
+            "value": {"oneOf": [{"type": "integer", "multipleOf": 3}, {"type": "number", "maximum": 10}], "not": {"enum": [1, True]}},
+            "string": {"if": {"type": "string"}, "then": {"pattern": "^x"}, "else": {"type": "integer"}},
+        },
+        "patternProperties": {"^a": {"type": "integer"}},
+        "additionalProperties": {"type": "string"},
+        "propertyNames": {"maxLength": 6},
+        "dependentRequired": {"array": ["value"]},
+    }
+
+    validator, reference = module.compile(schema), jsonschema.Draft202012Validator(schema)
+
+    instances = [
+        {"array": [1], "value": 12, "string": "xy", "a1": 1, "other": "text"},
+        {"array": [1, 2], "value": 1, "string": "y"},
+        {"array": [2], "value": 9, "string": 1.5, "a1": "1", "other": 1, "too-long": ""},
+        {"value": True, "string": 3},
+    ]
+
+    # Only the message of a oneOf failure matching several schema(s) differs, as the compiled check doesn't name them.
+    for instance in instances:
+        assert sorted(path for path, _ in validator.errors(instance)) == sorted(tuple(error.absolute_path) for error in reference.iter_errors(instance))
+        assert {message for _, message in validator.errors(instance)} - {error.message for error in reference.iter_errors(instance)} <= {"9 is valid under more than one of the given schemas"}
+
+@pytest.mark.parametrize("properties", [{}, {"x": {}}])
+def test_additional_patterns(request: pytest.FixtureRequest, properties: dict):
+    """
+    Tests that, alongside `patternProperties`, disallowed additional propert(ies) are reported as `jsonschema` does.
+    """
+
+    schema = {"type": "object", "properties": properties, "patternProperties": {"^c": {}, "^a%s": {}}, "additionalProperties": False}
+
+    validator, reference = module.compile(schema), jsonschema.Draft202012Validator(schema)
+
+    assert isinstance(validator, module.Compiled)
+
+    for instance in ({"a%s": 1, "x": 1}, {"b": 1}, {"b": 1, "d": 2, "c": 3}):
+        assert sorted(validator.errors(instance)) == sorted((tuple(error.absolute_path), error.message) for error in reference.iter_errors(instance))
+
+def test_first(request: pytest.FixtureRequest):
+    """
+    Tests that early exit stops at the first failure, and that `validate` raises it.
+    """
+
+    validator = module.compile(polyium.schemas.sampling_test.Node.model_json_schema())
+
+    instance = {"name": "", "children": [{"name": 1}, {}]}
+
+    assert len(validator.errors(instance)) == 3
+    assert validator.errors(instance, first=True) == [(("name",), "'' should be non-empty")]
+
+    with pytest.raises(jsonschema.exceptions.ValidationError) as e:
+        validator.validate(instance)
+
+    assert list(e.value.absolute_path) == ["name"]
+
+    assert [list(error.absolute_path) for error in validator.iter_errors(instance)] == [["name"], ["children", 0, "name"], ["children", 1]]
+
+def test_formats(request: pytest.FixtureRequest):
+    schema = {"type": "string", "format": "date"}
+
+    assert not module.compile(schema).is_valid("today")
+    assert module.compile(schema, formats=False).is_valid("today")
+
+@pytest.mark.parametrize("schema", [
+    {"type": "object", "unevaluatedProperties": False},
+    {"$defs": {"a": {"$dynamicAnchor": "a"}}, "$dynamicRef": "#a"},
+    {"$ref": "https://json-schema.org/draft/2020-12/schema"},
+    {"properties": {"a": {"$id": "https://example.com/a", "type": "string"}}},
+    {"$schema": "http://json-schema.org/draft-07/schema#", "type": "string"},
+])
+def test_fallback(request: pytest.FixtureRequest, schema: dict):
+    """
+    Tests that a schema using an unsupported keyword, or draft, falls back to a `jsonschema` validator.
+    """
+
+    with pytest.raises(module.Unsupported):
+        module.generate(schema)
+
+    assert isinstance(module.compile(schema), jsonschema.protocols.Validator)
+
+def test_invalid_schema(request: pytest.FixtureRequest):
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        module.compile({"type": "unknown"})
+
+def test_directory(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that the generated module is stored by schema hash, and loaded (rather than regenerated) upon reuse.
+    """
+
+    schema = polyium.schemas.sampling_test.Event.model_json_schema()
+
+    validator = module.compile(schema, directory=directory)
+
+    paths = list(directory.glob("*.py"))
+
+    assert len(paths) == 1
+    assert paths[0].read_text() == validator.source == module.generate(schema)
+
+    paths[0].write_text(validator.source.replace("formats = None", "formats = None\nloaded = True"))
+
+    assert "loaded = True" in module.compile(schema, directory=directory).source
+    assert module.compile(schema, directory=directory).is_valid({"identifier": "not-a-uuid"}) is False
+
+    module.compile(polyium.schemas.sampling_test.Node.model_json_schema(), directory=directory)
+
+    assert len(list(directory.glob("*.py"))) == 2
+
+def test_untrusted(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that a module planted in a directory that isn't private to the user, or that isn't itself private to the user,
+    is never executed.
+    """
+
+    schema = {"type": "integer"}
+
+    directory.chmod(0o700)
+
+    path = module.location(schema, directory)
+    path.write_text("def validate(x, path, errors, first):\n    pass\n")
+
+    path.chmod(0o666)
+
+    assert not module.compile(schema, directory=directory).is_valid("text")
+
+    path.chmod(0o600)
+    directory.chmod(0o777)
+
+    assert not module.compile(schema, directory=directory).is_valid("text")
+
+    directory.chmod(0o700)
+
+    if hasattr(os, "getuid") and os.getuid() == 0:
+        os.chown(path, 65534, 65534)
+
+        assert not module.compile(schema, directory=directory).is_valid("text")
+
+        os.chown(path, 0, 0)
+
+    # Once private to the user, the stored module is trusted as-is.
+    assert module.compile(schema, directory=directory).is_valid("text")
+
+def test_default(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch, directory: pathlib.Path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(directory))
+
+    assert module.default() == directory.joinpath("json-schema-cli", "validators")
+
+    module.compile({"type": "string"}, directory=module.default())
+
+    assert module.default().stat().st_mode & 0o777 == 0o700
@@ -0,0 +1,261 @@
+"""
+The ndjson module validates newline-delimited JSON document(s) at scale.
+
+The input is memory-mapped and split into shard(s) at newline boundaries, so no process ever holds more than a shard's
+line(s) at once. Shard(s) are validated across a process pool, where every worker compiles (and keeps) its own
+validator, and failure(s) are streamed back in input order with their absolute line number(s).
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import dataclasses
+import json
+import logging
+import mmap
+import os
+import typing
+
+import jsonschema.protocols
+
+import polyium.validation.validators
+
+logger = logging.getLogger(__name__)
+
+# The default shard size, in bytes.
+SHARD_SIZE = 4 * 1024 * 1024
+
+@dataclasses.dataclass(frozen=True)
+class Shard:
+    """
+    A newline-aligned byte range of an NDJSON file.
+
+    :ivar path: The file's path.
+    :ivar start: The inclusive start offset.
+    :ivar end: The exclusive end offset; either the end of the file, or immediately after a newline.
+    """
+
+    path: str
+    start: int
+    end: int
+
+@dataclasses.dataclass(frozen=True)
+class Failure:
+    """
+    A validation failure.
+
+    :ivar line: The 1-based line number, relative to the shard until re-based by :func:`stream`.
+    :ivar pointer: The JSON pointer of the failing instance.
+    :ivar message: The failure's description.
+    """
+
+    line: int
+    pointer: str
+    message: str
+
+@dataclasses.dataclass(frozen=True)
+class Outcome:
+    """
+    The result of validating a :class:`Shard`.
+
+    :ivar lines: The number of line(s) in the shard.
+    :ivar failures: The shard's failure(s), with shard-relative line number(s).
+    """
+
+    lines: int
+    failures: typing.List[Failure]
+
+def shards(path: typing.Union[str, os.PathLike], size: int = SHARD_SIZE) -> typing.Iterator[Shard]:
+    """
+    Lazily splits an NDJSON file into newline-aligned shard(s) of approximately the given size.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The file's path.
+    size : int
+        The target shard size, in bytes; a shard is extended to the end of the line it would otherwise split.
+
+    Yields
+    ------
+    Shard
+        The file's shard(s), in order.
+    """
+
+    path = os.fspath(path)
+
+    length = os.path.getsize(path)
+
+    if length == 0:
+        return
+
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        start = 0
+
+        while start < length:
+            end = min(start + max(size, 1), length)
+
+            if end < length:
+                newline = mapping.find(b"\n", end - 1)
+
+                end = length if newline == -1 else newline + 1
+
+            yield Shard(path=path, start=start, end=end)
+
+            start = end
+
+# The worker process's validator, compiled once by :func:`initialize`.
+validator: typing.Optional[jsonschema.protocols.Validator] = None
+
+def initialize(schema: bytes, formats: bool = True, compiled: bool = False, directory: typing.Optional[str] = None, location: typing.Optional[str] = None) -> None:
+    """
+    Initializes a worker process's validator.
+
+    Parameters
+    ----------
+    schema : bytes
+        The raw schema.
+    formats : bool
+        Whether to assert the `format` keyword.
+    compiled : bool
+        Whether to compile the schema into generated Python source, see `polyium.validation.compiler`.
+    directory : str | None
+        The generated source's on-disk cache directory, shared by every worker.
+    location : str | None
+        The schema file's path, against which non-local reference(s) resolve.
+    """
+
+    global validator
+
+    validator = polyium.validation.validators.Cache(maximum=1, formats=formats, compiled=compiled, directory=directory, location=location).get(schema)
+
+def validate(shard: Shard, instance: typing.Optional[jsonschema.protocols.Validator] = None) -> Outcome:
+    """
+    Validates every (non-blank) line of a shard.
+
+    Parameters
+    ----------
+    shard : Shard
+        The shard.
+    instance : jsonschema.protocols.Validator | None
+        The validator; defaults to the worker's validator, see :func:`initialize`.
+
+    Returns
+    -------
+    Outcome
+        The shard's line count and failure(s).
+    """
+
+    instance = instance or validator
+
+    if instance is None:
+        raise RuntimeError("The worker's validator has not been initialized")
+
+    failures: typing.List[Failure] = []
+
+    lines = 0
+
+    with open(shard.path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        position = shard.start
+
+        while position < shard.end:
+            newline = mapping.find(b"\n", position, shard.end)
+
+            end = shard.end if newline == -1 else newline
+
+            lines += 1
+
+            content = mapping[position:end]
+
+            position = end + 1
+
+            if not content.strip():
+                continue
+
+            try:
+                document = json.loads(content)
+            except ValueError as e:
+                failures.append(Failure(line=lines, pointer="", message="Invalid JSON: %s" % e))
+
+                continue
+
+            for error in instance.iter_errors(document):
+                failures.append(Failure(line=lines, pointer=polyium.validation.validators.pointer(error.absolute_path), message=error.message))
+
+    return Outcome(lines=lines, failures=failures)
+
+def stream(path: typing.Union[str, os.PathLike], schema: bytes, jobs: typing.Optional[int] = None, size: int = SHARD_SIZE, formats: bool = True, compiled: bool = False, directory: typing.Optional[str] = None, location: typing.Optional[str] = None) -> typing.Iterator[Failure]:
+    """
+    Validates an NDJSON file, streaming failure(s) in line order.
+
+    At most two shard(s) per worker are in flight at any time, so memory use is independent of the file's size.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The file's path.
+    schema : bytes
+        The raw schema.
+    jobs : int | None
+        The number of worker process(es). Defaults to the system's CPU count; a single job validates in-process.
+    size : int
+        The target shard size, in bytes.
+    formats : bool
+        Whether to assert the `format` keyword.
+    compiled : bool
+        Whether to compile the schema into generated Python source, see `polyium.validation.compiler`.
+    directory : str | None
+        The generated source's on-disk cache directory.
+    location : str | None
+        The schema file's path, against which non-local reference(s) resolve, see
+        `polyium.validation.validators.registry`.
+
+    Yields
+    ------
+    Failure
+        Every failure, with absolute (file-relative) line number(s).
+    """
+
+    jobs = max(1, jobs or os.cpu_count() or 1)
+
+    offset = 0
+
+    if jobs == 1:
+        instance = polyium.validation.validators.Cache(maximum=1, formats=formats, compiled=compiled, directory=directory, location=location).get(schema)
+
+        for shard in shards(path, size):
+            outcome = validate(shard, instance)
+
+            for failure in outcome.failures:
+                yield dataclasses.replace(failure, line=failure.line + offset)
+
+            offset += outcome.lines
+
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=initialize, initargs=(schema, formats, compiled, directory, location)) as executor:
+        pending: collections.deque[concurrent.futures.Future] = collections.deque()
+
+        iterator = shards(path, size)
+
+        for shard in iterator:
+            pending.append(executor.submit(validate, shard))
+
+            if len(pending) < jobs * 2:
+                continue
+
+            outcome = pending.popleft().result()
+
+            for failure in outcome.failures:
+                yield dataclasses.replace(failure, line=failure.line + offset)
+
+            offset += outcome.lines
+
+        while pending:
+            outcome = pending.popleft().result()
+
+            for failure in outcome.failures:
+                yield dataclasses.replace(failure, line=failure.line + offset)
+
+            offset += outcome.lines
@@ -0,0 +1,112 @@
+import json
+import pathlib
+import shutil
+import tempfile
+
+import pytest
+import logging
+
+import polyium.validation.ndjson as module
+
+logger = logging.getLogger(__name__)
+
+schema = json.dumps({
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "properties": {"name": {"type": "string"}, "items": {"type": "array", "items": {"type": "integer"}}},
+    "required": ["name"],
+}).encode("utf-8")
+
+@pytest.fixture()
+def document(request: pytest.FixtureRequest) -> pathlib.Path:
+    """
+    Creates an NDJSON document, named after the test, with a failure on every tenth line.
+    """
+
+    temporary = pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name)
+
+    shutil.rmtree(temporary, ignore_errors=True)
+
+    temporary.mkdir(parents=True)
+
+    lines = []
+
+    for index in range(1, 201):
+        if index % 10 == 0:
+            lines.append(json.dumps({"name": index, "items": [1, "two"]}))
+        elif index % 50 == 7:
+            lines.append("")
+        else:
+            lines.append(json.dumps({"name": "document-%d" % index, "items": list(range(index % 5))}))
+
+    path = temporary.joinpath("documents.ndjson")
+    path.write_text("\n".join(lines))
+
+    try:
+        yield path
+    finally:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+def test_shards_newline_aligned(request: pytest.FixtureRequest, document: pathlib.Path):
+    """
+    Tests that shard(s) cover the entire file, and that every shard boundary immediately follows a newline.
+    """
+
+    content = document.read_bytes()
+
+    shards = list(module.shards(document, size=100))
+
+    logger.debug("Shard(s): %d", len(shards))
+
+    assert len(shards) > 1
+    assert shards[0].start == 0
+    assert shards[-1].end == len(content)
+
+    for previous, current in zip(shards, shards[1:]):
+        assert previous.end == current.start
+        assert content[current.start - 1:current.start] == b"\n"
+
+def test_shards_empty(request: pytest.FixtureRequest, document: pathlib.Path):
+    document.write_bytes(b"")
+
+    assert list(module.shards(document)) == []
+
+@pytest.mark.parametrize("size", [1, 64, module.SHARD_SIZE])
+def test_stream_line_numbers(request: pytest.FixtureRequest, document: pathlib.Path, size: int):
+    """
+    Tests that failure(s) carry absolute line number(s) and pointer(s), independent of the shard size.
+    """
+
+    failures = list(module.stream(document, schema, jobs=1, size=size))
+
+    assert [failure.line for failure in failures if failure.pointer == "/name"] == list(range(10, 201, 10))
+    assert [failure.line for failure in failures if failure.pointer == "/items/1"] == list(range(10, 201, 10))
+
+def test_stream_invalid_json(request: pytest.FixtureRequest, document: pathlib.Path):
+    document.write_text('{"name": "a"}\n{"name": \n{"name": "c"}\n')
+
+    failures = list(module.stream(document, schema, jobs=1))
+
+    assert len(failures) == 1
+    assert failures[0].line == 2
+    assert failures[0].message.startswith("Invalid JSON")
+
+def test_stream_parallel(request: pytest.FixtureRequest, document: pathlib.Path):
+    """
+    Tests that parallel validation streams the same failure(s), in the same order, as in-process validation.
+    """
+
+    assert list(module.stream(document, schema, jobs=2, size=256)) == list(module.stream(document, schema, jobs=1, size=256))
+
+def test_stream_compiled(request: pytest.FixtureRequest, document: pathlib.Path):
+    """
+    Tests that compiled validator(s), sharing an on-disk cache across worker(s), stream the same failure(s) as `jsonschema`.
+    """
+
+    directory = str(document.parent.joinpath("validators"))
+
+    assert list(module.stream(document, schema, jobs=2, size=256, compiled=True, directory=directory)) == list(module.stream(document, schema, jobs=1, size=256))
+
+def test_validate_uninitialized(request: pytest.FixtureRequest, document: pathlib.Path):
+    with pytest.raises(RuntimeError):
+        module.validate(next(module.shards(document)))
@@ -0,0 +1,278 @@
+"""
+The validators module compiles JSON schema(s) into `jsonschema` validator(s), and keeps compiled validator(s) in a
+process-wide, least-recently-used cache keyed by the schema's content hash.
+
+Building a validator checks the schema against its metaschema and resolves its vocabulary, which is far more expensive
+than validating a single, typical document; validator(s) should therefore be compiled once and reused.
+
+A schema read from a file may reference sibling file(s) (e.g. a bundle's `defs.json`, see `polyium.schemas.bundle`);
+:func:`registry` resolves such reference(s) relative to the schema's location.
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+import typing
+import urllib.parse
+import urllib.request
+
+import jsonschema
+import jsonschema.protocols
+import jsonschema.validators
+import referencing
+import referencing.exceptions
+import referencing.jsonschema
+
+logger = logging.getLogger(__name__)
+
+# The default metaschema, matching the `$schema` injected by `polyium.models.configuration.default()`.
+default = jsonschema.Draft202012Validator
+
+def digest(schema: typing.Union[bytes, str, typing.Mapping[str, typing.Any]]) -> str:
+    """
+    Computes a schema's content hash.
+
+    Raw content is hashed as-is, avoiding parsing; parsed schema(s) are hashed via their canonical (sorted, compact)
+    JSON serialization.
+
+    Parameters
+    ----------
+    schema : bytes | str | typing.Mapping[str, typing.Any]
+        The raw or parsed schema.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest.
+    """
+
+    if isinstance(schema, str):
+        schema = schema.encode("utf-8")
+    elif not isinstance(schema, bytes):
+        schema = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    return hashlib.sha256(schema).hexdigest()
+
+def remote(schema: typing.Any) -> bool:
+    """
+    Determines whether a schema has any non-local `$ref` (i.e. one that isn't a fragment of the schema itself).
+    """
+
+    if isinstance(schema, dict):
+        reference = schema.get("$ref")
+
+        if isinstance(reference, str) and not reference.startswith("#"):
+            return True
+
+        return any(remote(value) for value in schema.values())
+
+    if isinstance(schema, list):
+        return any(remote(value) for value in schema)
+
+    return False
+
+def registry(schema: typing.Mapping[str, typing.Any], location: typing.Union[str, os.PathLike]) -> referencing.Registry:
+    """
+    Returns a registry retrieving a schema's non-local reference(s) as file(s) relative to the schema's location.
+
+    A reference resolving to a `file:` uri is read from its path. Otherwise, a (resolved) reference beneath the directory
+    of the schema's `$id` (or a relative reference, where the schema has none) is read from the same relative path,
+    beneath the schema file's directory. Retrieved document(s) are memoized for the registry's lifetime.
+
+    Parameters
+    ----------
+    schema : typing.Mapping[str, typing.Any]
+        The parsed schema.
+    location : str | os.PathLike
+        The schema file's path.
+
+    Returns
+    -------
+    referencing.Registry
+        The registry; an unretrievable reference raises `referencing.exceptions.Unresolvable` upon validation.
+    """
+
+    directory = pathlib.Path(location).resolve().parent
+
+    identifier = schema.get("$id") if isinstance(schema.get("$id"), str) else ""
+
+    base = identifier.rpartition("/")[0] + "/" if "/" in identifier else ""
+
+    cached: typing.Dict[str, referencing.Resource] = {}
+
+    def retrieve(uri: str) -> referencing.Resource:
+        if uri not in cached:
+            partials = urllib.parse.urlsplit(uri)
+
+            if partials.scheme == "file":
+                path = pathlib.Path(urllib.request.url2pathname(partials.path))
+            elif base and uri.startswith(base):
+                path = directory.joinpath(urllib.parse.unquote(uri[len(base):]))
+            elif not partials.scheme and not partials.netloc:
+                path = directory.joinpath(urllib.parse.unquote(partials.path))
+            else:
+                raise referencing.exceptions.NoSuchResource(ref=uri)
+
+            cached[uri] = referencing.Resource.from_contents(json.loads(path.read_bytes()), default_specification=referencing.jsonschema.DRAFT202012)
+
+        return cached[uri]
+
+    return referencing.Registry(retrieve=retrieve)
+
+def compile(schema: typing.Mapping[str, typing.Any], formats: bool = True, registry: typing.Optional[referencing.Registry] = None) -> jsonschema.protocols.Validator:
+    """
+    Compiles a schema into a validator for the draft declared by its `$schema` (or draft 2020-12, if undeclared).
+
+    Parameters
+    ----------
+    schema : typing.Mapping[str, typing.Any]
+        The parsed schema.
+    formats : bool
+        Whether to assert the `format` keyword using the draft's format checker.
+    registry : referencing.Registry | None
+        The registry resolving non-local reference(s), see :func:`registry`.
+
+    Returns
+    -------
+    jsonschema.protocols.Validator
+        The validator.
+
+    Raises
+    ------
+    jsonschema.exceptions.SchemaError
+        If the schema is invalid under its metaschema.
+    """
+
+    cls = jsonschema.validators.validator_for(schema, default=default)
+
+    cls.check_schema(schema)
+
+    return instantiate(cls, schema, formats, registry)
+
+def instantiate(cls: typing.Type[jsonschema.protocols.Validator], schema: typing.Mapping[str, typing.Any], formats: bool = True, registry: typing.Optional[referencing.Registry] = None) -> jsonschema.protocols.Validator:
+    """
+    Instantiates a (checked) schema's validator, keeping `jsonschema`'s default registry unless one is given.
+    """
+
+    if registry is None:
+        return cls(schema, format_checker=cls.FORMAT_CHECKER if formats else None)
+
+    return cls(schema, format_checker=cls.FORMAT_CHECKER if formats else None, registry=registry)
+
+def pointer(path: typing.Iterable[typing.Union[str, int]]) -> str:
+    """
+    Converts a `jsonschema` error path into an RFC 6901 JSON pointer, e.g. `/items/0/name`.
+    """
+
+    return "".join("/%s" % str(token).replace("~", "~0").replace("/", "~1") for token in path)
+
+@dataclasses.dataclass(frozen=True)
+class Statistics:
+    hits: int
+    misses: int
+    size: int
+    maximum: int
+
+class Cache:
+    """
+    A thread-safe, least-recently-used cache of compiled validator(s), keyed by schema content hash.
+
+    :ivar maximum: The maximum number of cached validator(s).
+    :ivar formats: Whether compiled validator(s) assert the `format` keyword.
+    :ivar compiled: Whether schema(s) are compiled into generated Python source, see `polyium.validation.compiler`.
+    :ivar directory: The generated source's on-disk cache directory; None compiles it in-memory.
+    :ivar location: The schema file's path, against which non-local reference(s) resolve (see :func:`registry`); as
+        validator(s) then depend upon the schema's sibling file(s), such a cache should only be used for a single
+        invocation.
+    """
+
+    def __init__(self, maximum: int = 128, formats: bool = True, compiled: bool = False, directory: typing.Optional[typing.Union[str, os.PathLike]] = None, location: typing.Optional[typing.Union[str, os.PathLike]] = None):
+        self.maximum = maximum
+        self.formats = formats
+        self.compiled = compiled
+        self.directory = directory
+        self.location = location
+
+        self._validators: collections.OrderedDict[str, jsonschema.protocols.Validator] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    def get(self, schema: typing.Union[bytes, str, typing.Mapping[str, typing.Any]]) -> jsonschema.protocols.Validator:
+        """
+        Returns the compiled validator for a schema, compiling (and caching) it upon a miss.
+
+        Parameters
+        ----------
+        schema : bytes | str | typing.Mapping[str, typing.Any]
+            The raw or parsed schema; raw content is only parsed upon a miss.
+
+        Returns
+        -------
+        jsonschema.protocols.Validator
+            The validator.
+        """
+
+        key = digest(schema)
+
+        with self._lock:
+            validator = self._validators.get(key)
+
+            if validator is not None:
+                self._validators.move_to_end(key)
+                self._hits += 1
+
+                return validator
+
+            self._misses += 1
+
+        parsed = json.loads(schema) if isinstance(schema, (bytes, str)) else schema
+
+        resources = registry(parsed, self.location) if self.location is not None and isinstance(parsed, dict) else None
+
+        if self.compiled:
+            import polyium.validation.compiler
+
+            validator = polyium.validation.compiler.compile(parsed, directory=self.directory, formats=self.formats, registry=resources)
+        else:
+            validator = compile(parsed, formats=self.formats, registry=resources)
+
+        with self._lock:
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+
+            while len(self._validators) > self.maximum:
+                self._validators.popitem(last=False)
+
+        logger.debug("Compiled Validator: %s", key)
+
+        return validator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+
+    def statistics(self) -> Statistics:
+        with self._lock:
+            return Statistics(hits=self._hits, misses=self._misses, size=len(self._validators), maximum=self.maximum)
+
+# The process-wide validator cache.
+validators = Cache()
+
+def validator(schema: typing.Union[bytes, str, typing.Mapping[str, typing.Any]]) -> jsonschema.protocols.Validator:
+    """
+    Returns the compiled validator for a schema from the process-wide cache.
+    """
+
+    return validators.get(schema)
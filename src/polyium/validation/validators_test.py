@@ -0,0 +1,107 @@
+import json
+import pathlib
+
+import jsonschema
+import jsonschema.exceptions
+import referencing.exceptions
+import pytest
+import logging
+
+import polyium.models.base
+import polyium.validation.validators as module
+
+logger = logging.getLogger(__name__)
+
+schema = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "properties": {"name": {"type": "string"}, "items": {"type": "array", "items": {"type": "integer"}}},
+    "required": ["name"],
+}
+
+def test_digest_canonical(request: pytest.FixtureRequest):
+    """
+    Tests that a parsed schema's digest is independent of key order.
+    """
+
+    assert module.digest({"a": 1, "b": 2}) == module.digest({"b": 2, "a": 1})
+    assert module.digest(b'{"a":1,"b":2}') == module.digest({"a": 1, "b": 2})
+
+def test_compile_default_draft(request: pytest.FixtureRequest):
+    assert isinstance(module.compile({"type": "string"}), jsonschema.Draft202012Validator)
+
+def test_compile_declared_draft(request: pytest.FixtureRequest):
+    assert isinstance(module.compile({"$schema": "http://json-schema.org/draft-07/schema#"}), jsonschema.Draft7Validator)
+
+def test_compile_invalid(request: pytest.FixtureRequest):
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        module.compile({"type": 1})
+
+def test_compile_generated_schema(request: pytest.FixtureRequest):
+    validator = module.compile(polyium.models.base.Base.model_json_schema())
+
+    assert validator.is_valid({"working-directory": "."})
+    assert not validator.is_valid({"create-working-directory": "yes"})
+
+def test_pointer(request: pytest.FixtureRequest):
+    assert module.pointer(["items", 0, "a/b~c"]) == "/items/0/a~1b~0c"
+    assert module.pointer([]) == ""
+
+def test_cache_hit(request: pytest.FixtureRequest):
+    cache = module.Cache()
+
+    validator = cache.get(json.dumps(schema).encode("utf-8"))
+
+    assert cache.get(json.dumps(schema).encode("utf-8")) is validator
+
+    statistics = cache.statistics()
+
+    assert statistics.hits == 1
+    assert statistics.misses == 1
+
+def test_cache_eviction(request: pytest.FixtureRequest):
+    """
+    Tests that the least-recently used validator is evicted.
+    """
+
+    cache = module.Cache(maximum=2)
+
+    a = cache.get({"type": "string"})
+    cache.get({"type": "integer"})
+
+    assert cache.get({"type": "string"}) is a
+
+    cache.get({"type": "number"})
+
+    assert len(cache) == 2
+
+    assert cache.get({"type": "string"}) is a
+    assert cache.statistics().misses == 3
+
+def test_registry(request: pytest.FixtureRequest, directory: pathlib.Path):
+    """
+    Tests that relative and `file:` reference(s) are read relative to the schema's location, and that any other
+    reference is unresolvable.
+    """
+
+    directory.joinpath("nested").mkdir()
+    directory.joinpath("nested", "item.json").write_text(json.dumps({"type": "integer"}))
+
+    relative = {"type": "array", "items": {"$ref": "nested/item.json"}}
+    absolute = {"type": "array", "items": {"$ref": directory.joinpath("nested", "item.json").as_uri()}}
+
+    for value in (relative, absolute):
+        validator = module.Cache(location=directory.joinpath("schema.json")).get(value)
+
+        assert validator.is_valid([1, 2])
+        assert not validator.is_valid([1, "two"])
+
+    assert module.remote(relative) and not module.remote(schema)
+
+    with pytest.raises(referencing.exceptions.Unresolvable):
+        module.Cache(location=directory.joinpath("schema.json")).get({"$ref": "https://example.invalid/item.json"}).is_valid(1)
+
+def test_validation_errors(request: pytest.FixtureRequest):
+    errors = list(module.validator(schema).iter_errors({"name": "example", "items": [1, "two"]}))
+
+    assert [module.pointer(error.absolute_path) for error in errors] == ["/items/1"]